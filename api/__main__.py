@@ -2,7 +2,9 @@
 Life Manager API - Main Entry Point
 
 This module serves as the main entry point for running the Life Manager API
-using Python's module syntax: `python -m api`
+using Python's module syntax: `python -m api`. With `HTTP_PROCESSES` or
+`GRPC_PROCESSES` above 1 the servers run in supervised worker processes;
+send SIGHUP to restart them one at a time.
 """
 
 from .run import run
@@ -1,6 +1,15 @@
+"""
+Base Service
+
+This module provides the base class of the service layer shared by the REST
+routers and the gRPC servicers, and the exceptions services raise. Each
+exception carries a gRPC status code, which the REST API maps to an HTTP
+status with ``http_status``.
+"""
+
 import logging
 from datetime import datetime
-from typing import Any, Generic, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Iterable, Optional, Type, TypeVar
 
 import grpc
 from google.protobuf.message import Message
@@ -17,6 +26,20 @@ CreateSchemaType = TypeVar("CreateSchemaType")
 UpdateSchemaType = TypeVar("UpdateSchemaType")
 ResponseSchemaType = TypeVar("ResponseSchemaType")
 
+# HTTP status of each gRPC status code raised by services; others map to 500
+HTTP_STATUS_CODES: Dict[StatusCode, int] = {
+    StatusCode.INVALID_ARGUMENT: 400,
+    StatusCode.FAILED_PRECONDITION: 400,
+    StatusCode.ALREADY_EXISTS: 400,
+    StatusCode.UNAUTHENTICATED: 401,
+    StatusCode.PERMISSION_DENIED: 403,
+    StatusCode.NOT_FOUND: 404,
+    StatusCode.RESOURCE_EXHAUSTED: 429,
+    StatusCode.UNIMPLEMENTED: 501,
+    StatusCode.UNAVAILABLE: 503,
+    StatusCode.DEADLINE_EXCEEDED: 504,
+}
+
 
 class ServiceException(grpc.RpcError):
     """Base exception for service errors that should be translated to gRPC status codes."""
@@ -35,6 +58,11 @@ class ServiceException(grpc.RpcError):
     def __str__(self) -> str:
         return f"{self.status_code.name}: {self.message}"
 
+    @property
+    def http_status(self) -> int:
+        """The HTTP status code of the error."""
+        return HTTP_STATUS_CODES.get(self.status_code, 500)
+
 
 class NotFoundError(ServiceException):
     """Raised when a resource is not found."""
@@ -77,6 +105,22 @@ class PermissionDeniedError(ServiceException):
         super().__init__(message, StatusCode.PERMISSION_DENIED, details)
 
 
+class FailedPreconditionError(ServiceException):
+    """Raised when the system is not in the state an action requires."""
+
+    def __init__(self, message: str, details: Optional[str] = None):
+        super().__init__(message, StatusCode.FAILED_PRECONDITION, details)
+
+
+class DeadlineExceededError(ServiceException):
+    """Raised when the deadline of a request passes before its work is done."""
+
+    def __init__(
+        self, message: str = "Deadline exceeded", details: Optional[str] = None
+    ):
+        super().__init__(message, StatusCode.DEADLINE_EXCEEDED, details)
+
+
 class BaseService(
     Generic[ModelType, CreateSchemaType, UpdateSchemaType, ResponseSchemaType]
 ):
@@ -138,6 +182,13 @@ class BaseService(
         """
         pass
 
+    def _create_values(self, obj_in: CreateSchemaType) -> Dict[str, Any]:
+        """Return the column values of a new object.
+
+        Can be overridden by subclasses to set columns not in the schema.
+        """
+        return obj_in.dict(exclude_unset=True)
+
     def _pre_update(self, obj_in: UpdateSchemaType, obj_id: Any) -> ModelType:
         """Hook for pre-processing before updating an existing object.
 
@@ -167,6 +218,21 @@ class BaseService(
         """Get multiple objects with pagination."""
         return self.db.query(self.model).offset(skip).limit(limit).all()
 
+    def _query(self):
+        """Return a query of the objects the service may access."""
+        return self.db.query(self.model)
+
+    def get_many(self, ids: Iterable[Any]) -> Dict[Any, ModelType]:
+        """Get objects by ID with one query.
+
+        Returns:
+            The objects found, by ID; missing IDs are left out.
+        """
+        ids = list(dict.fromkeys(ids))
+        if not ids:
+            return {}
+        return {obj.id: obj for obj in self._query().filter(self.model.id.in_(ids))}
+
     def create(self, obj_in: CreateSchemaType) -> ModelType:
         """Create a new object."""
         self._validate_create(obj_in)
@@ -175,7 +241,7 @@ class BaseService(
         obj_in = self._pre_create(obj_in)
 
         # Convert to ORM model
-        db_obj = self.model(**obj_in.dict(exclude_unset=True))
+        db_obj = self.model(**self._create_values(obj_in))
 
         # Add to session and commit
         self.db.add(db_obj)
@@ -227,3 +293,50 @@ class BaseService(
         self.db.commit()
 
         return True
+
+
+class HouseholdScopedService(
+    BaseService[ModelType, CreateSchemaType, UpdateSchemaType, ResponseSchemaType]
+):
+    """Base class for services of resources that belong to a household.
+
+    Every lookup is restricted to the household the service was created for,
+    so objects of other households are reported as not found.
+    """
+
+    # Name of the resource in error messages
+    resource_name = "Resource"
+
+    def __init__(self, model: Type[ModelType], db_session: Session, household_id: int):
+        """Initialize with SQLAlchemy model class, database session and household."""
+        super().__init__(model, db_session)
+        self.household_id = household_id
+
+    def _query(self):
+        """Return a query of the household's objects."""
+        return self.db.query(self.model).filter(
+            self.model.household_id == self.household_id
+        )
+
+    def _create_values(self, obj_in: CreateSchemaType) -> Dict[str, Any]:
+        """Return the column values of a new object of the household."""
+        return {**super()._create_values(obj_in), "household_id": self.household_id}
+
+    def get(self, id: Any) -> Optional[ModelType]:
+        """Get a single object of the household by ID."""
+        return self._query().filter(self.model.id == id).first()
+
+    def get_multi(self, skip: int = 0, limit: int = 100) -> list[ModelType]:
+        """Get multiple objects of the household with pagination."""
+        return self._query().order_by(self.model.id).offset(skip).limit(limit).all()
+
+    def require(self, id: Any, details: Optional[str] = None) -> ModelType:
+        """Get an object of the household by ID.
+
+        Raises:
+            NotFoundError: If the household has no such object.
+        """
+        db_obj = self.get(id)
+        if db_obj is None:
+            raise NotFoundError(self.resource_name, id, details)
+        return db_obj
@@ -30,13 +30,142 @@ class Settings:
     # gRPC settings
     GRPC_MAX_MESSAGE_LENGTH: int = 100 * 1024 * 1024  # 100MB
     GRPC_MAX_METADATA_SIZE: int = 32 * 1024  # 32KB
-    GRPC_MAX_CONCURRENT_RPCS: int = 1000
+    GRPC_MAX_CONCURRENT_RPCS: int = int(os.getenv("GRPC_MAX_CONCURRENT_RPCS", "1000"))
     GRPC_KEEPALIVE_TIME_MS: int = 30000  # 30 seconds
     GRPC_KEEPALIVE_TIMEOUT_MS: int = 10000  # 10 seconds
     GRPC_KEEPALIVE_MIN_TIME_MS: int = 60000  # 1 minute
     GRPC_HTTP2_MAX_PINGS_WITHOUT_DATA: int = 0  # Unlimited
     GRPC_HTTP2_MIN_RECV_PING_INTERVAL_WITHOUT_DATA_SEC: int = 300  # 5 minutes
 
+    # gRPC load shedding: comma-separated "pattern=limit[:queue_size]" entries,
+    # where a pattern is a full method name or a prefix ending in "*" whose
+    # methods share the limit (see api/grpc_limits.py)
+    GRPC_CONCURRENCY_LIMITS: str = os.getenv(
+        "GRPC_CONCURRENCY_LIMITS",
+        "api.v1.UserService/ListUsers=8,"
+        "api.v1.FinanceService/GetSpending*=4,"
+        "api.v1.FinanceService/GetBudgetSummary=4,"
+        "api.v1.CalendarService/GetFreeBusy=8",
+    )
+    GRPC_CONCURRENCY_QUEUE_SIZE: int = int(
+        os.getenv("GRPC_CONCURRENCY_QUEUE_SIZE", "32")
+    )
+
+    # gRPC response compression with gzip, deflate or none, by method:
+    # comma-separated "pattern[=min_bytes]" or "pattern=off" entries, where
+    # smaller responses are sent uncompressed (see api/grpc_compression.py)
+    GRPC_COMPRESSION_ALGORITHM: str = os.getenv("GRPC_COMPRESSION_ALGORITHM", "gzip")
+    GRPC_COMPRESSION_POLICY: str = os.getenv(
+        "GRPC_COMPRESSION_POLICY",
+        "api.v1.UserService/ListUsers,"
+        "api.v1.UserService/BatchGetUsers,"
+        "api.v1.FinanceService/ListTransactions,"
+        "api.v1.FinanceService/BatchGetTransactions,"
+        "api.v1.FinanceService/GetSpendingOverTime,"
+        "api.v1.CalendarService/ListEvents,"
+        "api.v1.CalendarService/GetEventsInRange",
+    )
+    GRPC_COMPRESSION_MIN_BYTES: int = int(
+        os.getenv("GRPC_COMPRESSION_MIN_BYTES", "1024")
+    )
+
+    # Concurrent single-ID lookups arriving within this window are merged into
+    # one query (0 disables merging); batch reads take at most this many IDs
+    GRPC_COALESCE_WINDOW_MS: float = float(os.getenv("GRPC_COALESCE_WINDOW_MS", "2"))
+    GRPC_BATCH_MAX_SIZE: int = int(os.getenv("GRPC_BATCH_MAX_SIZE", "500"))
+
+    # Streamed transaction ingestion: rows are committed in batches of this
+    # size, or once this many seconds have passed since the last commit
+    GRPC_INGEST_BATCH_SIZE: int = int(os.getenv("GRPC_INGEST_BATCH_SIZE", "500"))
+    GRPC_INGEST_FLUSH_SECONDS: float = float(
+        os.getenv("GRPC_INGEST_FLUSH_SECONDS", "1")
+    )
+    GRPC_INGEST_MAX_ERRORS: int = int(os.getenv("GRPC_INGEST_MAX_ERRORS", "100"))
+
+    # Prefork servers: python -m api runs HTTP_PROCESSES uvicorn workers and
+    # GRPC_PROCESSES gRPC workers under a supervisor when either is above 1
+    # (python -m api.grpc_server runs the gRPC workers alone). Workers are
+    # given PREFORK_GRACE_SECONDS to finish their requests on shutdown and
+    # restarted after PREFORK_HEARTBEAT_TIMEOUT_SECONDS without a heartbeat;
+    # gRPC health reports SERVING while PREFORK_MIN_HEALTHY_WORKERS are alive
+    HTTP_PROCESSES: int = int(os.getenv("HTTP_PROCESSES", "1"))
+    GRPC_PROCESSES: int = int(os.getenv("GRPC_PROCESSES", "1"))
+    PREFORK_GRACE_SECONDS: float = float(os.getenv("PREFORK_GRACE_SECONDS", "10"))
+    PREFORK_HEARTBEAT_TIMEOUT_SECONDS: float = float(
+        os.getenv("PREFORK_HEARTBEAT_TIMEOUT_SECONDS", "10")
+    )
+    PREFORK_MIN_HEALTHY_WORKERS: int = int(
+        os.getenv("PREFORK_MIN_HEALTHY_WORKERS", "1")
+    )
+
+    # Logging: LOG_FORMAT is "text" or "json"; records go through a queue of
+    # LOG_QUEUE_SIZE records to a writer thread, and are dropped when it is
+    # full. Every request is logged as one line on the api.requests logger,
+    # sampled by route with comma-separated "pattern=rate" entries, where a
+    # pattern is a gRPC method or HTTP route template, or a prefix ending in
+    # "*", and others at REQUEST_LOG_SAMPLE_RATE; failed requests and those
+    # slower than REQUEST_LOG_SLOW_MS are always logged
+    # (see api/request_logging.py)
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "text").lower()
+    LOG_QUEUE_SIZE: int = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+    REQUEST_LOG_SAMPLING: str = os.getenv(
+        "REQUEST_LOG_SAMPLING", "grpc.health.v1.*=0,/health*=0"
+    )
+    REQUEST_LOG_SAMPLE_RATE: float = float(os.getenv("REQUEST_LOG_SAMPLE_RATE", "1"))
+    REQUEST_LOG_SLOW_MS: float = float(os.getenv("REQUEST_LOG_SLOW_MS", "500"))
+
+    # Recurring transaction scheduler
+    RECURRING_SCHEDULER_ENABLED: bool = (
+        os.getenv("RECURRING_SCHEDULER_ENABLED", "True").lower() == "true"
+    )
+    RECURRING_SCHEDULER_INTERVAL_SECONDS: int = int(
+        os.getenv("RECURRING_SCHEDULER_INTERVAL_SECONDS", "3600")
+    )
+    RECURRING_SCHEDULER_BATCH_SIZE: int = int(
+        os.getenv("RECURRING_SCHEDULER_BATCH_SIZE", "500")
+    )
+
+    # Savings goal simulation
+    SIMULATION_DEFAULT_PATHS: int = int(os.getenv("SIMULATION_DEFAULT_PATHS", "5000"))
+    SIMULATION_MAX_PATHS: int = int(os.getenv("SIMULATION_MAX_PATHS", "20000"))
+    SIMULATION_MAX_CPU_SECONDS: float = float(
+        os.getenv("SIMULATION_MAX_CPU_SECONDS", "0.5")
+    )
+
+    # Calendar caches and interval index
+    CALENDAR_CACHE_MAX_SERIES: int = int(os.getenv("CALENDAR_CACHE_MAX_SERIES", "1024"))
+    CALENDAR_CACHE_WINDOWS_PER_SERIES: int = int(
+        os.getenv("CALENDAR_CACHE_WINDOWS_PER_SERIES", "8")
+    )
+    CALENDAR_INDEX_MAX_HOUSEHOLDS: int = int(
+        os.getenv("CALENDAR_INDEX_MAX_HOUSEHOLDS", "256")
+    )
+    CALENDAR_FREEBUSY_MAX_ENTRIES: int = int(
+        os.getenv("CALENDAR_FREEBUSY_MAX_ENTRIES", "4096")
+    )
+    CALENDAR_CONFLICT_HORIZON_DAYS: int = int(
+        os.getenv("CALENDAR_CONFLICT_HORIZON_DAYS", "90")
+    )
+    CALENDAR_CONFLICT_MAX_OCCURRENCES: int = int(
+        os.getenv("CALENDAR_CONFLICT_MAX_OCCURRENCES", "200")
+    )
+
+    # Event reminder worker
+    REMINDER_WORKER_ENABLED: bool = (
+        os.getenv("REMINDER_WORKER_ENABLED", "True").lower() == "true"
+    )
+    REMINDER_WORKER_INTERVAL_SECONDS: int = int(
+        os.getenv("REMINDER_WORKER_INTERVAL_SECONDS", "30")
+    )
+    REMINDER_HORIZON_MINUTES: int = int(os.getenv("REMINDER_HORIZON_MINUTES", "60"))
+    REMINDER_MAX_LEAD_MINUTES: int = int(
+        os.getenv("REMINDER_MAX_LEAD_MINUTES", str(7 * 24 * 60))
+    )
+    REMINDER_GRACE_MINUTES: int = int(os.getenv("REMINDER_GRACE_MINUTES", "15"))
+    REMINDER_BATCH_SIZE: int = int(os.getenv("REMINDER_BATCH_SIZE", "200"))
+    REMINDER_LEASE_SECONDS: int = int(os.getenv("REMINDER_LEASE_SECONDS", "300"))
+    REMINDER_MAX_ATTEMPTS: int = int(os.getenv("REMINDER_MAX_ATTEMPTS", "5"))
+
     # Security
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     ALGORITHM: str = "HS256"
@@ -71,6 +200,10 @@ class Settings:
     POSTGRES_PASSWORD: str = os.getenv("POSTGRES_PASSWORD", "postgres")
     POSTGRES_DB: str = os.getenv("POSTGRES_DB", "lifemanager")
     DATABASE_URI: Optional[PostgresDsn] = None
+    # Connections kept by the pool of a database server, and opened beyond
+    # them under load; blocking gRPC methods get one thread per connection
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
 
     @validator("DATABASE_URI", pre=True)
     @classmethod
@@ -98,13 +231,13 @@ class Settings:
     )
 
     # Email settings (for password reset, etc.)
-    SMTP_TLS: bool = True
-    SMTP_PORT: Optional[int] = None
-    SMTP_HOST: Optional[str] = None
-    SMTP_USER: Optional[str] = None
-    SMTP_PASSWORD: Optional[str] = None
-    EMAILS_FROM_EMAIL: Optional[EmailStr] = None
-    EMAILS_FROM_NAME: Optional[str] = None
+    SMTP_TLS: bool = os.getenv("SMTP_TLS", "True").lower() == "true"
+    SMTP_PORT: Optional[int] = int(os.getenv("SMTP_PORT", "0")) or None
+    SMTP_HOST: Optional[str] = os.getenv("SMTP_HOST") or None
+    SMTP_USER: Optional[str] = os.getenv("SMTP_USER") or None
+    SMTP_PASSWORD: Optional[str] = os.getenv("SMTP_PASSWORD") or None
+    EMAILS_FROM_EMAIL: Optional[EmailStr] = os.getenv("EMAILS_FROM_EMAIL") or None
+    EMAILS_FROM_NAME: Optional[str] = os.getenv("EMAILS_FROM_NAME") or None
 
     @validator("EMAILS_FROM_NAME")
     @classmethod
@@ -130,6 +263,7 @@ class Settings:
 
     class Config:
         """Configuration for settings."""
+
         case_sensitive = True
         env_file = ".env"
 
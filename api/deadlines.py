@@ -0,0 +1,119 @@
+"""
+Request Deadlines
+
+This module carries the deadline of the current request, the point after
+which its caller has given up, and holds the database work of the request to
+it. gRPC servicers take the deadline from ``context.time_remaining()`` and the
+REST API from the ``X-Request-Deadline`` header.
+
+The deadline lives in a context variable, so it follows the request onto the
+worker threads of blocking RPCs and synchronous routes. Once it has passed,
+statements are refused before they reach the database. Statements already
+running are cut short: Postgres transactions get a ``statement_timeout`` of
+the time remaining when they begin, and SQLite connections are interrupted
+from a progress handler. Either way ``DeadlineExceededError`` is raised.
+"""
+
+import contextlib
+import contextvars
+import logging
+import time
+from typing import Iterator, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from api.base_service import DeadlineExceededError
+
+logger = logging.getLogger(__name__)
+
+# SQLite virtual machine instructions between deadline checks of a statement
+SQLITE_PROGRESS_INSTRUCTIONS = 10000
+
+# Monotonic time after which the current request is abandoned, if it has one
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar(
+    "request_deadline", default=None
+)
+
+
+def set_deadline(timeout: Optional[float]) -> contextvars.Token:
+    """Set the deadline of the current context to ``timeout`` seconds from now.
+
+    A ``timeout`` of None clears the deadline. Returns the token restoring the
+    previous deadline.
+    """
+    return _deadline.set(None if timeout is None else time.monotonic() + timeout)
+
+
+@contextlib.contextmanager
+def request_deadline(timeout: Optional[float]) -> Iterator[None]:
+    """Hold the work done in the block to a deadline ``timeout`` seconds away."""
+    token = set_deadline(timeout)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def time_remaining() -> Optional[float]:
+    """Return the seconds left until the deadline, or None without one."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def expired() -> bool:
+    """Return whether the deadline of the current context has passed."""
+    deadline = _deadline.get()
+    return deadline is not None and time.monotonic() >= deadline
+
+
+def check_deadline() -> None:
+    """Raise ``DeadlineExceededError`` if the deadline has passed."""
+    if expired():
+        raise DeadlineExceededError()
+
+
+def install(engine: Engine) -> None:
+    """Hold the statements executed by an engine to the request deadline."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", _install_progress_handler)
+    elif engine.dialect.name == "postgresql":
+        event.listen(engine, "begin", _set_statement_timeout)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Refuse statements of requests whose deadline has passed."""
+    check_deadline()
+
+
+def _handle_error(exception_context) -> None:
+    """Report statements failed by an expired deadline as such."""
+    if expired():
+        raise DeadlineExceededError() from exception_context.original_exception
+
+
+def _install_progress_handler(dbapi_connection, connection_record) -> None:
+    """Interrupt the statements of a SQLite connection once their deadline passes.
+
+    The handler runs on the thread executing the statement, so it sees the
+    deadline of the request the statement belongs to.
+    """
+    dbapi_connection.set_progress_handler(expired, SQLITE_PROGRESS_INSTRUCTIONS)
+
+
+def _set_statement_timeout(conn) -> None:
+    """Bound the statements of a new Postgres transaction by the time remaining."""
+    remaining = time_remaining()
+    if remaining is None:
+        return
+    check_deadline()
+    # The transaction is not begun yet, so go through the DBAPI connection;
+    # psycopg opens the transaction with this statement, and SET LOCAL ends
+    # with it
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"SET LOCAL statement_timeout = {max(1, int(remaining * 1e3))}")
+    finally:
+        cursor.close()
@@ -0,0 +1,2 @@
+# Generated file - do not edit
+__version__ = '0.1.0'
@@ -0,0 +1,10 @@
+# Generated file - do not edit
+# flake8: noqa
+# fmt: off
+# isort: skip_file
+# mypy: ignore-errors
+# pylint: skip-file
+
+"""Auto-generated package for v1."""
+
+__all__ = []
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: api/v1/calendar.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'api/v1/calendar.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x15\x61pi/v1/calendar.proto\x12\x06\x61pi.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1bgoogle/protobuf/empty.proto\"\xa1\x06\n\x05\x45vent\x12\n\n\x02id\x18\x01 \x01(\t\x12\x14\n\x0chousehold_id\x18\x02 \x01(\t\x12\r\n\x05title\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x1f\n\x04type\x18\x05 \x01(\x0e\x32\x11.api.v1.EventType\x12#\n\x06status\x18\x06 \x01(\x0e\x32\x13.api.v1.EventStatus\x12.\n\nstart_time\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nis_all_day\x18\t \x01(\x08\x12\x10\n\x08location\x18\n \x01(\t\x12\x14\n\x0cis_recurring\x18\x0b \x01(\x08\x12\x39\n\x14recurrence_frequency\x18\x0c \x01(\x0e\x32\x1b.api.v1.RecurrenceFrequency\x12\x1b\n\x13recurrence_interval\x18\r \x01(\x05\x12\x18\n\x10recurrence_count\x18\x0e \x01(\x05\x12\x37\n\x13recurrence_end_date\x18\x0f \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1d\n\x15recurrence_by_weekday\x18\x10 \x03(\x05\x12\x12\n\ncreated_by\x18\x11 \x01(\t\x12.\n\ncreated_at\x18\x12 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x13 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05\x63olor\x18\x14 \x01(\t\x12\x0c\n\x04tags\x18\x15 \x03(\t\x12\x11\n\tattendees\x18\x16 \x03(\t\x12\x10\n\x08timezone\x18\x17 \x01(\t\x12\x37\n\x13original_start_time\x18\x18 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x18\n\x10reminder_enabled\x18\x19 \x01(\x08\x12\x1f\n\x17reminder_minutes_before\x18\x1a \x01(\x05\"\xe8\x04\n\x0b\x45ventCreate\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\r\n\x05title\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x1f\n\x04type\x18\x04 \x01(\x0e\x32\x11.api.v1.EventType\x12.\n\nstart_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\nis_all_day\x18\x07 \x01(\x08\x12\x10\n\x08location\x18\x08 \x01(\t\x12\x14\n\x0cis_recurring\x18\t \x01(\x08\x12\x39\n\x14recurrence_frequency\x18\n \x01(\x0e\x32\x1b.api.v1.RecurrenceFrequency\x12\x1b\n\x13recurrence_interval\x18\x0b \x01(\x05\x12\x18\n\x10recurrence_count\x18\x0c \x01(\x05\x12\x37\n\x13recurrence_end_date\x18\r \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1d\n\x15recurrence_by_weekday\x18\x0e \x03(\x05\x12\r\n\x05\x63olor\x18\x0f \x01(\t\x12\x0c\n\x04tags\x18\x10 \x03(\t\x12\x17\n\x0f\x61ttendee_emails\x18\x11 \x03(\t\x12\x10\n\x08timezone\x18\x12 \x01(\t\x12\x18\n\x10reminder_enabled\x18\x13 \x01(\x08\x12\x1f\n\x17reminder_minutes_before\x18\x14 \x01(\x05\x12\x17\n\x0f\x63heck_conflicts\x18\x15 \x01(\x08\"\x92\t\n\x0b\x45ventUpdate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\x05title\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12$\n\x04type\x18\x04 \x01(\x0e\x32\x11.api.v1.EventTypeH\x02\x88\x01\x01\x12\x33\n\nstart_time\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03\x88\x01\x01\x12\x31\n\x08\x65nd_time\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x04\x88\x01\x01\x12\x17\n\nis_all_day\x18\x07 \x01(\x08H\x05\x88\x01\x01\x12\x15\n\x08location\x18\x08 \x01(\tH\x06\x88\x01\x01\x12(\n\x06status\x18\t \x01(\x0e\x32\x13.api.v1.EventStatusH\x07\x88\x01\x01\x12\x19\n\x0cis_recurring\x18\n \x01(\x08H\x08\x88\x01\x01\x12>\n\x14recurrence_frequency\x18\x0b \x01(\x0e\x32\x1b.api.v1.RecurrenceFrequencyH\t\x88\x01\x01\x12 \n\x13recurrence_interval\x18\x0c \x01(\x05H\n\x88\x01\x01\x12\x1d\n\x10recurrence_count\x18\r \x01(\x05H\x0b\x88\x01\x01\x12<\n\x13recurrence_end_date\x18\x0e \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x0c\x88\x01\x01\x12\x1d\n\x15recurrence_by_weekday\x18\x0f \x03(\x05\x12\x12\n\x05\x63olor\x18\x10 \x01(\tH\r\x88\x01\x01\x12\x0c\n\x04tags\x18\x11 \x03(\t\x12\x17\n\x0f\x61ttendee_emails\x18\x12 \x03(\t\x12\x15\n\x08timezone\x18\x13 \x01(\tH\x0e\x88\x01\x01\x12\x1e\n\x16update_all_occurrences\x18\x14 \x01(\x08\x12!\n\x19update_future_occurrences\x18\x15 \x01(\x08\x12>\n\x15occurrence_start_time\x18\x16 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x0f\x88\x01\x01\x12\x1d\n\x10reminder_enabled\x18\x17 \x01(\x08H\x10\x88\x01\x01\x12$\n\x17reminder_minutes_before\x18\x18 \x01(\x05H\x11\x88\x01\x01\x12\x17\n\x0f\x63heck_conflicts\x18\x19 \x01(\x08\x42\x08\n\x06_titleB\x0e\n\x0c_descriptionB\x07\n\x05_typeB\r\n\x0b_start_timeB\x0b\n\t_end_timeB\r\n\x0b_is_all_dayB\x0b\n\t_locationB\t\n\x07_statusB\x0f\n\r_is_recurringB\x17\n\x15_recurrence_frequencyB\x16\n\x14_recurrence_intervalB\x13\n\x11_recurrence_countB\x16\n\x14_recurrence_end_dateB\x08\n\x06_colorB\x0b\n\t_timezoneB\x18\n\x16_occurrence_start_timeB\x13\n\x11_reminder_enabledB\x1a\n\x18_reminder_minutes_before\"W\n\rEventResponse\x12\x1c\n\x05\x65vent\x18\x01 \x01(\x0b\x32\r.api.v1.Event\x12(\n\tconflicts\x18\x02 \x03(\x0b\x32\x15.api.v1.EventConflict\"z\n\rEventConflict\x12\x1c\n\x05\x65vent\x18\x01 \x01(\x0b\x32\r.api.v1.Event\x12\x39\n\x15occurrence_start_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x10\n\x08user_ids\x18\x03 \x03(\t\"A\n\x11\x45ventListResponse\x12\x1d\n\x06\x65vents\x18\x01 \x03(\x0b\x32\r.api.v1.Event\x12\r\n\x05total\x18\x02 \x01(\x05\"\xc6\x02\n\x0b\x45ventFilter\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x33\n\nstart_date\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x12\x31\n\x08\x65nd_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x01\x88\x01\x01\x12 \n\x05types\x18\x04 \x03(\x0e\x32\x11.api.v1.EventType\x12\x12\n\ncreated_by\x18\x05 \x03(\t\x12\x0c\n\x04tags\x18\x06 \x03(\t\x12\x1d\n\x11include_recurring\x18\x07 \x01(\x08\x42\x02\x18\x01\x12\x0c\n\x04page\x18\x08 \x01(\x05\x12\x11\n\tpage_size\x18\t \x01(\x05\x12\x19\n\x11\x65xclude_recurring\x18\n \x01(\x08\x42\r\n\x0b_start_dateB\x0b\n\t_end_date\"\x17\n\tIdRequest\x12\n\n\x02id\x18\x01 \x01(\t\"\xbd\x01\n\x12\x44\x65leteEventRequest\x12\n\n\x02id\x18\x01 \x01(\t\x12\x1e\n\x16\x64\x65lete_all_occurrences\x18\x02 \x01(\x08\x12!\n\x19\x64\x65lete_future_occurrences\x18\x03 \x01(\x08\x12>\n\x15occurrence_start_time\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x00\x88\x01\x01\x42\x18\n\x16_occurrence_start_time\"\xc4\x01\n\x14\x45ventsInRangeRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12.\n\nstart_date\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1d\n\x11include_recurring\x18\x04 \x01(\x08\x42\x02\x18\x01\x12\x19\n\x11\x65xclude_recurring\x18\x05 \x01(\x08\"P\n\x15UpcomingEventsRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x12\n\ndays_ahead\x18\x02 \x01(\x05\x12\r\n\x05limit\x18\x03 \x01(\x05\"K\n\x11ShareEventRequest\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x13\n\x0buser_emails\x18\x02 \x03(\t\x12\x0f\n\x07message\x18\x03 \x01(\t\"X\n\x12ShareEventResponse\x12\x10\n\x08\x65vent_id\x18\x01 \x01(\t\x12\x19\n\x11shared_with_count\x18\x02 \x01(\x05\x12\x15\n\rfailed_emails\x18\x03 \x03(\t\"\x87\x02\n\x0f\x46reeBusyRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12.\n\nweek_start\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05weeks\x18\x03 \x01(\x05\x12\x10\n\x08user_ids\x18\x04 \x03(\t\x12\x18\n\x10\x64uration_minutes\x18\x05 \x01(\x05\x12\x17\n\x0fmax_suggestions\x18\x06 \x01(\x05\x12\x1b\n\x0e\x64\x61y_start_hour\x18\x07 \x01(\x05H\x00\x88\x01\x01\x12\x19\n\x0c\x64\x61y_end_hour\x18\x08 \x01(\x05H\x01\x88\x01\x01\x42\x11\n\x0f_day_start_hourB\x0f\n\r_day_end_hour\"+\n\nMemberBusy\x12\x0f\n\x07user_id\x18\x01 \x01(\t\x12\x0c\n\x04\x62usy\x18\x02 \x01(\x0c\"h\n\x08TimeSlot\x12.\n\nstart_time\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_time\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xb8\x01\n\x10\x46reeBusyResponse\x12.\n\nweek_start\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x14\n\x0cslot_minutes\x18\x02 \x01(\x05\x12\x12\n\nslot_count\x18\x03 \x01(\x05\x12#\n\x07members\x18\x04 \x03(\x0b\x32\x12.api.v1.MemberBusy\x12%\n\x0bsuggestions\x18\x05 \x03(\x0b\x32\x10.api.v1.TimeSlot*t\n\tEventType\x12\x0b\n\x07GENERIC\x10\x00\x12\x0b\n\x07MEETING\x10\x01\x12\x0f\n\x0b\x41PPOINTMENT\x10\x02\x12\x0c\n\x08REMINDER\x10\x03\x12\x0c\n\x08\x42IRTHDAY\x10\x04\x12\x0b\n\x07HOLIDAY\x10\x05\x12\x08\n\x04TASK\x10\x06\x12\t\n\x05OTHER\x10\x07*I\n\x0b\x45ventStatus\x12\r\n\tTENTATIVE\x10\x00\x12\r\n\tCONFIRMED\x10\x01\x12\r\n\tCANCELLED\x10\x02\x12\r\n\tCOMPLETED\x10\x03*O\n\x13RecurrenceFrequency\x12\x08\n\x04NONE\x10\x00\x12\t\n\x05\x44\x41ILY\x10\x01\x12\n\n\x06WEEKLY\x10\x02\x12\x0b\n\x07MONTHLY\x10\x03\x12\n\n\x06YEARLY\x10\x04\x32\xef\x04\n\x0f\x43\x61lendarService\x12;\n\x0b\x43reateEvent\x12\x13.api.v1.EventCreate\x1a\x15.api.v1.EventResponse\"\x00\x12\x36\n\x08GetEvent\x12\x11.api.v1.IdRequest\x1a\x15.api.v1.EventResponse\"\x00\x12>\n\nListEvents\x12\x13.api.v1.EventFilter\x1a\x19.api.v1.EventListResponse\"\x00\x12;\n\x0bUpdateEvent\x12\x13.api.v1.EventUpdate\x1a\x15.api.v1.EventResponse\"\x00\x12\x43\n\x0b\x44\x65leteEvent\x12\x1a.api.v1.DeleteEventRequest\x1a\x16.google.protobuf.Empty\"\x00\x12M\n\x10GetEventsInRange\x12\x1c.api.v1.EventsInRangeRequest\x1a\x19.api.v1.EventListResponse\"\x00\x12O\n\x11GetUpcomingEvents\x12\x1d.api.v1.UpcomingEventsRequest\x1a\x19.api.v1.EventListResponse\"\x00\x12\x41\n\nShareEvent\x12\x19.api.v1.ShareEventRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x42\n\x0bGetFreeBusy\x12\x17.api.v1.FreeBusyRequest\x1a\x18.api.v1.FreeBusyResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'api.v1.calendar_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_EVENTFILTER'].fields_by_name['include_recurring']._loaded_options = None
+  _globals['_EVENTFILTER'].fields_by_name['include_recurring']._serialized_options = b'\030\001'
+  _globals['_EVENTSINRANGEREQUEST'].fields_by_name['include_recurring']._loaded_options = None
+  _globals['_EVENTSINRANGEREQUEST'].fields_by_name['include_recurring']._serialized_options = b'\030\001'
+  _globals['_EVENTTYPE']._serialized_start=4569
+  _globals['_EVENTTYPE']._serialized_end=4685
+  _globals['_EVENTSTATUS']._serialized_start=4687
+  _globals['_EVENTSTATUS']._serialized_end=4760
+  _globals['_RECURRENCEFREQUENCY']._serialized_start=4762
+  _globals['_RECURRENCEFREQUENCY']._serialized_end=4841
+  _globals['_EVENT']._serialized_start=96
+  _globals['_EVENT']._serialized_end=897
+  _globals['_EVENTCREATE']._serialized_start=900
+  _globals['_EVENTCREATE']._serialized_end=1516
+  _globals['_EVENTUPDATE']._serialized_start=1519
+  _globals['_EVENTUPDATE']._serialized_end=2689
+  _globals['_EVENTRESPONSE']._serialized_start=2691
+  _globals['_EVENTRESPONSE']._serialized_end=2778
+  _globals['_EVENTCONFLICT']._serialized_start=2780
+  _globals['_EVENTCONFLICT']._serialized_end=2902
+  _globals['_EVENTLISTRESPONSE']._serialized_start=2904
+  _globals['_EVENTLISTRESPONSE']._serialized_end=2969
+  _globals['_EVENTFILTER']._serialized_start=2972
+  _globals['_EVENTFILTER']._serialized_end=3298
+  _globals['_IDREQUEST']._serialized_start=3300
+  _globals['_IDREQUEST']._serialized_end=3323
+  _globals['_DELETEEVENTREQUEST']._serialized_start=3326
+  _globals['_DELETEEVENTREQUEST']._serialized_end=3515
+  _globals['_EVENTSINRANGEREQUEST']._serialized_start=3518
+  _globals['_EVENTSINRANGEREQUEST']._serialized_end=3714
+  _globals['_UPCOMINGEVENTSREQUEST']._serialized_start=3716
+  _globals['_UPCOMINGEVENTSREQUEST']._serialized_end=3796
+  _globals['_SHAREEVENTREQUEST']._serialized_start=3798
+  _globals['_SHAREEVENTREQUEST']._serialized_end=3873
+  _globals['_SHAREEVENTRESPONSE']._serialized_start=3875
+  _globals['_SHAREEVENTRESPONSE']._serialized_end=3963
+  _globals['_FREEBUSYREQUEST']._serialized_start=3966
+  _globals['_FREEBUSYREQUEST']._serialized_end=4229
+  _globals['_MEMBERBUSY']._serialized_start=4231
+  _globals['_MEMBERBUSY']._serialized_end=4274
+  _globals['_TIMESLOT']._serialized_start=4276
+  _globals['_TIMESLOT']._serialized_end=4380
+  _globals['_FREEBUSYRESPONSE']._serialized_start=4383
+  _globals['_FREEBUSYRESPONSE']._serialized_end=4567
+  _globals['_CALENDARSERVICE']._serialized_start=4844
+  _globals['_CALENDARSERVICE']._serialized_end=5467
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,938 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from collections import abc as _abc
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import message as _message
+from google.protobuf import timestamp_pb2 as _timestamp_pb2
+from google.protobuf.internal import containers as _containers
+from google.protobuf.internal import enum_type_wrapper as _enum_type_wrapper
+import builtins as _builtins
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import TypeAlias as _TypeAlias, Never as _Never
+else:
+    from typing_extensions import TypeAlias as _TypeAlias, Never as _Never
+
+DESCRIPTOR: _descriptor.FileDescriptor
+
+class _EventType:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _EventTypeEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_EventType.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    GENERIC: _EventType.ValueType  # 0
+    MEETING: _EventType.ValueType  # 1
+    APPOINTMENT: _EventType.ValueType  # 2
+    REMINDER: _EventType.ValueType  # 3
+    BIRTHDAY: _EventType.ValueType  # 4
+    HOLIDAY: _EventType.ValueType  # 5
+    TASK: _EventType.ValueType  # 6
+    OTHER: _EventType.ValueType  # 7
+
+class EventType(_EventType, metaclass=_EventTypeEnumTypeWrapper):
+    """EventType represents the type of calendar event."""
+
+GENERIC: EventType.ValueType  # 0
+MEETING: EventType.ValueType  # 1
+APPOINTMENT: EventType.ValueType  # 2
+REMINDER: EventType.ValueType  # 3
+BIRTHDAY: EventType.ValueType  # 4
+HOLIDAY: EventType.ValueType  # 5
+TASK: EventType.ValueType  # 6
+OTHER: EventType.ValueType  # 7
+Global___EventType: _TypeAlias = EventType  # noqa: Y015
+
+class _EventStatus:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _EventStatusEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_EventStatus.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    TENTATIVE: _EventStatus.ValueType  # 0
+    CONFIRMED: _EventStatus.ValueType  # 1
+    CANCELLED: _EventStatus.ValueType  # 2
+    COMPLETED: _EventStatus.ValueType  # 3
+
+class EventStatus(_EventStatus, metaclass=_EventStatusEnumTypeWrapper):
+    """EventStatus represents the status of an event."""
+
+TENTATIVE: EventStatus.ValueType  # 0
+CONFIRMED: EventStatus.ValueType  # 1
+CANCELLED: EventStatus.ValueType  # 2
+COMPLETED: EventStatus.ValueType  # 3
+Global___EventStatus: _TypeAlias = EventStatus  # noqa: Y015
+
+class _RecurrenceFrequency:
+    ValueType = _typing.NewType("ValueType", _builtins.int)
+    V: _TypeAlias = ValueType  # noqa: Y015
+
+class _RecurrenceFrequencyEnumTypeWrapper(_enum_type_wrapper._EnumTypeWrapper[_RecurrenceFrequency.ValueType], _builtins.type):
+    DESCRIPTOR: _descriptor.EnumDescriptor
+    NONE: _RecurrenceFrequency.ValueType  # 0
+    DAILY: _RecurrenceFrequency.ValueType  # 1
+    WEEKLY: _RecurrenceFrequency.ValueType  # 2
+    MONTHLY: _RecurrenceFrequency.ValueType  # 3
+    YEARLY: _RecurrenceFrequency.ValueType  # 4
+
+class RecurrenceFrequency(_RecurrenceFrequency, metaclass=_RecurrenceFrequencyEnumTypeWrapper):
+    """RecurrenceFrequency defines how often an event repeats."""
+
+NONE: RecurrenceFrequency.ValueType  # 0
+DAILY: RecurrenceFrequency.ValueType  # 1
+WEEKLY: RecurrenceFrequency.ValueType  # 2
+MONTHLY: RecurrenceFrequency.ValueType  # 3
+YEARLY: RecurrenceFrequency.ValueType  # 4
+Global___RecurrenceFrequency: _TypeAlias = RecurrenceFrequency  # noqa: Y015
+
+@_typing.final
+class Event(_message.Message):
+    """Event represents a calendar event."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    HOUSEHOLD_ID_FIELD_NUMBER: _builtins.int
+    TITLE_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    STATUS_FIELD_NUMBER: _builtins.int
+    START_TIME_FIELD_NUMBER: _builtins.int
+    END_TIME_FIELD_NUMBER: _builtins.int
+    IS_ALL_DAY_FIELD_NUMBER: _builtins.int
+    LOCATION_FIELD_NUMBER: _builtins.int
+    IS_RECURRING_FIELD_NUMBER: _builtins.int
+    RECURRENCE_FREQUENCY_FIELD_NUMBER: _builtins.int
+    RECURRENCE_INTERVAL_FIELD_NUMBER: _builtins.int
+    RECURRENCE_COUNT_FIELD_NUMBER: _builtins.int
+    RECURRENCE_END_DATE_FIELD_NUMBER: _builtins.int
+    RECURRENCE_BY_WEEKDAY_FIELD_NUMBER: _builtins.int
+    CREATED_BY_FIELD_NUMBER: _builtins.int
+    CREATED_AT_FIELD_NUMBER: _builtins.int
+    UPDATED_AT_FIELD_NUMBER: _builtins.int
+    COLOR_FIELD_NUMBER: _builtins.int
+    TAGS_FIELD_NUMBER: _builtins.int
+    ATTENDEES_FIELD_NUMBER: _builtins.int
+    TIMEZONE_FIELD_NUMBER: _builtins.int
+    ORIGINAL_START_TIME_FIELD_NUMBER: _builtins.int
+    REMINDER_ENABLED_FIELD_NUMBER: _builtins.int
+    REMINDER_MINUTES_BEFORE_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    household_id: _builtins.str
+    title: _builtins.str
+    description: _builtins.str
+    type: Global___EventType.ValueType
+    status: Global___EventStatus.ValueType
+    is_all_day: _builtins.bool
+    location: _builtins.str
+    """Location"""
+    is_recurring: _builtins.bool
+    """Recurrence"""
+    recurrence_frequency: Global___RecurrenceFrequency.ValueType
+    recurrence_interval: _builtins.int
+    """e.g., every 2 weeks"""
+    recurrence_count: _builtins.int
+    """Number of occurrences, 0 for infinite"""
+    created_by: _builtins.str
+    """Metadata"""
+    color: _builtins.str
+    """Optional fields"""
+    timezone: _builtins.str
+    reminder_enabled: _builtins.bool
+    """Reminder e-mailed to the household members before every occurrence"""
+    reminder_minutes_before: _builtins.int
+    @_builtins.property
+    def start_time(self) -> _timestamp_pb2.Timestamp:
+        """Timing"""
+
+    @_builtins.property
+    def end_time(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def recurrence_end_date(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def recurrence_by_weekday(self) -> _containers.RepeatedScalarFieldContainer[_builtins.int]:
+        """0=Sunday, 1=Monday, etc."""
+
+    @_builtins.property
+    def created_at(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def updated_at(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def tags(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    @_builtins.property
+    def attendees(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """User IDs"""
+
+    @_builtins.property
+    def original_start_time(self) -> _timestamp_pb2.Timestamp:
+        """Start of the instance as generated by the recurrence rule; only set on
+        occurrences returned by range queries
+        """
+
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        household_id: _builtins.str = ...,
+        title: _builtins.str = ...,
+        description: _builtins.str = ...,
+        type: Global___EventType.ValueType = ...,
+        status: Global___EventStatus.ValueType = ...,
+        start_time: _timestamp_pb2.Timestamp | None = ...,
+        end_time: _timestamp_pb2.Timestamp | None = ...,
+        is_all_day: _builtins.bool = ...,
+        location: _builtins.str = ...,
+        is_recurring: _builtins.bool = ...,
+        recurrence_frequency: Global___RecurrenceFrequency.ValueType = ...,
+        recurrence_interval: _builtins.int = ...,
+        recurrence_count: _builtins.int = ...,
+        recurrence_end_date: _timestamp_pb2.Timestamp | None = ...,
+        recurrence_by_weekday: _abc.Iterable[_builtins.int] | None = ...,
+        created_by: _builtins.str = ...,
+        created_at: _timestamp_pb2.Timestamp | None = ...,
+        updated_at: _timestamp_pb2.Timestamp | None = ...,
+        color: _builtins.str = ...,
+        tags: _abc.Iterable[_builtins.str] | None = ...,
+        attendees: _abc.Iterable[_builtins.str] | None = ...,
+        timezone: _builtins.str = ...,
+        original_start_time: _timestamp_pb2.Timestamp | None = ...,
+        reminder_enabled: _builtins.bool = ...,
+        reminder_minutes_before: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["created_at", b"created_at", "end_time", b"end_time", "original_start_time", b"original_start_time", "recurrence_end_date", b"recurrence_end_date", "start_time", b"start_time", "updated_at", b"updated_at"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["attendees", b"attendees", "color", b"color", "created_at", b"created_at", "created_by", b"created_by", "description", b"description", "end_time", b"end_time", "household_id", b"household_id", "id", b"id", "is_all_day", b"is_all_day", "is_recurring", b"is_recurring", "location", b"location", "original_start_time", b"original_start_time", "recurrence_by_weekday", b"recurrence_by_weekday", "recurrence_count", b"recurrence_count", "recurrence_end_date", b"recurrence_end_date", "recurrence_frequency", b"recurrence_frequency", "recurrence_interval", b"recurrence_interval", "reminder_enabled", b"reminder_enabled", "reminder_minutes_before", b"reminder_minutes_before", "start_time", b"start_time", "status", b"status", "tags", b"tags", "timezone", b"timezone", "title", b"title", "type", b"type", "updated_at", b"updated_at"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___Event: _TypeAlias = Event  # noqa: Y015
+
+@_typing.final
+class EventCreate(_message.Message):
+    """EventCreate represents the data needed to create a new event."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    HOUSEHOLD_ID_FIELD_NUMBER: _builtins.int
+    TITLE_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    START_TIME_FIELD_NUMBER: _builtins.int
+    END_TIME_FIELD_NUMBER: _builtins.int
+    IS_ALL_DAY_FIELD_NUMBER: _builtins.int
+    LOCATION_FIELD_NUMBER: _builtins.int
+    IS_RECURRING_FIELD_NUMBER: _builtins.int
+    RECURRENCE_FREQUENCY_FIELD_NUMBER: _builtins.int
+    RECURRENCE_INTERVAL_FIELD_NUMBER: _builtins.int
+    RECURRENCE_COUNT_FIELD_NUMBER: _builtins.int
+    RECURRENCE_END_DATE_FIELD_NUMBER: _builtins.int
+    RECURRENCE_BY_WEEKDAY_FIELD_NUMBER: _builtins.int
+    COLOR_FIELD_NUMBER: _builtins.int
+    TAGS_FIELD_NUMBER: _builtins.int
+    ATTENDEE_EMAILS_FIELD_NUMBER: _builtins.int
+    TIMEZONE_FIELD_NUMBER: _builtins.int
+    REMINDER_ENABLED_FIELD_NUMBER: _builtins.int
+    REMINDER_MINUTES_BEFORE_FIELD_NUMBER: _builtins.int
+    CHECK_CONFLICTS_FIELD_NUMBER: _builtins.int
+    household_id: _builtins.str
+    title: _builtins.str
+    description: _builtins.str
+    type: Global___EventType.ValueType
+    is_all_day: _builtins.bool
+    location: _builtins.str
+    is_recurring: _builtins.bool
+    """Recurrence"""
+    recurrence_frequency: Global___RecurrenceFrequency.ValueType
+    recurrence_interval: _builtins.int
+    recurrence_count: _builtins.int
+    color: _builtins.str
+    """Optional fields"""
+    timezone: _builtins.str
+    reminder_enabled: _builtins.bool
+    """Reminder; defaults to 24 hours before each occurrence when enabled"""
+    reminder_minutes_before: _builtins.int
+    check_conflicts: _builtins.bool
+    """Report existing events of the creator and attendees that overlap"""
+    @_builtins.property
+    def start_time(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def end_time(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def recurrence_end_date(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def recurrence_by_weekday(self) -> _containers.RepeatedScalarFieldContainer[_builtins.int]: ...
+    @_builtins.property
+    def tags(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    @_builtins.property
+    def attendee_emails(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        household_id: _builtins.str = ...,
+        title: _builtins.str = ...,
+        description: _builtins.str = ...,
+        type: Global___EventType.ValueType = ...,
+        start_time: _timestamp_pb2.Timestamp | None = ...,
+        end_time: _timestamp_pb2.Timestamp | None = ...,
+        is_all_day: _builtins.bool = ...,
+        location: _builtins.str = ...,
+        is_recurring: _builtins.bool = ...,
+        recurrence_frequency: Global___RecurrenceFrequency.ValueType = ...,
+        recurrence_interval: _builtins.int = ...,
+        recurrence_count: _builtins.int = ...,
+        recurrence_end_date: _timestamp_pb2.Timestamp | None = ...,
+        recurrence_by_weekday: _abc.Iterable[_builtins.int] | None = ...,
+        color: _builtins.str = ...,
+        tags: _abc.Iterable[_builtins.str] | None = ...,
+        attendee_emails: _abc.Iterable[_builtins.str] | None = ...,
+        timezone: _builtins.str = ...,
+        reminder_enabled: _builtins.bool = ...,
+        reminder_minutes_before: _builtins.int = ...,
+        check_conflicts: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["end_time", b"end_time", "recurrence_end_date", b"recurrence_end_date", "start_time", b"start_time"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["attendee_emails", b"attendee_emails", "check_conflicts", b"check_conflicts", "color", b"color", "description", b"description", "end_time", b"end_time", "household_id", b"household_id", "is_all_day", b"is_all_day", "is_recurring", b"is_recurring", "location", b"location", "recurrence_by_weekday", b"recurrence_by_weekday", "recurrence_count", b"recurrence_count", "recurrence_end_date", b"recurrence_end_date", "recurrence_frequency", b"recurrence_frequency", "recurrence_interval", b"recurrence_interval", "reminder_enabled", b"reminder_enabled", "reminder_minutes_before", b"reminder_minutes_before", "start_time", b"start_time", "tags", b"tags", "timezone", b"timezone", "title", b"title", "type", b"type"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EventCreate: _TypeAlias = EventCreate  # noqa: Y015
+
+@_typing.final
+class EventUpdate(_message.Message):
+    """EventUpdate represents the data that can be updated for an event."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    TITLE_FIELD_NUMBER: _builtins.int
+    DESCRIPTION_FIELD_NUMBER: _builtins.int
+    TYPE_FIELD_NUMBER: _builtins.int
+    START_TIME_FIELD_NUMBER: _builtins.int
+    END_TIME_FIELD_NUMBER: _builtins.int
+    IS_ALL_DAY_FIELD_NUMBER: _builtins.int
+    LOCATION_FIELD_NUMBER: _builtins.int
+    STATUS_FIELD_NUMBER: _builtins.int
+    IS_RECURRING_FIELD_NUMBER: _builtins.int
+    RECURRENCE_FREQUENCY_FIELD_NUMBER: _builtins.int
+    RECURRENCE_INTERVAL_FIELD_NUMBER: _builtins.int
+    RECURRENCE_COUNT_FIELD_NUMBER: _builtins.int
+    RECURRENCE_END_DATE_FIELD_NUMBER: _builtins.int
+    RECURRENCE_BY_WEEKDAY_FIELD_NUMBER: _builtins.int
+    COLOR_FIELD_NUMBER: _builtins.int
+    TAGS_FIELD_NUMBER: _builtins.int
+    ATTENDEE_EMAILS_FIELD_NUMBER: _builtins.int
+    TIMEZONE_FIELD_NUMBER: _builtins.int
+    UPDATE_ALL_OCCURRENCES_FIELD_NUMBER: _builtins.int
+    UPDATE_FUTURE_OCCURRENCES_FIELD_NUMBER: _builtins.int
+    OCCURRENCE_START_TIME_FIELD_NUMBER: _builtins.int
+    REMINDER_ENABLED_FIELD_NUMBER: _builtins.int
+    REMINDER_MINUTES_BEFORE_FIELD_NUMBER: _builtins.int
+    CHECK_CONFLICTS_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    title: _builtins.str
+    description: _builtins.str
+    type: Global___EventType.ValueType
+    is_all_day: _builtins.bool
+    location: _builtins.str
+    status: Global___EventStatus.ValueType
+    is_recurring: _builtins.bool
+    recurrence_frequency: Global___RecurrenceFrequency.ValueType
+    """Recurrence"""
+    recurrence_interval: _builtins.int
+    recurrence_count: _builtins.int
+    color: _builtins.str
+    """Optional fields"""
+    timezone: _builtins.str
+    update_all_occurrences: _builtins.bool
+    """Update scope for recurring events"""
+    update_future_occurrences: _builtins.bool
+    reminder_enabled: _builtins.bool
+    """Reminder settings; always apply to the whole series"""
+    reminder_minutes_before: _builtins.int
+    check_conflicts: _builtins.bool
+    """Report existing events of the creator and attendees that overlap"""
+    @_builtins.property
+    def start_time(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def end_time(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def recurrence_end_date(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def recurrence_by_weekday(self) -> _containers.RepeatedScalarFieldContainer[_builtins.int]:
+        """Replaces all weekdays"""
+
+    @_builtins.property
+    def tags(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """Replaces all tags"""
+
+    @_builtins.property
+    def attendee_emails(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """Replaces all attendees"""
+
+    @_builtins.property
+    def occurrence_start_time(self) -> _timestamp_pb2.Timestamp:
+        """Original start of the occurrence to update, for single and future scopes"""
+
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        title: _builtins.str | None = ...,
+        description: _builtins.str | None = ...,
+        type: Global___EventType.ValueType | None = ...,
+        start_time: _timestamp_pb2.Timestamp | None = ...,
+        end_time: _timestamp_pb2.Timestamp | None = ...,
+        is_all_day: _builtins.bool | None = ...,
+        location: _builtins.str | None = ...,
+        status: Global___EventStatus.ValueType | None = ...,
+        is_recurring: _builtins.bool | None = ...,
+        recurrence_frequency: Global___RecurrenceFrequency.ValueType | None = ...,
+        recurrence_interval: _builtins.int | None = ...,
+        recurrence_count: _builtins.int | None = ...,
+        recurrence_end_date: _timestamp_pb2.Timestamp | None = ...,
+        recurrence_by_weekday: _abc.Iterable[_builtins.int] | None = ...,
+        color: _builtins.str | None = ...,
+        tags: _abc.Iterable[_builtins.str] | None = ...,
+        attendee_emails: _abc.Iterable[_builtins.str] | None = ...,
+        timezone: _builtins.str | None = ...,
+        update_all_occurrences: _builtins.bool = ...,
+        update_future_occurrences: _builtins.bool = ...,
+        occurrence_start_time: _timestamp_pb2.Timestamp | None = ...,
+        reminder_enabled: _builtins.bool | None = ...,
+        reminder_minutes_before: _builtins.int | None = ...,
+        check_conflicts: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_color", b"_color", "_description", b"_description", "_end_time", b"_end_time", "_is_all_day", b"_is_all_day", "_is_recurring", b"_is_recurring", "_location", b"_location", "_occurrence_start_time", b"_occurrence_start_time", "_recurrence_count", b"_recurrence_count", "_recurrence_end_date", b"_recurrence_end_date", "_recurrence_frequency", b"_recurrence_frequency", "_recurrence_interval", b"_recurrence_interval", "_reminder_enabled", b"_reminder_enabled", "_reminder_minutes_before", b"_reminder_minutes_before", "_start_time", b"_start_time", "_status", b"_status", "_timezone", b"_timezone", "_title", b"_title", "_type", b"_type", "color", b"color", "description", b"description", "end_time", b"end_time", "is_all_day", b"is_all_day", "is_recurring", b"is_recurring", "location", b"location", "occurrence_start_time", b"occurrence_start_time", "recurrence_count", b"recurrence_count", "recurrence_end_date", b"recurrence_end_date", "recurrence_frequency", b"recurrence_frequency", "recurrence_interval", b"recurrence_interval", "reminder_enabled", b"reminder_enabled", "reminder_minutes_before", b"reminder_minutes_before", "start_time", b"start_time", "status", b"status", "timezone", b"timezone", "title", b"title", "type", b"type"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_color", b"_color", "_description", b"_description", "_end_time", b"_end_time", "_is_all_day", b"_is_all_day", "_is_recurring", b"_is_recurring", "_location", b"_location", "_occurrence_start_time", b"_occurrence_start_time", "_recurrence_count", b"_recurrence_count", "_recurrence_end_date", b"_recurrence_end_date", "_recurrence_frequency", b"_recurrence_frequency", "_recurrence_interval", b"_recurrence_interval", "_reminder_enabled", b"_reminder_enabled", "_reminder_minutes_before", b"_reminder_minutes_before", "_start_time", b"_start_time", "_status", b"_status", "_timezone", b"_timezone", "_title", b"_title", "_type", b"_type", "attendee_emails", b"attendee_emails", "check_conflicts", b"check_conflicts", "color", b"color", "description", b"description", "end_time", b"end_time", "id", b"id", "is_all_day", b"is_all_day", "is_recurring", b"is_recurring", "location", b"location", "occurrence_start_time", b"occurrence_start_time", "recurrence_by_weekday", b"recurrence_by_weekday", "recurrence_count", b"recurrence_count", "recurrence_end_date", b"recurrence_end_date", "recurrence_frequency", b"recurrence_frequency", "recurrence_interval", b"recurrence_interval", "reminder_enabled", b"reminder_enabled", "reminder_minutes_before", b"reminder_minutes_before", "start_time", b"start_time", "status", b"status", "tags", b"tags", "timezone", b"timezone", "title", b"title", "type", b"type", "update_all_occurrences", b"update_all_occurrences", "update_future_occurrences", b"update_future_occurrences"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__color: _TypeAlias = _typing.Literal["color"]  # noqa: Y015
+    _WhichOneofArgType__color: _TypeAlias = _typing.Literal["_color", b"_color"]  # noqa: Y015
+    _WhichOneofReturnType__description: _TypeAlias = _typing.Literal["description"]  # noqa: Y015
+    _WhichOneofArgType__description: _TypeAlias = _typing.Literal["_description", b"_description"]  # noqa: Y015
+    _WhichOneofReturnType__end_time: _TypeAlias = _typing.Literal["end_time"]  # noqa: Y015
+    _WhichOneofArgType__end_time: _TypeAlias = _typing.Literal["_end_time", b"_end_time"]  # noqa: Y015
+    _WhichOneofReturnType__is_all_day: _TypeAlias = _typing.Literal["is_all_day"]  # noqa: Y015
+    _WhichOneofArgType__is_all_day: _TypeAlias = _typing.Literal["_is_all_day", b"_is_all_day"]  # noqa: Y015
+    _WhichOneofReturnType__is_recurring: _TypeAlias = _typing.Literal["is_recurring"]  # noqa: Y015
+    _WhichOneofArgType__is_recurring: _TypeAlias = _typing.Literal["_is_recurring", b"_is_recurring"]  # noqa: Y015
+    _WhichOneofReturnType__location: _TypeAlias = _typing.Literal["location"]  # noqa: Y015
+    _WhichOneofArgType__location: _TypeAlias = _typing.Literal["_location", b"_location"]  # noqa: Y015
+    _WhichOneofReturnType__occurrence_start_time: _TypeAlias = _typing.Literal["occurrence_start_time"]  # noqa: Y015
+    _WhichOneofArgType__occurrence_start_time: _TypeAlias = _typing.Literal["_occurrence_start_time", b"_occurrence_start_time"]  # noqa: Y015
+    _WhichOneofReturnType__recurrence_count: _TypeAlias = _typing.Literal["recurrence_count"]  # noqa: Y015
+    _WhichOneofArgType__recurrence_count: _TypeAlias = _typing.Literal["_recurrence_count", b"_recurrence_count"]  # noqa: Y015
+    _WhichOneofReturnType__recurrence_end_date: _TypeAlias = _typing.Literal["recurrence_end_date"]  # noqa: Y015
+    _WhichOneofArgType__recurrence_end_date: _TypeAlias = _typing.Literal["_recurrence_end_date", b"_recurrence_end_date"]  # noqa: Y015
+    _WhichOneofReturnType__recurrence_frequency: _TypeAlias = _typing.Literal["recurrence_frequency"]  # noqa: Y015
+    _WhichOneofArgType__recurrence_frequency: _TypeAlias = _typing.Literal["_recurrence_frequency", b"_recurrence_frequency"]  # noqa: Y015
+    _WhichOneofReturnType__recurrence_interval: _TypeAlias = _typing.Literal["recurrence_interval"]  # noqa: Y015
+    _WhichOneofArgType__recurrence_interval: _TypeAlias = _typing.Literal["_recurrence_interval", b"_recurrence_interval"]  # noqa: Y015
+    _WhichOneofReturnType__reminder_enabled: _TypeAlias = _typing.Literal["reminder_enabled"]  # noqa: Y015
+    _WhichOneofArgType__reminder_enabled: _TypeAlias = _typing.Literal["_reminder_enabled", b"_reminder_enabled"]  # noqa: Y015
+    _WhichOneofReturnType__reminder_minutes_before: _TypeAlias = _typing.Literal["reminder_minutes_before"]  # noqa: Y015
+    _WhichOneofArgType__reminder_minutes_before: _TypeAlias = _typing.Literal["_reminder_minutes_before", b"_reminder_minutes_before"]  # noqa: Y015
+    _WhichOneofReturnType__start_time: _TypeAlias = _typing.Literal["start_time"]  # noqa: Y015
+    _WhichOneofArgType__start_time: _TypeAlias = _typing.Literal["_start_time", b"_start_time"]  # noqa: Y015
+    _WhichOneofReturnType__status: _TypeAlias = _typing.Literal["status"]  # noqa: Y015
+    _WhichOneofArgType__status: _TypeAlias = _typing.Literal["_status", b"_status"]  # noqa: Y015
+    _WhichOneofReturnType__timezone: _TypeAlias = _typing.Literal["timezone"]  # noqa: Y015
+    _WhichOneofArgType__timezone: _TypeAlias = _typing.Literal["_timezone", b"_timezone"]  # noqa: Y015
+    _WhichOneofReturnType__title: _TypeAlias = _typing.Literal["title"]  # noqa: Y015
+    _WhichOneofArgType__title: _TypeAlias = _typing.Literal["_title", b"_title"]  # noqa: Y015
+    _WhichOneofReturnType__type: _TypeAlias = _typing.Literal["type"]  # noqa: Y015
+    _WhichOneofArgType__type: _TypeAlias = _typing.Literal["_type", b"_type"]  # noqa: Y015
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__color) -> _WhichOneofReturnType__color | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__description) -> _WhichOneofReturnType__description | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__end_time) -> _WhichOneofReturnType__end_time | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__is_all_day) -> _WhichOneofReturnType__is_all_day | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__is_recurring) -> _WhichOneofReturnType__is_recurring | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__location) -> _WhichOneofReturnType__location | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__occurrence_start_time) -> _WhichOneofReturnType__occurrence_start_time | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__recurrence_count) -> _WhichOneofReturnType__recurrence_count | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__recurrence_end_date) -> _WhichOneofReturnType__recurrence_end_date | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__recurrence_frequency) -> _WhichOneofReturnType__recurrence_frequency | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__recurrence_interval) -> _WhichOneofReturnType__recurrence_interval | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__reminder_enabled) -> _WhichOneofReturnType__reminder_enabled | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__reminder_minutes_before) -> _WhichOneofReturnType__reminder_minutes_before | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__start_time) -> _WhichOneofReturnType__start_time | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__status) -> _WhichOneofReturnType__status | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__timezone) -> _WhichOneofReturnType__timezone | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__title) -> _WhichOneofReturnType__title | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__type) -> _WhichOneofReturnType__type | None: ...
+
+Global___EventUpdate: _TypeAlias = EventUpdate  # noqa: Y015
+
+@_typing.final
+class EventResponse(_message.Message):
+    """EventResponse is the response containing a single event."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    EVENT_FIELD_NUMBER: _builtins.int
+    CONFLICTS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def event(self) -> Global___Event: ...
+    @_builtins.property
+    def conflicts(self) -> _containers.RepeatedCompositeFieldContainer[Global___EventConflict]:
+        """Only set when requested"""
+
+    def __init__(
+        self,
+        *,
+        event: Global___Event | None = ...,
+        conflicts: _abc.Iterable[Global___EventConflict] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["event", b"event"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["conflicts", b"conflicts", "event", b"event"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EventResponse: _TypeAlias = EventResponse  # noqa: Y015
+
+@_typing.final
+class EventConflict(_message.Message):
+    """EventConflict is an existing occurrence overlapping the written event."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    EVENT_FIELD_NUMBER: _builtins.int
+    OCCURRENCE_START_TIME_FIELD_NUMBER: _builtins.int
+    USER_IDS_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def event(self) -> Global___Event:
+        """The existing occurrence"""
+
+    @_builtins.property
+    def occurrence_start_time(self) -> _timestamp_pb2.Timestamp:
+        """Start of the overlapping occurrence of the written event"""
+
+    @_builtins.property
+    def user_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """Members taking part in both"""
+
+    def __init__(
+        self,
+        *,
+        event: Global___Event | None = ...,
+        occurrence_start_time: _timestamp_pb2.Timestamp | None = ...,
+        user_ids: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["event", b"event", "occurrence_start_time", b"occurrence_start_time"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["event", b"event", "occurrence_start_time", b"occurrence_start_time", "user_ids", b"user_ids"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EventConflict: _TypeAlias = EventConflict  # noqa: Y015
+
+@_typing.final
+class EventListResponse(_message.Message):
+    """EventListResponse is the response containing a list of events."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    EVENTS_FIELD_NUMBER: _builtins.int
+    TOTAL_FIELD_NUMBER: _builtins.int
+    total: _builtins.int
+    @_builtins.property
+    def events(self) -> _containers.RepeatedCompositeFieldContainer[Global___Event]: ...
+    def __init__(
+        self,
+        *,
+        events: _abc.Iterable[Global___Event] | None = ...,
+        total: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["events", b"events", "total", b"total"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EventListResponse: _TypeAlias = EventListResponse  # noqa: Y015
+
+@_typing.final
+class EventFilter(_message.Message):
+    """EventFilter is used to filter events."""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    HOUSEHOLD_ID_FIELD_NUMBER: _builtins.int
+    START_DATE_FIELD_NUMBER: _builtins.int
+    END_DATE_FIELD_NUMBER: _builtins.int
+    TYPES_FIELD_NUMBER: _builtins.int
+    CREATED_BY_FIELD_NUMBER: _builtins.int
+    TAGS_FIELD_NUMBER: _builtins.int
+    INCLUDE_RECURRING_FIELD_NUMBER: _builtins.int
+    PAGE_FIELD_NUMBER: _builtins.int
+    PAGE_SIZE_FIELD_NUMBER: _builtins.int
+    household_id: _builtins.str
+    include_recurring: _builtins.bool
+    page: _builtins.int
+    page_size: _builtins.int
+    @_builtins.property
+    def start_date(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def end_date(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def types(self) -> _containers.RepeatedScalarFieldContainer[Global___EventType.ValueType]: ...
+    @_builtins.property
+    def created_by(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    @_builtins.property
+    def tags(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        household_id: _builtins.str = ...,
+        start_date: _timestamp_pb2.Timestamp | None = ...,
+        end_date: _timestamp_pb2.Timestamp | None = ...,
+        types: _abc.Iterable[Global___EventType.ValueType] | None = ...,
+        created_by: _abc.Iterable[_builtins.str] | None = ...,
+        tags: _abc.Iterable[_builtins.str] | None = ...,
+        include_recurring: _builtins.bool = ...,
+        page: _builtins.int = ...,
+        page_size: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_end_date", b"_end_date", "_start_date", b"_start_date", "end_date", b"end_date", "start_date", b"start_date"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_end_date", b"_end_date", "_start_date", b"_start_date", "created_by", b"created_by", "end_date", b"end_date", "household_id", b"household_id", "include_recurring", b"include_recurring", "page", b"page", "page_size", b"page_size", "start_date", b"start_date", "tags", b"tags", "types", b"types"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__end_date: _TypeAlias = _typing.Literal["end_date"]  # noqa: Y015
+    _WhichOneofArgType__end_date: _TypeAlias = _typing.Literal["_end_date", b"_end_date"]  # noqa: Y015
+    _WhichOneofReturnType__start_date: _TypeAlias = _typing.Literal["start_date"]  # noqa: Y015
+    _WhichOneofArgType__start_date: _TypeAlias = _typing.Literal["_start_date", b"_start_date"]  # noqa: Y015
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__end_date) -> _WhichOneofReturnType__end_date | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__start_date) -> _WhichOneofReturnType__start_date | None: ...
+
+Global___EventFilter: _TypeAlias = EventFilter  # noqa: Y015
+
+@_typing.final
+class IdRequest(_message.Message):
+    """Common request/response messages"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["id", b"id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___IdRequest: _TypeAlias = IdRequest  # noqa: Y015
+
+@_typing.final
+class DeleteEventRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    ID_FIELD_NUMBER: _builtins.int
+    DELETE_ALL_OCCURRENCES_FIELD_NUMBER: _builtins.int
+    DELETE_FUTURE_OCCURRENCES_FIELD_NUMBER: _builtins.int
+    OCCURRENCE_START_TIME_FIELD_NUMBER: _builtins.int
+    id: _builtins.str
+    delete_all_occurrences: _builtins.bool
+    delete_future_occurrences: _builtins.bool
+    @_builtins.property
+    def occurrence_start_time(self) -> _timestamp_pb2.Timestamp:
+        """Original start of the occurrence to delete, for single and future scopes"""
+
+    def __init__(
+        self,
+        *,
+        id: _builtins.str = ...,
+        delete_all_occurrences: _builtins.bool = ...,
+        delete_future_occurrences: _builtins.bool = ...,
+        occurrence_start_time: _timestamp_pb2.Timestamp | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_occurrence_start_time", b"_occurrence_start_time", "occurrence_start_time", b"occurrence_start_time"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_occurrence_start_time", b"_occurrence_start_time", "delete_all_occurrences", b"delete_all_occurrences", "delete_future_occurrences", b"delete_future_occurrences", "id", b"id", "occurrence_start_time", b"occurrence_start_time"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__occurrence_start_time: _TypeAlias = _typing.Literal["occurrence_start_time"]  # noqa: Y015
+    _WhichOneofArgType__occurrence_start_time: _TypeAlias = _typing.Literal["_occurrence_start_time", b"_occurrence_start_time"]  # noqa: Y015
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__occurrence_start_time) -> _WhichOneofReturnType__occurrence_start_time | None: ...
+
+Global___DeleteEventRequest: _TypeAlias = DeleteEventRequest  # noqa: Y015
+
+@_typing.final
+class EventsInRangeRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    HOUSEHOLD_ID_FIELD_NUMBER: _builtins.int
+    START_DATE_FIELD_NUMBER: _builtins.int
+    END_DATE_FIELD_NUMBER: _builtins.int
+    INCLUDE_RECURRING_FIELD_NUMBER: _builtins.int
+    household_id: _builtins.str
+    include_recurring: _builtins.bool
+    @_builtins.property
+    def start_date(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def end_date(self) -> _timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        household_id: _builtins.str = ...,
+        start_date: _timestamp_pb2.Timestamp | None = ...,
+        end_date: _timestamp_pb2.Timestamp | None = ...,
+        include_recurring: _builtins.bool = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["end_date", b"end_date", "start_date", b"start_date"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["end_date", b"end_date", "household_id", b"household_id", "include_recurring", b"include_recurring", "start_date", b"start_date"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___EventsInRangeRequest: _TypeAlias = EventsInRangeRequest  # noqa: Y015
+
+@_typing.final
+class UpcomingEventsRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    HOUSEHOLD_ID_FIELD_NUMBER: _builtins.int
+    DAYS_AHEAD_FIELD_NUMBER: _builtins.int
+    LIMIT_FIELD_NUMBER: _builtins.int
+    household_id: _builtins.str
+    days_ahead: _builtins.int
+    """Number of days to look ahead"""
+    limit: _builtins.int
+    """Maximum number of events to return"""
+    def __init__(
+        self,
+        *,
+        household_id: _builtins.str = ...,
+        days_ahead: _builtins.int = ...,
+        limit: _builtins.int = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["days_ahead", b"days_ahead", "household_id", b"household_id", "limit", b"limit"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___UpcomingEventsRequest: _TypeAlias = UpcomingEventsRequest  # noqa: Y015
+
+@_typing.final
+class ShareEventRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    EVENT_ID_FIELD_NUMBER: _builtins.int
+    USER_EMAILS_FIELD_NUMBER: _builtins.int
+    MESSAGE_FIELD_NUMBER: _builtins.int
+    event_id: _builtins.str
+    message: _builtins.str
+    @_builtins.property
+    def user_emails(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        event_id: _builtins.str = ...,
+        user_emails: _abc.Iterable[_builtins.str] | None = ...,
+        message: _builtins.str = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["event_id", b"event_id", "message", b"message", "user_emails", b"user_emails"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ShareEventRequest: _TypeAlias = ShareEventRequest  # noqa: Y015
+
+@_typing.final
+class ShareEventResponse(_message.Message):
+    """Response messages for calendar operations"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    EVENT_ID_FIELD_NUMBER: _builtins.int
+    SHARED_WITH_COUNT_FIELD_NUMBER: _builtins.int
+    FAILED_EMAILS_FIELD_NUMBER: _builtins.int
+    event_id: _builtins.str
+    shared_with_count: _builtins.int
+    @_builtins.property
+    def failed_emails(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]: ...
+    def __init__(
+        self,
+        *,
+        event_id: _builtins.str = ...,
+        shared_with_count: _builtins.int = ...,
+        failed_emails: _abc.Iterable[_builtins.str] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["event_id", b"event_id", "failed_emails", b"failed_emails", "shared_with_count", b"shared_with_count"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___ShareEventResponse: _TypeAlias = ShareEventResponse  # noqa: Y015
+
+@_typing.final
+class FreeBusyRequest(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    HOUSEHOLD_ID_FIELD_NUMBER: _builtins.int
+    WEEK_START_FIELD_NUMBER: _builtins.int
+    WEEKS_FIELD_NUMBER: _builtins.int
+    USER_IDS_FIELD_NUMBER: _builtins.int
+    DURATION_MINUTES_FIELD_NUMBER: _builtins.int
+    MAX_SUGGESTIONS_FIELD_NUMBER: _builtins.int
+    DAY_START_HOUR_FIELD_NUMBER: _builtins.int
+    DAY_END_HOUR_FIELD_NUMBER: _builtins.int
+    household_id: _builtins.str
+    weeks: _builtins.int
+    """Defaults to 1"""
+    duration_minutes: _builtins.int
+    """Common free slots to suggest; none when duration_minutes is 0"""
+    max_suggestions: _builtins.int
+    day_start_hour: _builtins.int
+    """Earliest hour of a suggested slot"""
+    day_end_hour: _builtins.int
+    """Hour by which a suggested slot ends"""
+    @_builtins.property
+    def week_start(self) -> _timestamp_pb2.Timestamp:
+        """Rounded down to Monday 00:00"""
+
+    @_builtins.property
+    def user_ids(self) -> _containers.RepeatedScalarFieldContainer[_builtins.str]:
+        """Defaults to all members"""
+
+    def __init__(
+        self,
+        *,
+        household_id: _builtins.str = ...,
+        week_start: _timestamp_pb2.Timestamp | None = ...,
+        weeks: _builtins.int = ...,
+        user_ids: _abc.Iterable[_builtins.str] | None = ...,
+        duration_minutes: _builtins.int = ...,
+        max_suggestions: _builtins.int = ...,
+        day_start_hour: _builtins.int | None = ...,
+        day_end_hour: _builtins.int | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["_day_end_hour", b"_day_end_hour", "_day_start_hour", b"_day_start_hour", "day_end_hour", b"day_end_hour", "day_start_hour", b"day_start_hour", "week_start", b"week_start"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["_day_end_hour", b"_day_end_hour", "_day_start_hour", b"_day_start_hour", "day_end_hour", b"day_end_hour", "day_start_hour", b"day_start_hour", "duration_minutes", b"duration_minutes", "household_id", b"household_id", "max_suggestions", b"max_suggestions", "user_ids", b"user_ids", "week_start", b"week_start", "weeks", b"weeks"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    _WhichOneofReturnType__day_end_hour: _TypeAlias = _typing.Literal["day_end_hour"]  # noqa: Y015
+    _WhichOneofArgType__day_end_hour: _TypeAlias = _typing.Literal["_day_end_hour", b"_day_end_hour"]  # noqa: Y015
+    _WhichOneofReturnType__day_start_hour: _TypeAlias = _typing.Literal["day_start_hour"]  # noqa: Y015
+    _WhichOneofArgType__day_start_hour: _TypeAlias = _typing.Literal["_day_start_hour", b"_day_start_hour"]  # noqa: Y015
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__day_end_hour) -> _WhichOneofReturnType__day_end_hour | None: ...
+    @_typing.overload
+    def WhichOneof(self, oneof_group: _WhichOneofArgType__day_start_hour) -> _WhichOneofReturnType__day_start_hour | None: ...
+
+Global___FreeBusyRequest: _TypeAlias = FreeBusyRequest  # noqa: Y015
+
+@_typing.final
+class MemberBusy(_message.Message):
+    """Busy slots of one member; bit i of the little-endian bytes is slot i"""
+
+    DESCRIPTOR: _descriptor.Descriptor
+
+    USER_ID_FIELD_NUMBER: _builtins.int
+    BUSY_FIELD_NUMBER: _builtins.int
+    user_id: _builtins.str
+    busy: _builtins.bytes
+    def __init__(
+        self,
+        *,
+        user_id: _builtins.str = ...,
+        busy: _builtins.bytes = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _Never  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["busy", b"busy", "user_id", b"user_id"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___MemberBusy: _TypeAlias = MemberBusy  # noqa: Y015
+
+@_typing.final
+class TimeSlot(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    START_TIME_FIELD_NUMBER: _builtins.int
+    END_TIME_FIELD_NUMBER: _builtins.int
+    @_builtins.property
+    def start_time(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def end_time(self) -> _timestamp_pb2.Timestamp: ...
+    def __init__(
+        self,
+        *,
+        start_time: _timestamp_pb2.Timestamp | None = ...,
+        end_time: _timestamp_pb2.Timestamp | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["end_time", b"end_time", "start_time", b"start_time"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["end_time", b"end_time", "start_time", b"start_time"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___TimeSlot: _TypeAlias = TimeSlot  # noqa: Y015
+
+@_typing.final
+class FreeBusyResponse(_message.Message):
+    DESCRIPTOR: _descriptor.Descriptor
+
+    WEEK_START_FIELD_NUMBER: _builtins.int
+    SLOT_MINUTES_FIELD_NUMBER: _builtins.int
+    SLOT_COUNT_FIELD_NUMBER: _builtins.int
+    MEMBERS_FIELD_NUMBER: _builtins.int
+    SUGGESTIONS_FIELD_NUMBER: _builtins.int
+    slot_minutes: _builtins.int
+    slot_count: _builtins.int
+    @_builtins.property
+    def week_start(self) -> _timestamp_pb2.Timestamp: ...
+    @_builtins.property
+    def members(self) -> _containers.RepeatedCompositeFieldContainer[Global___MemberBusy]: ...
+    @_builtins.property
+    def suggestions(self) -> _containers.RepeatedCompositeFieldContainer[Global___TimeSlot]: ...
+    def __init__(
+        self,
+        *,
+        week_start: _timestamp_pb2.Timestamp | None = ...,
+        slot_minutes: _builtins.int = ...,
+        slot_count: _builtins.int = ...,
+        members: _abc.Iterable[Global___MemberBusy] | None = ...,
+        suggestions: _abc.Iterable[Global___TimeSlot] | None = ...,
+    ) -> None: ...
+    _HasFieldArgType: _TypeAlias = _typing.Literal["week_start", b"week_start"]  # noqa: Y015
+    def HasField(self, field_name: _HasFieldArgType) -> _builtins.bool: ...
+    _ClearFieldArgType: _TypeAlias = _typing.Literal["members", b"members", "slot_count", b"slot_count", "slot_minutes", b"slot_minutes", "suggestions", b"suggestions", "week_start", b"week_start"]  # noqa: Y015
+    def ClearField(self, field_name: _ClearFieldArgType) -> None: ...
+    def WhichOneof(self, oneof_group: _Never) -> None: ...
+
+Global___FreeBusyResponse: _TypeAlias = FreeBusyResponse  # noqa: Y015
@@ -0,0 +1,454 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from api.generated.api.v1 import calendar_pb2 as api_dot_v1_dot_calendar__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in api/v1/calendar_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class CalendarServiceStub:
+    """CalendarService handles calendar and event operations.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateEvent = channel.unary_unary(
+                '/api.v1.CalendarService/CreateEvent',
+                request_serializer=api_dot_v1_dot_calendar__pb2.EventCreate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_calendar__pb2.EventResponse.FromString,
+                _registered_method=True)
+        self.GetEvent = channel.unary_unary(
+                '/api.v1.CalendarService/GetEvent',
+                request_serializer=api_dot_v1_dot_calendar__pb2.IdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_calendar__pb2.EventResponse.FromString,
+                _registered_method=True)
+        self.ListEvents = channel.unary_unary(
+                '/api.v1.CalendarService/ListEvents',
+                request_serializer=api_dot_v1_dot_calendar__pb2.EventFilter.SerializeToString,
+                response_deserializer=api_dot_v1_dot_calendar__pb2.EventListResponse.FromString,
+                _registered_method=True)
+        self.UpdateEvent = channel.unary_unary(
+                '/api.v1.CalendarService/UpdateEvent',
+                request_serializer=api_dot_v1_dot_calendar__pb2.EventUpdate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_calendar__pb2.EventResponse.FromString,
+                _registered_method=True)
+        self.DeleteEvent = channel.unary_unary(
+                '/api.v1.CalendarService/DeleteEvent',
+                request_serializer=api_dot_v1_dot_calendar__pb2.DeleteEventRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.GetEventsInRange = channel.unary_unary(
+                '/api.v1.CalendarService/GetEventsInRange',
+                request_serializer=api_dot_v1_dot_calendar__pb2.EventsInRangeRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_calendar__pb2.EventListResponse.FromString,
+                _registered_method=True)
+        self.GetUpcomingEvents = channel.unary_unary(
+                '/api.v1.CalendarService/GetUpcomingEvents',
+                request_serializer=api_dot_v1_dot_calendar__pb2.UpcomingEventsRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_calendar__pb2.EventListResponse.FromString,
+                _registered_method=True)
+        self.ShareEvent = channel.unary_unary(
+                '/api.v1.CalendarService/ShareEvent',
+                request_serializer=api_dot_v1_dot_calendar__pb2.ShareEventRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.GetFreeBusy = channel.unary_unary(
+                '/api.v1.CalendarService/GetFreeBusy',
+                request_serializer=api_dot_v1_dot_calendar__pb2.FreeBusyRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_calendar__pb2.FreeBusyResponse.FromString,
+                _registered_method=True)
+
+
+class CalendarServiceServicer:
+    """CalendarService handles calendar and event operations.
+    """
+
+    def CreateEvent(self, request, context):
+        """Create a new event.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetEvent(self, request, context):
+        """Get an event by ID.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListEvents(self, request, context):
+        """List events based on filters.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateEvent(self, request, context):
+        """Update an event.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteEvent(self, request, context):
+        """Delete an event.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetEventsInRange(self, request, context):
+        """Get events for a specific date range.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetUpcomingEvents(self, request, context):
+        """Get upcoming events.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ShareEvent(self, request, context):
+        """Share an event with other users.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetFreeBusy(self, request, context):
+        """Get the busy slots of household members and their common free slots
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_CalendarServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateEvent': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateEvent,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.EventCreate.FromString,
+                    response_serializer=api_dot_v1_dot_calendar__pb2.EventResponse.SerializeToString,
+            ),
+            'GetEvent': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetEvent,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.IdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_calendar__pb2.EventResponse.SerializeToString,
+            ),
+            'ListEvents': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListEvents,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.EventFilter.FromString,
+                    response_serializer=api_dot_v1_dot_calendar__pb2.EventListResponse.SerializeToString,
+            ),
+            'UpdateEvent': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateEvent,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.EventUpdate.FromString,
+                    response_serializer=api_dot_v1_dot_calendar__pb2.EventResponse.SerializeToString,
+            ),
+            'DeleteEvent': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteEvent,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.DeleteEventRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'GetEventsInRange': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetEventsInRange,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.EventsInRangeRequest.FromString,
+                    response_serializer=api_dot_v1_dot_calendar__pb2.EventListResponse.SerializeToString,
+            ),
+            'GetUpcomingEvents': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetUpcomingEvents,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.UpcomingEventsRequest.FromString,
+                    response_serializer=api_dot_v1_dot_calendar__pb2.EventListResponse.SerializeToString,
+            ),
+            'ShareEvent': grpc.unary_unary_rpc_method_handler(
+                    servicer.ShareEvent,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.ShareEventRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'GetFreeBusy': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetFreeBusy,
+                    request_deserializer=api_dot_v1_dot_calendar__pb2.FreeBusyRequest.FromString,
+                    response_serializer=api_dot_v1_dot_calendar__pb2.FreeBusyResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'api.v1.CalendarService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('api.v1.CalendarService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class CalendarService:
+    """CalendarService handles calendar and event operations.
+    """
+
+    @staticmethod
+    def CreateEvent(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/CreateEvent',
+            api_dot_v1_dot_calendar__pb2.EventCreate.SerializeToString,
+            api_dot_v1_dot_calendar__pb2.EventResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetEvent(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/GetEvent',
+            api_dot_v1_dot_calendar__pb2.IdRequest.SerializeToString,
+            api_dot_v1_dot_calendar__pb2.EventResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListEvents(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/ListEvents',
+            api_dot_v1_dot_calendar__pb2.EventFilter.SerializeToString,
+            api_dot_v1_dot_calendar__pb2.EventListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateEvent(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/UpdateEvent',
+            api_dot_v1_dot_calendar__pb2.EventUpdate.SerializeToString,
+            api_dot_v1_dot_calendar__pb2.EventResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteEvent(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/DeleteEvent',
+            api_dot_v1_dot_calendar__pb2.DeleteEventRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetEventsInRange(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/GetEventsInRange',
+            api_dot_v1_dot_calendar__pb2.EventsInRangeRequest.SerializeToString,
+            api_dot_v1_dot_calendar__pb2.EventListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetUpcomingEvents(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/GetUpcomingEvents',
+            api_dot_v1_dot_calendar__pb2.UpcomingEventsRequest.SerializeToString,
+            api_dot_v1_dot_calendar__pb2.EventListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ShareEvent(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/ShareEvent',
+            api_dot_v1_dot_calendar__pb2.ShareEventRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetFreeBusy(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.CalendarService/GetFreeBusy',
+            api_dot_v1_dot_calendar__pb2.FreeBusyRequest.SerializeToString,
+            api_dot_v1_dot_calendar__pb2.FreeBusyResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,155 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from api.generated.api.v1 import calendar_pb2 as _calendar_pb2
+from collections import abc as _abc
+from google.protobuf import empty_pb2 as _empty_pb2
+from grpc import aio as _aio
+import abc as _abc_1
+import grpc as _grpc
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import Self as _Self
+else:
+    from typing_extensions import Self as _Self
+
+_T = _typing.TypeVar("_T")
+
+class _MaybeAsyncIterator(_abc.AsyncIterator[_T], _abc.Iterator[_T], metaclass=_abc_1.ABCMeta): ...
+
+class _ServicerContext(_grpc.ServicerContext, _aio.ServicerContext):  # type: ignore[misc, type-arg]
+    ...
+
+GRPC_GENERATED_VERSION: str
+GRPC_VERSION: str
+
+class CalendarServiceStub:
+    """CalendarService handles calendar and event operations."""
+
+    @_typing.overload
+    def __new__(cls, channel: _grpc.Channel) -> _Self: ...
+    @_typing.overload
+    def __new__(cls, channel: _aio.Channel) -> CalendarServiceAsyncStub: ...
+    CreateEvent: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.EventCreate, _calendar_pb2.EventResponse]
+    """Create a new event."""
+    GetEvent: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.IdRequest, _calendar_pb2.EventResponse]
+    """Get an event by ID."""
+    ListEvents: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.EventFilter, _calendar_pb2.EventListResponse]
+    """List events based on filters."""
+    UpdateEvent: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.EventUpdate, _calendar_pb2.EventResponse]
+    """Update an event."""
+    DeleteEvent: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.DeleteEventRequest, _empty_pb2.Empty]
+    """Delete an event."""
+    GetEventsInRange: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.EventsInRangeRequest, _calendar_pb2.EventListResponse]
+    """Get events for a specific date range."""
+    GetUpcomingEvents: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.UpcomingEventsRequest, _calendar_pb2.EventListResponse]
+    """Get upcoming events."""
+    ShareEvent: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.ShareEventRequest, _empty_pb2.Empty]
+    """Share an event with other users."""
+    GetFreeBusy: _grpc.UnaryUnaryMultiCallable[_calendar_pb2.FreeBusyRequest, _calendar_pb2.FreeBusyResponse]
+    """Get the busy slots of household members and their common free slots"""
+
+@_typing.type_check_only
+class CalendarServiceAsyncStub(CalendarServiceStub):
+    """CalendarService handles calendar and event operations."""
+
+    def __init__(self, channel: _aio.Channel) -> None: ...
+    CreateEvent: _aio.UnaryUnaryMultiCallable[_calendar_pb2.EventCreate, _calendar_pb2.EventResponse]  # type: ignore[assignment]
+    """Create a new event."""
+    GetEvent: _aio.UnaryUnaryMultiCallable[_calendar_pb2.IdRequest, _calendar_pb2.EventResponse]  # type: ignore[assignment]
+    """Get an event by ID."""
+    ListEvents: _aio.UnaryUnaryMultiCallable[_calendar_pb2.EventFilter, _calendar_pb2.EventListResponse]  # type: ignore[assignment]
+    """List events based on filters."""
+    UpdateEvent: _aio.UnaryUnaryMultiCallable[_calendar_pb2.EventUpdate, _calendar_pb2.EventResponse]  # type: ignore[assignment]
+    """Update an event."""
+    DeleteEvent: _aio.UnaryUnaryMultiCallable[_calendar_pb2.DeleteEventRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    """Delete an event."""
+    GetEventsInRange: _aio.UnaryUnaryMultiCallable[_calendar_pb2.EventsInRangeRequest, _calendar_pb2.EventListResponse]  # type: ignore[assignment]
+    """Get events for a specific date range."""
+    GetUpcomingEvents: _aio.UnaryUnaryMultiCallable[_calendar_pb2.UpcomingEventsRequest, _calendar_pb2.EventListResponse]  # type: ignore[assignment]
+    """Get upcoming events."""
+    ShareEvent: _aio.UnaryUnaryMultiCallable[_calendar_pb2.ShareEventRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    """Share an event with other users."""
+    GetFreeBusy: _aio.UnaryUnaryMultiCallable[_calendar_pb2.FreeBusyRequest, _calendar_pb2.FreeBusyResponse]  # type: ignore[assignment]
+    """Get the busy slots of household members and their common free slots"""
+
+class CalendarServiceServicer(metaclass=_abc_1.ABCMeta):
+    """CalendarService handles calendar and event operations."""
+
+    @_abc_1.abstractmethod
+    def CreateEvent(
+        self,
+        request: _calendar_pb2.EventCreate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_calendar_pb2.EventResponse, _abc.Awaitable[_calendar_pb2.EventResponse]]:
+        """Create a new event."""
+
+    @_abc_1.abstractmethod
+    def GetEvent(
+        self,
+        request: _calendar_pb2.IdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_calendar_pb2.EventResponse, _abc.Awaitable[_calendar_pb2.EventResponse]]:
+        """Get an event by ID."""
+
+    @_abc_1.abstractmethod
+    def ListEvents(
+        self,
+        request: _calendar_pb2.EventFilter,
+        context: _ServicerContext,
+    ) -> _typing.Union[_calendar_pb2.EventListResponse, _abc.Awaitable[_calendar_pb2.EventListResponse]]:
+        """List events based on filters."""
+
+    @_abc_1.abstractmethod
+    def UpdateEvent(
+        self,
+        request: _calendar_pb2.EventUpdate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_calendar_pb2.EventResponse, _abc.Awaitable[_calendar_pb2.EventResponse]]:
+        """Update an event."""
+
+    @_abc_1.abstractmethod
+    def DeleteEvent(
+        self,
+        request: _calendar_pb2.DeleteEventRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]:
+        """Delete an event."""
+
+    @_abc_1.abstractmethod
+    def GetEventsInRange(
+        self,
+        request: _calendar_pb2.EventsInRangeRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_calendar_pb2.EventListResponse, _abc.Awaitable[_calendar_pb2.EventListResponse]]:
+        """Get events for a specific date range."""
+
+    @_abc_1.abstractmethod
+    def GetUpcomingEvents(
+        self,
+        request: _calendar_pb2.UpcomingEventsRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_calendar_pb2.EventListResponse, _abc.Awaitable[_calendar_pb2.EventListResponse]]:
+        """Get upcoming events."""
+
+    @_abc_1.abstractmethod
+    def ShareEvent(
+        self,
+        request: _calendar_pb2.ShareEventRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]:
+        """Share an event with other users."""
+
+    @_abc_1.abstractmethod
+    def GetFreeBusy(
+        self,
+        request: _calendar_pb2.FreeBusyRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_calendar_pb2.FreeBusyResponse, _abc.Awaitable[_calendar_pb2.FreeBusyResponse]]:
+        """Get the busy slots of household members and their common free slots"""
+
+def add_CalendarServiceServicer_to_server(servicer: CalendarServiceServicer, server: _typing.Union[_grpc.Server, _aio.Server]) -> None: ...
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: api/v1/finance.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'api/v1/finance.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x14\x61pi/v1/finance.proto\x12\x06\x61pi.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1bgoogle/protobuf/empty.proto\"\x9e\x03\n\x0bTransaction\x12\n\n\x02id\x18\x01 \x01(\t\x12\x14\n\x0chousehold_id\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x61tegory_id\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x61mount\x18\x05 \x01(\x01\x12%\n\x04type\x18\x06 \x01(\x0e\x32\x17.api.v1.TransactionType\x12)\n\x06status\x18\x07 \x01(\x0e\x32\x19.api.v1.TransactionStatus\x12\x34\n\x10transaction_date\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x12\n\ncreated_by\x18\t \x01(\t\x12.\n\ncreated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05notes\x18\x0c \x01(\t\x12\x0c\n\x04tags\x18\r \x03(\t\x12\x1a\n\x12receipt_attachment\x18\x0e \x01(\t\"\x86\x02\n\x08\x43\x61tegory\x12\n\n\x02id\x18\x01 \x01(\t\x12\x14\n\x0chousehold_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0c\n\x04icon\x18\x05 \x01(\t\x12\r\n\x05\x63olor\x18\x06 \x01(\t\x12\x11\n\tis_income\x18\x07 \x01(\x08\x12\x12\n\nis_expense\x18\x08 \x01(\x08\x12\x11\n\tparent_id\x18\t \x01(\t\x12.\n\ncreated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xc0\x02\n\x06\x42udget\x12\n\n\x02id\x18\x01 \x01(\t\x12\x14\n\x0chousehold_id\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x61tegory_id\x18\x03 \x01(\t\x12\x0c\n\x04name\x18\x04 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x05 \x01(\t\x12\x0e\n\x06\x61mount\x18\x06 \x01(\x01\x12\x0e\n\x06period\x18\x07 \x01(\t\x12.\n\nstart_date\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\t \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\ncreated_at\x18\n \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x0b \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xf9\x01\n\x11TransactionCreate\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x61tegory_id\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x01\x12%\n\x04type\x18\x05 \x01(\x0e\x32\x17.api.v1.TransactionType\x12\x34\n\x10transaction_date\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\r\n\x05notes\x18\x07 \x01(\t\x12\x0c\n\x04tags\x18\x08 \x03(\t\x12\x1a\n\x12receipt_attachment\x18\t \x01(\t\"\xb7\x03\n\x11TransactionUpdate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x18\n\x0b\x63\x61tegory_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x13\n\x06\x61mount\x18\x04 \x01(\x01H\x02\x88\x01\x01\x12*\n\x04type\x18\x05 \x01(\x0e\x32\x17.api.v1.TransactionTypeH\x03\x88\x01\x01\x12.\n\x06status\x18\x06 \x01(\x0e\x32\x19.api.v1.TransactionStatusH\x04\x88\x01\x01\x12\x39\n\x10transaction_date\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x05\x88\x01\x01\x12\x12\n\x05notes\x18\x08 \x01(\tH\x06\x88\x01\x01\x12\x0c\n\x04tags\x18\t \x03(\t\x12\x1f\n\x12receipt_attachment\x18\n \x01(\tH\x07\x88\x01\x01\x42\x0e\n\x0c_category_idB\x0e\n\x0c_descriptionB\t\n\x07_amountB\x07\n\x05_typeB\t\n\x07_statusB\x13\n\x11_transaction_dateB\x08\n\x06_notesB\x15\n\x13_receipt_attachment\"\xa0\x01\n\x0e\x43\x61tegoryCreate\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x0c\n\x04icon\x18\x04 \x01(\t\x12\r\n\x05\x63olor\x18\x05 \x01(\t\x12\x11\n\tis_income\x18\x06 \x01(\x08\x12\x12\n\nis_expense\x18\x07 \x01(\x08\x12\x11\n\tparent_id\x18\x08 \x01(\t\"\xda\x01\n\x0c\x42udgetCreate\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x13\n\x0b\x63\x61tegory_id\x18\x02 \x01(\t\x12\x0c\n\x04name\x18\x03 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x04 \x01(\t\x12\x0e\n\x06\x61mount\x18\x05 \x01(\x01\x12\x0e\n\x06period\x18\x06 \x01(\t\x12.\n\nstart_date\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x08 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"?\n\x13TransactionResponse\x12(\n\x0btransaction\x18\x01 \x01(\x0b\x32\x13.api.v1.Transaction\"S\n\x17TransactionListResponse\x12)\n\x0ctransactions\x18\x01 \x03(\x0b\x32\x13.api.v1.Transaction\x12\r\n\x05total\x18\x02 \x01(\x05\"6\n\x10\x43\x61tegoryResponse\x12\"\n\x08\x63\x61tegory\x18\x01 \x01(\x0b\x32\x10.api.v1.Category\"K\n\x14\x43\x61tegoryListResponse\x12$\n\ncategories\x18\x01 \x03(\x0b\x32\x10.api.v1.Category\x12\r\n\x05total\x18\x02 \x01(\x05\"0\n\x0e\x42udgetResponse\x12\x1e\n\x06\x62udget\x18\x01 \x01(\x0b\x32\x0e.api.v1.Budget\"D\n\x12\x42udgetListResponse\x12\x1f\n\x07\x62udgets\x18\x01 \x03(\x0b\x32\x0e.api.v1.Budget\x12\r\n\x05total\x18\x02 \x01(\x05\"\x1e\n\x10\x46inanceIdRequest\x12\n\n\x02id\x18\x01 \x01(\t\"*\n\x1b\x42\x61tchGetTransactionsRequest\x12\x0b\n\x03ids\x18\x01 \x03(\t\"^\n\x1c\x42\x61tchGetTransactionsResponse\x12)\n\x0ctransactions\x18\x01 \x03(\x0b\x32\x13.api.v1.Transaction\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\t\"\x87\x01\n\x1aIngestTransactionsResponse\x12\x10\n\x08received\x18\x01 \x01(\x05\x12\x0f\n\x07\x63reated\x18\x02 \x01(\x05\x12\x10\n\x08rejected\x18\x03 \x01(\x05\x12\x0f\n\x07\x62\x61tches\x18\x04 \x01(\x05\x12#\n\x06\x65rrors\x18\x05 \x03(\x0b\x32\x13.api.v1.IngestError\"-\n\x0bIngestError\x12\r\n\x05index\x18\x01 \x01(\x05\x12\x0f\n\x07message\x18\x02 \x01(\t\"/\n\x17\x46inanceHouseholdRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\"(\n\x11\x43\x61tegoryIdRequest\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\t\"$\n\x0f\x42udgetIdRequest\x12\x11\n\tbudget_id\x18\x01 \x01(\t\"p\n\x10\x44\x61teRangeRequest\x12.\n\nstart_date\x18\x01 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\xf6\x02\n\x11TransactionFilter\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x18\n\x0b\x63\x61tegory_id\x18\x02 \x01(\tH\x00\x88\x01\x01\x12*\n\x04type\x18\x03 \x01(\x0e\x32\x17.api.v1.TransactionTypeH\x01\x88\x01\x01\x12.\n\x06status\x18\x04 \x01(\x0e\x32\x19.api.v1.TransactionStatusH\x02\x88\x01\x01\x12\x33\n\nstart_date\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x03\x88\x01\x01\x12\x31\n\x08\x65nd_date\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.TimestampH\x04\x88\x01\x01\x12\x0c\n\x04tags\x18\x07 \x03(\t\x12\x0c\n\x04page\x18\x08 \x01(\x05\x12\x11\n\tpage_size\x18\t \x01(\x05\x42\x0e\n\x0c_category_idB\x07\n\x05_typeB\t\n\x07_statusB\r\n\x0b_start_dateB\x0b\n\t_end_date\"b\n\x10\x43\x61tegorySpending\x12\x13\n\x0b\x63\x61tegory_id\x18\x01 \x01(\t\x12\x15\n\rcategory_name\x18\x02 \x01(\t\x12\x0e\n\x06\x61mount\x18\x03 \x01(\x01\x12\x12\n\npercentage\x18\x04 \x01(\x01\"\xc7\x01\n\x17SpendingOverTimeRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x0e\n\x06period\x18\x02 \x01(\t\x12.\n\nstart_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x04 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x18\n\x0b\x63\x61tegory_id\x18\x05 \x01(\tH\x00\x88\x01\x01\x42\x0e\n\x0c_category_id\"\x98\x01\n\x18SpendingOverTimeResponse\x12\x0e\n\x06period\x18\x01 \x01(\t\x12.\n\nstart_date\x18\x02 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12,\n\x08\x65nd_date\x18\x03 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x0e\n\x06\x61mount\x18\x04 \x01(\x01\"\xa4\x01\n\x15\x42udgetSummaryResponse\x12&\n\x07\x62udgets\x18\x01 \x03(\x0b\x32\x15.api.v1.BudgetSummary\x12\x14\n\x0ctotal_budget\x18\x02 \x01(\x01\x12\x13\n\x0btotal_spent\x18\x03 \x01(\x01\x12\x18\n\x10remaining_budget\x18\x04 \x01(\x01\x12\x1e\n\x16utilization_percentage\x18\x05 \x01(\x01\"\xc5\x01\n\rBudgetSummary\x12\x11\n\tbudget_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x63\x61tegory_id\x18\x03 \x01(\t\x12\x15\n\rcategory_name\x18\x04 \x01(\t\x12\x17\n\x0f\x62udgeted_amount\x18\x05 \x01(\x01\x12\x14\n\x0cspent_amount\x18\x06 \x01(\x01\x12\x18\n\x10remaining_amount\x18\x07 \x01(\x01\x12\x1e\n\x16utilization_percentage\x18\x08 \x01(\x01*k\n\x0fTransactionType\x12\x1b\n\x17TRANSACTION_TYPE_INCOME\x10\x00\x12\x1c\n\x18TRANSACTION_TYPE_EXPENSE\x10\x01\x12\x1d\n\x19TRANSACTION_TYPE_TRANSFER\x10\x02*\x96\x01\n\x11TransactionStatus\x12\x1e\n\x1aTRANSACTION_STATUS_PENDING\x10\x00\x12 \n\x1cTRANSACTION_STATUS_COMPLETED\x10\x01\x12 \n\x1cTRANSACTION_STATUS_CANCELLED\x10\x02\x12\x1d\n\x19TRANSACTION_STATUS_FAILED\x10\x03\x32\x8f\x0c\n\x0e\x46inanceService\x12M\n\x11\x43reateTransaction\x12\x19.api.v1.TransactionCreate\x1a\x1b.api.v1.TransactionResponse\"\x00\x12I\n\x0eGetTransaction\x12\x18.api.v1.FinanceIdRequest\x1a\x1b.api.v1.TransactionResponse\"\x00\x12\x63\n\x14\x42\x61tchGetTransactions\x12#.api.v1.BatchGetTransactionsRequest\x1a$.api.v1.BatchGetTransactionsResponse\"\x00\x12W\n\x12IngestTransactions\x12\x19.api.v1.TransactionCreate\x1a\".api.v1.IngestTransactionsResponse\"\x00(\x01\x12P\n\x10ListTransactions\x12\x19.api.v1.TransactionFilter\x1a\x1f.api.v1.TransactionListResponse\"\x00\x12M\n\x11UpdateTransaction\x12\x19.api.v1.TransactionUpdate\x1a\x1b.api.v1.TransactionResponse\"\x00\x12G\n\x11\x44\x65leteTransaction\x12\x18.api.v1.FinanceIdRequest\x1a\x16.google.protobuf.Empty\"\x00\x12\x44\n\x0e\x43reateCategory\x12\x16.api.v1.CategoryCreate\x1a\x18.api.v1.CategoryResponse\"\x00\x12\x43\n\x0bGetCategory\x12\x18.api.v1.FinanceIdRequest\x1a\x18.api.v1.CategoryResponse\"\x00\x12Q\n\x0eListCategories\x12\x1f.api.v1.FinanceHouseholdRequest\x1a\x1c.api.v1.CategoryListResponse\"\x00\x12>\n\x0eUpdateCategory\x12\x10.api.v1.Category\x1a\x18.api.v1.CategoryResponse\"\x00\x12\x44\n\x0e\x44\x65leteCategory\x12\x18.api.v1.FinanceIdRequest\x1a\x16.google.protobuf.Empty\"\x00\x12>\n\x0c\x43reateBudget\x12\x14.api.v1.BudgetCreate\x1a\x16.api.v1.BudgetResponse\"\x00\x12?\n\tGetBudget\x12\x18.api.v1.FinanceIdRequest\x1a\x16.api.v1.BudgetResponse\"\x00\x12L\n\x0bListBudgets\x12\x1f.api.v1.FinanceHouseholdRequest\x1a\x1a.api.v1.BudgetListResponse\"\x00\x12\x38\n\x0cUpdateBudget\x12\x0e.api.v1.Budget\x1a\x16.api.v1.BudgetResponse\"\x00\x12\x42\n\x0c\x44\x65leteBudget\x12\x18.api.v1.FinanceIdRequest\x1a\x16.google.protobuf.Empty\"\x00\x12V\n\x15GetSpendingByCategory\x12\x1f.api.v1.FinanceHouseholdRequest\x1a\x18.api.v1.CategorySpending\"\x00\x30\x01\x12\\\n\x13GetSpendingOverTime\x12\x1f.api.v1.SpendingOverTimeRequest\x1a .api.v1.SpendingOverTimeResponse\"\x00\x30\x01\x12T\n\x10GetBudgetSummary\x12\x1f.api.v1.FinanceHouseholdRequest\x1a\x1d.api.v1.BudgetSummaryResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'api.v1.finance_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_TRANSACTIONTYPE']._serialized_start=4381
+  _globals['_TRANSACTIONTYPE']._serialized_end=4488
+  _globals['_TRANSACTIONSTATUS']._serialized_start=4491
+  _globals['_TRANSACTIONSTATUS']._serialized_end=4641
+  _globals['_TRANSACTION']._serialized_start=95
+  _globals['_TRANSACTION']._serialized_end=509
+  _globals['_CATEGORY']._serialized_start=512
+  _globals['_CATEGORY']._serialized_end=774
+  _globals['_BUDGET']._serialized_start=777
+  _globals['_BUDGET']._serialized_end=1097
+  _globals['_TRANSACTIONCREATE']._serialized_start=1100
+  _globals['_TRANSACTIONCREATE']._serialized_end=1349
+  _globals['_TRANSACTIONUPDATE']._serialized_start=1352
+  _globals['_TRANSACTIONUPDATE']._serialized_end=1791
+  _globals['_CATEGORYCREATE']._serialized_start=1794
+  _globals['_CATEGORYCREATE']._serialized_end=1954
+  _globals['_BUDGETCREATE']._serialized_start=1957
+  _globals['_BUDGETCREATE']._serialized_end=2175
+  _globals['_TRANSACTIONRESPONSE']._serialized_start=2177
+  _globals['_TRANSACTIONRESPONSE']._serialized_end=2240
+  _globals['_TRANSACTIONLISTRESPONSE']._serialized_start=2242
+  _globals['_TRANSACTIONLISTRESPONSE']._serialized_end=2325
+  _globals['_CATEGORYRESPONSE']._serialized_start=2327
+  _globals['_CATEGORYRESPONSE']._serialized_end=2381
+  _globals['_CATEGORYLISTRESPONSE']._serialized_start=2383
+  _globals['_CATEGORYLISTRESPONSE']._serialized_end=2458
+  _globals['_BUDGETRESPONSE']._serialized_start=2460
+  _globals['_BUDGETRESPONSE']._serialized_end=2508
+  _globals['_BUDGETLISTRESPONSE']._serialized_start=2510
+  _globals['_BUDGETLISTRESPONSE']._serialized_end=2578
+  _globals['_FINANCEIDREQUEST']._serialized_start=2580
+  _globals['_FINANCEIDREQUEST']._serialized_end=2610
+  _globals['_BATCHGETTRANSACTIONSREQUEST']._serialized_start=2612
+  _globals['_BATCHGETTRANSACTIONSREQUEST']._serialized_end=2654
+  _globals['_BATCHGETTRANSACTIONSRESPONSE']._serialized_start=2656
+  _globals['_BATCHGETTRANSACTIONSRESPONSE']._serialized_end=2750
+  _globals['_INGESTTRANSACTIONSRESPONSE']._serialized_start=2753
+  _globals['_INGESTTRANSACTIONSRESPONSE']._serialized_end=2888
+  _globals['_INGESTERROR']._serialized_start=2890
+  _globals['_INGESTERROR']._serialized_end=2935
+  _globals['_FINANCEHOUSEHOLDREQUEST']._serialized_start=2937
+  _globals['_FINANCEHOUSEHOLDREQUEST']._serialized_end=2984
+  _globals['_CATEGORYIDREQUEST']._serialized_start=2986
+  _globals['_CATEGORYIDREQUEST']._serialized_end=3026
+  _globals['_BUDGETIDREQUEST']._serialized_start=3028
+  _globals['_BUDGETIDREQUEST']._serialized_end=3064
+  _globals['_DATERANGEREQUEST']._serialized_start=3066
+  _globals['_DATERANGEREQUEST']._serialized_end=3178
+  _globals['_TRANSACTIONFILTER']._serialized_start=3181
+  _globals['_TRANSACTIONFILTER']._serialized_end=3555
+  _globals['_CATEGORYSPENDING']._serialized_start=3557
+  _globals['_CATEGORYSPENDING']._serialized_end=3655
+  _globals['_SPENDINGOVERTIMEREQUEST']._serialized_start=3658
+  _globals['_SPENDINGOVERTIMEREQUEST']._serialized_end=3857
+  _globals['_SPENDINGOVERTIMERESPONSE']._serialized_start=3860
+  _globals['_SPENDINGOVERTIMERESPONSE']._serialized_end=4012
+  _globals['_BUDGETSUMMARYRESPONSE']._serialized_start=4015
+  _globals['_BUDGETSUMMARYRESPONSE']._serialized_end=4179
+  _globals['_BUDGETSUMMARY']._serialized_start=4182
+  _globals['_BUDGETSUMMARY']._serialized_end=4379
+  _globals['_FINANCESERVICE']._serialized_start=4644
+  _globals['_FINANCESERVICE']._serialized_end=6195
+# @@protoc_insertion_point(module_scope)
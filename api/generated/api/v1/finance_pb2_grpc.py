@@ -0,0 +1,922 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from api.generated.api.v1 import finance_pb2 as api_dot_v1_dot_finance__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in api/v1/finance_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class FinanceServiceStub:
+    """FinanceService handles financial operations.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateTransaction = channel.unary_unary(
+                '/api.v1.FinanceService/CreateTransaction',
+                request_serializer=api_dot_v1_dot_finance__pb2.TransactionCreate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.TransactionResponse.FromString,
+                _registered_method=True)
+        self.GetTransaction = channel.unary_unary(
+                '/api.v1.FinanceService/GetTransaction',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.TransactionResponse.FromString,
+                _registered_method=True)
+        self.BatchGetTransactions = channel.unary_unary(
+                '/api.v1.FinanceService/BatchGetTransactions',
+                request_serializer=api_dot_v1_dot_finance__pb2.BatchGetTransactionsRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.BatchGetTransactionsResponse.FromString,
+                _registered_method=True)
+        self.IngestTransactions = channel.stream_unary(
+                '/api.v1.FinanceService/IngestTransactions',
+                request_serializer=api_dot_v1_dot_finance__pb2.TransactionCreate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.IngestTransactionsResponse.FromString,
+                _registered_method=True)
+        self.ListTransactions = channel.unary_unary(
+                '/api.v1.FinanceService/ListTransactions',
+                request_serializer=api_dot_v1_dot_finance__pb2.TransactionFilter.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.TransactionListResponse.FromString,
+                _registered_method=True)
+        self.UpdateTransaction = channel.unary_unary(
+                '/api.v1.FinanceService/UpdateTransaction',
+                request_serializer=api_dot_v1_dot_finance__pb2.TransactionUpdate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.TransactionResponse.FromString,
+                _registered_method=True)
+        self.DeleteTransaction = channel.unary_unary(
+                '/api.v1.FinanceService/DeleteTransaction',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.CreateCategory = channel.unary_unary(
+                '/api.v1.FinanceService/CreateCategory',
+                request_serializer=api_dot_v1_dot_finance__pb2.CategoryCreate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.CategoryResponse.FromString,
+                _registered_method=True)
+        self.GetCategory = channel.unary_unary(
+                '/api.v1.FinanceService/GetCategory',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.CategoryResponse.FromString,
+                _registered_method=True)
+        self.ListCategories = channel.unary_unary(
+                '/api.v1.FinanceService/ListCategories',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.CategoryListResponse.FromString,
+                _registered_method=True)
+        self.UpdateCategory = channel.unary_unary(
+                '/api.v1.FinanceService/UpdateCategory',
+                request_serializer=api_dot_v1_dot_finance__pb2.Category.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.CategoryResponse.FromString,
+                _registered_method=True)
+        self.DeleteCategory = channel.unary_unary(
+                '/api.v1.FinanceService/DeleteCategory',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.CreateBudget = channel.unary_unary(
+                '/api.v1.FinanceService/CreateBudget',
+                request_serializer=api_dot_v1_dot_finance__pb2.BudgetCreate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.BudgetResponse.FromString,
+                _registered_method=True)
+        self.GetBudget = channel.unary_unary(
+                '/api.v1.FinanceService/GetBudget',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.BudgetResponse.FromString,
+                _registered_method=True)
+        self.ListBudgets = channel.unary_unary(
+                '/api.v1.FinanceService/ListBudgets',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.BudgetListResponse.FromString,
+                _registered_method=True)
+        self.UpdateBudget = channel.unary_unary(
+                '/api.v1.FinanceService/UpdateBudget',
+                request_serializer=api_dot_v1_dot_finance__pb2.Budget.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.BudgetResponse.FromString,
+                _registered_method=True)
+        self.DeleteBudget = channel.unary_unary(
+                '/api.v1.FinanceService/DeleteBudget',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.GetSpendingByCategory = channel.unary_stream(
+                '/api.v1.FinanceService/GetSpendingByCategory',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.CategorySpending.FromString,
+                _registered_method=True)
+        self.GetSpendingOverTime = channel.unary_stream(
+                '/api.v1.FinanceService/GetSpendingOverTime',
+                request_serializer=api_dot_v1_dot_finance__pb2.SpendingOverTimeRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.SpendingOverTimeResponse.FromString,
+                _registered_method=True)
+        self.GetBudgetSummary = channel.unary_unary(
+                '/api.v1.FinanceService/GetBudgetSummary',
+                request_serializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_finance__pb2.BudgetSummaryResponse.FromString,
+                _registered_method=True)
+
+
+class FinanceServiceServicer:
+    """FinanceService handles financial operations.
+    """
+
+    def CreateTransaction(self, request, context):
+        """Transactions
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetTransaction(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def BatchGetTransactions(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def IngestTransactions(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListTransactions(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateTransaction(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteTransaction(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateCategory(self, request, context):
+        """Categories
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetCategory(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListCategories(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateCategory(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteCategory(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def CreateBudget(self, request, context):
+        """Budgets
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBudget(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListBudgets(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateBudget(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteBudget(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetSpendingByCategory(self, request, context):
+        """Reports
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetSpendingOverTime(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetBudgetSummary(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_FinanceServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateTransaction': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateTransaction,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.TransactionCreate.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.TransactionResponse.SerializeToString,
+            ),
+            'GetTransaction': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetTransaction,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.TransactionResponse.SerializeToString,
+            ),
+            'BatchGetTransactions': grpc.unary_unary_rpc_method_handler(
+                    servicer.BatchGetTransactions,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.BatchGetTransactionsRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.BatchGetTransactionsResponse.SerializeToString,
+            ),
+            'IngestTransactions': grpc.stream_unary_rpc_method_handler(
+                    servicer.IngestTransactions,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.TransactionCreate.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.IngestTransactionsResponse.SerializeToString,
+            ),
+            'ListTransactions': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListTransactions,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.TransactionFilter.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.TransactionListResponse.SerializeToString,
+            ),
+            'UpdateTransaction': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateTransaction,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.TransactionUpdate.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.TransactionResponse.SerializeToString,
+            ),
+            'DeleteTransaction': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteTransaction,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'CreateCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateCategory,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.CategoryCreate.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.CategoryResponse.SerializeToString,
+            ),
+            'GetCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetCategory,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.CategoryResponse.SerializeToString,
+            ),
+            'ListCategories': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListCategories,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.CategoryListResponse.SerializeToString,
+            ),
+            'UpdateCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateCategory,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.Category.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.CategoryResponse.SerializeToString,
+            ),
+            'DeleteCategory': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteCategory,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'CreateBudget': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateBudget,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.BudgetCreate.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.BudgetResponse.SerializeToString,
+            ),
+            'GetBudget': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBudget,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.BudgetResponse.SerializeToString,
+            ),
+            'ListBudgets': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListBudgets,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.BudgetListResponse.SerializeToString,
+            ),
+            'UpdateBudget': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateBudget,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.Budget.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.BudgetResponse.SerializeToString,
+            ),
+            'DeleteBudget': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteBudget,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceIdRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'GetSpendingByCategory': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetSpendingByCategory,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.CategorySpending.SerializeToString,
+            ),
+            'GetSpendingOverTime': grpc.unary_stream_rpc_method_handler(
+                    servicer.GetSpendingOverTime,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.SpendingOverTimeRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.SpendingOverTimeResponse.SerializeToString,
+            ),
+            'GetBudgetSummary': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetBudgetSummary,
+                    request_deserializer=api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_finance__pb2.BudgetSummaryResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'api.v1.FinanceService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('api.v1.FinanceService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class FinanceService:
+    """FinanceService handles financial operations.
+    """
+
+    @staticmethod
+    def CreateTransaction(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/CreateTransaction',
+            api_dot_v1_dot_finance__pb2.TransactionCreate.SerializeToString,
+            api_dot_v1_dot_finance__pb2.TransactionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetTransaction(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/GetTransaction',
+            api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.TransactionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def BatchGetTransactions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/BatchGetTransactions',
+            api_dot_v1_dot_finance__pb2.BatchGetTransactionsRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.BatchGetTransactionsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def IngestTransactions(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            '/api.v1.FinanceService/IngestTransactions',
+            api_dot_v1_dot_finance__pb2.TransactionCreate.SerializeToString,
+            api_dot_v1_dot_finance__pb2.IngestTransactionsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListTransactions(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/ListTransactions',
+            api_dot_v1_dot_finance__pb2.TransactionFilter.SerializeToString,
+            api_dot_v1_dot_finance__pb2.TransactionListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateTransaction(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/UpdateTransaction',
+            api_dot_v1_dot_finance__pb2.TransactionUpdate.SerializeToString,
+            api_dot_v1_dot_finance__pb2.TransactionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteTransaction(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/DeleteTransaction',
+            api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/CreateCategory',
+            api_dot_v1_dot_finance__pb2.CategoryCreate.SerializeToString,
+            api_dot_v1_dot_finance__pb2.CategoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/GetCategory',
+            api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.CategoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListCategories(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/ListCategories',
+            api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.CategoryListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/UpdateCategory',
+            api_dot_v1_dot_finance__pb2.Category.SerializeToString,
+            api_dot_v1_dot_finance__pb2.CategoryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/DeleteCategory',
+            api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def CreateBudget(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/CreateBudget',
+            api_dot_v1_dot_finance__pb2.BudgetCreate.SerializeToString,
+            api_dot_v1_dot_finance__pb2.BudgetResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBudget(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/GetBudget',
+            api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.BudgetResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListBudgets(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/ListBudgets',
+            api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.BudgetListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateBudget(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/UpdateBudget',
+            api_dot_v1_dot_finance__pb2.Budget.SerializeToString,
+            api_dot_v1_dot_finance__pb2.BudgetResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteBudget(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/DeleteBudget',
+            api_dot_v1_dot_finance__pb2.FinanceIdRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetSpendingByCategory(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/api.v1.FinanceService/GetSpendingByCategory',
+            api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.CategorySpending.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetSpendingOverTime(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/api.v1.FinanceService/GetSpendingOverTime',
+            api_dot_v1_dot_finance__pb2.SpendingOverTimeRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.SpendingOverTimeResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetBudgetSummary(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.FinanceService/GetBudgetSummary',
+            api_dot_v1_dot_finance__pb2.FinanceHouseholdRequest.SerializeToString,
+            api_dot_v1_dot_finance__pb2.BudgetSummaryResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
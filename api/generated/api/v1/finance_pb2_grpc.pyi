@@ -0,0 +1,239 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from api.generated.api.v1 import finance_pb2 as _finance_pb2
+from collections import abc as _abc
+from google.protobuf import empty_pb2 as _empty_pb2
+from grpc import aio as _aio
+import abc as _abc_1
+import grpc as _grpc
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import Self as _Self
+else:
+    from typing_extensions import Self as _Self
+
+_T = _typing.TypeVar("_T")
+
+class _MaybeAsyncIterator(_abc.AsyncIterator[_T], _abc.Iterator[_T], metaclass=_abc_1.ABCMeta): ...
+
+class _ServicerContext(_grpc.ServicerContext, _aio.ServicerContext):  # type: ignore[misc, type-arg]
+    ...
+
+GRPC_GENERATED_VERSION: str
+GRPC_VERSION: str
+
+class FinanceServiceStub:
+    """FinanceService handles financial operations."""
+
+    @_typing.overload
+    def __new__(cls, channel: _grpc.Channel) -> _Self: ...
+    @_typing.overload
+    def __new__(cls, channel: _aio.Channel) -> FinanceServiceAsyncStub: ...
+    CreateTransaction: _grpc.UnaryUnaryMultiCallable[_finance_pb2.TransactionCreate, _finance_pb2.TransactionResponse]
+    """Transactions"""
+    GetTransaction: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _finance_pb2.TransactionResponse]
+    BatchGetTransactions: _grpc.UnaryUnaryMultiCallable[_finance_pb2.BatchGetTransactionsRequest, _finance_pb2.BatchGetTransactionsResponse]
+    IngestTransactions: _grpc.StreamUnaryMultiCallable[_finance_pb2.TransactionCreate, _finance_pb2.IngestTransactionsResponse]
+    ListTransactions: _grpc.UnaryUnaryMultiCallable[_finance_pb2.TransactionFilter, _finance_pb2.TransactionListResponse]
+    UpdateTransaction: _grpc.UnaryUnaryMultiCallable[_finance_pb2.TransactionUpdate, _finance_pb2.TransactionResponse]
+    DeleteTransaction: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _empty_pb2.Empty]
+    CreateCategory: _grpc.UnaryUnaryMultiCallable[_finance_pb2.CategoryCreate, _finance_pb2.CategoryResponse]
+    """Categories"""
+    GetCategory: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _finance_pb2.CategoryResponse]
+    ListCategories: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.CategoryListResponse]
+    UpdateCategory: _grpc.UnaryUnaryMultiCallable[_finance_pb2.Category, _finance_pb2.CategoryResponse]
+    DeleteCategory: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _empty_pb2.Empty]
+    CreateBudget: _grpc.UnaryUnaryMultiCallable[_finance_pb2.BudgetCreate, _finance_pb2.BudgetResponse]
+    """Budgets"""
+    GetBudget: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _finance_pb2.BudgetResponse]
+    ListBudgets: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.BudgetListResponse]
+    UpdateBudget: _grpc.UnaryUnaryMultiCallable[_finance_pb2.Budget, _finance_pb2.BudgetResponse]
+    DeleteBudget: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _empty_pb2.Empty]
+    GetSpendingByCategory: _grpc.UnaryStreamMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.CategorySpending]
+    """Reports"""
+    GetSpendingOverTime: _grpc.UnaryStreamMultiCallable[_finance_pb2.SpendingOverTimeRequest, _finance_pb2.SpendingOverTimeResponse]
+    GetBudgetSummary: _grpc.UnaryUnaryMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.BudgetSummaryResponse]
+
+@_typing.type_check_only
+class FinanceServiceAsyncStub(FinanceServiceStub):
+    """FinanceService handles financial operations."""
+
+    def __init__(self, channel: _aio.Channel) -> None: ...
+    CreateTransaction: _aio.UnaryUnaryMultiCallable[_finance_pb2.TransactionCreate, _finance_pb2.TransactionResponse]  # type: ignore[assignment]
+    """Transactions"""
+    GetTransaction: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _finance_pb2.TransactionResponse]  # type: ignore[assignment]
+    BatchGetTransactions: _aio.UnaryUnaryMultiCallable[_finance_pb2.BatchGetTransactionsRequest, _finance_pb2.BatchGetTransactionsResponse]  # type: ignore[assignment]
+    IngestTransactions: _aio.StreamUnaryMultiCallable[_finance_pb2.TransactionCreate, _finance_pb2.IngestTransactionsResponse]  # type: ignore[assignment]
+    ListTransactions: _aio.UnaryUnaryMultiCallable[_finance_pb2.TransactionFilter, _finance_pb2.TransactionListResponse]  # type: ignore[assignment]
+    UpdateTransaction: _aio.UnaryUnaryMultiCallable[_finance_pb2.TransactionUpdate, _finance_pb2.TransactionResponse]  # type: ignore[assignment]
+    DeleteTransaction: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    CreateCategory: _aio.UnaryUnaryMultiCallable[_finance_pb2.CategoryCreate, _finance_pb2.CategoryResponse]  # type: ignore[assignment]
+    """Categories"""
+    GetCategory: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _finance_pb2.CategoryResponse]  # type: ignore[assignment]
+    ListCategories: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.CategoryListResponse]  # type: ignore[assignment]
+    UpdateCategory: _aio.UnaryUnaryMultiCallable[_finance_pb2.Category, _finance_pb2.CategoryResponse]  # type: ignore[assignment]
+    DeleteCategory: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    CreateBudget: _aio.UnaryUnaryMultiCallable[_finance_pb2.BudgetCreate, _finance_pb2.BudgetResponse]  # type: ignore[assignment]
+    """Budgets"""
+    GetBudget: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _finance_pb2.BudgetResponse]  # type: ignore[assignment]
+    ListBudgets: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.BudgetListResponse]  # type: ignore[assignment]
+    UpdateBudget: _aio.UnaryUnaryMultiCallable[_finance_pb2.Budget, _finance_pb2.BudgetResponse]  # type: ignore[assignment]
+    DeleteBudget: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceIdRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    GetSpendingByCategory: _aio.UnaryStreamMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.CategorySpending]  # type: ignore[assignment]
+    """Reports"""
+    GetSpendingOverTime: _aio.UnaryStreamMultiCallable[_finance_pb2.SpendingOverTimeRequest, _finance_pb2.SpendingOverTimeResponse]  # type: ignore[assignment]
+    GetBudgetSummary: _aio.UnaryUnaryMultiCallable[_finance_pb2.FinanceHouseholdRequest, _finance_pb2.BudgetSummaryResponse]  # type: ignore[assignment]
+
+class FinanceServiceServicer(metaclass=_abc_1.ABCMeta):
+    """FinanceService handles financial operations."""
+
+    @_abc_1.abstractmethod
+    def CreateTransaction(
+        self,
+        request: _finance_pb2.TransactionCreate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.TransactionResponse, _abc.Awaitable[_finance_pb2.TransactionResponse]]:
+        """Transactions"""
+
+    @_abc_1.abstractmethod
+    def GetTransaction(
+        self,
+        request: _finance_pb2.FinanceIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.TransactionResponse, _abc.Awaitable[_finance_pb2.TransactionResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def BatchGetTransactions(
+        self,
+        request: _finance_pb2.BatchGetTransactionsRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.BatchGetTransactionsResponse, _abc.Awaitable[_finance_pb2.BatchGetTransactionsResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def IngestTransactions(
+        self,
+        request_iterator: _MaybeAsyncIterator[_finance_pb2.TransactionCreate],
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.IngestTransactionsResponse, _abc.Awaitable[_finance_pb2.IngestTransactionsResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def ListTransactions(
+        self,
+        request: _finance_pb2.TransactionFilter,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.TransactionListResponse, _abc.Awaitable[_finance_pb2.TransactionListResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def UpdateTransaction(
+        self,
+        request: _finance_pb2.TransactionUpdate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.TransactionResponse, _abc.Awaitable[_finance_pb2.TransactionResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def DeleteTransaction(
+        self,
+        request: _finance_pb2.FinanceIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]: ...
+
+    @_abc_1.abstractmethod
+    def CreateCategory(
+        self,
+        request: _finance_pb2.CategoryCreate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.CategoryResponse, _abc.Awaitable[_finance_pb2.CategoryResponse]]:
+        """Categories"""
+
+    @_abc_1.abstractmethod
+    def GetCategory(
+        self,
+        request: _finance_pb2.FinanceIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.CategoryResponse, _abc.Awaitable[_finance_pb2.CategoryResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def ListCategories(
+        self,
+        request: _finance_pb2.FinanceHouseholdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.CategoryListResponse, _abc.Awaitable[_finance_pb2.CategoryListResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def UpdateCategory(
+        self,
+        request: _finance_pb2.Category,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.CategoryResponse, _abc.Awaitable[_finance_pb2.CategoryResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def DeleteCategory(
+        self,
+        request: _finance_pb2.FinanceIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]: ...
+
+    @_abc_1.abstractmethod
+    def CreateBudget(
+        self,
+        request: _finance_pb2.BudgetCreate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.BudgetResponse, _abc.Awaitable[_finance_pb2.BudgetResponse]]:
+        """Budgets"""
+
+    @_abc_1.abstractmethod
+    def GetBudget(
+        self,
+        request: _finance_pb2.FinanceIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.BudgetResponse, _abc.Awaitable[_finance_pb2.BudgetResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def ListBudgets(
+        self,
+        request: _finance_pb2.FinanceHouseholdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.BudgetListResponse, _abc.Awaitable[_finance_pb2.BudgetListResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def UpdateBudget(
+        self,
+        request: _finance_pb2.Budget,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.BudgetResponse, _abc.Awaitable[_finance_pb2.BudgetResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def DeleteBudget(
+        self,
+        request: _finance_pb2.FinanceIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]: ...
+
+    @_abc_1.abstractmethod
+    def GetSpendingByCategory(
+        self,
+        request: _finance_pb2.FinanceHouseholdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_abc.Iterator[_finance_pb2.CategorySpending], _abc.AsyncIterator[_finance_pb2.CategorySpending]]:
+        """Reports"""
+
+    @_abc_1.abstractmethod
+    def GetSpendingOverTime(
+        self,
+        request: _finance_pb2.SpendingOverTimeRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_abc.Iterator[_finance_pb2.SpendingOverTimeResponse], _abc.AsyncIterator[_finance_pb2.SpendingOverTimeResponse]]: ...
+
+    @_abc_1.abstractmethod
+    def GetBudgetSummary(
+        self,
+        request: _finance_pb2.FinanceHouseholdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_finance_pb2.BudgetSummaryResponse, _abc.Awaitable[_finance_pb2.BudgetSummaryResponse]]: ...
+
+def add_FinanceServiceServicer_to_server(servicer: FinanceServiceServicer, server: _typing.Union[_grpc.Server, _aio.Server]) -> None: ...
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: api/v1/household.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'api/v1/household.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+from api.generated.api.v1 import user_pb2 as api_dot_v1_dot_user__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16\x61pi/v1/household.proto\x12\x06\x61pi.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1bgoogle/protobuf/empty.proto\x1a\x11\x61pi/v1/user.proto\"\xae\x01\n\tHousehold\x12\n\n\x02id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x03 \x01(\t\x12\x12\n\ncreated_by\x18\x04 \x01(\t\x12.\n\ncreated_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"\x9d\x01\n\x0fHouseholdMember\x12\n\n\x02id\x18\x01 \x01(\t\x12\x14\n\x0chousehold_id\x18\x02 \x01(\t\x12\x0f\n\x07user_id\x18\x03 \x01(\t\x12\x0c\n\x04role\x18\x04 \x01(\t\x12-\n\tjoined_at\x18\x05 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12\x1a\n\x04user\x18\x06 \x01(\x0b\x32\x0c.api.v1.User\"4\n\x0fHouseholdCreate\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x13\n\x0b\x64\x65scription\x18\x02 \x01(\t\"c\n\x0fHouseholdUpdate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x11\n\x04name\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x18\n\x0b\x64\x65scription\x18\x03 \x01(\tH\x01\x88\x01\x01\x42\x07\n\x05_nameB\x0e\n\x0c_description\"9\n\x11HouseholdResponse\x12$\n\thousehold\x18\x01 \x01(\x0b\x32\x11.api.v1.Household\"M\n\x15HouseholdListResponse\x12%\n\nhouseholds\x18\x01 \x03(\x0b\x32\x11.api.v1.Household\x12\r\n\x05total\x18\x02 \x01(\x05\"V\n\x1bHouseholdMemberListResponse\x12(\n\x07members\x18\x01 \x03(\x0b\x32\x17.api.v1.HouseholdMember\x12\r\n\x05total\x18\x02 \x01(\x05\" \n\x12HouseholdIdRequest\x12\n\n\x02id\x18\x01 \x01(\t\"G\n\x10\x41\x64\x64MemberRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x0c\n\x04role\x18\x03 \x01(\t\"N\n\x17UpdateMemberRoleRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t\x12\x0c\n\x04role\x18\x03 \x01(\t\"<\n\x13RemoveMemberRequest\x12\x14\n\x0chousehold_id\x18\x01 \x01(\t\x12\x0f\n\x07user_id\x18\x02 \x01(\t2\xd0\x05\n\x10HouseholdService\x12G\n\x0f\x43reateHousehold\x12\x17.api.v1.HouseholdCreate\x1a\x19.api.v1.HouseholdResponse\"\x00\x12G\n\x0cGetHousehold\x12\x1a.api.v1.HouseholdIdRequest\x1a\x19.api.v1.HouseholdResponse\"\x00\x12I\n\x0eListHouseholds\x12\x16.google.protobuf.Empty\x1a\x1d.api.v1.HouseholdListResponse\"\x00\x12G\n\x0fUpdateHousehold\x12\x17.api.v1.HouseholdUpdate\x1a\x19.api.v1.HouseholdResponse\"\x00\x12G\n\x0f\x44\x65leteHousehold\x12\x1a.api.v1.HouseholdIdRequest\x1a\x16.google.protobuf.Empty\"\x00\x12I\n\x12\x41\x64\x64HouseholdMember\x12\x18.api.v1.AddMemberRequest\x1a\x17.api.v1.HouseholdMember\"\x00\x12W\n\x19UpdateHouseholdMemberRole\x12\x1f.api.v1.UpdateMemberRoleRequest\x1a\x17.api.v1.HouseholdMember\"\x00\x12N\n\x15RemoveHouseholdMember\x12\x1b.api.v1.RemoveMemberRequest\x1a\x16.google.protobuf.Empty\"\x00\x12Y\n\x14ListHouseholdMembers\x12\x1a.api.v1.HouseholdIdRequest\x1a#.api.v1.HouseholdMemberListResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'api.v1.household_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_HOUSEHOLD']._serialized_start=116
+  _globals['_HOUSEHOLD']._serialized_end=290
+  _globals['_HOUSEHOLDMEMBER']._serialized_start=293
+  _globals['_HOUSEHOLDMEMBER']._serialized_end=450
+  _globals['_HOUSEHOLDCREATE']._serialized_start=452
+  _globals['_HOUSEHOLDCREATE']._serialized_end=504
+  _globals['_HOUSEHOLDUPDATE']._serialized_start=506
+  _globals['_HOUSEHOLDUPDATE']._serialized_end=605
+  _globals['_HOUSEHOLDRESPONSE']._serialized_start=607
+  _globals['_HOUSEHOLDRESPONSE']._serialized_end=664
+  _globals['_HOUSEHOLDLISTRESPONSE']._serialized_start=666
+  _globals['_HOUSEHOLDLISTRESPONSE']._serialized_end=743
+  _globals['_HOUSEHOLDMEMBERLISTRESPONSE']._serialized_start=745
+  _globals['_HOUSEHOLDMEMBERLISTRESPONSE']._serialized_end=831
+  _globals['_HOUSEHOLDIDREQUEST']._serialized_start=833
+  _globals['_HOUSEHOLDIDREQUEST']._serialized_end=865
+  _globals['_ADDMEMBERREQUEST']._serialized_start=867
+  _globals['_ADDMEMBERREQUEST']._serialized_end=938
+  _globals['_UPDATEMEMBERROLEREQUEST']._serialized_start=940
+  _globals['_UPDATEMEMBERROLEREQUEST']._serialized_end=1018
+  _globals['_REMOVEMEMBERREQUEST']._serialized_start=1020
+  _globals['_REMOVEMEMBERREQUEST']._serialized_end=1080
+  _globals['_HOUSEHOLDSERVICE']._serialized_start=1083
+  _globals['_HOUSEHOLDSERVICE']._serialized_end=1803
+# @@protoc_insertion_point(module_scope)
@@ -0,0 +1,454 @@
+# Generated by the gRPC Python protocol compiler plugin. DO NOT EDIT!
+"""Client and server classes corresponding to protobuf-defined services."""
+import grpc
+import warnings
+
+from api.generated.api.v1 import household_pb2 as api_dot_v1_dot_household__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+GRPC_GENERATED_VERSION = '1.84.0'
+GRPC_VERSION = grpc.__version__
+_version_not_supported = False
+
+try:
+    from grpc._utilities import first_version_is_lower
+    _version_not_supported = first_version_is_lower(GRPC_VERSION, GRPC_GENERATED_VERSION)
+except ImportError:
+    _version_not_supported = True
+
+if _version_not_supported:
+    raise RuntimeError(
+        f'The grpc package installed is at version {GRPC_VERSION},'
+        + ' but the generated code in api/v1/household_pb2_grpc.py depends on'
+        + f' grpcio>={GRPC_GENERATED_VERSION}.'
+        + f' Please upgrade your grpc module to grpcio>={GRPC_GENERATED_VERSION}'
+        + f' or downgrade your generated code using grpcio-tools<={GRPC_VERSION}.'
+    )
+
+
+class HouseholdServiceStub:
+    """HouseholdService handles household-related operations.
+    """
+
+    def __init__(self, channel):
+        """Constructor.
+
+        Args:
+            channel: A grpc.Channel.
+        """
+        self.CreateHousehold = channel.unary_unary(
+                '/api.v1.HouseholdService/CreateHousehold',
+                request_serializer=api_dot_v1_dot_household__pb2.HouseholdCreate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_household__pb2.HouseholdResponse.FromString,
+                _registered_method=True)
+        self.GetHousehold = channel.unary_unary(
+                '/api.v1.HouseholdService/GetHousehold',
+                request_serializer=api_dot_v1_dot_household__pb2.HouseholdIdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_household__pb2.HouseholdResponse.FromString,
+                _registered_method=True)
+        self.ListHouseholds = channel.unary_unary(
+                '/api.v1.HouseholdService/ListHouseholds',
+                request_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+                response_deserializer=api_dot_v1_dot_household__pb2.HouseholdListResponse.FromString,
+                _registered_method=True)
+        self.UpdateHousehold = channel.unary_unary(
+                '/api.v1.HouseholdService/UpdateHousehold',
+                request_serializer=api_dot_v1_dot_household__pb2.HouseholdUpdate.SerializeToString,
+                response_deserializer=api_dot_v1_dot_household__pb2.HouseholdResponse.FromString,
+                _registered_method=True)
+        self.DeleteHousehold = channel.unary_unary(
+                '/api.v1.HouseholdService/DeleteHousehold',
+                request_serializer=api_dot_v1_dot_household__pb2.HouseholdIdRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.AddHouseholdMember = channel.unary_unary(
+                '/api.v1.HouseholdService/AddHouseholdMember',
+                request_serializer=api_dot_v1_dot_household__pb2.AddMemberRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_household__pb2.HouseholdMember.FromString,
+                _registered_method=True)
+        self.UpdateHouseholdMemberRole = channel.unary_unary(
+                '/api.v1.HouseholdService/UpdateHouseholdMemberRole',
+                request_serializer=api_dot_v1_dot_household__pb2.UpdateMemberRoleRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_household__pb2.HouseholdMember.FromString,
+                _registered_method=True)
+        self.RemoveHouseholdMember = channel.unary_unary(
+                '/api.v1.HouseholdService/RemoveHouseholdMember',
+                request_serializer=api_dot_v1_dot_household__pb2.RemoveMemberRequest.SerializeToString,
+                response_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                _registered_method=True)
+        self.ListHouseholdMembers = channel.unary_unary(
+                '/api.v1.HouseholdService/ListHouseholdMembers',
+                request_serializer=api_dot_v1_dot_household__pb2.HouseholdIdRequest.SerializeToString,
+                response_deserializer=api_dot_v1_dot_household__pb2.HouseholdMemberListResponse.FromString,
+                _registered_method=True)
+
+
+class HouseholdServiceServicer:
+    """HouseholdService handles household-related operations.
+    """
+
+    def CreateHousehold(self, request, context):
+        """Create a new household.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def GetHousehold(self, request, context):
+        """Get a household by ID.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListHouseholds(self, request, context):
+        """List all households for the current user.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateHousehold(self, request, context):
+        """Update a household.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def DeleteHousehold(self, request, context):
+        """Delete a household.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def AddHouseholdMember(self, request, context):
+        """Add a member to a household.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def UpdateHouseholdMemberRole(self, request, context):
+        """Update a member's role in a household.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def RemoveHouseholdMember(self, request, context):
+        """Remove a member from a household.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def ListHouseholdMembers(self, request, context):
+        """List all members of a household.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+
+def add_HouseholdServiceServicer_to_server(servicer, server):
+    rpc_method_handlers = {
+            'CreateHousehold': grpc.unary_unary_rpc_method_handler(
+                    servicer.CreateHousehold,
+                    request_deserializer=api_dot_v1_dot_household__pb2.HouseholdCreate.FromString,
+                    response_serializer=api_dot_v1_dot_household__pb2.HouseholdResponse.SerializeToString,
+            ),
+            'GetHousehold': grpc.unary_unary_rpc_method_handler(
+                    servicer.GetHousehold,
+                    request_deserializer=api_dot_v1_dot_household__pb2.HouseholdIdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_household__pb2.HouseholdResponse.SerializeToString,
+            ),
+            'ListHouseholds': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListHouseholds,
+                    request_deserializer=google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+                    response_serializer=api_dot_v1_dot_household__pb2.HouseholdListResponse.SerializeToString,
+            ),
+            'UpdateHousehold': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateHousehold,
+                    request_deserializer=api_dot_v1_dot_household__pb2.HouseholdUpdate.FromString,
+                    response_serializer=api_dot_v1_dot_household__pb2.HouseholdResponse.SerializeToString,
+            ),
+            'DeleteHousehold': grpc.unary_unary_rpc_method_handler(
+                    servicer.DeleteHousehold,
+                    request_deserializer=api_dot_v1_dot_household__pb2.HouseholdIdRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'AddHouseholdMember': grpc.unary_unary_rpc_method_handler(
+                    servicer.AddHouseholdMember,
+                    request_deserializer=api_dot_v1_dot_household__pb2.AddMemberRequest.FromString,
+                    response_serializer=api_dot_v1_dot_household__pb2.HouseholdMember.SerializeToString,
+            ),
+            'UpdateHouseholdMemberRole': grpc.unary_unary_rpc_method_handler(
+                    servicer.UpdateHouseholdMemberRole,
+                    request_deserializer=api_dot_v1_dot_household__pb2.UpdateMemberRoleRequest.FromString,
+                    response_serializer=api_dot_v1_dot_household__pb2.HouseholdMember.SerializeToString,
+            ),
+            'RemoveHouseholdMember': grpc.unary_unary_rpc_method_handler(
+                    servicer.RemoveHouseholdMember,
+                    request_deserializer=api_dot_v1_dot_household__pb2.RemoveMemberRequest.FromString,
+                    response_serializer=google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            ),
+            'ListHouseholdMembers': grpc.unary_unary_rpc_method_handler(
+                    servicer.ListHouseholdMembers,
+                    request_deserializer=api_dot_v1_dot_household__pb2.HouseholdIdRequest.FromString,
+                    response_serializer=api_dot_v1_dot_household__pb2.HouseholdMemberListResponse.SerializeToString,
+            ),
+    }
+    generic_handler = grpc.method_handlers_generic_handler(
+            'api.v1.HouseholdService', rpc_method_handlers)
+    server.add_generic_rpc_handlers((generic_handler,))
+    server.add_registered_method_handlers('api.v1.HouseholdService', rpc_method_handlers)
+
+
+ # This class is part of an EXPERIMENTAL API.
+class HouseholdService:
+    """HouseholdService handles household-related operations.
+    """
+
+    @staticmethod
+    def CreateHousehold(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/CreateHousehold',
+            api_dot_v1_dot_household__pb2.HouseholdCreate.SerializeToString,
+            api_dot_v1_dot_household__pb2.HouseholdResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def GetHousehold(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/GetHousehold',
+            api_dot_v1_dot_household__pb2.HouseholdIdRequest.SerializeToString,
+            api_dot_v1_dot_household__pb2.HouseholdResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListHouseholds(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/ListHouseholds',
+            google_dot_protobuf_dot_empty__pb2.Empty.SerializeToString,
+            api_dot_v1_dot_household__pb2.HouseholdListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateHousehold(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/UpdateHousehold',
+            api_dot_v1_dot_household__pb2.HouseholdUpdate.SerializeToString,
+            api_dot_v1_dot_household__pb2.HouseholdResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def DeleteHousehold(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/DeleteHousehold',
+            api_dot_v1_dot_household__pb2.HouseholdIdRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def AddHouseholdMember(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/AddHouseholdMember',
+            api_dot_v1_dot_household__pb2.AddMemberRequest.SerializeToString,
+            api_dot_v1_dot_household__pb2.HouseholdMember.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def UpdateHouseholdMemberRole(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/UpdateHouseholdMemberRole',
+            api_dot_v1_dot_household__pb2.UpdateMemberRoleRequest.SerializeToString,
+            api_dot_v1_dot_household__pb2.HouseholdMember.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def RemoveHouseholdMember(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/RemoveHouseholdMember',
+            api_dot_v1_dot_household__pb2.RemoveMemberRequest.SerializeToString,
+            google_dot_protobuf_dot_empty__pb2.Empty.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def ListHouseholdMembers(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/api.v1.HouseholdService/ListHouseholdMembers',
+            api_dot_v1_dot_household__pb2.HouseholdIdRequest.SerializeToString,
+            api_dot_v1_dot_household__pb2.HouseholdMemberListResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
@@ -0,0 +1,155 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from api.generated.api.v1 import household_pb2 as _household_pb2
+from collections import abc as _abc
+from google.protobuf import empty_pb2 as _empty_pb2
+from grpc import aio as _aio
+import abc as _abc_1
+import grpc as _grpc
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import Self as _Self
+else:
+    from typing_extensions import Self as _Self
+
+_T = _typing.TypeVar("_T")
+
+class _MaybeAsyncIterator(_abc.AsyncIterator[_T], _abc.Iterator[_T], metaclass=_abc_1.ABCMeta): ...
+
+class _ServicerContext(_grpc.ServicerContext, _aio.ServicerContext):  # type: ignore[misc, type-arg]
+    ...
+
+GRPC_GENERATED_VERSION: str
+GRPC_VERSION: str
+
+class HouseholdServiceStub:
+    """HouseholdService handles household-related operations."""
+
+    @_typing.overload
+    def __new__(cls, channel: _grpc.Channel) -> _Self: ...
+    @_typing.overload
+    def __new__(cls, channel: _aio.Channel) -> HouseholdServiceAsyncStub: ...
+    CreateHousehold: _grpc.UnaryUnaryMultiCallable[_household_pb2.HouseholdCreate, _household_pb2.HouseholdResponse]
+    """Create a new household."""
+    GetHousehold: _grpc.UnaryUnaryMultiCallable[_household_pb2.HouseholdIdRequest, _household_pb2.HouseholdResponse]
+    """Get a household by ID."""
+    ListHouseholds: _grpc.UnaryUnaryMultiCallable[_empty_pb2.Empty, _household_pb2.HouseholdListResponse]
+    """List all households for the current user."""
+    UpdateHousehold: _grpc.UnaryUnaryMultiCallable[_household_pb2.HouseholdUpdate, _household_pb2.HouseholdResponse]
+    """Update a household."""
+    DeleteHousehold: _grpc.UnaryUnaryMultiCallable[_household_pb2.HouseholdIdRequest, _empty_pb2.Empty]
+    """Delete a household."""
+    AddHouseholdMember: _grpc.UnaryUnaryMultiCallable[_household_pb2.AddMemberRequest, _household_pb2.HouseholdMember]
+    """Add a member to a household."""
+    UpdateHouseholdMemberRole: _grpc.UnaryUnaryMultiCallable[_household_pb2.UpdateMemberRoleRequest, _household_pb2.HouseholdMember]
+    """Update a member's role in a household."""
+    RemoveHouseholdMember: _grpc.UnaryUnaryMultiCallable[_household_pb2.RemoveMemberRequest, _empty_pb2.Empty]
+    """Remove a member from a household."""
+    ListHouseholdMembers: _grpc.UnaryUnaryMultiCallable[_household_pb2.HouseholdIdRequest, _household_pb2.HouseholdMemberListResponse]
+    """List all members of a household."""
+
+@_typing.type_check_only
+class HouseholdServiceAsyncStub(HouseholdServiceStub):
+    """HouseholdService handles household-related operations."""
+
+    def __init__(self, channel: _aio.Channel) -> None: ...
+    CreateHousehold: _aio.UnaryUnaryMultiCallable[_household_pb2.HouseholdCreate, _household_pb2.HouseholdResponse]  # type: ignore[assignment]
+    """Create a new household."""
+    GetHousehold: _aio.UnaryUnaryMultiCallable[_household_pb2.HouseholdIdRequest, _household_pb2.HouseholdResponse]  # type: ignore[assignment]
+    """Get a household by ID."""
+    ListHouseholds: _aio.UnaryUnaryMultiCallable[_empty_pb2.Empty, _household_pb2.HouseholdListResponse]  # type: ignore[assignment]
+    """List all households for the current user."""
+    UpdateHousehold: _aio.UnaryUnaryMultiCallable[_household_pb2.HouseholdUpdate, _household_pb2.HouseholdResponse]  # type: ignore[assignment]
+    """Update a household."""
+    DeleteHousehold: _aio.UnaryUnaryMultiCallable[_household_pb2.HouseholdIdRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    """Delete a household."""
+    AddHouseholdMember: _aio.UnaryUnaryMultiCallable[_household_pb2.AddMemberRequest, _household_pb2.HouseholdMember]  # type: ignore[assignment]
+    """Add a member to a household."""
+    UpdateHouseholdMemberRole: _aio.UnaryUnaryMultiCallable[_household_pb2.UpdateMemberRoleRequest, _household_pb2.HouseholdMember]  # type: ignore[assignment]
+    """Update a member's role in a household."""
+    RemoveHouseholdMember: _aio.UnaryUnaryMultiCallable[_household_pb2.RemoveMemberRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    """Remove a member from a household."""
+    ListHouseholdMembers: _aio.UnaryUnaryMultiCallable[_household_pb2.HouseholdIdRequest, _household_pb2.HouseholdMemberListResponse]  # type: ignore[assignment]
+    """List all members of a household."""
+
+class HouseholdServiceServicer(metaclass=_abc_1.ABCMeta):
+    """HouseholdService handles household-related operations."""
+
+    @_abc_1.abstractmethod
+    def CreateHousehold(
+        self,
+        request: _household_pb2.HouseholdCreate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_household_pb2.HouseholdResponse, _abc.Awaitable[_household_pb2.HouseholdResponse]]:
+        """Create a new household."""
+
+    @_abc_1.abstractmethod
+    def GetHousehold(
+        self,
+        request: _household_pb2.HouseholdIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_household_pb2.HouseholdResponse, _abc.Awaitable[_household_pb2.HouseholdResponse]]:
+        """Get a household by ID."""
+
+    @_abc_1.abstractmethod
+    def ListHouseholds(
+        self,
+        request: _empty_pb2.Empty,
+        context: _ServicerContext,
+    ) -> _typing.Union[_household_pb2.HouseholdListResponse, _abc.Awaitable[_household_pb2.HouseholdListResponse]]:
+        """List all households for the current user."""
+
+    @_abc_1.abstractmethod
+    def UpdateHousehold(
+        self,
+        request: _household_pb2.HouseholdUpdate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_household_pb2.HouseholdResponse, _abc.Awaitable[_household_pb2.HouseholdResponse]]:
+        """Update a household."""
+
+    @_abc_1.abstractmethod
+    def DeleteHousehold(
+        self,
+        request: _household_pb2.HouseholdIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]:
+        """Delete a household."""
+
+    @_abc_1.abstractmethod
+    def AddHouseholdMember(
+        self,
+        request: _household_pb2.AddMemberRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_household_pb2.HouseholdMember, _abc.Awaitable[_household_pb2.HouseholdMember]]:
+        """Add a member to a household."""
+
+    @_abc_1.abstractmethod
+    def UpdateHouseholdMemberRole(
+        self,
+        request: _household_pb2.UpdateMemberRoleRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_household_pb2.HouseholdMember, _abc.Awaitable[_household_pb2.HouseholdMember]]:
+        """Update a member's role in a household."""
+
+    @_abc_1.abstractmethod
+    def RemoveHouseholdMember(
+        self,
+        request: _household_pb2.RemoveMemberRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]:
+        """Remove a member from a household."""
+
+    @_abc_1.abstractmethod
+    def ListHouseholdMembers(
+        self,
+        request: _household_pb2.HouseholdIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_household_pb2.HouseholdMemberListResponse, _abc.Awaitable[_household_pb2.HouseholdMemberListResponse]]:
+        """List all members of a household."""
+
+def add_HouseholdServiceServicer_to_server(servicer: HouseholdServiceServicer, server: _typing.Union[_grpc.Server, _aio.Server]) -> None: ...
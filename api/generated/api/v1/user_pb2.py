@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+# Generated by the protocol buffer compiler.  DO NOT EDIT!
+# NO CHECKED-IN PROTOBUF GENCODE
+# source: api/v1/user.proto
+# Protobuf Python Version: 7.35.1
+"""Generated protocol buffer code."""
+from google.protobuf import descriptor as _descriptor
+from google.protobuf import descriptor_pool as _descriptor_pool
+from google.protobuf import runtime_version as _runtime_version
+from google.protobuf import symbol_database as _symbol_database
+from google.protobuf.internal import builder as _builder
+_runtime_version.ValidateProtobufRuntimeVersion(
+    _runtime_version.Domain.PUBLIC,
+    7,
+    35,
+    1,
+    '',
+    'api/v1/user.proto'
+)
+# @@protoc_insertion_point(imports)
+
+_sym_db = _symbol_database.Default()
+
+
+from google.protobuf import timestamp_pb2 as google_dot_protobuf_dot_timestamp__pb2
+from google.protobuf import empty_pb2 as google_dot_protobuf_dot_empty__pb2
+
+
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x61pi/v1/user.proto\x12\x06\x61pi.v1\x1a\x1fgoogle/protobuf/timestamp.proto\x1a\x1bgoogle/protobuf/empty.proto\"\xbd\x01\n\x04User\x12\n\n\x02id\x18\x01 \x01(\t\x12\r\n\x05\x65mail\x18\x02 \x01(\t\x12\x11\n\tfull_name\x18\x03 \x01(\t\x12\x11\n\tis_active\x18\x04 \x01(\x08\x12\x14\n\x0cis_superuser\x18\x05 \x01(\x08\x12.\n\ncreated_at\x18\x06 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\x12.\n\nupdated_at\x18\x07 \x01(\x0b\x32\x1a.google.protobuf.Timestamp\"@\n\nUserCreate\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\x12\x11\n\tfull_name\x18\x03 \x01(\t\"\xa6\x01\n\nUserUpdate\x12\n\n\x02id\x18\x01 \x01(\t\x12\x12\n\x05\x65mail\x18\x02 \x01(\tH\x00\x88\x01\x01\x12\x16\n\tfull_name\x18\x03 \x01(\tH\x01\x88\x01\x01\x12\x16\n\tis_active\x18\x04 \x01(\x08H\x02\x88\x01\x01\x12\x15\n\x08password\x18\x05 \x01(\tH\x03\x88\x01\x01\x42\x08\n\x06_emailB\x0c\n\n_full_nameB\x0c\n\n_is_activeB\x0b\n\t_password\"*\n\x0cUserResponse\x12\x1a\n\x04user\x18\x01 \x01(\x0b\x32\x0c.api.v1.User\">\n\x10UserListResponse\x12\x1b\n\x05users\x18\x01 \x03(\x0b\x32\x0c.api.v1.User\x12\r\n\x05total\x18\x02 \x01(\x05\"\x1b\n\rUserIdRequest\x12\n\n\x02id\x18\x01 \x01(\t\"#\n\x14\x42\x61tchGetUsersRequest\x12\x0b\n\x03ids\x18\x01 \x03(\t\"I\n\x15\x42\x61tchGetUsersResponse\x12\x1b\n\x05users\x18\x01 \x03(\x0b\x32\x0c.api.v1.User\x12\x13\n\x0bmissing_ids\x18\x02 \x03(\t\"!\n\x10UserEmailRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\"/\n\x0cLoginRequest\x12\r\n\x05\x65mail\x18\x01 \x01(\t\x12\x10\n\x08password\x18\x02 \x01(\t\"h\n\x0c\x41uthResponse\x12\x14\n\x0c\x61\x63\x63\x65ss_token\x18\x01 \x01(\t\x12\x12\n\ntoken_type\x18\x02 \x01(\t\x12\x12\n\nexpires_in\x18\x03 \x01(\x03\x12\x1a\n\x04user\x18\x04 \x01(\x0b\x32\x0c.api.v1.User\"\x1d\n\x0cTokenRequest\x12\r\n\x05token\x18\x01 \x01(\t2\xca\x04\n\x0bUserService\x12\x38\n\nCreateUser\x12\x12.api.v1.UserCreate\x1a\x14.api.v1.UserResponse\"\x00\x12\x38\n\x07GetUser\x12\x15.api.v1.UserIdRequest\x1a\x14.api.v1.UserResponse\"\x00\x12N\n\rBatchGetUsers\x12\x1c.api.v1.BatchGetUsersRequest\x1a\x1d.api.v1.BatchGetUsersResponse\"\x00\x12\x42\n\x0eGetUserByEmail\x12\x18.api.v1.UserEmailRequest\x1a\x14.api.v1.UserResponse\"\x00\x12?\n\tListUsers\x12\x16.google.protobuf.Empty\x1a\x18.api.v1.UserListResponse\"\x00\x12\x38\n\nUpdateUser\x12\x12.api.v1.UserUpdate\x1a\x14.api.v1.UserResponse\"\x00\x12=\n\nDeleteUser\x12\x15.api.v1.UserIdRequest\x1a\x16.google.protobuf.Empty\"\x00\x12<\n\x0c\x41uthenticate\x12\x14.api.v1.LoginRequest\x1a\x14.api.v1.AuthResponse\"\x00\x12;\n\x0bVerifyToken\x12\x14.api.v1.TokenRequest\x1a\x14.api.v1.UserResponse\"\x00\x62\x06proto3')
+
+_globals = globals()
+_builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
+_builder.BuildTopDescriptorsAndMessages(DESCRIPTOR, 'api.v1.user_pb2', _globals)
+if not _descriptor._USE_C_DESCRIPTORS:
+  DESCRIPTOR._loaded_options = None
+  _globals['_USER']._serialized_start=92
+  _globals['_USER']._serialized_end=281
+  _globals['_USERCREATE']._serialized_start=283
+  _globals['_USERCREATE']._serialized_end=347
+  _globals['_USERUPDATE']._serialized_start=350
+  _globals['_USERUPDATE']._serialized_end=516
+  _globals['_USERRESPONSE']._serialized_start=518
+  _globals['_USERRESPONSE']._serialized_end=560
+  _globals['_USERLISTRESPONSE']._serialized_start=562
+  _globals['_USERLISTRESPONSE']._serialized_end=624
+  _globals['_USERIDREQUEST']._serialized_start=626
+  _globals['_USERIDREQUEST']._serialized_end=653
+  _globals['_BATCHGETUSERSREQUEST']._serialized_start=655
+  _globals['_BATCHGETUSERSREQUEST']._serialized_end=690
+  _globals['_BATCHGETUSERSRESPONSE']._serialized_start=692
+  _globals['_BATCHGETUSERSRESPONSE']._serialized_end=765
+  _globals['_USEREMAILREQUEST']._serialized_start=767
+  _globals['_USEREMAILREQUEST']._serialized_end=800
+  _globals['_LOGINREQUEST']._serialized_start=802
+  _globals['_LOGINREQUEST']._serialized_end=849
+  _globals['_AUTHRESPONSE']._serialized_start=851
+  _globals['_AUTHRESPONSE']._serialized_end=955
+  _globals['_TOKENREQUEST']._serialized_start=957
+  _globals['_TOKENREQUEST']._serialized_end=986
+  _globals['_USERSERVICE']._serialized_start=989
+  _globals['_USERSERVICE']._serialized_end=1575
+# @@protoc_insertion_point(module_scope)
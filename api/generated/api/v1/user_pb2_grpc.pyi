@@ -0,0 +1,155 @@
+"""
+@generated by mypy-protobuf.  Do not edit manually!
+isort:skip_file
+"""
+
+from api.generated.api.v1 import user_pb2 as _user_pb2
+from collections import abc as _abc
+from google.protobuf import empty_pb2 as _empty_pb2
+from grpc import aio as _aio
+import abc as _abc_1
+import grpc as _grpc
+import sys
+import typing as _typing
+
+if sys.version_info >= (3, 11):
+    from typing import Self as _Self
+else:
+    from typing_extensions import Self as _Self
+
+_T = _typing.TypeVar("_T")
+
+class _MaybeAsyncIterator(_abc.AsyncIterator[_T], _abc.Iterator[_T], metaclass=_abc_1.ABCMeta): ...
+
+class _ServicerContext(_grpc.ServicerContext, _aio.ServicerContext):  # type: ignore[misc, type-arg]
+    ...
+
+GRPC_GENERATED_VERSION: str
+GRPC_VERSION: str
+
+class UserServiceStub:
+    """UserService handles user-related operations."""
+
+    @_typing.overload
+    def __new__(cls, channel: _grpc.Channel) -> _Self: ...
+    @_typing.overload
+    def __new__(cls, channel: _aio.Channel) -> UserServiceAsyncStub: ...
+    CreateUser: _grpc.UnaryUnaryMultiCallable[_user_pb2.UserCreate, _user_pb2.UserResponse]
+    """Create a new user."""
+    GetUser: _grpc.UnaryUnaryMultiCallable[_user_pb2.UserIdRequest, _user_pb2.UserResponse]
+    """Get a user by ID."""
+    BatchGetUsers: _grpc.UnaryUnaryMultiCallable[_user_pb2.BatchGetUsersRequest, _user_pb2.BatchGetUsersResponse]
+    """Get users by ID with one lookup."""
+    GetUserByEmail: _grpc.UnaryUnaryMultiCallable[_user_pb2.UserEmailRequest, _user_pb2.UserResponse]
+    """Get a user by email."""
+    ListUsers: _grpc.UnaryUnaryMultiCallable[_empty_pb2.Empty, _user_pb2.UserListResponse]
+    """List all users with pagination."""
+    UpdateUser: _grpc.UnaryUnaryMultiCallable[_user_pb2.UserUpdate, _user_pb2.UserResponse]
+    """Update a user."""
+    DeleteUser: _grpc.UnaryUnaryMultiCallable[_user_pb2.UserIdRequest, _empty_pb2.Empty]
+    """Delete a user."""
+    Authenticate: _grpc.UnaryUnaryMultiCallable[_user_pb2.LoginRequest, _user_pb2.AuthResponse]
+    """Authenticate a user and return a token."""
+    VerifyToken: _grpc.UnaryUnaryMultiCallable[_user_pb2.TokenRequest, _user_pb2.UserResponse]
+    """Verify a token and return the user."""
+
+@_typing.type_check_only
+class UserServiceAsyncStub(UserServiceStub):
+    """UserService handles user-related operations."""
+
+    def __init__(self, channel: _aio.Channel) -> None: ...
+    CreateUser: _aio.UnaryUnaryMultiCallable[_user_pb2.UserCreate, _user_pb2.UserResponse]  # type: ignore[assignment]
+    """Create a new user."""
+    GetUser: _aio.UnaryUnaryMultiCallable[_user_pb2.UserIdRequest, _user_pb2.UserResponse]  # type: ignore[assignment]
+    """Get a user by ID."""
+    BatchGetUsers: _aio.UnaryUnaryMultiCallable[_user_pb2.BatchGetUsersRequest, _user_pb2.BatchGetUsersResponse]  # type: ignore[assignment]
+    """Get users by ID with one lookup."""
+    GetUserByEmail: _aio.UnaryUnaryMultiCallable[_user_pb2.UserEmailRequest, _user_pb2.UserResponse]  # type: ignore[assignment]
+    """Get a user by email."""
+    ListUsers: _aio.UnaryUnaryMultiCallable[_empty_pb2.Empty, _user_pb2.UserListResponse]  # type: ignore[assignment]
+    """List all users with pagination."""
+    UpdateUser: _aio.UnaryUnaryMultiCallable[_user_pb2.UserUpdate, _user_pb2.UserResponse]  # type: ignore[assignment]
+    """Update a user."""
+    DeleteUser: _aio.UnaryUnaryMultiCallable[_user_pb2.UserIdRequest, _empty_pb2.Empty]  # type: ignore[assignment]
+    """Delete a user."""
+    Authenticate: _aio.UnaryUnaryMultiCallable[_user_pb2.LoginRequest, _user_pb2.AuthResponse]  # type: ignore[assignment]
+    """Authenticate a user and return a token."""
+    VerifyToken: _aio.UnaryUnaryMultiCallable[_user_pb2.TokenRequest, _user_pb2.UserResponse]  # type: ignore[assignment]
+    """Verify a token and return the user."""
+
+class UserServiceServicer(metaclass=_abc_1.ABCMeta):
+    """UserService handles user-related operations."""
+
+    @_abc_1.abstractmethod
+    def CreateUser(
+        self,
+        request: _user_pb2.UserCreate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.UserResponse, _abc.Awaitable[_user_pb2.UserResponse]]:
+        """Create a new user."""
+
+    @_abc_1.abstractmethod
+    def GetUser(
+        self,
+        request: _user_pb2.UserIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.UserResponse, _abc.Awaitable[_user_pb2.UserResponse]]:
+        """Get a user by ID."""
+
+    @_abc_1.abstractmethod
+    def BatchGetUsers(
+        self,
+        request: _user_pb2.BatchGetUsersRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.BatchGetUsersResponse, _abc.Awaitable[_user_pb2.BatchGetUsersResponse]]:
+        """Get users by ID with one lookup."""
+
+    @_abc_1.abstractmethod
+    def GetUserByEmail(
+        self,
+        request: _user_pb2.UserEmailRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.UserResponse, _abc.Awaitable[_user_pb2.UserResponse]]:
+        """Get a user by email."""
+
+    @_abc_1.abstractmethod
+    def ListUsers(
+        self,
+        request: _empty_pb2.Empty,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.UserListResponse, _abc.Awaitable[_user_pb2.UserListResponse]]:
+        """List all users with pagination."""
+
+    @_abc_1.abstractmethod
+    def UpdateUser(
+        self,
+        request: _user_pb2.UserUpdate,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.UserResponse, _abc.Awaitable[_user_pb2.UserResponse]]:
+        """Update a user."""
+
+    @_abc_1.abstractmethod
+    def DeleteUser(
+        self,
+        request: _user_pb2.UserIdRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_empty_pb2.Empty, _abc.Awaitable[_empty_pb2.Empty]]:
+        """Delete a user."""
+
+    @_abc_1.abstractmethod
+    def Authenticate(
+        self,
+        request: _user_pb2.LoginRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.AuthResponse, _abc.Awaitable[_user_pb2.AuthResponse]]:
+        """Authenticate a user and return a token."""
+
+    @_abc_1.abstractmethod
+    def VerifyToken(
+        self,
+        request: _user_pb2.TokenRequest,
+        context: _ServicerContext,
+    ) -> _typing.Union[_user_pb2.UserResponse, _abc.Awaitable[_user_pb2.UserResponse]]:
+        """Verify a token and return the user."""
+
+def add_UserServiceServicer_to_server(servicer: UserServiceServicer, server: _typing.Union[_grpc.Server, _aio.Server]) -> None: ...
@@ -0,0 +1,179 @@
+"""
+gRPC Response Compression
+
+This module decides which gRPC responses are compressed. Compression costs
+CPU on both ends and only pays off for large messages, such as the pages of
+``ListUsers`` and ``ListTransactions``; small responses such as those of
+``Authenticate`` are sent as they are.
+
+Responses are compressed with ``GRPC_COMPRESSION_ALGORITHM``, ``gzip`` or
+``deflate``, by the methods of ``GRPC_COMPRESSION_POLICY``: a comma-separated
+list of ``pattern``, ``pattern=min_bytes`` or ``pattern=off`` entries, where
+responses smaller than ``min_bytes`` (by default
+``GRPC_COMPRESSION_MIN_BYTES``) are sent uncompressed and ``off`` excludes
+methods a broader pattern matches. Patterns match method names as those of
+``GRPC_CONCURRENCY_LIMITS`` do: a full method name, or a prefix ending in
+``*``, exact names first and longer prefixes before shorter ones. Responses
+of methods matching no pattern are not compressed.
+
+``grpc.aio`` ignores the compression a unary handler sets on its call, so the
+algorithm is the server's default compression, and the responses the policy
+leaves uncompressed are sent with ``disable_next_message_compression``.
+Clients that do not accept the algorithm receive uncompressed responses.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+import grpc
+
+from api.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Algorithms by their name in the settings
+ALGORITHMS = {
+    "none": grpc.Compression.NoCompression,
+    "gzip": grpc.Compression.Gzip,
+    "deflate": grpc.Compression.Deflate,
+}
+
+
+class CompressionRule:
+    """The size threshold of the responses of the methods matching a pattern."""
+
+    def __init__(self, pattern: str, min_bytes: Optional[int]):
+        """Initialize the rule.
+
+        Args:
+            pattern: The method name or prefix the rule applies to.
+            min_bytes: Size under which responses are not compressed, or None
+                if they never are.
+        """
+        self.pattern = pattern
+        self.min_bytes = min_bytes
+        self.compressed = 0
+        self.skipped = 0
+        # Serialized size of the responses compressed, before compression
+        self.compressed_bytes = 0
+
+    def should_compress(self, response: Any) -> bool:
+        """Return whether a response is large enough to compress, and count it."""
+        size = response.ByteSize()
+        if size < self.min_bytes:
+            self.skipped += 1
+            return False
+        self.compressed += 1
+        self.compressed_bytes += size
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the configuration and counters of the rule."""
+        return {
+            "pattern": self.pattern,
+            "min_bytes": self.min_bytes,
+            "compressed": self.compressed,
+            "skipped": self.skipped,
+            "compressed_bytes": self.compressed_bytes,
+        }
+
+
+def parse_policy(spec: str, min_bytes: int) -> List[Tuple[str, Optional[int]]]:
+    """Parse a ``GRPC_COMPRESSION_POLICY`` value.
+
+    Returns:
+        The pattern and size threshold of every entry, None for ``off``.
+
+    Raises:
+        ValueError: If an entry is malformed.
+    """
+    rules = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        pattern, separator, value = entry.partition("=")
+        value = value.strip().lower()
+        if not pattern.strip() or (
+            separator and value != "off" and not value.isdigit()
+        ):
+            raise ValueError(f"Invalid gRPC compression rule: {entry!r}")
+        if not separator:
+            threshold = min_bytes
+        elif value == "off":
+            threshold = None
+        else:
+            threshold = int(value)
+        rules.append((pattern.strip().lstrip("/"), threshold))
+    return rules
+
+
+class CompressionPolicy:
+    """The compression rules of the gRPC server, looked up by method name."""
+
+    def __init__(self, algorithm: str, rules: List[Tuple[str, Optional[int]]]):
+        """Initialize with the algorithm, and the pattern and threshold of every rule.
+
+        Raises:
+            ValueError: If the algorithm is unknown.
+        """
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Invalid gRPC compression algorithm: {algorithm!r}")
+        self.algorithm = algorithm
+        self.rules = [CompressionRule(*rule) for rule in rules]
+        # Default compression of the server, None if nothing is compressed
+        self.compression: Optional[grpc.Compression] = None
+        if algorithm != "none" and any(
+            rule.min_bytes is not None for rule in self.rules
+        ):
+            self.compression = ALGORITHMS[algorithm]
+        self._exact = {
+            rule.pattern: rule for rule in self.rules if not rule.pattern.endswith("*")
+        }
+        # Longest prefix first, so the most specific one matches
+        self._prefixes = sorted(
+            (rule for rule in self.rules if rule.pattern.endswith("*")),
+            key=lambda rule: len(rule.pattern),
+            reverse=True,
+        )
+        self._by_method: Dict[str, Optional[CompressionRule]] = {}
+
+    @classmethod
+    def from_settings(cls) -> "CompressionPolicy":
+        """Create the policy configured in the settings."""
+        return cls(
+            settings.GRPC_COMPRESSION_ALGORITHM.strip().lower(),
+            parse_policy(
+                settings.GRPC_COMPRESSION_POLICY, settings.GRPC_COMPRESSION_MIN_BYTES
+            ),
+        )
+
+    def for_method(self, method_name: str) -> Optional[CompressionRule]:
+        """Return the rule of a method, or None if its responses are not compressed."""
+        method_name = method_name.lstrip("/")
+        if method_name not in self._by_method:
+            rule = self._exact.get(method_name)
+            if rule is None:
+                rule = next(
+                    (
+                        prefix
+                        for prefix in self._prefixes
+                        if method_name.startswith(prefix.pattern[:-1])
+                    ),
+                    None,
+                )
+            if rule is not None and rule.min_bytes is None:
+                rule = None
+            self._by_method[method_name] = rule
+        return self._by_method[method_name]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the algorithm, and the configuration and counters of every rule."""
+        return {
+            "algorithm": self.algorithm if self.compression else "none",
+            "rules": [rule.snapshot() for rule in self.rules],
+        }
+
+
+# Compression policy of the gRPC server of this process
+compression_policy = CompressionPolicy.from_settings()
@@ -1,12 +1,29 @@
+"""
+gRPC Server Interceptors
+
+This module provides the ``grpc.aio`` interceptors of the gRPC server:
+logging, per-method response compression, per-method concurrency limits,
+JWT authentication and mapping of unhandled exceptions to status codes. They
+run on the event loop, so they must not block.
+"""
+
+import asyncio
+import inspect
 import logging
+import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import grpc
+import grpc.aio
 from google.protobuf import message as _message
 from grpc import StatusCode
 
+from api.base_service import ServiceException
 from api.config import settings
+from api.grpc_compression import CompressionPolicy, CompressionRule, compression_policy
+from api.grpc_limits import ConcurrencyLimit, LimitExceeded, MethodLimits, method_limits
+from api.request_logging import RequestLog, request_log
 from api.security import decode_access_token
 
 logger = logging.getLogger(__name__)
@@ -25,7 +42,86 @@ PUBLIC_METHODS = [
 ]
 
 
-class AuthInterceptor(grpc.ServerInterceptor):
+async def _call(behavior: Callable, request: Any, context: Any) -> Any:
+    """Call an RPC behavior, awaiting it if it is a coroutine function."""
+    response = behavior(request, context)
+    if inspect.isawaitable(response):
+        response = await response
+    return response
+
+
+def _response_stream(behavior: Callable) -> Callable:
+    """Return a response-streaming behavior as an async generator function.
+
+    A coroutine writing its responses with ``context.write`` becomes an async
+    generator yielding nothing, so wrappers still see the RPC start, end and
+    fail, though not its responses one by one.
+
+    Raises:
+        TypeError: If the behavior is synchronous; it would block the event
+            loop, so blocking methods are served with ``blocking_stream_rpc``.
+    """
+    if inspect.isasyncgenfunction(behavior):
+        return behavior
+    if not inspect.iscoroutinefunction(behavior):
+        raise TypeError(
+            f"Response-streaming handler {behavior!r} must be an async generator "
+            "or a coroutine function"
+        )
+
+    async def stream(request, context):
+        await behavior(request, context)
+        for response in ():
+            yield response
+
+    return stream
+
+
+def _wrap_behavior(
+    handler: Optional[grpc.RpcMethodHandler],
+    wrap: Callable[[Callable, bool], Callable],
+) -> Optional[grpc.RpcMethodHandler]:
+    """Return a copy of a method handler whose behavior is wrapped.
+
+    ``wrap`` is called with the behavior and whether it streams responses.
+    Response-streaming behaviors are given to it as async generators (see
+    ``_response_stream``).
+    """
+    if handler is None:
+        return handler
+    if handler.request_streaming and handler.response_streaming:
+        behavior, factory = handler.stream_stream, grpc.stream_stream_rpc_method_handler
+    elif handler.request_streaming:
+        behavior, factory = handler.stream_unary, grpc.stream_unary_rpc_method_handler
+    elif handler.response_streaming:
+        behavior, factory = handler.unary_stream, grpc.unary_stream_rpc_method_handler
+    else:
+        behavior, factory = handler.unary_unary, grpc.unary_unary_rpc_method_handler
+    if handler.response_streaming:
+        behavior = _response_stream(behavior)
+    return factory(
+        wrap(behavior, handler.response_streaming),
+        request_deserializer=handler.request_deserializer,
+        response_serializer=handler.response_serializer,
+    )
+
+
+class _ContextWithVars:
+    """Servicer context carrying variables set by an interceptor.
+
+    ``grpc.aio`` servicer contexts do not accept new attributes, so handlers
+    are given this proxy instead, which delegates everything else.
+    """
+
+    def __init__(self, context: grpc.aio.ServicerContext, context_vars: Dict[str, Any]):
+        self._context = context
+        self.__dict__.update(context_vars)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
+
+
+class AuthInterceptor(grpc.aio.ServerInterceptor):
     """gRPC interceptor for JWT authentication."""
 
     def __init__(self, public_methods: Optional[List[str]] = None):
@@ -33,9 +129,6 @@ class AuthInterceptor(grpc.ServerInterceptor):
         self.public_methods = set(public_methods or [])
         self.public_methods.update(PUBLIC_METHODS)
 
-        # Initialize the RPC state
-        self._rpc_state = {}
-
     def _get_auth_token(self, metadata: List[Tuple[str, str]]) -> Optional[str]:
         """Extract the JWT token from metadata."""
         if not metadata:
@@ -52,6 +145,9 @@ class AuthInterceptor(grpc.ServerInterceptor):
 
     def _is_public_method(self, method_name: str) -> bool:
         """Check if the method is public."""
+        # Full method names start with a slash, e.g. "/api.v1.UserService/Authenticate"
+        method_name = method_name.lstrip("/")
+
         # Check exact match
         if method_name in self.public_methods:
             return True
@@ -75,16 +171,13 @@ class AuthInterceptor(grpc.ServerInterceptor):
             logger.warning(f"Token verification failed: {e}")
             return None
 
-    def intercept_service(self, continuation, handler_call_details):
+    async def intercept_service(self, continuation, handler_call_details):
         """Intercept incoming RPCs before handing them over to a handler."""
         method_name = handler_call_details.method
 
         # Skip authentication for public methods
         if self._is_public_method(method_name):
-            return continuation(handler_call_details)
-
-        # Get the metadata
-        metadata = dict(handler_call_details.invocation_metadata)
+            return await continuation(handler_call_details)
 
         # Check for authorization header
         token = self._get_auth_token(handler_call_details.invocation_metadata)
@@ -109,125 +202,317 @@ class AuthInterceptor(grpc.ServerInterceptor):
 
         # Continue with the RPC
         try:
-            return self._continue_rpc(continuation, handler_call_details, context_vars)
+            return await self._continue_rpc(
+                continuation, handler_call_details, context_vars
+            )
         except Exception as e:
             logger.error(f"RPC failed: {e}", exc_info=True)
             raise
 
-    def _continue_rpc(self, continuation, handler_call_details, context_vars):
+    async def _continue_rpc(self, continuation, handler_call_details, context_vars):
         """Continue the RPC with the given context variables."""
         # Create a new handler with the context variables
-        handler = continuation(handler_call_details)
-
-        # If this is a unary-unary RPC, wrap the handler
-        if handler and (handler.request_streaming, handler.response_streaming) == (
-            False,
-            False,
-        ):
-            return grpc.unary_unary_rpc_method_handler(
-                self._unary_unary_handler(handler.handle_unary_unary, context_vars),
-                request_deserializer=handler.request_deserializer,
-                response_serializer=handler.response_serializer,
+        handler = await continuation(handler_call_details)
+
+        return _wrap_behavior(
+            handler,
+            lambda behavior, streaming: self._wrap_handler(
+                behavior, streaming, context_vars
+            ),
+        )
+
+    def _wrap_handler(self, handler, streaming: bool, context_vars):
+        """Wrap a handler to inject context variables."""
+        if streaming:
+
+            async def stream_wrapper(request, context):
+                async for response in handler(
+                    request, _ContextWithVars(context, context_vars)
+                ):
+                    yield response
+
+            return stream_wrapper
+
+        async def wrapper(request, context):
+            # Inject context variables and call the original handler
+            return await _call(
+                handler, request, _ContextWithVars(context, context_vars)
             )
 
-        # For other types of RPCs, return the original handler
-        return handler
-
-    def _unary_unary_handler(self, handler, context_vars):
-        """Wrap a unary-unary handler to inject context variables."""
-
-        def wrapper(request, context):
-            # Inject context variables
-            for key, value in context_vars.items():
-                setattr(context, key, value)
-
-            # Call the original handler
-            return handler(request, context)
-
         return wrapper
 
     def _abort_with_status(self, status_code: StatusCode, details: str):
         """Abort the RPC with the given status code and details."""
 
         # Create a generic handler that will raise the error
-        def abort_handler(request, context):
-            context.abort(status_code, details)
+        async def abort_handler(request, context):
+            await context.abort(status_code, details)
 
         return grpc.unary_unary_rpc_method_handler(abort_handler)
 
 
-class LoggingInterceptor(grpc.ServerInterceptor):
-    """gRPC interceptor for request/response logging."""
+class LoggingInterceptor(grpc.aio.ServerInterceptor):
+    """gRPC interceptor logging every RPC as one line of the request log.
+
+    Lines are written once the RPC ends, with its status and duration, and
+    are sampled by method as ``REQUEST_LOG_SAMPLING`` sets (see
+    api/request_logging.py). It runs first, so RPCs shed or rejected by the
+    other interceptors are logged too.
+    """
+
+    def __init__(self, log: Optional[RequestLog] = None):
+        """Initialize the interceptor with the request log of the server."""
+        self.log = log or request_log
+
+    async def intercept_service(self, continuation, handler_call_details):
+        """Intercept incoming RPCs to log them once they end."""
+        method_name = handler_call_details.method.lstrip("/")
+        handler = await continuation(handler_call_details)
+        return _wrap_behavior(
+            handler,
+            lambda behavior, streaming: self._logged(behavior, streaming, method_name),
+        )
+
+    def _logged(self, handler, streaming: bool, method_name: str):
+        """Wrap a handler to log the RPC once it ends."""
+        if streaming:
+
+            async def stream_wrapper(request, context):
+                started = time.perf_counter()
+                code = None
+                try:
+                    async for response in handler(request, context):
+                        yield response
+                except grpc.aio.AbortError:
+                    raise
+                except asyncio.CancelledError:
+                    code = StatusCode.CANCELLED
+                    raise
+                except BaseException:
+                    code = StatusCode.UNKNOWN
+                    raise
+                finally:
+                    self._log(method_name, context, code, started)
+
+            return stream_wrapper
+
+        async def wrapper(request, context):
+            started = time.perf_counter()
+            code = None
+            try:
+                return await _call(handler, request, context)
+            except grpc.aio.AbortError:
+                raise
+            except asyncio.CancelledError:
+                code = StatusCode.CANCELLED
+                raise
+            except BaseException:
+                code = StatusCode.UNKNOWN
+                raise
+            finally:
+                self._log(method_name, context, code, started)
+
+        return wrapper
 
-    def intercept_service(self, continuation, handler_call_details):
-        """Intercept incoming RPCs for logging."""
-        method_name = handler_call_details.method
-        logger.info(f"gRPC request started: {method_name}")
+    def _log(
+        self, method_name: str, context, code: Optional[StatusCode], started: float
+    ) -> None:
+        """Log an RPC with the status it ended with."""
+        # Aborted RPCs have their status set on the context; an exception
+        # escaping the handler ends as UNKNOWN, a cancelled RPC as CANCELLED
+        code = code or context.code() or StatusCode.OK
+        self.log.log(
+            "grpc",
+            method_name,
+            code.name,
+            code is not StatusCode.OK,
+            (time.perf_counter() - started) * 1e3,
+            peer=context.peer(),
+        )
+
+
+class CompressionInterceptor(grpc.aio.ServerInterceptor):
+    """gRPC interceptor applying the response compression policy.
+
+    The server compresses every response with the policy's algorithm; this
+    interceptor turns it off for the responses of methods the policy leaves
+    out, and for those under the size threshold of their method's rule.
+    Response streams are decided message by message.
+    """
+
+    def __init__(self, policy: Optional[CompressionPolicy] = None):
+        """Initialize the interceptor with the policy of the server."""
+        self.policy = policy or compression_policy
+
+    async def intercept_service(self, continuation, handler_call_details):
+        """Intercept incoming RPCs to decide on the compression of their responses."""
+        handler = await continuation(handler_call_details)
+        if self.policy.compression is None:
+            return handler
+        rule = self.policy.for_method(handler_call_details.method)
+        return _wrap_behavior(
+            handler,
+            lambda behavior, streaming: self._compressed(behavior, streaming, rule),
+        )
+
+    @staticmethod
+    def _compressed(handler, streaming: bool, rule: Optional[CompressionRule]):
+        """Wrap a handler to send the responses not worth compressing as they are."""
+        if streaming:
+
+            async def stream_wrapper(request, context):
+                async for response in handler(request, context):
+                    if rule is None or not rule.should_compress(response):
+                        context.disable_next_message_compression()
+                    yield response
+
+            return stream_wrapper
+
+        async def wrapper(request, context):
+            response = await _call(handler, request, context)
+            if rule is None or response is None or not rule.should_compress(response):
+                context.disable_next_message_compression()
+            return response
 
+        return wrapper
+
+
+class ConcurrencyLimitInterceptor(grpc.aio.ServerInterceptor):
+    """gRPC interceptor shedding load over the configured concurrency limits.
+
+    RPCs of a limited method wait for a slot in a bounded queue, and are
+    rejected with RESOURCE_EXHAUSTED if the queue is full or their deadline
+    would pass first. It runs before authentication, so shed RPCs cost as
+    little as possible.
+    """
+
+    def __init__(self, limits: Optional[MethodLimits] = None):
+        """Initialize the interceptor with the limits of the server."""
+        self.limits = limits or method_limits
+
+    async def intercept_service(self, continuation, handler_call_details):
+        """Intercept incoming RPCs to hold them to their method's limit."""
+        handler = await continuation(handler_call_details)
+        limit = self.limits.for_method(handler_call_details.method)
+        if limit is None:
+            return handler
+        return _wrap_behavior(
+            handler,
+            lambda behavior, streaming: self._limited(behavior, streaming, limit),
+        )
+
+    def _limited(self, handler, streaming: bool, limit: ConcurrencyLimit):
+        """Wrap a handler to run it in a slot of a limit."""
+        if streaming:
+
+            async def stream_wrapper(request, context):
+                await self._acquire(limit, context)
+                started = time.monotonic()
+                try:
+                    async for response in handler(request, context):
+                        yield response
+                finally:
+                    limit.release(time.monotonic() - started)
+
+            return stream_wrapper
+
+        async def wrapper(request, context):
+            await self._acquire(limit, context)
+            started = time.monotonic()
+            try:
+                return await _call(handler, request, context)
+            finally:
+                limit.release(time.monotonic() - started)
+
+        return wrapper
+
+    @staticmethod
+    async def _acquire(limit: ConcurrencyLimit, context) -> None:
+        """Wait for a slot of a limit, or abort the RPC if it is shed."""
         try:
-            # Continue with the RPC
-            return continuation(handler_call_details)
-        except Exception as e:
-            logger.error(
-                f"gRPC request failed: {method_name}",
-                exc_info=True,
-                extra={"error": str(e)},
-            )
-            raise
+            await limit.acquire(context.time_remaining())
+        except LimitExceeded as e:
+            await context.abort(StatusCode.RESOURCE_EXHAUSTED, str(e))
 
 
-class ErrorHandlingInterceptor(grpc.ServerInterceptor):
+class ErrorHandlingInterceptor(grpc.aio.ServerInterceptor):
     """gRPC interceptor for error handling and status code mapping."""
 
-    def intercept_service(self, continuation, handler_call_details):
+    async def intercept_service(self, continuation, handler_call_details):
         """Intercept incoming RPCs to handle errors."""
-        try:
-            return continuation(handler_call_details)
-        except Exception as e:
-            logger.error(
-                f"Unhandled exception in gRPC method {handler_call_details.method}",
-                exc_info=True,
-            )
-
-            # Map exception to gRPC status code
-            status_code = StatusCode.INTERNAL
-            details = "Internal server error"
+        method_name = handler_call_details.method
+        handler = await continuation(handler_call_details)
+        return _wrap_behavior(
+            handler,
+            lambda behavior, streaming: self._error_handler(
+                behavior, streaming, method_name
+            ),
+        )
+
+    def _error_handler(self, handler, streaming: bool, method_name: str):
+        """Wrap a handler to map its exceptions to status codes."""
+        if streaming:
+
+            async def stream_wrapper(request, context):
+                try:
+                    async for response in handler(request, context):
+                        yield response
+                except Exception as e:
+                    await self._abort(e, context, method_name)
+
+            return stream_wrapper
+
+        async def wrapper(request, context):
+            try:
+                return await _call(handler, request, context)
+            except Exception as e:
+                await self._abort(e, context, method_name)
 
-            if isinstance(e, grpc.RpcError):
-                # Already a gRPC error, re-raise
-                raise
+        return wrapper
 
-            # Map common exception types to gRPC status codes
-            if isinstance(e, (ValueError, TypeError, AttributeError)):
-                status_code = StatusCode.INVALID_ARGUMENT
-                details = str(e) or "Invalid argument"
-            elif isinstance(e, PermissionError):
-                status_code = StatusCode.PERMISSION_DENIED
-                details = str(e) or "Permission denied"
-            elif isinstance(e, FileNotFoundError):
-                status_code = StatusCode.NOT_FOUND
-                details = str(e) or "Resource not found"
-            elif isinstance(e, TimeoutError):
-                status_code = StatusCode.DEADLINE_EXCEEDED
-                details = str(e) or "Request timed out"
-            elif isinstance(e, NotImplementedError):
-                status_code = StatusCode.UNIMPLEMENTED
-                details = str(e) or "Not implemented"
-
-            # Log the error
-            logger.error(f"gRPC error: {status_code.name} - {details}")
-
-            # Raise a gRPC error
-            context = grpc.ServicerContext()
-            context.set_code(status_code)
-            context.set_details(details)
-            context.abort(status_code, details)
-
-
-def create_grpc_interceptors() -> List[grpc.ServerInterceptor]:
+    async def _abort(self, e: Exception, context, method_name: str) -> None:
+        """Abort the RPC with the status of an exception."""
+        if isinstance(e, (grpc.aio.AbortError, grpc.RpcError)) and not isinstance(
+            e, ServiceException
+        ):
+            # Already a gRPC error, re-raise
+            raise e
+        if not isinstance(e, ServiceException):
+            logger.error(
+                f"Unhandled exception in gRPC method {method_name}",
+                exc_info=e,
+            )
+        status_code, details = self._map_exception(e)
+
+        # Log the error
+        logger.error(f"gRPC error: {status_code.name} - {details}")
+        await context.abort(status_code, details)
+
+    @staticmethod
+    def _map_exception(e: Exception) -> Tuple[StatusCode, str]:
+        """Map an exception to a gRPC status code and details."""
+        if isinstance(e, ServiceException):
+            return e.status_code, e.details
+        # Map common exception types to gRPC status codes
+        if isinstance(e, (ValueError, TypeError, AttributeError)):
+            return StatusCode.INVALID_ARGUMENT, str(e) or "Invalid argument"
+        if isinstance(e, PermissionError):
+            return StatusCode.PERMISSION_DENIED, str(e) or "Permission denied"
+        if isinstance(e, FileNotFoundError):
+            return StatusCode.NOT_FOUND, str(e) or "Resource not found"
+        if isinstance(e, TimeoutError):
+            return StatusCode.DEADLINE_EXCEEDED, str(e) or "Request timed out"
+        if isinstance(e, NotImplementedError):
+            return StatusCode.UNIMPLEMENTED, str(e) or "Not implemented"
+        return StatusCode.INTERNAL, "Internal server error"
+
+
+def create_grpc_interceptors() -> List[grpc.aio.ServerInterceptor]:
     """Create and return a list of gRPC interceptors."""
     return [
         LoggingInterceptor(),
+        CompressionInterceptor(),
+        ConcurrencyLimitInterceptor(),
         AuthInterceptor(),
         ErrorHandlingInterceptor(),
     ]
@@ -0,0 +1,239 @@
+"""
+gRPC Concurrency Limits
+
+This module bounds how many RPCs of a method, or of a group of methods, run
+at once, so bursts of heavy RPCs cannot take every worker thread from cheap
+ones such as ``Authenticate``. RPCs over a limit wait in a bounded queue and
+are rejected early when the queue is full or their deadline would pass
+before their turn.
+
+Limits are configured with ``GRPC_CONCURRENCY_LIMITS``, a comma-separated
+list of ``pattern=limit`` or ``pattern=limit:queue_size`` entries. A pattern
+is a full method name such as ``api.v1.UserService/ListUsers`` or a prefix
+ending in ``*`` such as ``api.v1.FinanceService/*``; all methods matching a
+pattern share its limit. Exact names take precedence over prefixes, and
+longer prefixes over shorter ones. Methods matching no pattern are not
+limited.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from api.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Weight of the latest RPC in the moving average of service times
+SERVICE_TIME_SMOOTHING = 0.2
+
+
+class LimitExceeded(Exception):
+    """Raised when an RPC is shed instead of waiting for its limit."""
+
+
+class ConcurrencyLimit:
+    """A limit on the RPCs running at once, with a bounded FIFO wait queue.
+
+    Freed slots are handed to the oldest waiter, so waiters are served in
+    order. The limit belongs to the event loop of the gRPC server.
+    """
+
+    def __init__(self, pattern: str, limit: int, queue_size: int):
+        """Initialize the limit.
+
+        Args:
+            pattern: The method name or prefix the limit applies to.
+            limit: Number of RPCs that may run at once.
+            queue_size: Number of RPCs that may wait for a slot.
+        """
+        self.pattern = pattern
+        self.limit = limit
+        self.queue_size = queue_size
+        self.active = 0
+        self.rejected = 0
+        self.completed = 0
+        # Moving average of RPC durations in seconds, once one has completed
+        self.service_time: Optional[float] = None
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """Number of RPCs waiting for a slot."""
+        return len(self._waiters)
+
+    def expected_wait(self) -> float:
+        """Estimate how long an RPC arriving now waits for a slot, in seconds."""
+        if self.active < self.limit and not self._waiters:
+            return 0.0
+        # Every `limit` completions admit one more waiter
+        return (self.waiting + 1) / self.limit * (self.service_time or 0.0)
+
+    async def acquire(self, time_remaining: Optional[float] = None) -> None:
+        """Wait for a slot.
+
+        Args:
+            time_remaining: Seconds until the caller's deadline, if it has one.
+
+        Raises:
+            LimitExceeded: If the queue is full, or the deadline passes or is
+                expected to pass before a slot frees up.
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if self.waiting >= self.queue_size:
+            self._reject()
+            raise LimitExceeded(f"Too many concurrent requests ({self.pattern})")
+        if time_remaining is not None and self.expected_wait() >= time_remaining:
+            self._reject()
+            raise LimitExceeded(
+                f"Deadline too short for the current load ({self.pattern})"
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, time_remaining)
+        except asyncio.TimeoutError:
+            self._reject()
+            raise LimitExceeded(f"Deadline passed while queued ({self.pattern})")
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                # A slot was handed over as the caller went away; pass it on
+                self._hand_over()
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    def release(self, elapsed: float) -> None:
+        """Free the slot of an RPC that ran for ``elapsed`` seconds."""
+        self.completed += 1
+        if self.service_time is None:
+            self.service_time = elapsed
+        else:
+            self.service_time += SERVICE_TIME_SMOOTHING * (elapsed - self.service_time)
+        self._hand_over()
+
+    def _hand_over(self) -> None:
+        """Give a freed slot to the oldest waiter, or return it."""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _reject(self) -> None:
+        """Count a shed RPC."""
+        self.rejected += 1
+        logger.warning(
+            f"Shedding RPC for {self.pattern}: {self.active} active, "
+            f"{self.waiting} waiting"
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the configuration and live state of the limit."""
+        return {
+            "pattern": self.pattern,
+            "limit": self.limit,
+            "queue_size": self.queue_size,
+            "active": self.active,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "completed": self.completed,
+            "service_time_ms": (
+                round(self.service_time * 1e3, 3)
+                if self.service_time is not None
+                else None
+            ),
+        }
+
+
+def parse_limits(spec: str, queue_size: int) -> List[Tuple[str, int, int]]:
+    """Parse a ``GRPC_CONCURRENCY_LIMITS`` value.
+
+    Returns:
+        The pattern, limit and queue size of every entry.
+
+    Raises:
+        ValueError: If an entry is malformed.
+    """
+    limits = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        pattern, separator, value = entry.partition("=")
+        limit, _, queue = value.partition(":")
+        if not separator or not pattern.strip() or not limit.strip().isdigit():
+            raise ValueError(f"Invalid gRPC concurrency limit: {entry!r}")
+        if int(limit) < 1 or (queue and not queue.strip().isdigit()):
+            raise ValueError(f"Invalid gRPC concurrency limit: {entry!r}")
+        limits.append(
+            (
+                pattern.strip().lstrip("/"),
+                int(limit),
+                int(queue) if queue else queue_size,
+            )
+        )
+    return limits
+
+
+class MethodLimits:
+    """The concurrency limits of the gRPC server, looked up by method name."""
+
+    def __init__(self, limits: List[Tuple[str, int, int]]):
+        """Initialize with the pattern, limit and queue size of every limit."""
+        self.limits = [ConcurrencyLimit(*limit) for limit in limits]
+        self._exact = {
+            limit.pattern: limit
+            for limit in self.limits
+            if not limit.pattern.endswith("*")
+        }
+        # Longest prefix first, so the most specific one matches
+        self._prefixes = sorted(
+            (limit for limit in self.limits if limit.pattern.endswith("*")),
+            key=lambda limit: len(limit.pattern),
+            reverse=True,
+        )
+        self._by_method: Dict[str, Optional[ConcurrencyLimit]] = {}
+
+    @classmethod
+    def from_settings(cls) -> "MethodLimits":
+        """Create the limits configured in the settings."""
+        return cls(
+            parse_limits(
+                settings.GRPC_CONCURRENCY_LIMITS, settings.GRPC_CONCURRENCY_QUEUE_SIZE
+            )
+        )
+
+    def for_method(self, method_name: str) -> Optional[ConcurrencyLimit]:
+        """Return the limit of a method, or None if it is not limited."""
+        method_name = method_name.lstrip("/")
+        if method_name not in self._by_method:
+            limit = self._exact.get(method_name)
+            if limit is None:
+                limit = next(
+                    (
+                        prefix
+                        for prefix in self._prefixes
+                        if method_name.startswith(prefix.pattern[:-1])
+                    ),
+                    None,
+                )
+            self._by_method[method_name] = limit
+        return self._by_method[method_name]
+
+    def snapshot(self) -> List[Dict[str, Any]]:
+        """Return the configuration and live state of every limit."""
+        return [limit.snapshot() for limit in self.limits]
+
+
+# Limits of the gRPC server of this process
+method_limits = MethodLimits.from_settings()
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import signal
 import sys
@@ -6,9 +7,19 @@ from typing import List, Optional
 
 import grpc
 from grpc_health.v1 import health as health_servicer
-from grpc_health.v1 import health_pb2_grpc
+from grpc_health.v1 import health_pb2, health_pb2_grpc
 from grpc_reflection.v1alpha import reflection
 
+from api.config import settings
+from api.prefork import (
+    HEARTBEAT_INTERVAL,
+    Supervisor,
+    WorkerGroup,
+    WorkerHealth,
+    worker_statuses,
+)
+from api.request_logging import WORKER_TEXT_FORMAT, configure_logging
+
 logger = logging.getLogger(__name__)
 
 
@@ -176,31 +187,162 @@ class GRPCServer:
         self.stop()
 
 
-def serve():
-    """Run the gRPC server."""
-    import logging
-    from concurrent import futures
+def _service_names() -> List[str]:
+    """Return the full names of the application's gRPC services."""
+    from api.generated.api.v1 import calendar_pb2, finance_pb2, household_pb2, user_pb2
 
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    return [
+        service.full_name
+        for module in (user_pb2, calendar_pb2, household_pb2, finance_pb2)
+        for service in module.DESCRIPTOR.services_by_name.values()
+    ]
+
+
+def _worker_service_name(slot: int) -> str:
+    """Return the health service name reporting on a prefork worker."""
+    return f"worker-{slot}"
+
+
+async def _report_health(
+    servicer: health_servicer.aio.HealthServicer, health: WorkerHealth
+) -> None:
+    """Set the health statuses of a worker from the heartbeats of its group.
+
+    The overall status (the empty service name) and those of the application's
+    services are SERVING while enough workers of the group are alive, so any
+    worker answers for the whole group; ``worker-<slot>`` reports on each one.
+    """
+    serving, alive = worker_statuses(
+        health,
+        settings.PREFORK_MIN_HEALTHY_WORKERS,
+        settings.PREFORK_HEARTBEAT_TIMEOUT_SECONDS,
     )
+    status = health_pb2.HealthCheckResponse
+    overall = status.SERVING if serving else status.NOT_SERVING
+    for service_name in ["", *_service_names()]:
+        await servicer.set(service_name, overall)
+    for slot, is_alive in enumerate(alive):
+        await servicer.set(
+            _worker_service_name(slot),
+            status.SERVING if is_alive else status.NOT_SERVING,
+        )
+
+
+async def _run_grpc_worker(
+    slot: int, health: WorkerHealth, host: str, port: int, grace: float
+) -> None:
+    """Serve gRPC on a port shared with the other workers until SIGTERM."""
+    from api.run import create_servers
+
+    # A worker without its services is of no use: let the error, such as a
+    # service failing to import, end the worker with its traceback
+    server = create_servers(reuse_port=True, raise_errors=True)[0]
+
+    servicer = health_servicer.aio.HealthServicer()
+    health_pb2_grpc.add_HealthServicer_to_server(servicer, server)
+    reflection.enable_server_reflection(
+        (
+            *_service_names(),
+            health_pb2.DESCRIPTOR.services_by_name["Health"].full_name,
+            reflection.SERVICE_NAME,
+        ),
+        server,
+    )
+    server.add_insecure_port(f"{host}:{port}")
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stopping.set)
+
+    await server.start()
+    logger.info(f"gRPC worker {slot} serving on {host}:{port}")
+    while not stopping.is_set():
+        health.beat(slot)
+        await _report_health(servicer, health)
+        try:
+            await asyncio.wait_for(stopping.wait(), HEARTBEAT_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+    # Fail health checks first, so load balancers stop sending new RPCs while
+    # those in flight finish
+    logger.info(f"gRPC worker {slot} draining ({grace:g}s grace)")
+    await servicer.enter_graceful_shutdown()
+    health.clear(slot)
+    await server.stop(grace)
+    logger.info(f"gRPC worker {slot} stopped")
+
+
+def serve_grpc_worker(
+    slot: int, health: WorkerHealth, host: str, port: int, grace: float
+) -> None:
+    """Entry point of a prefork gRPC worker process."""
+    configure_logging(WORKER_TEXT_FORMAT)
+    asyncio.run(_run_grpc_worker(slot, health, host, port, grace))
+
+
+class PreforkGRPCServer:
+    """The application's gRPC server, run by several processes sharing its port.
+
+    A ``grpc.aio`` server runs Python code under the GIL, so a single process
+    uses at most one core however many threads it has. This server starts
+    ``processes`` workers, each binding the port with ``grpc.so_reuseport`` so
+    the kernel balances connections among them, under a supervisor that
+    restarts crashed or hung workers and drains them on SIGTERM or SIGINT.
 
-    # Create and start the server
-    server = GRPCServer(host="[::]", port=50051)
+    Every worker serves the standard health service: the overall status is
+    SERVING while ``PREFORK_MIN_HEALTHY_WORKERS`` workers are alive and the
+    server is not draining, and ``worker-<n>`` reports on each worker.
+    """
 
-    # Note: Add your services here
-    # from api.services.user_service import UserService
-    # from api.generated.api.v1 import user_pb2_grpc
-    # server.add_service(UserService(), user_pb2_grpc.add_UserServiceServicer_to_server)
+    def __init__(
+        self,
+        host: str = "[::]",
+        port: int = 50051,
+        processes: Optional[int] = None,
+        grace: Optional[float] = None,
+    ):
+        """Initialize the server.
+
+        Args:
+            host: The host to bind the server to.
+            port: The port to bind the server to.
+            processes: Number of worker processes. Defaults to
+                ``GRPC_PROCESSES``.
+            grace: Seconds workers are given to finish their RPCs on
+                shutdown. Defaults to ``PREFORK_GRACE_SECONDS``.
+        """
+        self.host = host
+        self.port = port
+        self.processes = processes or settings.GRPC_PROCESSES
+        self.grace = settings.PREFORK_GRACE_SECONDS if grace is None else grace
+        self.supervisor = Supervisor(
+            [
+                WorkerGroup(
+                    "grpc",
+                    serve_grpc_worker,
+                    self.processes,
+                    (self.host, self.port, self.grace),
+                )
+            ],
+            grace=self.grace,
+        )
+
+    def serve(self) -> None:
+        """Run the workers until SIGTERM or SIGINT, then drain them."""
+        logger.info(
+            f"Starting {self.processes} gRPC workers on {self.host}:{self.port}"
+        )
+        self.supervisor.run()
+
+
+def serve():
+    """Run the application's gRPC server in ``GRPC_PROCESSES`` processes."""
+    # Configure logging
+    configure_logging()
 
-    try:
-        server.start()
-        server.wait_for_termination()
-    except KeyboardInterrupt:
-        logger.info("Shutting down...")
-        server.stop()
+    PreforkGRPCServer(host="[::]", port=settings.GRPC_PORT).serve()
 
 
 if __name__ == "__main__":
@@ -1,18 +1,38 @@
 """
 gRPC Utilities
 
-This module provides utility functions for working with gRPC in the Life Manager API.
+This module provides utility functions for working with gRPC in the Life Manager API,
+including the converters between models and protobuf messages.
 """
 
-from datetime import datetime
-from typing import Any, Dict, Optional, Type, TypeVar, Union
+import enum
+import functools
+import keyword
+import operator
+import re
+from datetime import datetime, time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from google.protobuf import timestamp_pb2
 from google.protobuf.message import Message
+from sqlalchemy import inspect as sqlalchemy_inspect
 
 # Type variable for protobuf message classes
 T = TypeVar("T", bound=Message)
 
+_TIMESTAMP_NAME = timestamp_pb2.Timestamp.DESCRIPTOR.full_name
+
 
 def to_proto_timestamp(dt: Optional[datetime]) -> Optional[timestamp_pb2.Timestamp]:
     """Convert a Python datetime to a protobuf Timestamp.
@@ -45,11 +65,241 @@ def from_proto_timestamp(timestamp: timestamp_pb2.Timestamp) -> Optional[datetim
     return timestamp.ToDatetime()
 
 
+def _proto_enum_numbers(enum_descriptor) -> Dict[str, int]:
+    """Map the names of a protobuf enum's values to their numbers.
+
+    Values are also found without the enum's prefix, so ``INCOME`` names
+    ``TRANSACTION_TYPE_INCOME`` of ``TransactionType``.
+    """
+    prefix = re.sub(r"(?<!^)(?=[A-Z])", "_", enum_descriptor.name).upper() + "_"
+    numbers = {}
+    for value in enum_descriptor.values:
+        numbers[value.name] = value.number
+        if value.name.startswith(prefix):
+            numbers.setdefault(value.name[len(prefix) :], value.number)
+    return numbers
+
+
+def _enum_adapter(enum_descriptor) -> Callable[[Any], int]:
+    """Return a function converting model enums and names to a protobuf enum."""
+    numbers = _proto_enum_numbers(enum_descriptor)
+    # Numbers of the values seen so far, which are few
+    seen: Dict[Any, int] = {}
+
+    def adapt(value: Any) -> int:
+        try:
+            return seen[value]
+        except KeyError:
+            pass
+        if isinstance(value, enum.Enum):
+            key = value.name
+        elif isinstance(value, int):
+            return value
+        else:
+            key = str(value).upper()
+        try:
+            seen[value] = number = numbers[key]
+        except KeyError:
+            raise ValueError(f"Invalid {enum_descriptor.name}: {value!r}") from None
+        return number
+
+    return adapt
+
+
+def _to_proto_string(value: Any) -> str:
+    """Convert a model value, such as an integer ID or an enum, to a string."""
+    if isinstance(value, enum.Enum):
+        return str(value.value)
+    return value if type(value) is str else str(value)
+
+
+def _set_proto_timestamp(timestamp: timestamp_pb2.Timestamp, value: Any) -> None:
+    """Set a protobuf Timestamp to a datetime, or to midnight of a date."""
+    if not isinstance(value, datetime):
+        value = datetime.combine(value, time())
+    timestamp.FromDatetime(value)
+
+
+def _is_timestamp(field) -> bool:
+    """Return whether a field descriptor is of a protobuf Timestamp."""
+    return (
+        field.message_type is not None
+        and field.message_type.full_name == _TIMESTAMP_NAME
+    )
+
+
+def _is_repeated(field) -> bool:
+    """Return whether a field descriptor is of a repeated field.
+
+    Protobuf 7 drops ``label`` for ``is_repeated``, which older releases lack.
+    """
+    label = getattr(field, "label", None)
+    if label is None:
+        return field.is_repeated
+    return label == field.LABEL_REPEATED
+
+
+def _scalar_adapter(field) -> Tuple[str, Optional[Callable[[Any], Any]]]:
+    """Return how to convert a model value to a non-message field.
+
+    Returns:
+        The expression converting ``value``, which calls ``adapt`` if it is
+        given.
+    """
+    if field.type == field.TYPE_STRING:
+        return "value if value.__class__ is str else adapt(value)", _to_proto_string
+    if field.type == field.TYPE_BOOL:
+        return "bool(value)", None
+    if field.type in (field.TYPE_DOUBLE, field.TYPE_FLOAT):
+        return "float(value)", None
+    if field.type == field.TYPE_ENUM:
+        return "adapt(value)", _enum_adapter(field.enum_type)
+    if field.type == field.TYPE_BYTES:
+        return "bytes(value)", None
+    return "int(value)", None
+
+
+def _message_adapter(field) -> Callable[[Any], Any]:
+    """Return the function converting a value to a nested message field."""
+    message_class = field.message_type._concrete_class
+
+    def adapt(value: Any) -> Message:
+        if isinstance(value, Message):
+            return value
+        return to_proto_message(value, message_class)
+
+    return adapt
+
+
+def _declared_fields(model: type) -> Set[str]:
+    """Return the attributes a model class declares, without relationships.
+
+    Relationships are left out so that a conversion never loads them.
+    """
+    if model is dict:
+        return set()
+    declared = {name for name in dir(model) if not name.startswith("__")}
+    declared.update(getattr(model, "__dataclass_fields__", ()))
+    declared.update(getattr(model, "model_fields", ()))
+    mapper = sqlalchemy_inspect(model, raiseerr=False)
+    if mapper is not None:
+        declared.difference_update(mapper.relationships.keys())
+    return declared
+
+
+class ProtoConverter(Generic[T]):
+    """Converter of model objects to one protobuf message class.
+
+    The converter is generated once from the message's descriptor as a
+    function reading every field with a plain attribute access and adapting
+    it to the field's type, so converting an object costs what a hand-written
+    converter does. By default a field is read from the model attribute of
+    the same name; ``fields`` maps a field to another attribute name or to a
+    function of the object. Attributes the model class does not declare, and
+    relationships, are only read when mapped explicitly. None values leave
+    their field unset.
+
+    Values are adapted to the field's type: IDs and enums to strings, model
+    enums and their names to protobuf enums (with or without the enum's
+    prefix), datetimes and dates to Timestamps, iterables to repeated fields
+    and objects to nested messages, by the converter of their type.
+    """
+
+    def __init__(
+        self,
+        model: type,
+        message_class: Type[T],
+        **fields: Union[str, Callable[[Any], Any]],
+    ):
+        """Generate the converter.
+
+        Args:
+            model: The class of the objects to convert, or ``dict``.
+            message_class: The protobuf message class to create instances of.
+            **fields: Attribute names, or functions of the object, of fields
+                not read from the attribute of the same name.
+        """
+        self.model = model
+        self.message_class = message_class
+        declared = _declared_fields(model)
+        namespace: Dict[str, Any] = {
+            "message_class": message_class,
+            "set_timestamp": _set_proto_timestamp,
+        }
+        body = ["values = {}"]
+        # Timestamps are set in place once the message exists
+        timestamps = []
+
+        for index, field in enumerate(message_class.DESCRIPTOR.fields):
+            name = field.name
+            source = fields.get(name, name)
+            if callable(source):
+                namespace[f"get_{index}"] = source
+                read = f"get_{index}(obj)"
+            elif model is dict:
+                read = f"obj.get({source!r})"
+            elif source in declared:
+                read = f"getattr(obj, {source!r})"
+                if source.isidentifier() and not keyword.iskeyword(source):
+                    read = f"obj.{source}"
+            else:
+                continue
+
+            if _is_timestamp(field) and not _is_repeated(field):
+                timestamps += [
+                    f"if {name!r} not in kwargs:",
+                    f"    value = {read}",
+                    "    if value is not None:",
+                    f"        set_timestamp(getattr(message, {name!r}), value)",
+                ]
+                continue
+            if field.message_type is None:
+                convert, adapt = _scalar_adapter(field)
+            elif _is_timestamp(field):
+                convert, adapt = "adapt(value)", to_proto_timestamp
+            elif name in fields or model is dict:
+                convert, adapt = "adapt(value)", _message_adapter(field)
+            else:
+                continue  # Nested messages are only filled when mapped
+            if adapt is not None:
+                namespace[f"adapt_{index}"] = adapt
+                convert = convert.replace("adapt(", f"adapt_{index}(")
+            if _is_repeated(field):
+                convert = f"[{convert} for value in value]"
+            body += [
+                f"value = {read}",
+                "if value is not None:",
+                f"    values[{name!r}] = {convert}",
+            ]
+
+        body += ["values.update(kwargs)", "message = message_class(**values)"]
+        body += timestamps + ["return message"]
+        source = "def convert(obj, kwargs):\n" + "".join(
+            f"    {line}\n" for line in body
+        )
+        exec(
+            compile(source, f"<{message_class.__name__} converter>", "exec"), namespace
+        )
+        self._convert = namespace["convert"]
+
+    def __call__(self, obj: Any, **kwargs) -> T:
+        """Convert an object; ``kwargs`` are set on the message as given."""
+        return self._convert(obj, kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def proto_converter(model: type, message_class: Type[T]) -> ProtoConverter[T]:
+    """Return the converter of a model class to a message class."""
+    return ProtoConverter(model, message_class)
+
+
 def to_proto_message(
     data: Union[Dict[str, Any], Any], message_class: Type[T], **kwargs
 ) -> T:
     """Convert a dictionary or object to a protobuf message.
 
+    Uses the cached ``ProtoConverter`` of the object's class.
+
     Args:
         data: The data to convert. Can be a dictionary or an object with attributes.
         message_class: The protobuf message class to create an instance of.
@@ -58,19 +308,34 @@ def to_proto_message(
     Returns:
         An instance of the specified protobuf message class.
     """
-    if isinstance(data, dict):
-        message_data = {**data, **kwargs}
+    return proto_converter(type(data), message_class)(data, **kwargs)
+
+
+def _field_reader(field) -> Callable[[Message], Any]:
+    """Return the function reading a field of a message as Python values."""
+    name = field.name
+    if field.message_type is None:
+        if _is_repeated(field):
+            return lambda message: list(getattr(message, name))
+        return operator.attrgetter(name)
+
+    if _is_timestamp(field):
+        convert = from_proto_timestamp
     else:
-        # Convert object to dict
-        message_data = {
-            field: getattr(data, field)
-            for field in message_class.DESCRIPTOR.fields_by_name
-            if hasattr(data, field)
-        }
-        message_data.update(kwargs)
+        convert = from_proto_message
+    if _is_repeated(field):
+        if field.message_type.GetOptions().map_entry:
+            return lambda message: dict(getattr(message, name))
+        return lambda message: [convert(item) for item in getattr(message, name)]
+    return lambda message: (
+        convert(getattr(message, name)) if message.HasField(name) else None
+    )
 
-    # Create and return the message
-    return message_class(**message_data)
+
+@functools.lru_cache(maxsize=None)
+def _field_readers(descriptor) -> Tuple[Tuple[str, Callable[[Message], Any]], ...]:
+    """Return the name and reader of every field of a message descriptor."""
+    return tuple((field.name, _field_reader(field)) for field in descriptor.fields)
 
 
 def from_proto_message(
@@ -78,6 +343,9 @@ def from_proto_message(
 ) -> Union[Dict[str, Any], T]:
     """Convert a protobuf message to a dictionary or an instance of the specified class.
 
+    Timestamps become datetimes and nested messages dictionaries; unset
+    ones become None.
+
     Args:
         message: The protobuf message to convert.
         output_class: The class to create an instance of. If None, returns a dictionary.
@@ -89,28 +357,7 @@ def from_proto_message(
     if message is None:
         return None
 
-    # Convert message to dict
-    result = {}
-    for field in message.DESCRIPTOR.fields_by_name.values():
-        value = getattr(message, field.name)
-
-        # Handle nested messages
-        if field.message and hasattr(field.message, "_concrete_class"):
-            if field.label == field.LABEL_REPEATED:
-                value = [from_proto_message(item) for item in value]
-            else:
-                value = from_proto_message(value)
-
-        # Handle timestamps
-        elif (
-            field.type == field.TYPE_MESSAGE and field.message_type.name == "Timestamp"
-        ):
-            if field.label == field.LABEL_REPEATED:
-                value = [from_proto_timestamp(ts) for ts in value]
-            else:
-                value = from_proto_timestamp(value)
-
-        result[field.name] = value
+    result = {name: read(message) for name, read in _field_readers(message.DESCRIPTOR)}
 
     # Add any additional fields
     result.update(kwargs)
@@ -1,4 +1,8 @@
+import asyncio
+import logging
+import math
 import time
+from datetime import datetime
 from typing import Any, Dict, List, Optional, Union
 
 from fastapi import Depends, FastAPI, HTTPException, Request, status
@@ -12,11 +16,20 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 from . import __version__, models
 from . import schemas_main as schemas
+from .base_service import ServiceException
 from .config import settings
+from .deadlines import request_deadline
 from .dependencies import get_db
+from .grpc_compression import compression_policy
+from .grpc_limits import method_limits
 from .models import User
 from .models.database import SessionLocal
-from .routers import auth, finance, households, users
+from .request_logging import UNMATCHED_ROUTE, request_log
+from .routers import auth, calendar, finance, households, users
+from .services.reminders import dispatch_due_reminders, reminder_scheduler
+from .services.scheduler import run_scheduler_once
+
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -51,6 +64,74 @@ class ProcessTimeMiddleware(BaseHTTPMiddleware):
 
 app.add_middleware(ProcessTimeMiddleware)
 
+
+class RequestDeadlineMiddleware(BaseHTTPMiddleware):
+    """Hold requests to the deadline in their X-Request-Deadline header.
+
+    The header is the Unix time, in seconds, after which the client gives up
+    on the request. Requests past it are answered with 504 at once, and the
+    database work of the others is cut short once it passes.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        header = request.headers.get("X-Request-Deadline")
+        if header is None:
+            return await call_next(request)
+        try:
+            timeout = float(header) - time.time()
+        except ValueError:
+            timeout = math.nan
+        if not math.isfinite(timeout):
+            return JSONResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                content={"detail": "Invalid X-Request-Deadline header"},
+            )
+        if timeout <= 0:
+            return JSONResponse(
+                status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+                content={"detail": "Deadline exceeded"},
+            )
+        with request_deadline(timeout):
+            return await call_next(request)
+
+
+app.add_middleware(RequestDeadlineMiddleware)
+
+
+class RequestLogMiddleware(BaseHTTPMiddleware):
+    """Log every request as one line of the request log.
+
+    Requests are logged by route template, such as
+    ``/api/v1/users/{user_id}``, and sampled by it as ``REQUEST_LOG_SAMPLING``
+    sets (see api/request_logging.py); requests matching no route are all
+    logged under ``<unmatched>``, with their path. Uvicorn's own access log
+    is turned off in its favour.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        started = time.perf_counter()
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        try:
+            response = await call_next(request)
+            status_code = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            request_log.log(
+                "http",
+                getattr(route, "path", UNMATCHED_ROUTE),
+                str(status_code),
+                status_code >= 400,
+                (time.perf_counter() - started) * 1e3,
+                method=request.method,
+                path=request.url.path,
+                client=request.client.host if request.client else None,
+            )
+
+
+# Added last, so it runs first and times the whole request
+app.add_middleware(RequestLogMiddleware)
+
 # Include API routers
 app.include_router(
     users.router,
@@ -67,6 +148,11 @@ app.include_router(
     prefix=f"{settings.API_V1_STR}/finance",
     tags=["finance"],
 )
+app.include_router(
+    calendar.router,
+    prefix=f"{settings.API_V1_STR}/calendar",
+    tags=["calendar"],
+)
 app.include_router(
     auth.router,
     prefix=f"{settings.API_V1_STR}/auth",
@@ -84,6 +170,13 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     )
 
 
+@app.exception_handler(ServiceException)
+async def service_exception_handler(
+    request: Request, exc: ServiceException
+) -> JSONResponse:
+    return JSONResponse(status_code=exc.http_status, content={"detail": exc.details})
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
@@ -101,6 +194,23 @@ async def health_check() -> Dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/health/grpc", tags=["health"])
+async def grpc_health_check() -> Dict[str, Any]:
+    """Live state of the gRPC limits and compression rules, and of the request log.
+
+    Prefork HTTP workers serve no gRPC, so their limits and compression
+    counters would always be zero: only the request log is reported then.
+    """
+    health: Dict[str, Any] = {"request_log": request_log.snapshot()}
+    if settings.HTTP_PROCESSES > 1 or settings.GRPC_PROCESSES > 1:
+        return health
+    return {
+        "limits": method_limits.snapshot(),
+        "compression": compression_policy.snapshot(),
+        **health,
+    }
+
+
 # Root endpoint
 @app.get("/", tags=["root"])
 async def root() -> Dict[str, str]:
@@ -145,3 +255,67 @@ def create_first_superuser() -> None:
         print(f"Error creating first superuser: {e}")
     finally:
         db.close()
+
+
+async def _run_recurring_scheduler() -> None:
+    """Materialize due recurring transactions on a fixed interval."""
+    loop = asyncio.get_running_loop()
+    while True:
+        try:
+            # The scheduler uses a blocking session, keep it off the event loop
+            await loop.run_in_executor(None, run_scheduler_once)
+        except Exception:
+            logger.exception("Recurring scheduler tick failed")
+        await asyncio.sleep(settings.RECURRING_SCHEDULER_INTERVAL_SECONDS)
+
+
+@app.on_event("startup")
+async def start_recurring_scheduler() -> None:
+    """Start the recurring transaction scheduler if enabled."""
+    if settings.RECURRING_SCHEDULER_ENABLED:
+        app.state.recurring_scheduler = asyncio.create_task(_run_recurring_scheduler())
+
+
+@app.on_event("shutdown")
+async def stop_recurring_scheduler() -> None:
+    """Stop the recurring transaction scheduler."""
+    task = getattr(app.state, "recurring_scheduler", None)
+    if task is not None:
+        task.cancel()
+
+
+async def _run_reminder_worker() -> None:
+    """Send due event reminders, sleeping until the next one is due."""
+    interval = settings.REMINDER_WORKER_INTERVAL_SECONDS
+    while True:
+        try:
+            await dispatch_due_reminders()
+        except Exception:
+            logger.exception("Reminder dispatch failed")
+        # Sleep until the next reminder, but wake up regularly to refill the
+        # horizon and retry expired claims
+        delay = interval
+        next_fire_at = reminder_scheduler.next_fire_at()
+        if next_fire_at is not None:
+            until_next = (next_fire_at - datetime.utcnow()).total_seconds()
+            delay = min(interval, max(until_next, 0))
+        await asyncio.sleep(delay)
+
+
+@app.on_event("startup")
+async def start_reminder_worker() -> None:
+    """Start the event reminder worker if enabled and SMTP is configured."""
+    if not settings.REMINDER_WORKER_ENABLED:
+        return
+    if not settings.SMTP_HOST:
+        logger.warning("Event reminders are disabled because SMTP_HOST is not set")
+        return
+    app.state.reminder_worker = asyncio.create_task(_run_reminder_worker())
+
+
+@app.on_event("shutdown")
+async def stop_reminder_worker() -> None:
+    """Stop the event reminder worker."""
+    task = getattr(app.state, "reminder_worker", None)
+    if task is not None:
+        task.cancel()
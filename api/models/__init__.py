@@ -8,11 +8,19 @@ This module contains all the SQLAlchemy models and database utilities.
 from .base import Base
 
 # Import other models
-from .calendar import Event
+from .calendar import Event, EventException, EventFrequency, ReminderDelivery
 
 # Database utilities
-from .database import SessionLocal, get_db, init_db
-from .finance import Budget, Category, Transaction, TransactionStatus, TransactionType
+from .database import SessionLocal, get_db, init_db, session_scope
+from .finance import (
+    Budget,
+    Category,
+    RecurrenceFrequency,
+    RecurringSeries,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
 from .household import Household, HouseholdInvitation, HouseholdMember
 
 # Import all models to ensure they are registered with SQLAlchemy
@@ -33,6 +41,7 @@ __all__ = [
     "SessionLocal",
     "get_db",
     "init_db",
+    "session_scope",
     # Models
     "User",
     "UserRole",
@@ -44,5 +53,10 @@ __all__ = [
     "Budget",
     "TransactionType",
     "TransactionStatus",
+    "RecurringSeries",
+    "RecurrenceFrequency",
     "Event",
+    "EventException",
+    "EventFrequency",
+    "ReminderDelivery",
 ]
@@ -1,15 +1,64 @@
+import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import (
+    DDL,
+    Boolean,
+    Column,
+    DateTime,
+)
+from sqlalchemy import Enum as SQLEnum
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Table,
+    Text,
+    UniqueConstraint,
+    event,
+)
 from sqlalchemy.orm import relationship
 
-# Base class for declarative models
-Base = declarative_base()
+from .base import Base
+
+
+class EventFrequency(str, enum.Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    MONTHLY = "monthly"
+    YEARLY = "yearly"
+
+
+# Household members attending an event besides its creator
+event_attendees = Table(
+    "event_attendees",
+    Base.metadata,
+    Column(
+        "event_id",
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        primary_key=True,
+    ),
+    Column(
+        "user_id",
+        Integer,
+        ForeignKey("users.id", ondelete="CASCADE"),
+        primary_key=True,
+        index=True,
+    ),
+)
 
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_household_start", "household_id", "start_time"),
+        # Lets the reminder worker load only the events due in its horizon
+        Index("ix_events_reminder_start", "reminder_enabled", "start_time"),
+        # Makes re-importing an iCalendar file a no-op for known events
+        Index("ix_events_household_uid", "household_id", "uid", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -19,13 +68,116 @@ class Event(Base):
     is_all_day = Column(Boolean, default=False)
     location = Column(String, nullable=True)
 
+    # iCalendar UID of imported events; None for events created here
+    uid = Column(String, nullable=True)
+
     household_id = Column(Integer, ForeignKey("households.id"))
     created_by_user_id = Column(Integer, ForeignKey("users.id"))
 
     # Reminder settings (can be expanded later)
     reminder_enabled = Column(Boolean, default=False)
-    reminder_time_before = Column(Integer, nullable=True)  # e.g., minutes before event
+    reminder_time_before = Column(Integer, nullable=True)  # Minutes before each start
+
+    # Recurrence rule; the event itself is the first occurrence of the series
+    recurrence_frequency = Column(SQLEnum(EventFrequency), nullable=True)
+    recurrence_interval = Column(Integer, default=1)
+    recurrence_count = Column(Integer, nullable=True)  # None for no limit
+    recurrence_end_date = Column(DateTime, nullable=True)  # Inclusive
+    recurrence_by_weekday = Column(Integer, default=0)  # Bit n set for weekday n
+
+    # Envelope of all occurrences, including moved instances; None is unbounded.
+    # Postgres indexes it as the ``during`` tsrange column (see below)
+    span_start = Column(DateTime, nullable=True)
+    span_end = Column(DateTime, nullable=True)
+
+    # Incremented on every change to the event or its exceptions
+    sequence = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationship to household (optional, if needed)
     # household = relationship("Household")
     creator = relationship("User")
+    attendees = relationship("User", secondary=event_attendees, lazy="selectin")
+    exceptions = relationship(
+        "EventException",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        lazy="selectin",
+    )
+
+    @property
+    def is_recurring(self) -> bool:
+        return self.recurrence_frequency is not None
+
+
+# The tsrange column is generated from the span so the ORM never writes it, and
+# only exists on Postgres; other backends use the in-memory interval index
+event.listen(
+    Event.__table__,
+    "after_create",
+    DDL(
+        "ALTER TABLE events ADD COLUMN during tsrange "
+        "GENERATED ALWAYS AS (tsrange(span_start, span_end, '[]')) STORED"
+    ).execute_if(dialect="postgresql"),
+)
+event.listen(
+    Event.__table__,
+    "after_create",
+    DDL("CREATE INDEX ix_events_during ON events USING gist (during)").execute_if(
+        dialect="postgresql"
+    ),
+)
+
+
+class EventException(Base):
+    """An edited or cancelled instance of a recurring event."""
+
+    __tablename__ = "event_exceptions"
+    __table_args__ = (
+        UniqueConstraint(
+            "event_id", "original_start", name="uq_event_exceptions_original_start"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    event_id = Column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    # Start of the instance as generated by the recurrence rule
+    original_start = Column(DateTime, nullable=False)
+    is_cancelled = Column(Boolean, default=False)
+
+    # Overrides; None keeps the value of the series
+    start_time = Column(DateTime, nullable=True)
+    end_time = Column(DateTime, nullable=True)
+    title = Column(String, nullable=True)
+    description = Column(Text, nullable=True)
+    location = Column(String, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    event = relationship("Event", back_populates="exceptions")
+
+
+class ReminderDelivery(Base):
+    """A reminder e-mail claimed or sent for one occurrence and recipient.
+
+    The dedupe key is unique, so a reminder is claimed at most once; a claim
+    that was never marked as sent is retried once its lease expires.
+    """
+
+    __tablename__ = "reminder_deliveries"
+    __table_args__ = (Index("ix_reminder_deliveries_pending", "sent_at", "claimed_at"),)
+
+    id = Column(Integer, primary_key=True, index=True)
+    dedupe_key = Column(String, nullable=False, unique=True)
+    event_id = Column(
+        Integer, ForeignKey("events.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"))
+    recipient = Column(String, nullable=False)
+    occurrence_start = Column(DateTime, nullable=False)
+
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    claimed_at = Column(DateTime, nullable=False)
+    sent_at = Column(DateTime, nullable=True)  # None until the server accepted it
+    last_error = Column(Text, nullable=True)
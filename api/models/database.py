@@ -1,15 +1,29 @@
 """ Module for database connection and session management using SQLAlchemy. """
+import contextlib
+from typing import Iterator
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm import Session, scoped_session, sessionmaker
 
-from ..config import DATABASE_URL
+from .. import deadlines
+from ..config import DATABASE_URL, settings
 
 # Create SQLAlchemy engine
 engine = create_engine(
     DATABASE_URL,
     pool_pre_ping=True,
     connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {},
+    # SQLite keeps SQLAlchemy's pool, whose defaults are the same
+    **(
+        {}
+        if "sqlite" in DATABASE_URL
+        else {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+        }
+    ),
 )
+deadlines.install(engine)
 
 # Create a scoped session factory
 SessionLocal = scoped_session(
@@ -33,6 +47,24 @@ def get_db():
         db.close()
 
 
+@contextlib.contextmanager
+def session_scope() -> Iterator[Session]:
+    """Provide a session of its own to a unit of work.
+
+    The session is committed when the block completes, rolled back when it
+    raises, and closed either way, which returns its connection to the pool.
+    """
+    db = SessionLocal.session_factory()
+    try:
+        yield db
+        db.commit()
+    except BaseException:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 def init_db():
     """Initialize the database with tables"""
     Base.metadata.create_all(bind=engine)
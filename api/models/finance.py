@@ -1,13 +1,11 @@
 import enum
 
-from sqlalchemy import Column, Date
+from sqlalchemy import Boolean, Column, Date
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Float, ForeignKey, Integer, String
-from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy import Float, ForeignKey, Integer, String, UniqueConstraint
 from sqlalchemy.orm import relationship
 
-# Base class for declarative models
-Base = declarative_base()
+from .base import Base
 
 
 class TransactionType(str, enum.Enum):
@@ -22,6 +20,15 @@ class TransactionStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+class RecurrenceFrequency(str, enum.Enum):
+    DAILY = "daily"
+    WEEKLY = "weekly"
+    BIWEEKLY = "bi-weekly"
+    MONTHLY = "monthly"
+    QUARTERLY = "quarterly"
+    YEARLY = "yearly"
+
+
 class Category(Base):
     __tablename__ = "categories"
 
@@ -38,6 +45,12 @@ class Category(Base):
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # A series materializes at most one transaction per due date
+        UniqueConstraint(
+            "recurring_series_id", "date", name="uq_transactions_series_date"
+        ),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     description = Column(String)
@@ -52,6 +65,13 @@ class Transaction(Base):
     household_id = Column(
         Integer, ForeignKey("households.id")
     )  # Which household it belongs to
+    # Hash of (type, normalized description, amount band) used to group
+    # candidate recurring transactions without rescanning history
+    recurrence_fingerprint = Column(String(32), index=True, nullable=True)
+    # Set when the row was materialized from a recurring series
+    recurring_series_id = Column(
+        Integer, ForeignKey("recurring_series.id"), nullable=True
+    )
 
     category = relationship("Category", back_populates="transactions")
     user = relationship("User")  # Basic relationship to User
@@ -70,3 +90,31 @@ class Budget(Base):
     year = Column(Integer)
 
     category = relationship("Category", back_populates="budget")
+
+
+class RecurringSeries(Base):
+    __tablename__ = "recurring_series"
+    __table_args__ = (
+        UniqueConstraint(
+            "household_id", "fingerprint", name="uq_recurring_series_fingerprint"
+        ),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    household_id = Column(Integer, ForeignKey("households.id"), index=True)
+    category_id = Column(Integer, ForeignKey("categories.id"), nullable=True)
+    fingerprint = Column(String(32), nullable=False)
+    description = Column(String)  # Most recent raw description in the series
+    type = Column(SQLEnum(TransactionType))
+    frequency = Column(SQLEnum(RecurrenceFrequency))
+    average_amount = Column(Float)
+    occurrence_count = Column(Integer, default=0)
+    first_date = Column(Date)
+    last_date = Column(Date)
+    next_due_date = Column(Date, index=True)
+    last_transaction_id = Column(Integer, nullable=True)  # Incremental watermark
+    # Entered-by user for transactions materialized from this series
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
+    is_active = Column(Boolean, default=True)
+
+    category = relationship("Category")
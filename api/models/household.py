@@ -10,6 +10,10 @@ class Household(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, unique=True)
     created_by = Column(Integer, ForeignKey("users.id"))
+    # Bumped on every finance write; keys cached finance projections
+    finance_version = Column(Integer, nullable=False, default=0, server_default="0")
+    # Bumped on every calendar write; keys cached calendar indexes
+    calendar_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     # Relationships
     members = relationship(
@@ -0,0 +1,333 @@
+"""
+Prefork Supervisor
+
+This module runs servers in several worker processes, so they are not bound
+to the one core a Python process can use. Workers of a group bind the same
+port with ``SO_REUSEPORT``, and the kernel spreads connections among them.
+
+Workers are started with ``spawn``, so each one creates its own engine,
+connection pool and gRPC runtime instead of inheriting them. The supervisor
+restarts workers that exit, backing off while they keep crashing, and kills
+and restarts those whose heartbeat stops. On SIGTERM or SIGINT it drains:
+workers are sent SIGTERM, which they answer by failing their health checks
+and finishing the requests in flight, and those still running after the
+grace period are killed. On SIGHUP it restarts the workers one at a time,
+each being replaced once the previous one is back, so the processes pick up
+new code without the group ever stopping to serve.
+
+Workers write a heartbeat into memory shared with the supervisor and their
+siblings, from which every worker reads the health of its whole group.
+"""
+
+import logging
+import multiprocessing
+import signal
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from api.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Seconds between heartbeats of a worker, and between checks of the supervisor
+HEARTBEAT_INTERVAL = 1.0
+
+# Seconds a worker waits before its first restart, doubled after every crash
+# up to the maximum; a worker that ran for MIN_UPTIME seconds starts over
+RESTART_BACKOFF = 0.5
+MAX_RESTART_BACKOFF = 30.0
+MIN_UPTIME = 10.0
+
+# Seconds the supervisor waits past the grace period for workers to exit
+DRAIN_MARGIN = 5.0
+
+
+class WorkerHealth:
+    """Heartbeats of a group of workers, in memory shared between processes.
+
+    Heartbeats are ``time.monotonic()`` times, which all processes share on
+    the platforms ``SO_REUSEPORT`` balances connections on.
+    """
+
+    def __init__(self, size: int, context=None):
+        """Allocate the heartbeats of ``size`` workers."""
+        context = context or multiprocessing.get_context("spawn")
+        self.size = size
+        self._beats = context.Array("d", size, lock=False)
+        self._draining = context.Value("b", 0, lock=False)
+
+    def beat(self, slot: int) -> None:
+        """Record that the worker of a slot is alive."""
+        self._beats[slot] = time.monotonic()
+
+    def clear(self, slot: int) -> None:
+        """Record that the worker of a slot has stopped."""
+        self._beats[slot] = 0.0
+
+    def is_alive(self, slot: int, timeout: float) -> bool:
+        """Return whether the worker of a slot beat in the last ``timeout`` seconds."""
+        beat = self._beats[slot]
+        return beat > 0 and time.monotonic() - beat < timeout
+
+    def alive(self, timeout: float) -> List[bool]:
+        """Return whether the worker of every slot is alive."""
+        return [self.is_alive(slot, timeout) for slot in range(self.size)]
+
+    @property
+    def draining(self) -> bool:
+        """Whether the group is shutting down."""
+        return bool(self._draining.value)
+
+    def drain(self) -> None:
+        """Mark the group as shutting down."""
+        self._draining.value = 1
+
+
+class WorkerGroup:
+    """Worker processes running the same target."""
+
+    def __init__(
+        self,
+        name: str,
+        target: Callable[..., Any],
+        count: int,
+        args: Sequence[Any] = (),
+    ):
+        """Initialize the group.
+
+        Args:
+            name: Name of the group, used for logs and process names.
+            target: Importable function run by every worker, called with the
+                worker's slot, the group's ``WorkerHealth`` and ``args``.
+            count: Number of workers.
+            args: Further arguments of the target.
+        """
+        if count < 1:
+            raise ValueError(f"A worker group needs at least one worker: {name}")
+        self.name = name
+        self.target = target
+        self.count = count
+        self.args = tuple(args)
+        self.health: Optional[WorkerHealth] = None
+
+
+class _Worker:
+    """A slot of a group, and the process currently serving it."""
+
+    def __init__(self, group: WorkerGroup, slot: int):
+        self.group = group
+        self.slot = slot
+        self.process: Optional[multiprocessing.process.BaseProcess] = None
+        self.started_at = 0.0
+        self.restart_at = 0.0
+        self.backoff = RESTART_BACKOFF
+
+    @property
+    def name(self) -> str:
+        return f"{self.group.name}-{self.slot}"
+
+
+class Supervisor:
+    """Supervisor of groups of worker processes."""
+
+    def __init__(
+        self,
+        groups: List[WorkerGroup],
+        grace: Optional[float] = None,
+        heartbeat_timeout: Optional[float] = None,
+    ):
+        """Initialize the supervisor.
+
+        Args:
+            groups: The groups of workers to run.
+            grace: Seconds workers are given to finish their requests when
+                draining. Defaults to ``PREFORK_GRACE_SECONDS``.
+            heartbeat_timeout: Seconds without a heartbeat after which a
+                worker is restarted. Defaults to
+                ``PREFORK_HEARTBEAT_TIMEOUT_SECONDS``.
+        """
+        self.groups = groups
+        self.grace = settings.PREFORK_GRACE_SECONDS if grace is None else grace
+        self.heartbeat_timeout = (
+            heartbeat_timeout or settings.PREFORK_HEARTBEAT_TIMEOUT_SECONDS
+        )
+        self._context = multiprocessing.get_context("spawn")
+        self._stop = threading.Event()
+        self._reload = threading.Event()
+        self._workers: List[_Worker] = []
+        for group in groups:
+            group.health = WorkerHealth(group.count, self._context)
+            self._workers += [_Worker(group, slot) for slot in range(group.count)]
+
+    def stop(self, *args) -> None:
+        """Ask the supervisor to drain its workers; usable as a signal handler."""
+        self._stop.set()
+
+    def reload(self, *args) -> None:
+        """Ask the supervisor to restart its workers; usable as a signal handler."""
+        self._reload.set()
+
+    def run(self) -> None:
+        """Run the workers until the supervisor is stopped, then drain them.
+
+        Must be called from the main thread, which receives the signals.
+        """
+        handlers = {
+            signal.SIGTERM: self.stop,
+            signal.SIGINT: self.stop,
+            signal.SIGHUP: self.reload,
+        }
+        previous = {
+            signum: signal.signal(signum, handler)
+            for signum, handler in handlers.items()
+        }
+        try:
+            for worker in self._workers:
+                self._start(worker)
+            while not self._stop.wait(HEARTBEAT_INTERVAL):
+                if self._reload.is_set():
+                    self._reload.clear()
+                    self._rolling_restart()
+                self._supervise()
+        finally:
+            self._drain()
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the state of every worker, by group."""
+        state: Dict[str, List[Dict[str, Any]]] = {}
+        for worker in self._workers:
+            process = worker.process
+            state.setdefault(worker.group.name, []).append(
+                {
+                    "slot": worker.slot,
+                    "pid": process.pid if process else None,
+                    "running": bool(process and process.is_alive()),
+                    "alive": worker.group.health.is_alive(
+                        worker.slot, self.heartbeat_timeout
+                    ),
+                }
+            )
+        return state
+
+    def _start(self, worker: _Worker) -> None:
+        """Start the process of a worker."""
+        group = worker.group
+        group.health.clear(worker.slot)
+        worker.process = self._context.Process(
+            target=group.target,
+            args=(worker.slot, group.health, *group.args),
+            name=worker.name,
+            daemon=True,
+        )
+        worker.process.start()
+        worker.started_at = time.monotonic()
+        logger.info(f"Started worker {worker.name} (pid {worker.process.pid})")
+
+    def _supervise(self) -> None:
+        """Restart the workers that exited or stopped beating."""
+        now = time.monotonic()
+        for worker in self._workers:
+            process = worker.process
+            if process is not None and process.is_alive():
+                if self._is_hung(worker, now):
+                    logger.error(
+                        f"Worker {worker.name} (pid {process.pid}) sent no "
+                        f"heartbeat for {self.heartbeat_timeout:g}s, killing it"
+                    )
+                    process.kill()
+                continue
+            if process is not None:
+                process.join()
+                uptime = now - worker.started_at
+                worker.backoff = (
+                    RESTART_BACKOFF
+                    if uptime >= MIN_UPTIME
+                    else min(worker.backoff * 2, MAX_RESTART_BACKOFF)
+                )
+                worker.restart_at = now + worker.backoff
+                worker.process = None
+                logger.warning(
+                    f"Worker {worker.name} exited with code {process.exitcode} "
+                    f"after {uptime:.1f}s, restarting in {worker.backoff:g}s"
+                )
+            if now >= worker.restart_at:
+                self._start(worker)
+
+    def _is_hung(self, worker: _Worker, now: float) -> bool:
+        """Return whether a running worker has stopped sending heartbeats."""
+        if now - worker.started_at < self.heartbeat_timeout:
+            return False  # Still starting up
+        return not worker.group.health.is_alive(worker.slot, self.heartbeat_timeout)
+
+    def _rolling_restart(self) -> None:
+        """Replace the workers one at a time, waiting for each to come up.
+
+        A replacement that does not send a heartbeat in time stops the
+        restart, so a broken release takes down at most one worker.
+        """
+        logger.info("Restarting workers one at a time")
+        for worker in self._workers:
+            if self._stop.is_set():
+                return
+            process = worker.process
+            if process is not None and process.is_alive():
+                process.terminate()
+                process.join(self.grace + DRAIN_MARGIN)
+                if process.is_alive():
+                    process.kill()
+                    process.join()
+            worker.backoff = RESTART_BACKOFF
+            self._start(worker)
+            if not self._wait_alive(worker):
+                logger.error(
+                    f"Worker {worker.name} did not come up, stopping the restart"
+                )
+                return
+        logger.info("Restarted all workers")
+
+    def _wait_alive(self, worker: _Worker) -> bool:
+        """Wait until a newly started worker sends a heartbeat."""
+        deadline = worker.started_at + self.heartbeat_timeout
+        health = worker.group.health
+        while time.monotonic() < deadline and not self._stop.wait(0.1):
+            if health.is_alive(worker.slot, self.heartbeat_timeout):
+                return True
+            if not worker.process.is_alive():
+                return False
+        return False
+
+    def _drain(self) -> None:
+        """Stop every worker, giving them the grace period to finish."""
+        logger.info(f"Draining workers ({self.grace:g}s grace)")
+        for group in self.groups:
+            group.health.drain()
+        running = [
+            worker.process
+            for worker in self._workers
+            if worker.process is not None and worker.process.is_alive()
+        ]
+        for process in running:
+            process.terminate()
+        deadline = time.monotonic() + self.grace + DRAIN_MARGIN
+        for process in running:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                logger.warning(f"Killing worker {process.name} (pid {process.pid})")
+                process.kill()
+                process.join()
+        logger.info("All workers stopped")
+
+
+def worker_statuses(
+    health: WorkerHealth, min_healthy: int, timeout: float
+) -> Tuple[bool, List[bool]]:
+    """Return whether a group is serving, and whether each of its workers is.
+
+    A group serves while it is not draining and at least ``min_healthy`` of
+    its workers are alive.
+    """
+    alive = health.alive(timeout)
+    return (not health.draining and sum(alive) >= min_healthy), alive
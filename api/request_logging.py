@@ -0,0 +1,289 @@
+"""
+Request Logging
+
+This module logs every HTTP request and gRPC call as one JSON line on the
+``api.requests`` logger, and configures the logging of the servers so that
+no request waits on log I/O: records are put on a bounded queue by a
+``QueueHandler`` and written by a ``QueueListener`` thread, and records
+arriving while the queue is full are dropped and counted instead of waiting.
+
+Requests are sampled by route with ``REQUEST_LOG_SAMPLING``: a comma-separated
+list of ``pattern=rate`` entries, where ``rate`` is the fraction of requests
+logged, between 0 and 1. Patterns match gRPC method names, such as
+``api.v1.UserService/GetUser``, and HTTP route templates, such as
+``/api/v1/users/{user_id}``, as those of ``GRPC_CONCURRENCY_LIMITS`` do: a
+full name, or a prefix ending in ``*``, exact names first and longer prefixes
+before shorter ones. HTTP requests matching no route have the route
+``<unmatched>``. Other routes are logged at ``REQUEST_LOG_SAMPLE_RATE``.
+Failed requests, and those slower than ``REQUEST_LOG_SLOW_MS``, are always
+logged.
+
+``LOG_FORMAT`` sets the format of all the other logs: ``text`` as before, or
+``json`` for one JSON object per line.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+from api.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Logger of the request lines
+request_logger = logging.getLogger("api.requests")
+
+# Route of the HTTP requests matching no route, such as 404s, so that
+# clients cannot add routes to the sampling cache at will
+UNMATCHED_ROUTE = "<unmatched>"
+
+# Formats of text logs, in one process and in prefork workers
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+WORKER_TEXT_FORMAT = (
+    "%(asctime)s - %(processName)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as JSON objects, one per line.
+
+    The fields of request records are written at the top level of the object.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: Dict[str, Any] = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "process": record.processName,
+        }
+        fields = getattr(record, "fields", None)
+        if fields is not None:
+            entry.update(fields)
+        else:
+            entry["message"] = record.getMessage()
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that drops records when the queue is full.
+
+    Records are queued as they are, so formatting them is left to the
+    listener's thread; the request path only pays for creating the record.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]"):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class SamplingRule:
+    """The fraction of the requests of the routes matching a pattern to log."""
+
+    def __init__(self, pattern: str, rate: float):
+        self.pattern = pattern
+        self.rate = rate
+        self.logged = 0
+        self.sampled_out = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the configuration and counters of the rule."""
+        return {
+            "pattern": self.pattern,
+            "rate": self.rate,
+            "logged": self.logged,
+            "sampled_out": self.sampled_out,
+        }
+
+
+def parse_sampling(spec: str) -> List[Tuple[str, float]]:
+    """Parse a ``REQUEST_LOG_SAMPLING`` value.
+
+    Returns:
+        The pattern and rate of every entry.
+
+    Raises:
+        ValueError: If an entry is malformed or its rate is not in [0, 1].
+    """
+    rules = []
+    for entry in spec.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        pattern, separator, value = entry.rpartition("=")
+        try:
+            rate = float(value)
+        except ValueError:
+            rate = -1.0
+        if not separator or not pattern.strip() or not 0 <= rate <= 1:
+            raise ValueError(f"Invalid request log sampling rule: {entry!r}")
+        rules.append((pattern.strip(), rate))
+    return rules
+
+
+class RequestLog:
+    """Sampling of the request lines, looked up by route."""
+
+    def __init__(
+        self,
+        rules: List[Tuple[str, float]],
+        default_rate: float,
+        slow_ms: float,
+    ):
+        """Initialize with the pattern and rate of every rule.
+
+        Args:
+            rules: The pattern and rate of every rule.
+            default_rate: Rate of the routes matching no rule.
+            slow_ms: Duration above which requests are always logged.
+        """
+        self.rules = [SamplingRule(*rule) for rule in rules]
+        self.default = SamplingRule("*", default_rate)
+        self.slow_ms = slow_ms
+        self._exact = {
+            rule.pattern: rule for rule in self.rules if not rule.pattern.endswith("*")
+        }
+        # Longest prefix first, so the most specific one matches
+        self._prefixes = sorted(
+            (rule for rule in self.rules if rule.pattern.endswith("*")),
+            key=lambda rule: len(rule.pattern),
+            reverse=True,
+        )
+        self._by_route: Dict[str, SamplingRule] = {}
+
+    @classmethod
+    def from_settings(cls) -> "RequestLog":
+        """Create the request log configured in the settings."""
+        return cls(
+            parse_sampling(settings.REQUEST_LOG_SAMPLING),
+            settings.REQUEST_LOG_SAMPLE_RATE,
+            settings.REQUEST_LOG_SLOW_MS,
+        )
+
+    def for_route(self, route: str) -> SamplingRule:
+        """Return the sampling rule of a route."""
+        if route not in self._by_route:
+            rule = self._exact.get(route)
+            if rule is None:
+                rule = next(
+                    (
+                        prefix
+                        for prefix in self._prefixes
+                        if route.startswith(prefix.pattern[:-1])
+                    ),
+                    self.default,
+                )
+            self._by_route[route] = rule
+        return self._by_route[route]
+
+    def log(
+        self,
+        transport: str,
+        route: str,
+        status: str,
+        failed: bool,
+        duration_ms: float,
+        **fields: Any,
+    ) -> None:
+        """Log a request if it failed, was slow, or is sampled.
+
+        Args:
+            transport: ``http`` or ``grpc``.
+            route: The gRPC method or the HTTP route template.
+            status: The gRPC status code name or the HTTP status code.
+            failed: Whether the request failed.
+            duration_ms: How long the request took.
+            **fields: Further fields of the line.
+        """
+        rule = self.for_route(route)
+        if not (
+            failed
+            or duration_ms >= self.slow_ms
+            or (rule.rate > 0 and (rule.rate >= 1 or random.random() < rule.rate))
+        ):
+            rule.sampled_out += 1
+            return
+        rule.logged += 1
+        if not request_logger.isEnabledFor(logging.INFO):
+            return
+        line = {
+            "transport": transport,
+            "route": route,
+            "status": status,
+            "duration_ms": round(duration_ms, 3),
+            **fields,
+        }
+        if not failed and rule.rate < 1:
+            line["sample_rate"] = rule.rate
+        request_logger.info(
+            "%s %s %s %.3fms",
+            transport,
+            route,
+            status,
+            duration_ms,
+            extra={"fields": line},
+        )
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the configuration and counters of the sampling rules."""
+        return {
+            "rules": [rule.snapshot() for rule in [*self.rules, self.default]],
+            "slow_ms": self.slow_ms,
+            "dropped": _queue_handler.dropped if _queue_handler else 0,
+        }
+
+
+# Queue handler of this process, once logging is configured
+_queue_handler: Optional[DroppingQueueHandler] = None
+
+
+def configure_logging(
+    text_format: str = TEXT_FORMAT, stream: Optional[TextIO] = None
+) -> None:
+    """Send the logs of this process through a queue to a writer thread.
+
+    Replaces the handlers of the root logger; calling it again does nothing.
+
+    Args:
+        text_format: Format of the records when ``LOG_FORMAT`` is ``text``.
+        stream: Stream the records are written to. Defaults to stdout.
+    """
+    global _queue_handler
+    if _queue_handler is not None:
+        return
+    handler = logging.StreamHandler(stream or sys.stdout)
+    if settings.LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(text_format))
+    _queue_handler = DroppingQueueHandler(queue.Queue(settings.LOG_QUEUE_SIZE))
+    listener = logging.handlers.QueueListener(_queue_handler.queue, handler)
+    root = logging.getLogger()
+    for existing in root.handlers[:]:
+        root.removeHandler(existing)
+    root.addHandler(_queue_handler)
+    root.setLevel(logging.INFO)
+    listener.start()
+    # Write the records still queued at exit
+    atexit.register(listener.stop)
+
+
+# Request log of this process
+request_log = RequestLog.from_settings()
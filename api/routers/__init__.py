@@ -1,3 +1,3 @@
-from . import auth, finance, households, users
+from . import auth, calendar, finance, households, users
 
 # This file makes the routers directory a Python package
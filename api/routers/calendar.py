@@ -0,0 +1,196 @@
+from typing import Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse
+from jose import JWTError, jwt
+from sqlalchemy.orm import Session
+
+from .. import models
+from ..config import settings
+from ..dependencies import get_current_user
+from ..models.database import SessionLocal, get_db
+from ..schemas_main import (
+    CalendarFeedTokenResponse,
+    CalendarImportFailure,
+    CalendarImportResponse,
+)
+from ..services.ical import MEDIA_TYPE, calendar_etag, etag_matches, iter_calendar
+from ..services.ical_import import decode_lines, import_calendar
+from ..services.versions import get_calendar_version
+
+router = APIRouter()
+
+# Subscribing apps revalidate on every poll; the ETag makes that cheap
+FEED_CACHE_CONTROL = "private, no-cache"
+FEED_TOKEN_SCOPE = "calendar-feed"
+
+
+def create_feed_token(user: models.User, household_id: int) -> str:
+    """Create the non-expiring token embedded in a calendar subscription URL."""
+    claims = {"sub": user.email, "hid": household_id, "scope": FEED_TOKEN_SCOPE}
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+
+def decode_feed_token(token: str, household_id: int) -> Optional[str]:
+    """Return the e-mail of a feed token's user if it grants the household."""
+    try:
+        claims = jwt.decode(
+            token,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+            options={"verify_aud": False},
+        )
+    except JWTError:
+        return None
+    if claims.get("scope") != FEED_TOKEN_SCOPE or claims.get("hid") != household_id:
+        return None
+    return claims.get("sub")
+
+
+def _feed_user(
+    request: Request, household_id: int, token: Optional[str], db: Session
+) -> Optional[models.User]:
+    """Authenticate a feed request by its feed token or bearer access token.
+
+    Feed tokens are scoped to the household, so polls carrying one are not
+    looked up until the feed is rendered; None is returned for them.
+    """
+    if token:
+        if decode_feed_token(token, household_id) is None:
+            raise _credentials_exception()
+        return None
+    scheme, _, credentials = request.headers.get("Authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not credentials:
+        raise _credentials_exception()
+    try:
+        email = jwt.decode(
+            credentials,
+            settings.SECRET_KEY,
+            algorithms=[settings.ALGORITHM],
+            options={"verify_aud": False},
+        ).get("sub")
+    except JWTError:
+        raise _credentials_exception()
+    return _household_member(db, email, household_id)
+
+
+def _credentials_exception() -> HTTPException:
+    """Return the error raised for missing or invalid feed credentials."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _household_member(
+    db: Session, email: Optional[str], household_id: int
+) -> models.User:
+    """Return the user with an e-mail if they still belong to the household."""
+    user = db.query(models.User).filter(models.User.email == email).first()
+    if user is None or user.household_id != household_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is not a member of this household",
+        )
+    return user
+
+
+@router.post("/{household_id}/feed-token", response_model=CalendarFeedTokenResponse)
+def create_calendar_feed_token(
+    household_id: int,
+    request: Request,
+    current_user: models.User = Depends(get_current_user),
+):
+    """Create the subscription URL of the household calendar for calendar apps."""
+    if current_user.household_id != household_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is not a member of this household",
+        )
+    token = create_feed_token(current_user, household_id)
+    url = request.url_for("read_calendar_feed", household_id=household_id)
+    return CalendarFeedTokenResponse(
+        token=token, url=str(url.include_query_params(token=token))
+    )
+
+
+@router.get("/{household_id}.ics", response_class=StreamingResponse)
+def read_calendar_feed(
+    household_id: int,
+    request: Request,
+    token: Optional[str] = Query(None),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """Stream the household calendar as an iCalendar feed.
+
+    Authenticated by the `token` of a subscription URL or a bearer access
+    token. Subscription polls carrying the current ETag get a 304 after a
+    single version lookup.
+    """
+    user = _feed_user(request, household_id, token, db)
+    etag = calendar_etag(household_id, get_calendar_version(db, household_id))
+    headers = {"ETag": etag, "Cache-Control": FEED_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    if user is None:
+        # Tokens outlive memberships, so check the member before sending data
+        _household_member(db, decode_feed_token(token, household_id), household_id)
+    name = db.get(models.Household, household_id).name
+
+    def stream():
+        # The body is sent after the endpoint returns, on threadpool threads
+        # that serve other requests too, so it uses a session of its own rather
+        # than the thread's scoped one, which iter_calendar expunges
+        feed_db = SessionLocal.session_factory()
+        try:
+            yield from iter_calendar(feed_db, household_id, name)
+        finally:
+            feed_db.close()
+
+    headers["Content-Disposition"] = f'inline; filename="calendar-{household_id}.ics"'
+    return StreamingResponse(stream(), media_type=MEDIA_TYPE, headers=headers)
+
+
+@router.post("/{household_id}/import", response_model=CalendarImportResponse)
+def import_calendar_file(
+    household_id: int,
+    file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Import the events of an iCalendar (.ics) file into the household calendar.
+
+    Events already imported, recognized by their UID, are skipped, so importing
+    a file again changes nothing. Events that cannot be imported are listed
+    with the reason.
+    """
+    if current_user.household_id != household_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="User is not a member of this household",
+        )
+    result = import_calendar(db, household_id, current_user.id, decode_lines(file.file))
+    return CalendarImportResponse(
+        created=result.created,
+        skipped=result.skipped,
+        failed=result.failed,
+        failures=[
+            CalendarImportFailure(
+                index=failure.index, uid=failure.uid, message=failure.message
+            )
+            for failure in result.failures
+        ],
+    )
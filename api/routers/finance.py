@@ -1,20 +1,44 @@
+from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
-from .. import crud, models
+from .. import models
+from ..config import settings
 from ..dependencies import get_current_user  # Import from dependencies, not users
 from ..models.database import get_db
 from ..schemas_main import (
     BudgetCreate,
     BudgetResponse,
+    CashFlowForecastResponse,
     CategoryCreate,
     CategoryResponse,
+    ForecastDay,
+    RecurringOccurrenceResponse,
+    RecurringSeriesResponse,
+    SavingsGoalBand,
+    SavingsGoalRequest,
+    SavingsGoalResponse,
     TransactionCreate,
     TransactionResponse,
     TransactionType,
 )
+from ..services import recurring
+from ..services.finance import (
+    BudgetService,
+    CategoryService,
+    TransactionService,
+    recurring_series,
+)
+from ..services.forecast import MAX_FORECAST_DAYS, forecaster
+from ..services.households import household_of
+from ..services.scheduler import (
+    materialize_household_until,
+    project_household_occurrences,
+    scheduler,
+)
+from ..services.simulation import simulate_household_goal
 
 router = APIRouter(
     dependencies=[Depends(get_current_user)],  # Protect all finance routes
@@ -30,20 +54,8 @@ def create_category_endpoint(
     current_user: models.User = Depends(get_current_user),
 ):
     """Create a new expense or income category for the user's household."""
-    if current_user.household_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User does not belong to a household",
-        )
-
-    # Optional: Check if category name already exists for this household and type
-    # existing_categories = crud.get_categories_by_household(db, household_id=current_user.household_id, type=category.type)
-    # if any(c.name == category.name for c in existing_categories):
-    #     raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Category name already exists for this type")
-
-    return crud.create_category(
-        db=db, category=category, household_id=current_user.household_id
-    )
+    household_id = household_of(current_user)
+    return CategoryService(db, household_id).create(category)
 
 
 @router.get("/categories/", response_model=List[CategoryResponse])
@@ -53,16 +65,8 @@ def read_categories(
     current_user: models.User = Depends(get_current_user),
 ):
     """Get all categories for the user's household, optionally filtered by type."""
-    if current_user.household_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User does not belong to a household",
-        )
-
-    categories = crud.get_categories_by_household(
-        db, household_id=current_user.household_id, type=type
-    )
-    return categories
+    household_id = household_of(current_user)
+    return CategoryService(db, household_id).list(type=type)
 
 
 # == Transactions (Expenses/Income) ==
@@ -75,31 +79,10 @@ def create_transaction_endpoint(
     current_user: models.User = Depends(get_current_user),
 ):
     """Create a new transaction (expense or income)."""
-    if current_user.household_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User does not belong to a household",
-        )
-
-    # Verify the category exists and belongs to the user's household
-    category = crud.get_category(
-        db, category_id=transaction.category_id, household_id=current_user.household_id
-    )
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Category with id {transaction.category_id} not found in this household",
-        )
-
-    created_transaction = crud.create_transaction(
-        db=db,
-        transaction=transaction,
-        user_id=current_user.id,
-        household_id=current_user.household_id,
+    household_id = household_of(current_user)
+    return TransactionService(db, household_id).create_transaction(
+        transaction, user_id=current_user.id
     )
-    # The CRUD function already populates the type based on category
-    # The response model should handle nested category details
-    return created_transaction
 
 
 @router.get("/transactions/", response_model=List[TransactionResponse])
@@ -110,16 +93,8 @@ def read_transactions(
     current_user: models.User = Depends(get_current_user),
 ):
     """Get transactions for the user's household."""
-    if current_user.household_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User does not belong to a household",
-        )
-
-    transactions = crud.get_transactions_by_household(
-        db, household_id=current_user.household_id, skip=skip, limit=limit
-    )
-    return transactions
+    household_id = household_of(current_user)
+    return TransactionService(db, household_id).get_multi(skip=skip, limit=limit)
 
 
 # == Budgets ==
@@ -132,40 +107,8 @@ def create_or_update_budget_endpoint(
     current_user: models.User = Depends(get_current_user),
 ):
     """Create or update a budget threshold for a category in a specific month/year."""
-    if current_user.household_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User does not belong to a household",
-        )
-
-    # Verify the category exists and belongs to the user's household
-    category = crud.get_category(
-        db, category_id=budget.category_id, household_id=current_user.household_id
-    )
-    if not category:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Category with id {budget.category_id} not found in this household",
-        )
-
-    # Ensure budget is for an expense category (optional rule)
-    if category.type != TransactionType.EXPENSE:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Budgets can only be set for expense categories",
-        )
-
-    # Validate month/year if necessary (e.g., month between 1-12)
-    if not 1 <= budget.month <= 12:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Month must be between 1 and 12",
-        )
-
-    created_or_updated_budget = crud.create_or_update_budget(
-        db=db, budget=budget, household_id=current_user.household_id
-    )
-    return created_or_updated_budget
+    household_id = household_of(current_user)
+    return BudgetService(db, household_id).set_budget(budget)
 
 
 @router.get("/budgets/", response_model=List[BudgetResponse])
@@ -176,20 +119,145 @@ def read_budgets(
     current_user: models.User = Depends(get_current_user),
 ):
     """Get all budgets set for the user's household for a specific month and year."""
-    if current_user.household_id is None:
+    household_id = household_of(current_user)
+    return BudgetService(db, household_id).list(month=month, year=year)
+
+
+# == Recurring Series ==
+
+
+@router.get("/recurring/", response_model=List[RecurringSeriesResponse])
+def read_recurring_series(
+    include_inactive: bool = False,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Get the recurring series detected in the household's transactions."""
+    household_id = household_of(current_user)
+    return recurring_series(db, household_id, include_inactive=include_inactive)
+
+
+@router.post("/recurring/detect", response_model=List[RecurringSeriesResponse])
+def detect_recurring_series_endpoint(
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Re-run recurring series detection over the household's full history."""
+    household_id = household_of(current_user)
+
+    detected = recurring.detect_recurring_series(db, household_id=household_id)
+    for series in detected:
+        scheduler.schedule(series)
+    return detected
+
+
+@router.get("/recurring/occurrences", response_model=List[RecurringOccurrenceResponse])
+def read_recurring_occurrences(
+    start_date: date,
+    end_date: date,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Get the upcoming occurrences of the household's recurring series.
+
+    Occurrences that are already due are materialized as transactions first;
+    future ones are returned as projections without being stored.
+    """
+    household_id = household_of(current_user)
+
+    if end_date < start_date:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="User does not belong to a household",
+            detail="end_date must not be before start_date",
         )
 
-    # Validate month/year if necessary
-    if not 1 <= month <= 12:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Month must be between 1 and 12",
+    materialize_household_until(db, household_id, end_date)
+    occurrences = project_household_occurrences(db, household_id, start_date, end_date)
+    return [
+        RecurringOccurrenceResponse(
+            series_id=series.id,
+            description=series.description,
+            amount=series.average_amount,
+            date=due,
+            type=series.type,
+            category_id=series.category_id,
         )
+        for series, due in occurrences
+    ]
+
+
+# == Forecast ==
+
+
+@router.get("/forecast/", response_model=CashFlowForecastResponse)
+def read_cash_flow_forecast(
+    days: int = Query(30, ge=1, le=MAX_FORECAST_DAYS),
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Project the household's daily balance over the next `days` days."""
+    household_id = household_of(current_user)
+
+    components, path = forecaster.forecast(db, household_id, days)
+    dates = components.horizon_dates()[:days]
+    previous = [components.balance] + path[:-1].tolist()
+    lowest = int(path.argmin())
+    return CashFlowForecastResponse(
+        household_id=household_id,
+        version=components.version,
+        as_of=components.as_of,
+        starting_balance=components.balance,
+        ending_balance=float(path[-1]),
+        min_balance=float(path[lowest]),
+        min_balance_date=dates[lowest],
+        days=[
+            ForecastDay(date=day, net_change=balance - before, balance=balance)
+            for day, balance, before in zip(dates, path.tolist(), previous)
+        ],
+    )
+
+
+# == Savings Goals ==
 
-    budgets = crud.get_budgets_by_household(
-        db, household_id=current_user.household_id, month=month, year=year
+
+@router.post("/goals/simulate", response_model=SavingsGoalResponse)
+def simulate_savings_goal(
+    goal: SavingsGoalRequest,
+    db: Session = Depends(get_db),
+    current_user: models.User = Depends(get_current_user),
+):
+    """Estimate the chance of reaching a savings goal by the target date."""
+    household_id = household_of(current_user)
+
+    starting_balance = goal.starting_balance
+    if starting_balance is None:
+        starting_balance = forecaster.components(db, household_id).balance
+
+    try:
+        result = simulate_household_goal(
+            db,
+            household_id=household_id,
+            starting_balance=starting_balance,
+            target_amount=goal.target_amount,
+            target_date=goal.target_date,
+            paths=goal.paths or settings.SIMULATION_DEFAULT_PATHS,
+            seed=goal.seed,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return SavingsGoalResponse(
+        target_amount=goal.target_amount,
+        target_date=goal.target_date,
+        starting_balance=starting_balance,
+        probability=result.probability,
+        paths=result.paths,
+        truncated=result.truncated,
+        history_months=result.history_months,
+        bands=[
+            SavingsGoalBand(date=day, p5=p5, p25=p25, p50=p50, p75=p75, p95=p95)
+            for day, (p5, p25, p50, p75, p95) in zip(
+                result.months, result.percentiles.T.tolist()
+            )
+        ],
     )
-    return budgets
@@ -2,17 +2,26 @@
 Life Manager API - Combined FastAPI and gRPC Server
 
 This module provides functionality to run both FastAPI and gRPC servers
-concurrently using asyncio.
+concurrently using asyncio. The gRPC server is a ``grpc.aio`` server sharing
+uvicorn's event loop; it admits up to ``GRPC_MAX_CONCURRENT_RPCS`` RPCs at a
+time, and only their blocking database work is handed to worker threads.
+
+One process only uses one core, so when ``HTTP_PROCESSES`` or
+``GRPC_PROCESSES`` is above 1 the servers are run by that many worker
+processes each instead, under the supervisor of ``api.prefork``: HTTP
+workers serve uvicorn on ``uvloop`` and ``httptools`` where they are
+installed, and every worker of a server binds its port with ``SO_REUSEPORT``.
 """
 
 import asyncio
+import importlib.util
 import logging
 import signal
-import sys
-from concurrent import futures
+import socket
 from typing import Any, List, Optional
 
 import grpc
+import grpc.aio
 import uvicorn
 from fastapi import FastAPI
 from grpc_health.v1 import health as health_servicer
@@ -20,7 +29,10 @@ from grpc_health.v1 import health_pb2, health_pb2_grpc
 from grpc_reflection.v1alpha import reflection
 
 from .config import settings
+from .grpc_compression import compression_policy
 from .grpc_interceptors import create_grpc_interceptors
+from .prefork import Supervisor, WorkerGroup, WorkerHealth
+from .request_logging import WORKER_TEXT_FORMAT, configure_logging
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +43,7 @@ class ServerManager:
     def __init__(
         self,
         app: FastAPI,
-        grpc_servers: Optional[List[grpc.Server]] = None,
+        grpc_servers: Optional[List[grpc.aio.Server]] = None,
         host: str = "0.0.0.0",
         http_port: int = 8000,
         grpc_port: int = 50051,
@@ -45,7 +57,8 @@ class ServerManager:
             host: Host to bind the servers to.
             http_port: Port for the HTTP server.
             grpc_port: Port for the gRPC server.
-            max_workers: Maximum number of worker threads for gRPC server.
+            max_workers: Unused; gRPC concurrency is bounded by
+                ``GRPC_MAX_CONCURRENT_RPCS``.
         """
         self.app = app
         self.grpc_servers = grpc_servers or []
@@ -60,13 +73,7 @@ class ServerManager:
 
     def _configure_logging(self) -> None:
         """Configure logging for the application."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-            ],
-        )
+        configure_logging()
 
     async def start_http_server(self) -> None:
         """Start the FastAPI HTTP server."""
@@ -76,6 +83,9 @@ class ServerManager:
             port=self.http_port,
             log_level=logging.INFO,
             workers=1,  # We'll handle concurrency with gRPC
+            # Requests are logged by the app, through the logging queue
+            access_log=False,
+            log_config=None,
         )
 
         server = uvicorn.Server(config)
@@ -99,7 +109,7 @@ class ServerManager:
             server.add_insecure_port(f"{self.host}:{port}")
 
             # Add health check service
-            health_servicer_instance = health_servicer.HealthServicer()
+            health_servicer_instance = health_servicer.aio.HealthServicer()
             health_pb2_grpc.add_HealthServicer_to_server(
                 health_servicer_instance, server
             )
@@ -113,14 +123,15 @@ class ServerManager:
 
             # Start the server
             logger.info(f"Starting gRPC server {i+1} on {self.host}:{port}")
-            server.start()
-
-        # Wait for shutdown
-        await self._shutdown_event.wait()
+            await server.start()
 
-        # Graceful shutdown
-        for server in self.grpc_servers:
-            await server.stop(5)  # 5 second grace period
+        # Wait for shutdown, which may also come as cancellation of this task
+        try:
+            await self._shutdown_event.wait()
+        finally:
+            # Graceful shutdown
+            for server in self.grpc_servers:
+                await server.stop(5)  # 5 second grace period
 
     def _handle_shutdown(self, signum: int, frame: Any) -> None:
         """Handle shutdown signals."""
@@ -182,13 +193,29 @@ class ServerManager:
             pass
 
 
-def create_servers() -> List[grpc.Server]:
-    """Create gRPC servers with graceful error handling."""
+def create_servers(
+    reuse_port: bool = False, raise_errors: bool = False
+) -> List[grpc.aio.Server]:
+    """Create gRPC servers with graceful error handling.
+
+    ``grpc.aio`` servers are bound to the running event loop, so this must be
+    called from a coroutine.
+
+    Args:
+        reuse_port: Whether the port may be bound by other processes too, as
+            the workers of the prefork server do (see api/grpc_server.py).
+        raise_errors: Whether to raise the errors creating the server, such
+            as a service failing to import, instead of logging them and
+            returning no server.
+    """
     try:
         # Create server
-        server = grpc.server(
-            thread_pool=futures.ThreadPoolExecutor(max_workers=settings.WORKERS),
+        server = grpc.aio.server(
             interceptors=create_grpc_interceptors(),
+            # Responses are compressed by default; the compression interceptor
+            # turns it off for those the policy leaves out
+            compression=compression_policy.compression,
+            maximum_concurrent_rpcs=settings.GRPC_MAX_CONCURRENT_RPCS,
             options=[
                 ("grpc.max_send_message_length", settings.GRPC_MAX_MESSAGE_LENGTH),
                 ("grpc.max_receive_message_length", settings.GRPC_MAX_MESSAGE_LENGTH),
@@ -210,54 +237,185 @@ def create_servers() -> List[grpc.Server]:
                     "grpc.http2.min_time_between_pings_ms",
                     settings.GRPC_HTTP2_MIN_RECV_PING_INTERVAL_WITHOUT_DATA_SEC * 1000,
                 ),
+                ("grpc.so_reuseport", int(reuse_port)),
             ],
         )
 
         try:
             # Add gRPC services
-            from api.generated.api.v1 import user_pb2_grpc
-            from api.services.grpc import UserService
+            from api.generated.api.v1 import (
+                calendar_pb2_grpc,
+                finance_pb2_grpc,
+                household_pb2_grpc,
+                user_pb2_grpc,
+            )
+            from api.services.grpc import (
+                CalendarService,
+                FinanceService,
+                HouseholdService,
+                UserService,
+            )
 
             # Create and add UserService
             user_service = UserService()
             user_pb2_grpc.add_UserServiceServicer_to_server(user_service, server)
 
+            # Create and add CalendarService
+            calendar_service = CalendarService()
+            calendar_pb2_grpc.add_CalendarServiceServicer_to_server(
+                calendar_service, server
+            )
+
+            # Create and add HouseholdService
+            household_service = HouseholdService()
+            household_pb2_grpc.add_HouseholdServiceServicer_to_server(
+                household_service, server
+            )
+
+            # Create and add FinanceService
+            finance_service = FinanceService()
+            finance_pb2_grpc.add_FinanceServiceServicer_to_server(
+                finance_service, server
+            )
+
             logger.info("Registered gRPC services")
             return [server]
         except ImportError as e:
+            if raise_errors:
+                raise
             logger.warning(f"Could not import gRPC generated modules: {e}")
             return []
     except Exception as e:
+        if raise_errors:
+            raise
         logger.exception(f"Failed to create gRPC server: {e}")
         return []
 
 
+class _WorkerServer(uvicorn.Server):
+    """A uvicorn server sending heartbeats to the prefork supervisor."""
+
+    def __init__(self, config: uvicorn.Config, slot: int, health: WorkerHealth):
+        super().__init__(config)
+        self.slot = slot
+        self.health = health
+
+    async def on_tick(self, counter: int) -> bool:
+        # Ticks come every 0.1 seconds
+        if counter % 10 == 0:
+            self.health.beat(self.slot)
+        return await super().on_tick(counter)
+
+
+def _bind_reuse_port(host: str, port: int) -> socket.socket:
+    """Bind a listening socket to a port other processes may bind too."""
+    host = host.strip("[]")
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    return sock
+
+
+def serve_http_worker(
+    slot: int, health: WorkerHealth, host: str, port: int, grace: float
+) -> None:
+    """Entry point of a prefork HTTP worker process."""
+    configure_logging(WORKER_TEXT_FORMAT)
+    if slot:
+        # Background jobs run once, in the first worker
+        settings.RECURRING_SCHEDULER_ENABLED = False
+        settings.REMINDER_WORKER_ENABLED = False
+
+    from .main import app
+
+    # "auto" picks uvloop and httptools when they are installed
+    config = uvicorn.Config(
+        app=app,
+        loop="auto",
+        http="auto",
+        log_level=logging.INFO,
+        # Requests are logged by the app, through the logging queue
+        access_log=False,
+        log_config=None,
+        timeout_graceful_shutdown=int(grace),
+    )
+    logger.info(
+        f"HTTP worker {slot} serving on {host}:{port} with "
+        f"{'uvloop' if importlib.util.find_spec('uvloop') else 'asyncio'} and "
+        f"{'httptools' if importlib.util.find_spec('httptools') else 'h11'}"
+    )
+    _WorkerServer(config, slot, health).run(sockets=[_bind_reuse_port(host, port)])
+
+
+def run_prefork(
+    http_processes: Optional[int] = None, grpc_processes: Optional[int] = None
+) -> None:
+    """Run the HTTP and gRPC servers in supervised worker processes.
+
+    The supervisor drains the workers on SIGTERM or SIGINT and restarts them
+    one at a time on SIGHUP.
+
+    Args:
+        http_processes: Number of HTTP workers. Defaults to ``HTTP_PROCESSES``.
+        grpc_processes: Number of gRPC workers. Defaults to ``GRPC_PROCESSES``.
+    """
+    from .grpc_server import serve_grpc_worker
+
+    configure_logging()
+    grace = settings.PREFORK_GRACE_SECONDS
+    groups = [
+        WorkerGroup(
+            "http",
+            serve_http_worker,
+            http_processes or settings.HTTP_PROCESSES,
+            (settings.HOST, settings.PORT, grace),
+        ),
+        WorkerGroup(
+            "grpc",
+            serve_grpc_worker,
+            grpc_processes or settings.GRPC_PROCESSES,
+            (settings.HOST, settings.GRPC_PORT, grace),
+        ),
+    ]
+    for group in groups:
+        logger.info(f"Starting {group.count} {group.name} workers")
+    Supervisor(groups, grace=grace).run()
+
+
 def run() -> None:
     """Run the application."""
+    if settings.HTTP_PROCESSES > 1 or settings.GRPC_PROCESSES > 1:
+        run_prefork()
+        return
+
     # Create FastAPI app
     from .main import app
 
-    # Create gRPC servers
-    grpc_servers = create_servers()
-
-    # Create and run the server manager
-    manager = ServerManager(
-        app=app,
-        grpc_servers=grpc_servers,
-        host=settings.HOST,
-        http_port=settings.PORT,
-        grpc_port=settings.GRPC_PORT,
-        max_workers=settings.WORKERS,
-    )
+    async def serve() -> None:
+        # Create gRPC servers on the loop they will run on
+        grpc_servers = create_servers()
+
+        # Create and run the server manager
+        manager = ServerManager(
+            app=app,
+            grpc_servers=grpc_servers,
+            host=settings.HOST,
+            http_port=settings.PORT,
+            grpc_port=settings.GRPC_PORT,
+            max_workers=settings.WORKERS,
+        )
+        await manager.run()
 
     # Check if we're in an event loop already
     try:
         loop = asyncio.get_running_loop()
         # We're already in an event loop (likely Uvicorn's)
-        return asyncio.ensure_future(manager.run())
+        return asyncio.ensure_future(serve())
     except RuntimeError:
         # No running event loop, create one with asyncio.run()
-        asyncio.run(manager.run())
+        asyncio.run(serve())
 
 # Create an ASGI app object for Uvicorn to use directly
 from .main import app as fastapi_app
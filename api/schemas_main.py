@@ -1,9 +1,9 @@
 from datetime import date
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 
-from .models.finance import TransactionType  # Import enum
+from .models.finance import RecurrenceFrequency, TransactionType  # Import enums
 
 
 # User Schemas
@@ -136,3 +136,97 @@ class BudgetResponse(BudgetBase):
 
     class Config:
         orm_mode = True
+
+
+# Recurring Series Schemas
+class RecurringSeriesResponse(BaseModel):
+    id: int
+    household_id: int
+    category_id: Optional[int] = None
+    description: Optional[str] = None
+    type: TransactionType
+    frequency: RecurrenceFrequency
+    average_amount: float
+    occurrence_count: int
+    first_date: date
+    last_date: date
+    next_due_date: date
+    is_active: bool
+
+    class Config:
+        orm_mode = True
+
+
+class RecurringOccurrenceResponse(BaseModel):
+    series_id: int
+    description: Optional[str] = None
+    amount: float
+    date: date
+    type: TransactionType
+    category_id: Optional[int] = None
+
+
+# Cash-Flow Forecast Schemas
+class ForecastDay(BaseModel):
+    date: date
+    net_change: float
+    balance: float
+
+
+class CashFlowForecastResponse(BaseModel):
+    household_id: int
+    version: int
+    as_of: date
+    starting_balance: float
+    ending_balance: float
+    min_balance: float
+    min_balance_date: date
+    days: List[ForecastDay]
+
+
+# Savings Goal Schemas
+class SavingsGoalRequest(BaseModel):
+    target_amount: float
+    target_date: date
+    starting_balance: Optional[float] = None  # Defaults to the current balance
+    paths: Optional[int] = Field(None, ge=1)
+    seed: Optional[int] = None
+
+
+class SavingsGoalBand(BaseModel):
+    date: date
+    p5: float
+    p25: float
+    p50: float
+    p75: float
+    p95: float
+
+
+class SavingsGoalResponse(BaseModel):
+    target_amount: float
+    target_date: date
+    starting_balance: float
+    probability: float
+    paths: int
+    truncated: bool
+    history_months: int
+    bands: List[SavingsGoalBand]
+
+
+# Calendar Feed Schemas
+class CalendarFeedTokenResponse(BaseModel):
+    token: str
+    url: str  # Subscription URL with the token
+
+
+class CalendarImportFailure(BaseModel):
+    index: int  # Position of the VEVENT in the file, from 1
+    uid: Optional[str] = None
+    message: str
+
+
+class CalendarImportResponse(BaseModel):
+    created: int
+    skipped: int  # Already imported or cancelled
+    failed: int
+    failures: List[CalendarImportFailure]  # Up to the first 1000
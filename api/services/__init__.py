@@ -0,0 +1,6 @@
+"""
+Services
+
+This package contains the domain services shared by the REST routers and the
+gRPC servicers of the Life Manager API.
+"""
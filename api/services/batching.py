@@ -0,0 +1,113 @@
+"""
+Request Coalescing
+
+This module merges concurrent lookups of single objects by ID into batched
+queries, in the manner of a DataLoader: the first lookup of a batch waits a
+short window for others to arrive, then resolves all of them with one
+``IN`` query.
+
+Lookups run on the worker threads of blocking RPCs. Batches load their
+objects in a session of their own, which is closed once they are loaded, so
+the objects returned are detached: their columns can be read, but their
+relationships cannot be loaded.
+"""
+
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, Optional, TypeVar
+
+from api.base_service import BaseService
+from api.config import settings
+from api.models.database import SessionLocal
+from api.models.finance import Transaction
+from api.models.user import User
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    """Loader merging concurrent lookups by key into batches."""
+
+    def __init__(
+        self,
+        load_many: Callable[[Iterable[K]], Dict[K, V]],
+        window: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+    ):
+        """Initialize the loader.
+
+        Args:
+            load_many: Function loading the objects of a batch of keys, by key.
+            window: Seconds a batch waits for more lookups; 0 loads every
+                lookup on its own. Defaults to ``GRPC_COALESCE_WINDOW_MS``.
+            max_batch_size: Number of keys after which a batch is loaded at
+                once. Defaults to ``GRPC_BATCH_MAX_SIZE``.
+        """
+        self.load_many = load_many
+        self.window = (
+            settings.GRPC_COALESCE_WINDOW_MS / 1e3 if window is None else window
+        )
+        self.max_batch_size = max_batch_size or settings.GRPC_BATCH_MAX_SIZE
+        self._lock = threading.Lock()
+        self._pending: Dict[K, Future] = {}
+        self._full = threading.Event()
+
+    def load(self, key: K) -> Optional[V]:
+        """Return the object of a key, or None if there is none.
+
+        Raises:
+            Exception: Whatever loading the batch of the key raised.
+        """
+        if self.window <= 0:
+            return self.load_many([key]).get(key)
+
+        with self._lock:
+            leader = not self._pending
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+                if len(self._pending) >= self.max_batch_size:
+                    self._full.set()
+        if leader:
+            self._full.wait(self.window)
+            self._dispatch()
+        return future.result()
+
+    def _dispatch(self) -> None:
+        """Load the pending batch and resolve its lookups."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+            self._full.clear()
+        try:
+            # The batch serves many requests, so it is not held to the
+            # deadline of the one that happens to load it
+            found = contextvars.Context().run(self.load_many, list(batch))
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        logger.debug(f"Loaded a batch of {len(batch)} keys")
+        for key, future in batch.items():
+            future.set_result(found.get(key))
+
+
+def load_by_id(model: type, ids: Iterable[Any]) -> Dict[Any, Any]:
+    """Load objects of a model by ID in a session of their own."""
+    db = SessionLocal.session_factory()
+    try:
+        return BaseService(model, db).get_many(ids)
+    finally:
+        db.close()
+
+
+# Loaders of the objects looked up one at a time by the gRPC services
+user_loader: BatchLoader[int, User] = BatchLoader(functools.partial(load_by_id, User))
+transaction_loader: BatchLoader[int, Transaction] = BatchLoader(
+    functools.partial(load_by_id, Transaction)
+)
@@ -0,0 +1,149 @@
+"""
+Calendar Event Conflicts
+
+This module finds the existing occurrences that overlap a created or updated
+event for one of its participants, i.e. its creator and attendees. Every
+occurrence of the written event is looked up in the interval index on its own,
+so only events overlapping one of them are loaded, and of those only the ones
+sharing a participant. Recurring events on either side are expanded.
+
+Series are checked from now, or from their first occurrence if later, up to
+``CALENDAR_CONFLICT_HORIZON_DAYS`` ahead. All-day events never conflict, just
+as they do not count as busy time.
+"""
+
+import logging
+from bisect import bisect_left
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.calendar import Event
+from api.models.user import User
+
+from .event_index import LOAD_CHUNK_SIZE, event_index
+from .event_recurrence import Occurrence, expand_event, occurrence_cache
+from .free_busy import event_participants
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on the conflicts reported for one write
+MAX_CONFLICTS = 100
+
+# Instantaneous occurrences are treated as lasting this long
+_INSTANT = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class Conflict:
+    """An existing occurrence overlapping an occurrence of the written event."""
+
+    occurrence_start: datetime  # Start of the written event's occurrence
+    event: Event
+    occurrence: Occurrence
+    user_ids: Tuple[int, ...]  # Participants of both events
+
+
+def _end(occurrence: Occurrence) -> datetime:
+    """Return the end of an occurrence, giving instantaneous ones a length."""
+    return max(occurrence.end_time, occurrence.start_time + _INSTANT)
+
+
+def checked_occurrences(
+    event: Event, now: Optional[datetime] = None
+) -> List[Occurrence]:
+    """Return the occurrences of a written event that are checked for conflicts.
+
+    ``touch_event`` must have refreshed the span of the event.
+    """
+    if event.span_start is None or event.is_all_day:
+        return []
+    lower = event.span_start
+    if event.is_recurring:
+        lower = max(lower, now or datetime.utcnow())
+    upper = lower + timedelta(days=settings.CALENDAR_CONFLICT_HORIZON_DAYS)
+    occurrences, _ = expand_event(event, lower, upper)
+    return occurrences[: settings.CALENDAR_CONFLICT_MAX_OCCURRENCES]
+
+
+def find_conflicts(
+    db: Session,
+    event: Event,
+    occurrences: Optional[Sequence[Occurrence]] = None,
+    now: Optional[datetime] = None,
+) -> List[Conflict]:
+    """Find the existing occurrences overlapping a written event.
+
+    Args:
+        db: Database session.
+        event: The created or updated event.
+        occurrences: Occurrences of the event to check, e.g. a single edited
+            instance. Defaults to ``checked_occurrences(event)``.
+        now: Current time, where series checks start.
+
+    Returns:
+        Up to MAX_CONFLICTS conflicts, sorted by the start of the written
+        occurrence and then of the existing one.
+    """
+    if occurrences is None:
+        occurrences = checked_occurrences(event, now)
+    occurrences = sorted(occurrences, key=lambda occurrence: occurrence.start_time)
+    users = event_participants(event)
+    if not occurrences or not users:
+        return []
+
+    windows = [(occurrence.start_time, _end(occurrence)) for occurrence in occurrences]
+    candidate_ids = event_index.overlapping_ids(db, event.household_id, windows)
+    candidate_ids.discard(event.id)
+    candidate_ids = sorted(candidate_ids)
+
+    candidates: List[Event] = []
+    for i in range(0, len(candidate_ids), LOAD_CHUNK_SIZE):
+        candidates.extend(
+            db.query(Event).filter(
+                Event.id.in_(candidate_ids[i : i + LOAD_CHUNK_SIZE]),
+                or_(
+                    Event.created_by_user_id.in_(users),
+                    Event.attendees.any(User.id.in_(users)),
+                ),
+            )
+        )
+
+    starts = [occurrence.start_time for occurrence in occurrences]
+    longest = max(
+        _end(occurrence) - occurrence.start_time for occurrence in occurrences
+    )
+    window_start = starts[0]
+    window_end = max(end for _, end in windows)
+    conflicts = []
+    for candidate in candidates:
+        if candidate.is_all_day:
+            continue
+        shared = tuple(sorted(event_participants(candidate) & users))
+        if not shared:
+            continue
+        for existing in occurrence_cache.expand(candidate, window_start, window_end):
+            existing_end = _end(existing)
+            i = bisect_left(starts, existing.start_time - longest)
+            while i < len(starts) and starts[i] < existing_end:
+                if _end(occurrences[i]) > existing.start_time:
+                    conflicts.append(Conflict(starts[i], candidate, existing, shared))
+                i += 1
+
+    conflicts.sort(
+        key=lambda conflict: (
+            conflict.occurrence_start,
+            conflict.occurrence.start_time,
+            conflict.event.id,
+        )
+    )
+    if len(conflicts) > MAX_CONFLICTS:
+        logger.debug(
+            f"Reporting {MAX_CONFLICTS} of {len(conflicts)} conflicts "
+            f"of event {event.id}"
+        )
+    return conflicts[:MAX_CONFLICTS]
@@ -0,0 +1,444 @@
+"""
+Calendar Event Interval Index
+
+This module provides the interval access path for event range queries. Every
+event stores the envelope of all its occurrences as ``span_start`` and
+``span_end`` (None meaning an endless series), so a long, multi-day or recurring
+event that started before a window is still found by an overlap query.
+
+On Postgres the envelope is indexed by the generated ``during`` tsrange column
+and its GiST index. Other backends, SQLite in development and tests, use an
+in-memory interval tree per household that is rebuilt whenever the household's
+calendar version changes.
+"""
+
+import heapq
+import logging
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func, literal_column, or_
+from sqlalchemy.dialects.postgresql import TSRANGE
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.calendar import Event
+
+from .versions import get_calendar_version
+
+logger = logging.getLogger(__name__)
+
+# Number of IDs per IN clause when loading events found by the tree
+LOAD_CHUNK_SIZE = 500
+
+# Writes applied to a tree as an overlay before it is rebuilt from the database
+MAX_OVERLAY_SIZE = 256
+
+# Span of an event in the index: (start, end); an end of None is unbounded
+_Span = Tuple[datetime, Optional[datetime]]
+
+# The generated column is not mapped because it only exists on Postgres
+_DURING = literal_column("events.during", type_=TSRANGE)
+
+
+class IntervalTree:
+    """Static interval tree over closed intervals sorted by start.
+
+    The intervals are kept in start order and a segment tree of the maximum end
+    over that order prunes every subtree that ends before a bound. Overlap and
+    stabbing queries cost O(log n + k log n) for k results; containment within
+    a window and next-K-by-start queries are a binary search away. Unbounded
+    intervals are left out of the segment tree, where a few endless series
+    would defeat the pruning of most subtrees, and are listed separately.
+    """
+
+    def __init__(self, intervals: Iterable[Tuple[datetime, Optional[datetime], int]]):
+        """Build the tree.
+
+        Args:
+            intervals: (start, end, id) triples; an end of None is unbounded.
+        """
+        items = sorted(intervals, key=lambda item: (item[0], item[2]))
+        self.starts = [start for start, _, _ in items]
+        self.ends = [end or datetime.max for _, end, _ in items]
+        self.ids = [item_id for _, _, item_id in items]
+
+        size = 1
+        while size < len(items):
+            size *= 2
+        self._size = size
+        self._max_end = [datetime.min] * (2 * size)
+        self._max_end[size : size + len(items)] = [
+            datetime.min if end is None else end for _, end, _ in items
+        ]
+        self._unbounded = [i for i, (_, end, _) in enumerate(items) if end is None]
+        for node in range(size - 1, 0, -1):
+            self._max_end[node] = max(
+                self._max_end[2 * node], self._max_end[2 * node + 1]
+            )
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def _ending_after(self, stop: int, bound: datetime) -> List[int]:
+        """Return positions before ``stop`` of intervals ending at or after a bound."""
+        positions = self._unbounded[: bisect_left(self._unbounded, stop)]
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, low, high = stack.pop()
+            if low >= stop or self._max_end[node] < bound:
+                continue
+            if node >= self._size:
+                positions.append(low)
+                continue
+            middle = (low + high) // 2
+            stack.append((2 * node + 1, middle, high))
+            stack.append((2 * node, low, middle))
+        return positions
+
+    def overlapping(self, start: datetime, end: datetime) -> List[int]:
+        """Return the IDs of intervals intersecting [start, end)."""
+        stop = bisect_left(self.starts, end)
+        return [self.ids[i] for i in self._ending_after(stop, start)]
+
+    def containing(self, start: datetime, end: datetime) -> List[int]:
+        """Return the IDs of intervals that cover all of [start, end]."""
+        stop = bisect_right(self.starts, start)
+        return [self.ids[i] for i in self._ending_after(stop, end)]
+
+    def within(self, start: datetime, end: datetime) -> List[int]:
+        """Return the IDs of intervals that lie entirely inside [start, end]."""
+        low = bisect_left(self.starts, start)
+        high = bisect_right(self.starts, end)
+        return [self.ids[i] for i in range(low, high) if self.ends[i] <= end]
+
+    def starting_from(self, start: datetime) -> Iterator[Tuple[datetime, int]]:
+        """Yield (start, id) pairs of intervals starting at or after a bound."""
+        for i in range(bisect_left(self.starts, start), len(self.ids)):
+            yield self.starts[i], self.ids[i]
+
+
+class _HouseholdTree:
+    """Interval tree of one household at one calendar version.
+
+    Writes made by this process are applied as a small overlay instead of a
+    rebuild: ``changed`` maps the ID of every event written since the tree was
+    built to its new span, or to None once the event is gone.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        tree: IntervalTree,
+        recurring_ids: Set[int],
+        changed: Optional[Dict[int, Optional[_Span]]] = None,
+    ):
+        self.version = version
+        self.tree = tree
+        self.recurring_ids = recurring_ids
+        self.changed = changed or {}
+        self.delta = IntervalTree(
+            (span[0], span[1], event_id)
+            for event_id, span in self.changed.items()
+            if span is not None
+        )
+
+    def _merge(self, base: List[int], delta: List[int]) -> List[int]:
+        """Combine the results of the tree and the overlay."""
+        return [event_id for event_id in base if event_id not in self.changed] + delta
+
+    def overlapping(self, start: datetime, end: datetime) -> List[int]:
+        """See ``IntervalTree.overlapping``; written events come from the overlay."""
+        return self._merge(
+            self.tree.overlapping(start, end), self.delta.overlapping(start, end)
+        )
+
+    def containing(self, start: datetime, end: datetime) -> List[int]:
+        """See ``IntervalTree.containing``; written events come from the overlay."""
+        return self._merge(
+            self.tree.containing(start, end), self.delta.containing(start, end)
+        )
+
+    def within(self, start: datetime, end: datetime) -> List[int]:
+        """See ``IntervalTree.within``; written events come from the overlay."""
+        return self._merge(self.tree.within(start, end), self.delta.within(start, end))
+
+    def starting_from(self, start: datetime) -> Iterator[Tuple[datetime, int]]:
+        """See ``IntervalTree.starting_from``; written events come from the overlay."""
+        base = (
+            (event_start, event_id)
+            for event_start, event_id in self.tree.starting_from(start)
+            if event_id not in self.changed
+        )
+        return heapq.merge(base, self.delta.starting_from(start))
+
+    def with_changes(
+        self,
+        version: int,
+        spans: Dict[int, Optional[Tuple[datetime, Optional[datetime], bool]]],
+    ) -> "_HouseholdTree":
+        """Return a copy of the tree with written events applied to the overlay."""
+        changed = dict(self.changed)
+        recurring_ids = set(self.recurring_ids)
+        for event_id, span in spans.items():
+            recurring_ids.discard(event_id)
+            if span is None:
+                changed[event_id] = None
+                continue
+            changed[event_id] = (span[0], span[1])
+            if span[2]:
+                recurring_ids.add(event_id)
+        return _HouseholdTree(version, self.tree, recurring_ids, changed)
+
+
+class EventIntervalIndex:
+    """Overlap, containment and upcoming queries over event spans."""
+
+    def __init__(self, max_households: int = settings.CALENDAR_INDEX_MAX_HOUSEHOLDS):
+        """Initialize the index.
+
+        Args:
+            max_households: Maximum number of household trees kept in memory.
+        """
+        self.max_households = max_households
+        self._trees: "OrderedDict[int, _HouseholdTree]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def uses_database(db: Session) -> bool:
+        """Check whether the session's backend has a native interval index."""
+        return db.get_bind().dialect.name == "postgresql"
+
+    def _tree(self, db: Session, household_id: int) -> _HouseholdTree:
+        """Return the current tree of a household, rebuilding it when stale."""
+        version = get_calendar_version(db, household_id)
+        with self._lock:
+            cached = self._trees.get(household_id)
+            if cached is not None and cached.version == version:
+                self._trees.move_to_end(household_id)
+                return cached
+
+        rows = (
+            db.query(
+                Event.id,
+                Event.span_start,
+                Event.span_end,
+                Event.recurrence_frequency.isnot(None),
+            )
+            .filter(Event.household_id == household_id, Event.span_start.isnot(None))
+            .all()
+        )
+        tree = _HouseholdTree(
+            version,
+            IntervalTree((start, end, event_id) for event_id, start, end, _ in rows),
+            {event_id for event_id, _, _, recurring in rows if recurring},
+        )
+        with self._lock:
+            self._trees[household_id] = tree
+            self._trees.move_to_end(household_id)
+            while len(self._trees) > self.max_households:
+                self._trees.popitem(last=False)
+        logger.debug(
+            f"Built interval tree of {len(rows)} events for household "
+            f"{household_id} at calendar version {version}"
+        )
+        return tree
+
+    @staticmethod
+    def _filter(query, recurring: Optional[bool]):
+        """Restrict an event query to single or recurring events."""
+        if recurring is True:
+            return query.filter(Event.recurrence_frequency.isnot(None))
+        if recurring is False:
+            return query.filter(Event.recurrence_frequency.is_(None))
+        return query
+
+    def _load(
+        self, db: Session, event_ids: Sequence[int], recurring: Optional[bool]
+    ) -> List[Event]:
+        """Load events by ID in chunks."""
+        events: List[Event] = []
+        for i in range(0, len(event_ids), LOAD_CHUNK_SIZE):
+            query = db.query(Event).filter(
+                Event.id.in_(event_ids[i : i + LOAD_CHUNK_SIZE])
+            )
+            events.extend(self._filter(query, recurring).all())
+        return events
+
+    def _query(
+        self,
+        db: Session,
+        household_id: int,
+        clause,
+        recurring: Optional[bool],
+    ) -> List[Event]:
+        """Run an interval query against the Postgres GiST index."""
+        query = db.query(Event).filter(Event.household_id == household_id, clause)
+        return self._filter(query, recurring).all()
+
+    def overlapping(
+        self,
+        db: Session,
+        household_id: int,
+        start: datetime,
+        end: datetime,
+        recurring: Optional[bool] = None,
+    ) -> List[Event]:
+        """Load the events whose span intersects [start, end).
+
+        Args:
+            db: Database session.
+            household_id: ID of the household.
+            start: Inclusive start of the window.
+            end: Exclusive end of the window.
+            recurring: Only single events if False, only series if True.
+        """
+        if self.uses_database(db):
+            window = func.tsrange(start, end, "[)", type_=TSRANGE)
+            return self._query(db, household_id, _DURING.op("&&")(window), recurring)
+        ids = self._tree(db, household_id).overlapping(start, end)
+        return self._load(db, ids, recurring)
+
+    def containing(
+        self,
+        db: Session,
+        household_id: int,
+        start: datetime,
+        end: datetime,
+        recurring: Optional[bool] = None,
+    ) -> List[Event]:
+        """Load the events whose span covers all of [start, end]."""
+        if self.uses_database(db):
+            window = func.tsrange(start, end, "[]", type_=TSRANGE)
+            return self._query(db, household_id, _DURING.op("@>")(window), recurring)
+        ids = self._tree(db, household_id).containing(start, end)
+        return self._load(db, ids, recurring)
+
+    def within(
+        self,
+        db: Session,
+        household_id: int,
+        start: datetime,
+        end: datetime,
+        recurring: Optional[bool] = None,
+    ) -> List[Event]:
+        """Load the events whose span lies entirely inside [start, end]."""
+        if self.uses_database(db):
+            window = func.tsrange(start, end, "[]", type_=TSRANGE)
+            return self._query(db, household_id, _DURING.op("<@")(window), recurring)
+        ids = self._tree(db, household_id).within(start, end)
+        return self._load(db, ids, recurring)
+
+    def upcoming(
+        self,
+        db: Session,
+        household_id: int,
+        after: datetime,
+        limit: int,
+        before: Optional[datetime] = None,
+    ) -> List[Event]:
+        """Load the next single events starting at or after a time, by start."""
+        if self.uses_database(db):
+            query = db.query(Event).filter(
+                Event.household_id == household_id,
+                Event.recurrence_frequency.is_(None),
+                Event.start_time >= after,
+            )
+            if before is not None:
+                query = query.filter(Event.start_time < before)
+            return query.order_by(Event.start_time, Event.id).limit(limit).all()
+
+        household_tree = self._tree(db, household_id)
+        ids = []
+        for start, event_id in household_tree.starting_from(after):
+            if len(ids) >= limit or (before is not None and start >= before):
+                break
+            if event_id not in household_tree.recurring_ids:
+                ids.append(event_id)
+        events = self._load(db, ids, recurring=False)
+        events.sort(key=lambda event: (event.start_time, event.id))
+        return events
+
+    def overlapping_ids(
+        self,
+        db: Session,
+        household_id: int,
+        windows: Sequence[Tuple[datetime, datetime]],
+    ) -> Set[int]:
+        """Return the IDs of events intersecting any of several [start, end) windows.
+
+        Only IDs are read, so callers can narrow the candidates down before
+        loading them.
+        """
+        if not windows:
+            return set()
+        if self.uses_database(db):
+            clauses = [
+                _DURING.op("&&")(func.tsrange(start, end, "[)", type_=TSRANGE))
+                for start, end in windows
+            ]
+            rows = db.query(Event.id).filter(
+                Event.household_id == household_id, or_(*clauses)
+            )
+            return {event_id for (event_id,) in rows}
+        household_tree = self._tree(db, household_id)
+        return {
+            event_id
+            for start, end in windows
+            for event_id in household_tree.overlapping(start, end)
+        }
+
+    def record_write(
+        self,
+        db: Session,
+        household_id: int,
+        changed: Sequence[Event] = (),
+        deleted: Sequence[int] = (),
+    ) -> None:
+        """Apply a committed write of this process to the household's tree.
+
+        The tree is patched when the write is the only one since the tree was
+        built, i.e. it moved the calendar version up by exactly one; otherwise
+        it is dropped and the next query rebuilds it.
+
+        Args:
+            db: Database session the write was committed in.
+            household_id: ID of the household.
+            changed: Created or updated events.
+            deleted: IDs of deleted events.
+        """
+        if self.uses_database(db):
+            return
+        version = get_calendar_version(db, household_id)
+        spans = {
+            event.id: (
+                (event.span_start, event.span_end, event.is_recurring)
+                if event.span_start is not None
+                else None
+            )
+            for event in changed
+        }
+        spans.update(dict.fromkeys(deleted))
+        with self._lock:
+            cached = self._trees.get(household_id)
+            if cached is None or cached.version == version:
+                return
+            if (
+                cached.version != version - 1
+                or len(cached.changed) + len(spans) > MAX_OVERLAY_SIZE
+            ):
+                del self._trees[household_id]
+                return
+            self._trees[household_id] = cached.with_changes(version, spans)
+
+    def invalidate(self, household_id: int) -> None:
+        """Drop the in-memory tree of a household."""
+        with self._lock:
+            self._trees.pop(household_id, None)
+
+
+# Shared interval index used by the API process
+event_index = EventIntervalIndex()
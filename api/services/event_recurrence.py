@@ -0,0 +1,599 @@
+"""
+Calendar Event Recurrence
+
+This module expands recurring calendar events into occurrences. A series is
+stored as a single ``Event`` row holding its recurrence rule; occurrences are
+never persisted. Edited or cancelled instances are stored as ``EventException``
+rows keyed by the start the rule generated for them.
+
+Expansion is lazy and jumps straight to the requested window: the index of the
+first candidate occurrence is computed arithmetically from the window start, so
+the cost of a query depends on the number of occurrences in the window rather
+than on the age of the series. Expanded windows are kept in a per-series LRU
+keyed by the event sequence, so any write to a series makes its windows stale.
+"""
+
+import heapq
+import logging
+import math
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.calendar import Event, EventException, EventFrequency
+
+from .event_index import event_index
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on occurrences expanded per series for a single window
+MAX_OCCURRENCES_PER_WINDOW = 5000
+
+# Months between two occurrences of month-based rules, before the interval
+_MONTH_STEPS = {EventFrequency.MONTHLY: 1, EventFrequency.YEARLY: 12}
+
+
+def weekday_mask(weekdays: Iterable[int]) -> int:
+    """Pack weekdays (0=Sunday through 6=Saturday) into a bitmask.
+
+    Raises:
+        ValueError: If a weekday is out of range.
+    """
+    mask = 0
+    for weekday in weekdays:
+        if not 0 <= weekday <= 6:
+            raise ValueError(f"Invalid weekday: {weekday}")
+        mask |= 1 << weekday
+    return mask
+
+
+def mask_weekdays(mask: Optional[int]) -> List[int]:
+    """Unpack a weekday bitmask into a sorted list of weekdays."""
+    return [weekday for weekday in range(7) if (mask or 0) & (1 << weekday)]
+
+
+def _weekday(day: date) -> int:
+    """Return the weekday of a date with 0=Sunday."""
+    return (day.weekday() + 1) % 7
+
+
+def event_duration(event: Event) -> timedelta:
+    """Return the duration of an event; open-ended all-day events last a day."""
+    if event.end_time is not None and event.start_time is not None:
+        return max(event.end_time - event.start_time, timedelta(0))
+    return timedelta(days=1) if event.is_all_day else timedelta(0)
+
+
+def overlaps(
+    start: datetime, end: datetime, window_start: datetime, window_end: datetime
+) -> bool:
+    """Check whether an interval overlaps a half-open window.
+
+    Instantaneous intervals overlap when they start inside the window.
+    """
+    return start < window_end and (end > window_start or start >= window_start)
+
+
+@dataclass(frozen=True)
+class RecurrenceRule:
+    """Recurrence rule of an event series.
+
+    Daily and weekly rules honor ``by_weekday``; month-based rules repeat on the
+    day of month of the first occurrence, clamped to the end of shorter months.
+    """
+
+    start: datetime
+    duration: timedelta
+    frequency: EventFrequency
+    interval: int = 1
+    count: Optional[int] = None
+    until: Optional[datetime] = None
+    by_weekday: int = 0
+
+    @classmethod
+    def from_event(cls, event: Event) -> Optional["RecurrenceRule"]:
+        """Build the rule of an event, or None for a single event."""
+        if event.recurrence_frequency is None or event.start_time is None:
+            return None
+        return cls(
+            start=event.start_time,
+            duration=event_duration(event),
+            frequency=EventFrequency(event.recurrence_frequency),
+            interval=max(event.recurrence_interval or 1, 1),
+            count=event.recurrence_count or None,
+            until=event.recurrence_end_date,
+            by_weekday=event.recurrence_by_weekday or 0,
+        )
+
+    def _pattern(self) -> Tuple[int, date, List[int], int]:
+        """Return the day pattern of a daily or weekly rule.
+
+        Daily and weekly rules repeat a fixed list of day offsets from an anchor
+        day every period. Occurrence ``n`` is at position ``n + skipped`` of the
+        repeated pattern, since pattern positions before the first start are not
+        occurrences.
+
+        Returns:
+            A tuple of (period in days, anchor day, day offsets, skipped).
+        """
+        first_day = self.start.date()
+        if self.frequency == EventFrequency.WEEKLY:
+            period = 7 * self.interval
+            if self.by_weekday:
+                anchor = first_day - timedelta(days=_weekday(first_day))
+                offsets = mask_weekdays(self.by_weekday)
+            else:
+                anchor, offsets = first_day, [0]
+        elif self.by_weekday:
+            period = self.interval * 7 // math.gcd(self.interval, 7)
+            anchor = first_day
+            offsets = [
+                offset
+                for offset in range(0, period, self.interval)
+                if self.by_weekday & (1 << _weekday(anchor + timedelta(days=offset)))
+            ]
+        else:
+            period, anchor, offsets = self.interval, first_day, [0]
+        skipped = bisect_left(offsets, (first_day - anchor).days)
+        return period, anchor, offsets, skipped
+
+    def _indexed(self, lower: datetime) -> Iterator[Tuple[int, datetime]]:
+        """Yield (ordinal, start) pairs from the period containing a bound.
+
+        Only the first candidate index is derived from the bound; the pairs
+        that follow are unbounded and may start before the bound.
+        """
+        if self.frequency in _MONTH_STEPS:
+            step = _MONTH_STEPS[self.frequency] * self.interval
+            months = (lower.year - self.start.year) * 12 + lower.month
+            index = max((months - self.start.month) // step, 0)
+            while True:
+                # Always offset from the first start so clamping does not drift
+                yield index, self.start + relativedelta(months=index * step)
+                index += 1
+
+        period, anchor, offsets, skipped = self._pattern()
+        if not offsets:
+            return
+        per_period = len(offsets)
+        periods = max((lower.date() - anchor).days // period, 0)
+        index = max(periods * per_period, skipped)
+        clock = self.start.timetz()
+        while True:
+            cycle, position = divmod(index, per_period)
+            day = anchor + timedelta(days=cycle * period + offsets[position])
+            yield index - skipped, datetime.combine(day, clock)
+            index += 1
+
+    def nth_start(self, ordinal: int) -> Optional[datetime]:
+        """Return the start of an occurrence by position, ignoring the bounds."""
+        if self.frequency in _MONTH_STEPS:
+            step = _MONTH_STEPS[self.frequency] * self.interval
+            return self.start + relativedelta(months=ordinal * step)
+        period, anchor, offsets, skipped = self._pattern()
+        if not offsets:
+            return None
+        cycle, position = divmod(ordinal + skipped, len(offsets))
+        day = anchor + timedelta(days=cycle * period + offsets[position])
+        return datetime.combine(day, self.start.timetz())
+
+    def last_start_bound(self) -> Optional[datetime]:
+        """Return an upper bound on the last start, or None for endless series."""
+        bounds = []
+        if self.count is not None:
+            last = self.nth_start(self.count - 1)
+            bounds.append(last if last is not None else self.start)
+        if self.until is not None:
+            bounds.append(self.until)
+        return min(bounds) if bounds else None
+
+    def starts_from(self, lower: datetime) -> Iterator[datetime]:
+        """Lazily yield the starts of occurrences at or after a bound."""
+        for ordinal, start in self._indexed(lower):
+            if self.count is not None and ordinal >= self.count:
+                return
+            if self.until is not None and start > self.until:
+                return
+            if start >= lower:
+                yield start
+
+    def between(
+        self, window_start: datetime, window_end: datetime
+    ) -> Iterator[datetime]:
+        """Lazily yield the starts of occurrences overlapping a window."""
+        for start in self.starts_from(window_start - self.duration):
+            if start >= window_end:
+                return
+            if overlaps(start, start + self.duration, window_start, window_end):
+                yield start
+
+    def ordinal(self, start: datetime) -> Optional[int]:
+        """Return the zero-based position of an occurrence in the series."""
+        for ordinal, candidate in self._indexed(start):
+            if candidate > start or (self.count is not None and ordinal >= self.count):
+                return None
+            if candidate == start:
+                return ordinal
+        return None
+
+    def includes(self, start: datetime) -> bool:
+        """Check whether the rule generates an occurrence at a start."""
+        return next(self.starts_from(start), None) == start
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    """A single instance of an event within a window."""
+
+    event_id: int
+    original_start: datetime
+    start_time: datetime
+    end_time: datetime
+    title: Optional[str]
+    description: Optional[str]
+    location: Optional[str]
+    is_all_day: bool
+    is_recurring: bool
+    is_exception: bool = False
+
+
+def _occurrence(
+    event: Event,
+    original_start: datetime,
+    duration: timedelta,
+    exception: Optional[EventException] = None,
+) -> Optional[Occurrence]:
+    """Build an occurrence, applying the overrides of an exception."""
+    if exception is None:
+        return Occurrence(
+            event_id=event.id,
+            original_start=original_start,
+            start_time=original_start,
+            end_time=original_start + duration,
+            title=event.title,
+            description=event.description,
+            location=event.location,
+            is_all_day=bool(event.is_all_day),
+            is_recurring=event.is_recurring,
+        )
+    if exception.is_cancelled:
+        return None
+    start = exception.start_time or original_start
+    return Occurrence(
+        event_id=event.id,
+        original_start=original_start,
+        start_time=start,
+        end_time=exception.end_time or start + duration,
+        title=exception.title if exception.title is not None else event.title,
+        description=(
+            exception.description
+            if exception.description is not None
+            else event.description
+        ),
+        location=(
+            exception.location if exception.location is not None else event.location
+        ),
+        is_all_day=bool(event.is_all_day),
+        is_recurring=True,
+        is_exception=True,
+    )
+
+
+def expand_event(
+    event: Event, window_start: datetime, window_end: datetime
+) -> Tuple[List[Occurrence], bool]:
+    """Expand an event into the occurrences overlapping a window.
+
+    Returns:
+        The occurrences sorted by start, and whether the expansion is complete
+        (False when it stopped at MAX_OCCURRENCES_PER_WINDOW).
+    """
+    rule = RecurrenceRule.from_event(event)
+    if rule is None:
+        if event.start_time is None:
+            return [], True
+        occurrence = _occurrence(event, event.start_time, event_duration(event))
+        if overlaps(
+            occurrence.start_time, occurrence.end_time, window_start, window_end
+        ):
+            return [occurrence], True
+        return [], True
+
+    exceptions: Dict[datetime, EventException] = {
+        exception.original_start: exception for exception in event.exceptions
+    }
+    occurrences = []
+    generated = set()
+    for start in islice(
+        rule.between(window_start, window_end), MAX_OCCURRENCES_PER_WINDOW
+    ):
+        generated.add(start)
+        occurrence = _occurrence(event, start, rule.duration, exceptions.get(start))
+        if occurrence is not None and overlaps(
+            occurrence.start_time, occurrence.end_time, window_start, window_end
+        ):
+            occurrences.append(occurrence)
+    complete = len(generated) < MAX_OCCURRENCES_PER_WINDOW
+
+    # Edited instances moved into the window from outside of it
+    for original_start, exception in exceptions.items():
+        if original_start in generated or exception.is_cancelled:
+            continue
+        if exception.start_time is None:
+            continue
+        occurrence = _occurrence(event, original_start, rule.duration, exception)
+        if overlaps(
+            occurrence.start_time, occurrence.end_time, window_start, window_end
+        ) and rule.includes(original_start):
+            occurrences.append(occurrence)
+
+    occurrences.sort(key=lambda occurrence: occurrence.start_time)
+    return occurrences, complete
+
+
+class OccurrenceCache:
+    """LRU of expanded windows per series, keyed by the event sequence.
+
+    A window is served from any cached window of the same series that contains
+    it. Series are evicted least recently used first, and so are the windows of
+    a series.
+    """
+
+    def __init__(
+        self,
+        max_series: int = settings.CALENDAR_CACHE_MAX_SERIES,
+        windows_per_series: int = settings.CALENDAR_CACHE_WINDOWS_PER_SERIES,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_series: Maximum number of series kept in the cache.
+            windows_per_series: Maximum number of windows kept per series.
+        """
+        self.max_series = max_series
+        self.windows_per_series = windows_per_series
+        self._series: "OrderedDict[int, Tuple[int, OrderedDict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(
+        self, event: Event, window_start: datetime, window_end: datetime
+    ) -> Optional[List[Occurrence]]:
+        """Return the occurrences of a window from a containing cached window."""
+        with self._lock:
+            entry = self._series.get(event.id)
+            if entry is None or entry[0] != (event.sequence or 0):
+                self.misses += 1
+                return None
+            self._series.move_to_end(event.id)
+            windows = entry[1]
+            for (start, end), occurrences in reversed(windows.items()):
+                if start <= window_start and window_end <= end:
+                    windows.move_to_end((start, end))
+                    self.hits += 1
+                    break
+            else:
+                self.misses += 1
+                return None
+        if (start, end) == (window_start, window_end):
+            return list(occurrences)
+        return [
+            occurrence
+            for occurrence in occurrences
+            if overlaps(
+                occurrence.start_time, occurrence.end_time, window_start, window_end
+            )
+        ]
+
+    def _store(
+        self,
+        event: Event,
+        window_start: datetime,
+        window_end: datetime,
+        occurrences: List[Occurrence],
+    ) -> None:
+        """Store an expanded window, evicting the least recently used ones."""
+        sequence = event.sequence or 0
+        with self._lock:
+            entry = self._series.get(event.id)
+            if entry is None or entry[0] != sequence:
+                entry = (sequence, OrderedDict())
+                self._series[event.id] = entry
+            self._series.move_to_end(event.id)
+            windows = entry[1]
+            windows[(window_start, window_end)] = tuple(occurrences)
+            windows.move_to_end((window_start, window_end))
+            while len(windows) > self.windows_per_series:
+                windows.popitem(last=False)
+            while len(self._series) > self.max_series:
+                self._series.popitem(last=False)
+
+    def expand(
+        self, event: Event, window_start: datetime, window_end: datetime
+    ) -> List[Occurrence]:
+        """Expand an event into a window, using cached windows when possible."""
+        if not event.is_recurring:
+            return expand_event(event, window_start, window_end)[0]
+        occurrences = self._lookup(event, window_start, window_end)
+        if occurrences is not None:
+            return occurrences
+        occurrences, complete = expand_event(event, window_start, window_end)
+        if complete:
+            self._store(event, window_start, window_end, occurrences)
+        else:
+            logger.warning(
+                f"Expansion of event {event.id} stopped at "
+                f"{MAX_OCCURRENCES_PER_WINDOW} occurrences"
+            )
+        return occurrences
+
+    def invalidate(self, event_id: int) -> None:
+        """Drop the cached windows of a series."""
+        with self._lock:
+            self._series.pop(event_id, None)
+
+    def clear(self) -> None:
+        """Drop all cached windows."""
+        with self._lock:
+            self._series.clear()
+
+
+# Shared occurrence cache used by the API process
+occurrence_cache = OccurrenceCache()
+
+
+def event_span(event: Event) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """Return the envelope of all occurrences of an event.
+
+    The end is None for endless series. Moved instances widen the envelope so
+    that interval queries still find them.
+    """
+    if event.start_time is None:
+        return None, None
+    duration = event_duration(event)
+    rule = RecurrenceRule.from_event(event)
+    if rule is None:
+        return event.start_time, event.start_time + duration
+
+    last_start = rule.last_start_bound()
+    span_start = event.start_time
+    span_end = last_start + duration if last_start is not None else None
+    for exception in event.exceptions:
+        if exception.is_cancelled or exception.start_time is None:
+            continue
+        span_start = min(span_start, exception.start_time)
+        if span_end is not None:
+            span_end = max(
+                span_end, exception.end_time or exception.start_time + duration
+            )
+    return span_start, span_end
+
+
+def touch_event(event: Event) -> None:
+    """Mark a series as changed so that its cached windows become stale.
+
+    Also refreshes the span used by the interval index.
+    """
+    event.sequence = (event.sequence or 0) + 1
+    event.span_start, event.span_end = event_span(event)
+    if event.id is not None:
+        occurrence_cache.invalidate(event.id)
+
+
+def get_occurrences_in_range(
+    db: Session,
+    household_id: int,
+    window_start: datetime,
+    window_end: datetime,
+    include_recurring: bool = True,
+) -> List[Tuple[Event, Occurrence]]:
+    """List the occurrences of a household's events in a window.
+
+    Args:
+        db: Database session.
+        household_id: ID of the household.
+        window_start: Inclusive start of the window.
+        window_end: Exclusive end of the window.
+        include_recurring: Whether to expand recurring series.
+
+    Returns:
+        (event, occurrence) pairs sorted by occurrence start.
+    """
+    if window_end <= window_start:
+        raise ValueError("The end of the range must be after its start")
+    events = event_index.overlapping(
+        db,
+        household_id,
+        window_start,
+        window_end,
+        recurring=None if include_recurring else False,
+    )
+    pairs = [
+        (event, occurrence)
+        for event in events
+        for occurrence in occurrence_cache.expand(event, window_start, window_end)
+    ]
+    pairs.sort(key=lambda pair: (pair[1].start_time, pair[0].id))
+    return pairs
+
+
+# Merge key and payload of an upcoming occurrence
+_Upcoming = Tuple[datetime, int, Event, Occurrence]
+
+
+def _upcoming_in_series(event: Event, after: datetime) -> Iterator[_Upcoming]:
+    """Lazily yield the occurrences of a series starting at or after a time.
+
+    Occurrences are yielded in start order; moved instances are left out and
+    handled by the caller.
+    """
+    rule = RecurrenceRule.from_event(event)
+    exceptions = {exception.original_start: exception for exception in event.exceptions}
+    for start in rule.starts_from(after):
+        exception = exceptions.get(start)
+        if exception is None:
+            yield start, event.id, event, _occurrence(event, start, rule.duration)
+        elif not exception.is_cancelled and exception.start_time is None:
+            occurrence = _occurrence(event, start, rule.duration, exception)
+            yield start, event.id, event, occurrence
+
+
+def get_upcoming_occurrences(
+    db: Session,
+    household_id: int,
+    after: datetime,
+    limit: int,
+    before: Optional[datetime] = None,
+) -> List[Tuple[Event, Occurrence]]:
+    """List the next occurrences of a household's events.
+
+    Single events come from the index in start order and every series that can
+    still occur contributes a lazy stream; the streams are merged until
+    ``limit`` occurrences are found.
+
+    Args:
+        db: Database session.
+        household_id: ID of the household.
+        after: Only occurrences starting at or after this time are returned.
+        limit: Maximum number of occurrences.
+        before: Optional exclusive bound on the start of the occurrences.
+    """
+    singles: List[_Upcoming] = []
+    for event in event_index.upcoming(db, household_id, after, limit, before):
+        occurrence = _occurrence(event, event.start_time, event_duration(event))
+        singles.append((event.start_time, event.id, event, occurrence))
+    streams: List[Iterable[_Upcoming]] = [singles]
+
+    moved: List[_Upcoming] = []
+    for series in event_index.overlapping(
+        db, household_id, after, before or datetime.max, recurring=True
+    ):
+        streams.append(_upcoming_in_series(series, after))
+        for exception in series.exceptions:
+            if exception.is_cancelled or exception.start_time is None:
+                continue
+            if exception.start_time >= after:
+                occurrence = _occurrence(
+                    series, exception.original_start, event_duration(series), exception
+                )
+                moved.append((occurrence.start_time, series.id, series, occurrence))
+    moved.sort(key=lambda item: (item[0], item[1]))
+    streams.append(moved)
+
+    upcoming = []
+    for start, _, event, occurrence in heapq.merge(
+        *streams, key=lambda item: (item[0], item[1])
+    ):
+        if len(upcoming) >= limit or (before is not None and start >= before):
+            break
+        upcoming.append((event, occurrence))
+    return upcoming
@@ -0,0 +1,569 @@
+"""
+Household Finance
+
+This module implements categories, transactions, budgets and spending reports
+for the REST API and the gRPC FinanceService. Every service is scoped to one
+household. Transaction writes bump the household's finance version and keep
+the recurring series and the cached cash-flow forecast up to date.
+"""
+
+import logging
+from calendar import monthrange
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from api.base_service import (
+    FailedPreconditionError,
+    HouseholdScopedService,
+    ValidationError,
+)
+from api.models.finance import (
+    Budget,
+    Category,
+    RecurringSeries,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
+from api.schemas_main import (
+    BudgetCreate,
+    BudgetResponse,
+    CategoryCreate,
+    CategoryResponse,
+    TransactionCreate,
+    TransactionResponse,
+)
+
+from . import recurring
+from .forecast import forecaster
+from .scheduler import scheduler
+from .versions import bump_finance_version, get_finance_version
+
+logger = logging.getLogger(__name__)
+
+# Bucket sizes of spending reports
+SPENDING_PERIODS = ("daily", "weekly", "monthly", "yearly")
+
+
+def _month_start(day: date) -> date:
+    """Return the first day of a date's month."""
+    return day.replace(day=1)
+
+
+def period_start(day: date, period: str) -> date:
+    """Return the first day of the report period containing a date.
+
+    Weeks start on Monday.
+    """
+    if period == "daily":
+        return day
+    if period == "weekly":
+        return day - timedelta(days=day.weekday())
+    if period == "monthly":
+        return _month_start(day)
+    return day.replace(month=1, day=1)
+
+
+def next_period_start(start: date, period: str) -> date:
+    """Return the first day of the report period following the one at start."""
+    if period == "daily":
+        return start + timedelta(days=1)
+    if period == "weekly":
+        return start + timedelta(days=7)
+    if period == "monthly":
+        return start + timedelta(days=monthrange(start.year, start.month)[1])
+    return start.replace(year=start.year + 1)
+
+
+class CategoryService(
+    HouseholdScopedService[Category, CategoryCreate, CategoryCreate, CategoryResponse]
+):
+    """Service for the transaction categories of a household."""
+
+    resource_name = "Category"
+
+    def __init__(self, db_session: Session, household_id: int):
+        """Initialize with a database session and the household."""
+        super().__init__(Category, db_session, household_id)
+
+    def list(self, type: Optional[TransactionType] = None) -> List[Category]:
+        """Return the categories of the household, optionally of one type."""
+        query = self._query()
+        if type:
+            query = query.filter(Category.type == type)
+        return query.order_by(Category.id).all()
+
+    def update_category(
+        self,
+        category_id: int,
+        name: Optional[str] = None,
+        type: Optional[TransactionType] = None,
+    ) -> Category:
+        """Rename a category or change its type.
+
+        Raises:
+            FailedPreconditionError: If the type of a category with
+                transactions would change.
+        """
+        category = self.require(category_id)
+        if type is not None and type != category.type:
+            if self._in_use(Transaction, category_id):
+                raise FailedPreconditionError(
+                    "Cannot change the type of a category with transactions"
+                )
+            category.type = type
+        if name:
+            category.name = name
+        self.db.commit()
+        self.db.refresh(category)
+        return category
+
+    def delete_category(self, category_id: int) -> None:
+        """Delete a category without transactions or budget.
+
+        Raises:
+            FailedPreconditionError: If the category is in use.
+        """
+        category = self.require(category_id)
+        if self._in_use(Transaction, category_id) or self._in_use(Budget, category_id):
+            raise FailedPreconditionError("Category is in use")
+        self.db.delete(category)
+        self.db.commit()
+
+    def _in_use(self, model, category_id: int) -> bool:
+        """Check whether rows of a model reference a category."""
+        return (
+            self.db.query(model.id).filter(model.category_id == category_id).first()
+            is not None
+        )
+
+
+class TransactionService(
+    HouseholdScopedService[
+        Transaction, TransactionCreate, TransactionCreate, TransactionResponse
+    ]
+):
+    """Service for the income and expense transactions of a household."""
+
+    resource_name = "Transaction"
+
+    def __init__(self, db_session: Session, household_id: int):
+        """Initialize with a database session and the household."""
+        super().__init__(Transaction, db_session, household_id)
+        self.categories = CategoryService(db_session, household_id)
+
+    def _category(self, category_id: int) -> Category:
+        """Get a category of the household for a transaction."""
+        return self.categories.require(
+            category_id,
+            details=f"Category with id {category_id} not found in this household",
+        )
+
+    def create_transaction(
+        self, transaction_in: TransactionCreate, user_id: int
+    ) -> Transaction:
+        """Create a transaction, typed after its category.
+
+        The transaction is folded into the household's recurring series and
+        its cached forecast.
+        """
+        category = self._category(transaction_in.category_id)
+        transaction = Transaction(
+            **self._create_values(transaction_in),
+            user_id=user_id,
+            type=category.type,
+        )
+        self.db.add(transaction)
+        self.db.commit()
+        self.db.refresh(transaction)
+
+        # Fold the new transaction into the household's recurring series
+        series = recurring.observe_transaction(self.db, transaction)
+        bump_finance_version(self.db, self.household_id)
+        version = get_finance_version(self.db, self.household_id)
+        self.db.commit()
+        if series is not None:
+            # The recurring projection changed, rebuild the forecast on next use
+            scheduler.schedule(series)
+            forecaster.invalidate(self.household_id)
+        else:
+            forecaster.apply_transaction(self.household_id, transaction, version)
+        self.db.refresh(transaction)
+        return transaction
+
+    def filter(
+        self,
+        category_id: Optional[int] = None,
+        type: Optional[TransactionType] = None,
+        status: Optional[TransactionStatus] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+    ):
+        """Return a query of the household's transactions matching filters.
+
+        ``end_date`` is exclusive.
+        """
+        query = self._query()
+        if category_id is not None:
+            query = query.filter(Transaction.category_id == category_id)
+        if type is not None:
+            query = query.filter(Transaction.type == type)
+        if status is not None:
+            query = query.filter(Transaction.status == status)
+        if start_date is not None:
+            query = query.filter(Transaction.date >= start_date)
+        if end_date is not None:
+            query = query.filter(Transaction.date < end_date)
+        return query
+
+    def page(self, query, skip: int, limit: int) -> Tuple[int, List[Transaction]]:
+        """Return the total and one page of a transaction query, newest first."""
+        total = query.count()
+        transactions = (
+            query.order_by(Transaction.date.desc(), Transaction.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .all()
+        )
+        return total, transactions
+
+    def update_transaction(
+        self,
+        transaction_id: int,
+        category_id: Optional[int] = None,
+        description: Optional[str] = None,
+        amount: Optional[float] = None,
+        status: Optional[TransactionStatus] = None,
+        transaction_date: Optional[date] = None,
+    ) -> Transaction:
+        """Update the fields of a transaction that are given."""
+        transaction = self.require(transaction_id)
+        if category_id is not None and category_id != transaction.category_id:
+            category = self._category(category_id)
+            transaction.category_id = category.id
+            transaction.type = category.type
+        if description is not None:
+            transaction.description = description
+        if amount is not None:
+            transaction.amount = amount
+        if status is not None:
+            transaction.status = status
+        if transaction_date is not None:
+            transaction.date = transaction_date
+        bump_finance_version(self.db, self.household_id)
+        self.db.commit()
+        forecaster.invalidate(self.household_id)
+        self.db.refresh(transaction)
+        return transaction
+
+    def delete_transaction(self, transaction_id: int) -> None:
+        """Delete a transaction and take it out of the cached forecast."""
+        transaction = self.require(transaction_id)
+        self.db.delete(transaction)
+        bump_finance_version(self.db, self.household_id)
+        version = get_finance_version(self.db, self.household_id)
+        self.db.commit()
+        forecaster.apply_transaction(self.household_id, transaction, version, sign=-1)
+
+    def spending_by_category(self) -> List[Tuple[Category, float]]:
+        """Return the expense total of each category with expenses, largest first."""
+        rows = (
+            self.db.query(Category, func.sum(Transaction.amount))
+            .join(Transaction, Transaction.category_id == Category.id)
+            .filter(
+                Transaction.household_id == self.household_id,
+                Transaction.type == TransactionType.EXPENSE,
+            )
+            .group_by(Category.id)
+            .all()
+        )
+        return sorted(
+            ((category, total or 0.0) for category, total in rows),
+            key=lambda row: (-row[1], row[0].id),
+        )
+
+    def spending_over_time(
+        self,
+        period: str,
+        start_date: date,
+        end_date: date,
+        category_id: Optional[int] = None,
+    ) -> Iterator[Tuple[date, date, float]]:
+        """Yield the expense total of every period from start_date to end_date.
+
+        Args:
+            period: One of SPENDING_PERIODS.
+            start_date: First day reported; its period is reported in full.
+            end_date: Exclusive end of the report.
+            category_id: Restrict the report to one category.
+
+        Yields:
+            The first day, the exclusive end and the total of each period,
+            including periods without expenses.
+        """
+        if period not in SPENDING_PERIODS:
+            raise ValidationError(
+                f"period must be one of {', '.join(SPENDING_PERIODS)}"
+            )
+        if end_date <= start_date:
+            raise ValidationError("end_date must be after start_date")
+        if category_id is not None:
+            self._category(category_id)
+
+        first = period_start(start_date, period)
+        rows = self.filter(
+            category_id=category_id,
+            type=TransactionType.EXPENSE,
+            start_date=first,
+            end_date=end_date,
+        ).with_entities(Transaction.date, Transaction.amount)
+        totals: Dict[date, float] = {}
+        for day, amount in rows:
+            key = period_start(day, period)
+            totals[key] = totals.get(key, 0.0) + (amount or 0.0)
+
+        start = first
+        while start < end_date:
+            end = next_period_start(start, period)
+            yield start, end, totals.get(start, 0.0)
+            start = end
+
+
+class TransactionIngest:
+    """Bulk creation of a stream of transactions in one household.
+
+    Rows are created a batch at a time, with one insert and one commit per
+    batch, instead of the commits, recurring updates and forecast updates
+    ``create_transaction`` makes for each. The categories of the rows are
+    looked up once per ingest, those of a batch with one query. Rows that
+    fail validation are skipped and counted, and the first ``max_errors`` of
+    them are kept. Rows are stored with their recurrence fingerprint, and
+    ``finish`` folds them into the recurring series once per fingerprint.
+    """
+
+    def __init__(
+        self,
+        db_session: Session,
+        household_id: int,
+        user_id: int,
+        max_errors: int = 100,
+    ):
+        """Initialize with a database session, the household and the creator."""
+        self.transactions = TransactionService(db_session, household_id)
+        self.db = db_session
+        self.household_id = household_id
+        self.user_id = user_id
+        self.max_errors = max_errors
+        self.created = 0
+        self.batches = 0
+        self.rejected = 0
+        self.errors: List[Tuple[int, str]] = []
+        # Type of every category looked up, None for those not in the household
+        self._category_types: Dict[int, Optional[TransactionType]] = {}
+        # Recurrence fingerprints of the transactions created
+        self._fingerprints: Set[str] = set()
+
+    @property
+    def received(self) -> int:
+        """Return the number of rows created or rejected so far."""
+        return self.created + self.rejected
+
+    def reject(self, index: int, message: str) -> None:
+        """Skip the row at an index of the stream."""
+        self.rejected += 1
+        if len(self.errors) < self.max_errors:
+            self.errors.append((index, message))
+
+    def _load_categories(self, category_ids: Iterable[int]) -> None:
+        """Look up the types of the categories not seen yet."""
+        unknown = set(category_ids).difference(self._category_types)
+        if not unknown:
+            return
+        found = self.transactions.categories.get_many(unknown)
+        for category_id in unknown:
+            category = found.get(category_id)
+            self._category_types[category_id] = category and category.type
+
+    def add_batch(self, rows: Sequence[Tuple[int, TransactionCreate]]) -> int:
+        """Create a batch of rows, by index in the stream, and commit it.
+
+        Returns:
+            The number of transactions created.
+        """
+        self._load_categories(row.category_id for _, row in rows)
+        transactions = []
+        for index, row in rows:
+            type = self._category_types[row.category_id]
+            if type is None:
+                self.reject(
+                    index,
+                    f"Category with id {row.category_id} not found in this household",
+                )
+                continue
+            transaction = Transaction(
+                **self.transactions._create_values(row),
+                user_id=self.user_id,
+                type=type,
+            )
+            transaction.recurrence_fingerprint = recurring.compute_fingerprint(
+                transaction.description, transaction.amount, type
+            )
+            self._fingerprints.add(transaction.recurrence_fingerprint)
+            transactions.append(transaction)
+        if transactions:
+            self.db.add_all(transactions)
+            bump_finance_version(self.db, self.household_id)
+            self.db.commit()
+            forecaster.invalidate(self.household_id)
+        self.created += len(transactions)
+        self.batches += 1
+        return len(transactions)
+
+    def finish(self) -> None:
+        """Fold the transactions created into the household's recurring series."""
+        if not self._fingerprints:
+            return
+        observed = recurring.observe_fingerprints(
+            self.db, self.household_id, self._fingerprints
+        )
+        bump_finance_version(self.db, self.household_id)
+        self.db.commit()
+        for series in observed:
+            scheduler.schedule(series)
+        forecaster.invalidate(self.household_id)
+
+
+class BudgetService(
+    HouseholdScopedService[Budget, BudgetCreate, BudgetCreate, BudgetResponse]
+):
+    """Service for the monthly expense budgets of a household."""
+
+    resource_name = "Budget"
+
+    def __init__(self, db_session: Session, household_id: int):
+        """Initialize with a database session and the household."""
+        super().__init__(Budget, db_session, household_id)
+        self.categories = CategoryService(db_session, household_id)
+
+    def _validate_create(self, budget_in: BudgetCreate) -> None:
+        """Check that a budget is for an expense category and a valid month."""
+        category = self.categories.require(
+            budget_in.category_id,
+            details=(
+                f"Category with id {budget_in.category_id} not found in this household"
+            ),
+        )
+        # Budgets cap spending, so only expense categories have one
+        if category.type != TransactionType.EXPENSE:
+            raise ValidationError("Budgets can only be set for expense categories")
+        validate_month(budget_in.month)
+
+    def _commit(self) -> None:
+        """Commit a budget write and drop the household's cached forecast.
+
+        Forecasts fall back on budgets for categories without history, so a
+        budget write is a finance write like any transaction.
+        """
+        bump_finance_version(self.db, self.household_id)
+        self.db.commit()
+        forecaster.invalidate(self.household_id)
+
+    def for_month(self, category_id: int, month: int, year: int) -> Optional[Budget]:
+        """Return the budget of a category for a month."""
+        return (
+            self._query()
+            .filter(
+                Budget.category_id == category_id,
+                Budget.month == month,
+                Budget.year == year,
+            )
+            .first()
+        )
+
+    def set_budget(self, budget_in: BudgetCreate) -> Budget:
+        """Create the budget of a category for a month, or update its threshold."""
+        self._validate_create(budget_in)
+        budget = self.for_month(budget_in.category_id, budget_in.month, budget_in.year)
+        if budget is None:
+            budget = Budget(**self._create_values(budget_in))
+            self.db.add(budget)
+        else:
+            budget.threshold = budget_in.threshold
+        self._commit()
+        self.db.refresh(budget)
+        return budget
+
+    def list(self, month: Optional[int] = None, year: Optional[int] = None):
+        """Return the household's budgets, optionally of one month."""
+        query = self._query()
+        if month is not None:
+            validate_month(month)
+            query = query.filter(Budget.month == month)
+        if year is not None:
+            query = query.filter(Budget.year == year)
+        return query.order_by(Budget.year, Budget.month, Budget.id).all()
+
+    def update_budget(
+        self,
+        budget_id: int,
+        threshold: Optional[float] = None,
+        month: Optional[int] = None,
+        year: Optional[int] = None,
+    ) -> Budget:
+        """Update the threshold or month of a budget."""
+        budget = self.require(budget_id)
+        if month is not None:
+            validate_month(month)
+            budget.month = month
+        if year is not None:
+            budget.year = year
+        if threshold is not None:
+            budget.threshold = threshold
+        self._commit()
+        self.db.refresh(budget)
+        return budget
+
+    def delete_budget(self, budget_id: int) -> None:
+        """Delete a budget."""
+        self.db.delete(self.require(budget_id))
+        self._commit()
+
+    def summary(self, month: int, year: int) -> List[Tuple[Budget, float]]:
+        """Return the budgets of a month with the amount spent in each category."""
+        budgets = self.list(month, year)
+        start = date(year, month, 1)
+        end = next_period_start(start, "monthly")
+        spent = dict(
+            self.db.query(Transaction.category_id, func.sum(Transaction.amount))
+            .filter(
+                Transaction.household_id == self.household_id,
+                Transaction.type == TransactionType.EXPENSE,
+                Transaction.category_id.in_([budget.category_id for budget in budgets]),
+                Transaction.date >= start,
+                Transaction.date < end,
+            )
+            .group_by(Transaction.category_id)
+            .all()
+        )
+        return [(budget, spent.get(budget.category_id) or 0.0) for budget in budgets]
+
+
+def validate_month(month: int) -> None:
+    """Check that a month number is between 1 and 12."""
+    if not 1 <= month <= 12:
+        raise ValidationError("Month must be between 1 and 12")
+
+
+def recurring_series(
+    db: Session, household_id: int, include_inactive: bool = False
+) -> List[RecurringSeries]:
+    """Return the recurring series of a household, next due first."""
+    query = db.query(RecurringSeries).filter(
+        RecurringSeries.household_id == household_id
+    )
+    if not include_inactive:
+        query = query.filter(RecurringSeries.is_active.is_(True))
+    return query.order_by(RecurringSeries.next_due_date).all()
@@ -0,0 +1,302 @@
+"""
+Cash-Flow Forecasting
+
+This module projects the daily balance of a household over the coming days. The
+projection combines three components:
+
+* scheduled occurrences of the household's active recurring series,
+* per-category daily run rates over a lookback window of organic transactions,
+  falling back to the monthly ``Budget`` threshold for categories without
+  history,
+* transactions already entered with a future date.
+
+Components are loaded from the database once per household version and kept in
+an in-process cache. Combining them into a balance path is vectorized with
+NumPy, so applying a single new transaction only adjusts the cached components
+and re-runs the cheap combine step instead of querying the history again.
+"""
+
+import calendar
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import case, func, or_
+from sqlalchemy.orm import Session
+
+from api.models.finance import (
+    Budget,
+    RecurringSeries,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
+
+from .scheduler import iter_occurrences
+from .versions import get_finance_version
+
+logger = logging.getLogger(__name__)
+
+# Longest horizon a forecast can cover; components are built for this horizon
+MAX_FORECAST_DAYS = 365
+
+# Days of organic history used to derive per-category run rates
+RUN_RATE_LOOKBACK_DAYS = 90
+
+_EXCLUDED_STATUSES = (TransactionStatus.CANCELLED, TransactionStatus.FAILED)
+
+
+def _signed(amount: Optional[float], type) -> float:
+    """Return an amount signed by its direction: income in, expense out."""
+    value = abs(amount or 0.0)
+    return value if type == TransactionType.INCOME else -value
+
+
+@dataclass
+class ForecastComponents:
+    """Cached inputs of a household forecast."""
+
+    household_id: int
+    version: int
+    as_of: date
+    balance: float
+    # Signed sum per category over the lookback window
+    category_sums: Dict[Optional[int], float]
+    # Expense budget threshold per (category_id, year, month)
+    budgets: Dict[Tuple[int, int, int], float]
+    # Signed recurring and future-dated amounts per forecast day
+    recurring_deltas: np.ndarray
+    scheduled_deltas: np.ndarray
+    # Fingerprints of active series, excluded from run rates
+    recurring_fingerprints: frozenset = field(default_factory=frozenset)
+    _path: Optional[np.ndarray] = None
+
+    def horizon_dates(self) -> List[date]:
+        """Return the dates covered by the component arrays."""
+        return [self.as_of + timedelta(days=i + 1) for i in range(MAX_FORECAST_DAYS)]
+
+    def daily_run_rates(self) -> np.ndarray:
+        """Combine run rates and budget fallbacks into signed daily amounts."""
+        days = np.zeros(MAX_FORECAST_DAYS)
+        with_history = set()
+        for category_id, total in self.category_sums.items():
+            days += total / RUN_RATE_LOOKBACK_DAYS
+            with_history.add(category_id)
+
+        if self.budgets:
+            dates = self.horizon_dates()
+            month_keys = np.array([d.year * 12 + d.month for d in dates])
+            for (category_id, year, month), threshold in self.budgets.items():
+                if category_id in with_history:
+                    continue
+                mask = month_keys == year * 12 + month
+                days[mask] -= threshold / calendar.monthrange(year, month)[1]
+        return days
+
+    def path(self) -> np.ndarray:
+        """Return the projected end-of-day balance for every horizon day."""
+        if self._path is None:
+            deltas = (
+                self.daily_run_rates() + self.recurring_deltas + self.scheduled_deltas
+            )
+            self._path = self.balance + np.cumsum(deltas)
+        return self._path
+
+    def apply_transaction(self, transaction: Transaction, sign: int = 1) -> None:
+        """Adjust the components for a single added (or removed) transaction."""
+        if transaction.date is None or transaction.status in _EXCLUDED_STATUSES:
+            return
+        signed = sign * _signed(transaction.amount, transaction.type)
+        if transaction.date <= self.as_of:
+            self.balance += signed
+            window_start = self.as_of - timedelta(days=RUN_RATE_LOOKBACK_DAYS)
+            organic = (
+                transaction.recurring_series_id is None
+                and transaction.recurrence_fingerprint
+                not in self.recurring_fingerprints
+            )
+            if organic and transaction.date > window_start:
+                self.category_sums[transaction.category_id] = (
+                    self.category_sums.get(transaction.category_id, 0.0) + signed
+                )
+        else:
+            index = (transaction.date - self.as_of).days - 1
+            if index < MAX_FORECAST_DAYS:
+                self.scheduled_deltas[index] += signed
+        self._path = None
+
+
+def load_components(
+    db: Session, household_id: int, version: int, as_of: date
+) -> ForecastComponents:
+    """Load the forecast components of a household from the database."""
+    base = db.query(Transaction).filter(
+        Transaction.household_id == household_id,
+        or_(
+            Transaction.status.is_(None),
+            Transaction.status.notin_(_EXCLUDED_STATUSES),
+        ),
+    )
+    signed_amount = case(
+        (Transaction.type == TransactionType.INCOME, func.abs(Transaction.amount)),
+        else_=-func.abs(Transaction.amount),
+    )
+
+    balance = (
+        base.filter(Transaction.date <= as_of)
+        .with_entities(func.coalesce(func.sum(signed_amount), 0.0))
+        .scalar()
+    )
+
+    series_list = (
+        db.query(RecurringSeries)
+        .filter(
+            RecurringSeries.household_id == household_id,
+            RecurringSeries.is_active.is_(True),
+        )
+        .all()
+    )
+    fingerprints = frozenset(s.fingerprint for s in series_list)
+
+    window_start = as_of - timedelta(days=RUN_RATE_LOOKBACK_DAYS)
+    run_rate_query = base.filter(
+        Transaction.date > window_start,
+        Transaction.date <= as_of,
+        Transaction.recurring_series_id.is_(None),
+    )
+    if fingerprints:
+        run_rate_query = run_rate_query.filter(
+            or_(
+                Transaction.recurrence_fingerprint.is_(None),
+                Transaction.recurrence_fingerprint.notin_(fingerprints),
+            )
+        )
+    category_sums = dict(
+        run_rate_query.with_entities(Transaction.category_id, func.sum(signed_amount))
+        .group_by(Transaction.category_id)
+        .all()
+    )
+
+    horizon_end = as_of + timedelta(days=MAX_FORECAST_DAYS)
+    budget_month = Budget.year * 12 + Budget.month
+    budgets = {
+        (b.category_id, b.year, b.month): b.threshold or 0.0
+        for b in db.query(Budget).filter(
+            Budget.household_id == household_id,
+            budget_month >= as_of.year * 12 + as_of.month,
+            budget_month <= horizon_end.year * 12 + horizon_end.month,
+        )
+    }
+
+    # Recurring occurrences are vectorized with a single scatter-add; overdue
+    # occurrences that are not materialized yet land on the first day
+    indices: List[int] = []
+    amounts: List[float] = []
+    for series in series_list:
+        signed = _signed(series.average_amount, series.type)
+        for due in iter_occurrences(series, date.min, horizon_end):
+            indices.append(max((due - as_of).days - 1, 0))
+            amounts.append(signed)
+    recurring_deltas = np.zeros(MAX_FORECAST_DAYS)
+    if indices:
+        np.add.at(recurring_deltas, np.array(indices), np.array(amounts))
+
+    scheduled_deltas = np.zeros(MAX_FORECAST_DAYS)
+    future = (
+        base.filter(Transaction.date > as_of, Transaction.date <= horizon_end)
+        .with_entities(Transaction.date, signed_amount)
+        .all()
+    )
+    if future:
+        np.add.at(
+            scheduled_deltas,
+            np.array([(d - as_of).days - 1 for d, _ in future]),
+            np.array([amount for _, amount in future]),
+        )
+
+    return ForecastComponents(
+        household_id=household_id,
+        version=version,
+        as_of=as_of,
+        balance=float(balance),
+        category_sums=category_sums,
+        budgets=budgets,
+        recurring_deltas=recurring_deltas,
+        scheduled_deltas=scheduled_deltas,
+        recurring_fingerprints=fingerprints,
+    )
+
+
+class CashFlowForecaster:
+    """Per-process cache of forecast components keyed by household version."""
+
+    def __init__(self):
+        self._cache: Dict[int, ForecastComponents] = {}
+        self._lock = threading.Lock()
+
+    def components(
+        self, db: Session, household_id: int, as_of: Optional[date] = None
+    ) -> ForecastComponents:
+        """Return the components for the current version, loading on a miss."""
+        as_of = as_of or date.today()
+        version = get_finance_version(db, household_id)
+        with self._lock:
+            cached = self._cache.get(household_id)
+        if cached is not None and cached.version == version and cached.as_of == as_of:
+            return cached
+
+        components = load_components(db, household_id, version, as_of)
+        with self._lock:
+            self._cache[household_id] = components
+        return components
+
+    def forecast(
+        self,
+        db: Session,
+        household_id: int,
+        days: int,
+        as_of: Optional[date] = None,
+    ) -> Tuple[ForecastComponents, np.ndarray]:
+        """Project the daily balance of a household.
+
+        Args:
+            db: Database session.
+            household_id: ID of the household to forecast.
+            days: Number of days to project, up to MAX_FORECAST_DAYS.
+            as_of: Date the projection starts after. Defaults to today.
+
+        Returns:
+            The components used and the projected balance for each day.
+        """
+        components = self.components(db, household_id, as_of)
+        return components, components.path()[:days]
+
+    def apply_transaction(
+        self, household_id: int, transaction: Transaction, version: int, sign: int = 1
+    ) -> None:
+        """Fold one transaction write into the cached components.
+
+        The cache is only updated in place when it holds the version directly
+        preceding the write; otherwise it is dropped and rebuilt on next use.
+        """
+        with self._lock:
+            cached = self._cache.get(household_id)
+            if cached is None:
+                return
+            if cached.version != version - 1:
+                del self._cache[household_id]
+                return
+            cached.apply_transaction(transaction, sign)
+            cached.version = version
+
+    def invalidate(self, household_id: int) -> None:
+        """Drop the cached components of a household."""
+        with self._lock:
+            self._cache.pop(household_id, None)
+
+
+# Shared forecaster instance used by the API process
+forecaster = CashFlowForecaster()
@@ -0,0 +1,264 @@
+"""
+Calendar Free/Busy
+
+This module computes when household members are busy, as one bitset per member
+and week with a bit per 15-minute slot, recurring events included. Bitsets are
+plain integers, so the busy times of several members are combined with a
+single OR and runs of common free slots are found with a few shifts and ANDs.
+
+Bitsets are cached per member and week, keyed by the household's calendar
+version, so every event write invalidates them.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.calendar import Event
+
+from .event_index import event_index
+from .event_recurrence import occurrence_cache
+from .versions import get_calendar_version
+
+logger = logging.getLogger(__name__)
+
+SLOT_MINUTES = 15
+SLOT = timedelta(minutes=SLOT_MINUTES)
+SLOTS_PER_DAY = 24 * 60 // SLOT_MINUTES
+SLOTS_PER_WEEK = 7 * SLOTS_PER_DAY
+WEEK = timedelta(days=7)
+
+# Upper bound on the weeks of a single free/busy query
+MAX_WEEKS = 8
+
+
+def week_start_of(moment: datetime) -> datetime:
+    """Return the Monday 00:00 of the week containing a time."""
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday())
+
+
+def slot_mask(first: int, last: int) -> int:
+    """Return a bitset with slots [first, last) set."""
+    if last <= first:
+        return 0
+    return ((1 << (last - first)) - 1) << first
+
+
+def busy_mask(start: datetime, end: datetime, origin: datetime, slots: int) -> int:
+    """Return the slots after ``origin`` touched by [start, end).
+
+    Partially covered slots count as busy and instantaneous events occupy the
+    slot they start in.
+    """
+    first = (start - origin) // SLOT
+    last = -((origin - end) // SLOT)  # Ceiling division
+    if last <= first:
+        last = first + 1
+    return slot_mask(max(first, 0), min(last, slots))
+
+
+def event_participants(event: Event) -> Set[int]:
+    """Return the IDs of the members whose calendar an event belongs to.
+
+    These are its creator and its attendees.
+    """
+    participants = {user.id for user in event.attendees}
+    if event.created_by_user_id is not None:
+        participants.add(event.created_by_user_id)
+    return participants
+
+
+def daily_mask(weeks: int, start_hour: int, end_hour: int) -> int:
+    """Return the slots between two hours of every day of several weeks."""
+    day = slot_mask(start_hour * SLOTS_PER_DAY // 24, end_hour * SLOTS_PER_DAY // 24)
+    mask = 0
+    for offset in range(7 * weeks):
+        mask |= day << (offset * SLOTS_PER_DAY)
+    return mask
+
+
+def free_runs(free: int, length: int) -> int:
+    """Return the slots that start ``length`` consecutive free slots.
+
+    Doubles the run length per step, so the cost is logarithmic in ``length``.
+    """
+    runs = free
+    span = 1
+    while span < length:
+        step = min(span, length - span)
+        runs &= runs >> step
+        span += step
+    return runs
+
+
+def common_free_slots(
+    busy: Iterable[int], slots: int, length: int, allowed: int, limit: int
+) -> List[int]:
+    """Find non-overlapping runs of slots in which nobody is busy.
+
+    Args:
+        busy: Busy bitsets of the members.
+        slots: Number of slots covered by the bitsets.
+        length: Number of consecutive free slots wanted.
+        allowed: Bitset of the slots a run may use.
+        limit: Maximum number of runs.
+
+    Returns:
+        The first slot of each run, in time order.
+    """
+    anyone_busy = 0
+    for bits in busy:
+        anyone_busy |= bits
+    free = ~anyone_busy & allowed & slot_mask(0, slots)
+    runs = free_runs(free, length)
+    starts = []
+    while runs and len(starts) < limit:
+        first = (runs & -runs).bit_length() - 1
+        starts.append(first)
+        runs &= ~slot_mask(0, first + length)
+    return starts
+
+
+class FreeBusyCache:
+    """LRU of busy bitsets per (household, member, week), keyed by version."""
+
+    def __init__(self, max_entries: int = settings.CALENDAR_FREEBUSY_MAX_ENTRIES):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of member weeks kept in memory.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, int, datetime], Tuple[int, int]]" = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _compute(
+        self, db: Session, household_id: int, user_ids: Set[int], week: datetime
+    ) -> Dict[int, int]:
+        """Build the busy bitsets of several members for one week."""
+        busy = dict.fromkeys(user_ids, 0)
+        for event in event_index.overlapping(db, household_id, week, week + WEEK):
+            # All-day events such as birthdays do not block the day
+            if event.is_all_day:
+                continue
+            members = event_participants(event) & user_ids
+            if not members:
+                continue
+            bits = 0
+            for occurrence in occurrence_cache.expand(event, week, week + WEEK):
+                bits |= busy_mask(
+                    occurrence.start_time, occurrence.end_time, week, SLOTS_PER_WEEK
+                )
+            for user_id in members:
+                busy[user_id] |= bits
+        return busy
+
+    def week(
+        self, db: Session, household_id: int, user_ids: Sequence[int], week: datetime
+    ) -> Dict[int, int]:
+        """Return the busy bitsets of several members for one week.
+
+        Members missing from the cache are computed together in one pass over
+        the household's events of that week.
+        """
+        version = get_calendar_version(db, household_id)
+        result: Dict[int, int] = {}
+        with self._lock:
+            for user_id in user_ids:
+                entry = self._entries.get((household_id, user_id, week))
+                if entry is not None and entry[0] == version:
+                    self._entries.move_to_end((household_id, user_id, week))
+                    result[user_id] = entry[1]
+            self.hits += len(result)
+            self.misses += len(user_ids) - len(result)
+
+        missing = {user_id for user_id in user_ids if user_id not in result}
+        if missing:
+            computed = self._compute(db, household_id, missing, week)
+            result.update(computed)
+            with self._lock:
+                for user_id, bits in computed.items():
+                    self._entries[(household_id, user_id, week)] = (version, bits)
+                    self._entries.move_to_end((household_id, user_id, week))
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return result
+
+    def busy(
+        self,
+        db: Session,
+        household_id: int,
+        user_ids: Sequence[int],
+        start: datetime,
+        weeks: int = 1,
+    ) -> Dict[int, int]:
+        """Return the busy bitsets of several members over consecutive weeks.
+
+        Args:
+            db: Database session.
+            household_id: ID of the household.
+            user_ids: IDs of the members.
+            start: Monday 00:00 of the first week.
+            weeks: Number of weeks.
+
+        Returns:
+            A bitset per member; bit i is the i-th slot after ``start``.
+        """
+        busy = dict.fromkeys(user_ids, 0)
+        for offset in range(weeks):
+            week = self.week(db, household_id, user_ids, start + offset * WEEK)
+            for user_id, bits in week.items():
+                busy[user_id] |= bits << (offset * SLOTS_PER_WEEK)
+        return busy
+
+    def clear(self) -> None:
+        """Drop all cached bitsets."""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared free/busy cache used by the API process
+free_busy_cache = FreeBusyCache()
+
+
+def suggest_slots(
+    busy: Iterable[int],
+    start: datetime,
+    weeks: int,
+    duration: timedelta,
+    limit: int,
+    day_start_hour: int = 0,
+    day_end_hour: int = 24,
+    not_before: Optional[datetime] = None,
+) -> List[Tuple[datetime, datetime]]:
+    """Suggest times at which every member is free for a duration.
+
+    Args:
+        busy: Busy bitsets of the members, relative to ``start``.
+        start: Monday 00:00 of the first week.
+        weeks: Number of weeks covered by the bitsets.
+        duration: Length of the suggested slots.
+        limit: Maximum number of suggestions.
+        day_start_hour: Earliest hour of the day a suggestion may start.
+        day_end_hour: Hour of the day by which a suggestion must end.
+        not_before: Optional time before which nothing is suggested.
+    """
+    slots = weeks * SLOTS_PER_WEEK
+    length = max(1, -(-duration // SLOT))
+    allowed = daily_mask(weeks, day_start_hour, day_end_hour)
+    if not_before is not None and not_before > start:
+        allowed &= ~slot_mask(0, -((start - not_before) // SLOT))
+    return [
+        (start + first * SLOT, start + first * SLOT + duration)
+        for first in common_free_slots(busy, slots, length, allowed, limit)
+    ]
@@ -4,10 +4,18 @@ gRPC Services
 This package contains gRPC service implementations for the Life Manager API.
 """
 
-from .base import BaseGRPCService
+from .base import BaseGRPCService, blocking_rpc, blocking_stream_rpc
+from .calendar_service import CalendarService
+from .finance_service import FinanceService
+from .household_service import HouseholdService
 from .user_service import UserService
 
 __all__ = [
     "BaseGRPCService",
+    "CalendarService",
+    "FinanceService",
+    "HouseholdService",
     "UserService",
+    "blocking_rpc",
+    "blocking_stream_rpc",
 ]
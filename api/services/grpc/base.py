@@ -1,28 +1,229 @@
 """
 Base gRPC Service
 
-This module provides a base class for gRPC service implementations.
+This module provides a base class for gRPC service implementations, and the
+``blocking_rpc`` and ``blocking_stream_rpc`` decorators that serve their
+blocking, database-bound methods from the ``grpc.aio`` server. Handlers written
+as coroutines, such as those of request streams, call ``run_blocking`` for
+their database work. Every RPC works in a database session of its own, checked
+out of the pool for the RPC and released when it ends.
 """
 
+import asyncio
+import contextlib
+import contextvars
+import functools
 import logging
-from typing import Any, Dict, Optional, Type, TypeVar
+from concurrent import futures
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 
 import grpc
 from google.protobuf.message import Message
 from sqlalchemy.orm import Session
 
-from api.core.security import get_password_hash
-from api.db.session import get_db
+from api import deadlines
+from api.base_service import ServiceException, ValidationError
+from api.config import settings
 from api.grpc_utils import from_proto_message, to_proto_message
-from api.models.base import BaseModel
+from api.models.base import Base
+from api.models.database import SessionLocal, session_scope
+from api.models.user import User as UserModel
+from api.security import get_password_hash
+from api.services.households import household_of
 
 # Type variables
-T = TypeVar("T", bound=BaseModel)
+T = TypeVar("T", bound=Base)
 RequestType = TypeVar("RequestType", bound=Message)
 ResponseType = TypeVar("ResponseType", bound=Message)
 
 logger = logging.getLogger(__name__)
 
+# Database session of the RPC being served, set on its worker thread
+_rpc_session: contextvars.ContextVar[Optional[Session]] = contextvars.ContextVar(
+    "rpc_session", default=None
+)
+
+# One thread per connection the database pool can open: more threads would
+# only wait on the pool, and time out under load, while RPCs wait their turn
+# for a thread in the executor's queue
+_blocking_executor = futures.ThreadPoolExecutor(
+    max_workers=settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW,
+    thread_name_prefix="grpc-rpc",
+)
+
+
+class RpcAborted(Exception):
+    """Raised by ``BlockingContext.abort`` to unwind a blocking RPC method."""
+
+
+class BlockingContext:
+    """Servicer context of a blocking RPC method running on a worker thread.
+
+    ``grpc.aio`` contexts belong to the event loop and their ``abort`` and
+    ``send_initial_metadata`` are coroutines, so this wrapper gives the method
+    the synchronous interface it was written against. An abort is recorded and
+    applied on the loop once the method has returned; the first abort wins, so
+    catch-all handlers cannot replace its status. Everything else, including
+    the attributes set by the interceptors, is read from the wrapped context.
+    """
+
+    def __init__(
+        self, context: grpc.aio.ServicerContext, loop: asyncio.AbstractEventLoop
+    ):
+        """Wrap an aio servicer context.
+
+        Args:
+            context: The servicer context of the RPC.
+            loop: The event loop serving the RPC.
+        """
+        self._context = context
+        self._loop = loop
+        self.aborted: Optional[Tuple[grpc.StatusCode, str]] = None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._context, name)
+
+    def abort(self, code: grpc.StatusCode, details: str = "") -> None:
+        """Abort the RPC with a status once the method has returned.
+
+        Raises:
+            RpcAborted: Always.
+        """
+        if self.aborted is None:
+            self.aborted = (code, details)
+        raise RpcAborted(details)
+
+    def send_initial_metadata(self, metadata) -> None:
+        """Send the initial metadata of the RPC from the event loop."""
+        asyncio.run_coroutine_threadsafe(
+            self._context.send_initial_metadata(metadata), self._loop
+        ).result()
+
+
+def _call_in_deadline(method: Callable, self, request, context: BlockingContext) -> Any:
+    """Call a blocking RPC method, rolling back the work its deadline cut short."""
+    try:
+        return method(self, request, context)
+    except Exception:
+        # The servicer's session outlives the RPC; don't leave it a transaction
+        # interrupted mid-statement
+        if deadlines.expired() and getattr(self, "_db", None) is not None:
+            self._db.rollback()
+        raise
+
+
+def _call_in_session(method: Callable, self, request, context: BlockingContext) -> Any:
+    """Call a blocking RPC method with the database session of its RPC.
+
+    The call gets a session of its own from the pool, committed if the method
+    returns, rolled back if it raises and closed either way, unless it runs
+    within an ``rpc_session`` or the servicer was given a session.
+    """
+    if _rpc_session.get() is not None:
+        return method(self, request, context)
+    if getattr(self, "_db", None) is not None:
+        return _call_in_deadline(method, self, request, context)
+    with session_scope() as db:
+        _rpc_session.set(db)
+        return method(self, request, context)
+
+
+async def run_blocking(
+    method: Callable, self, request, context: grpc.aio.ServicerContext
+) -> Any:
+    """Run a blocking RPC method on a worker thread and return its result.
+
+    Aborts of the method, and the ``ServiceException``s it raises, are applied
+    to the RPC. The method's database work is done in a session of its own
+    and held to the RPC's deadline, and RPCs whose deadline has passed are not
+    run at all.
+    """
+    time_remaining = context.time_remaining()
+    if time_remaining is not None and time_remaining <= 0:
+        await context.abort(grpc.StatusCode.DEADLINE_EXCEEDED, "Deadline exceeded")
+    loop = asyncio.get_running_loop()
+    blocking_context = BlockingContext(context, loop)
+    call_context = contextvars.copy_context()
+    call_context.run(deadlines.set_deadline, time_remaining)
+    call = functools.partial(
+        call_context.run, _call_in_session, method, self, request, blocking_context
+    )
+    try:
+        return await loop.run_in_executor(_blocking_executor, call)
+    except ServiceException as e:
+        if blocking_context.aborted is None:
+            blocking_context.aborted = (e.status_code, e.details)
+    except Exception:
+        if blocking_context.aborted is None:
+            raise
+    finally:
+        if blocking_context.aborted is not None:
+            await context.abort(*blocking_context.aborted)
+
+
+@contextlib.asynccontextmanager
+async def rpc_session() -> AsyncIterator[Session]:
+    """Share one database session among the ``run_blocking`` calls of an RPC.
+
+    For coroutine handlers whose work spans several calls, such as those of
+    request streams. The session is committed when the block completes, and
+    closed, which rolls back what was not committed, either way.
+    """
+    loop = asyncio.get_running_loop()
+    db = SessionLocal.session_factory()
+    token = _rpc_session.set(db)
+    try:
+        yield db
+        await loop.run_in_executor(_blocking_executor, db.commit)
+    finally:
+        _rpc_session.reset(token)
+        await loop.run_in_executor(_blocking_executor, db.close)
+
+
+def blocking_rpc(method: Callable) -> Callable:
+    """Serve a blocking RPC method from the ``grpc.aio`` server.
+
+    The method runs on a worker thread, so database I/O never stalls the loop,
+    with the caller's context variables and a ``BlockingContext``. The
+    undecorated method stays available as ``__wrapped__``.
+    """
+
+    @functools.wraps(method)
+    async def handler(self, request, context: grpc.aio.ServicerContext):
+        return await run_blocking(method, self, request, context)
+
+    return handler
+
+
+def blocking_stream_rpc(method: Callable) -> Callable:
+    """Serve a blocking response-streaming RPC method from the ``grpc.aio`` server.
+
+    Like ``blocking_rpc``, but the method returns an iterable of responses,
+    which is drained on the worker thread and then streamed from the loop.
+    """
+
+    def drain(self, request, context) -> List[Any]:
+        return list(method(self, request, context))
+
+    @functools.wraps(method)
+    async def handler(self, request, context: grpc.aio.ServicerContext):
+        for response in await run_blocking(drain, self, request, context):
+            yield response
+
+    return handler
+
 
 class BaseGRPCService:
     """Base class for gRPC service implementations."""
@@ -31,20 +232,76 @@ class BaseGRPCService:
         """Initialize the service with an optional database session.
 
         Args:
-            db: Optional SQLAlchemy session. If not provided, a new one will be created.
+            db: Optional SQLAlchemy session, used by every RPC instead of
+                their own. Meant for tests; it is shared by concurrent RPCs.
         """
         self._db = db
 
     @property
     def db(self) -> Session:
-        """Get a database session.
+        """Get the database session of the current RPC.
+
+        Outside of an RPC, this is the calling thread's session of
+        ``SessionLocal``.
 
         Returns:
             A SQLAlchemy session.
         """
-        if self._db is None:
-            self._db = next(get_db())
-        return self._db
+        if self._db is not None:
+            return self._db
+        db = _rpc_session.get()
+        return db if db is not None else SessionLocal()
+
+    def _current_user(self, context) -> UserModel:
+        """Return the user authenticated by the auth interceptor."""
+        user_data = getattr(context, "user", None) or {}
+        email = user_data.get("email")
+        user = (
+            self.db.query(UserModel).filter(UserModel.email == email).first()
+            if email
+            else None
+        )
+        if not user:
+            context.abort(grpc.StatusCode.UNAUTHENTICATED, "Authentication required")
+        return user
+
+    def _check_household(self, household_id: str, user: UserModel) -> int:
+        """Return the household ID of a request after checking membership.
+
+        An empty ``household_id`` names the user's household.
+        """
+        requested = (
+            self._parse_id(household_id, "household_id") if household_id else None
+        )
+        return household_of(user, requested)
+
+    @staticmethod
+    def _parse_id(value: str, field: str = "id") -> int:
+        """Parse the string ID of a request.
+
+        Raises:
+            ValidationError: If the ID is not a number.
+        """
+        if not value.isdigit():
+            raise ValidationError(f"Invalid {field}: {value!r}")
+        return int(value)
+
+    @staticmethod
+    def _parse_ids(values: Iterable[str], field: str = "id") -> List[int]:
+        """Parse the repeated string IDs of a batch request, without duplicates.
+
+        Raises:
+            ValidationError: If an ID is not a number, or there are more IDs
+                than ``GRPC_BATCH_MAX_SIZE``.
+        """
+        ids = list(
+            dict.fromkeys(BaseGRPCService._parse_id(value, field) for value in values)
+        )
+        if len(ids) > settings.GRPC_BATCH_MAX_SIZE:
+            raise ValidationError(
+                f"At most {settings.GRPC_BATCH_MAX_SIZE} IDs may be requested at once"
+            )
+        return ids
 
     def _get_by_id(
         self, model: Type[T], id: Any, not_found_error: str = "Resource not found"
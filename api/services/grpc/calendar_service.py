@@ -0,0 +1,775 @@
+"""
+gRPC Calendar Service
+
+This module implements the gRPC CalendarService defined in the protobuf files.
+Recurring events are stored as one row per series; range queries expand them
+into occurrences with ``api.services.event_recurrence``.
+"""
+
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence
+
+import grpc
+from google.protobuf import empty_pb2
+from sqlalchemy.orm import Session
+
+# Import generated protobuf code
+from api.config import settings
+from api.generated.api.v1 import calendar_pb2, calendar_pb2_grpc
+from api.grpc_utils import from_proto_timestamp, to_proto_timestamp
+from api.models.calendar import Event, EventException, EventFrequency
+from api.models.user import User as UserModel
+
+from ..event_conflicts import Conflict, find_conflicts
+from ..event_index import event_index
+from ..event_recurrence import (
+    Occurrence,
+    RecurrenceRule,
+    event_duration,
+    get_occurrences_in_range,
+    get_upcoming_occurrences,
+    mask_weekdays,
+    touch_event,
+    weekday_mask,
+)
+from ..free_busy import (
+    MAX_WEEKS,
+    SLOT_MINUTES,
+    SLOTS_PER_WEEK,
+    free_busy_cache,
+    suggest_slots,
+    week_start_of,
+)
+from ..reminders import reminder_lead, reminder_scheduler
+from ..versions import bump_calendar_version
+from .base import BaseGRPCService, blocking_rpc
+
+logger = logging.getLogger(__name__)
+
+# Defaults for GetUpcomingEvents
+DEFAULT_UPCOMING_DAYS = 7
+DEFAULT_UPCOMING_LIMIT = 10
+
+# Default number of common free slots suggested by GetFreeBusy
+DEFAULT_SUGGESTIONS = 5
+
+# Defaults for ListEvents pagination
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+class CalendarService(calendar_pb2_grpc.CalendarServiceServicer, BaseGRPCService):
+    """gRPC servicer for Calendar operations."""
+
+    def __init__(self, db: Optional[Session] = None):
+        """Initialize the CalendarService.
+
+        Args:
+            db: Optional SQLAlchemy session. If not provided, a new one will be created.
+        """
+        super().__init__(db)
+
+    @blocking_rpc
+    def CreateEvent(self, request, context):
+        """Create a new event.
+
+        Implements the CreateEvent RPC method.
+        """
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+
+        event = Event(
+            title=request.title,
+            description=request.description or None,
+            start_time=from_proto_timestamp(request.start_time),
+            end_time=(
+                from_proto_timestamp(request.end_time)
+                if request.HasField("end_time")
+                else None
+            ),
+            is_all_day=request.is_all_day,
+            location=request.location or None,
+            household_id=household_id,
+            created_by_user_id=user.id,
+            reminder_enabled=request.reminder_enabled,
+            reminder_time_before=request.reminder_minutes_before or None,
+        )
+        self._validate_reminder(event, context)
+        if request.is_recurring or request.recurrence_frequency:
+            self._set_rule(
+                event,
+                context,
+                frequency=request.recurrence_frequency,
+                interval=request.recurrence_interval,
+                count=request.recurrence_count,
+                end_date=(
+                    from_proto_timestamp(request.recurrence_end_date)
+                    if request.HasField("recurrence_end_date")
+                    else None
+                ),
+                by_weekday=request.recurrence_by_weekday,
+            )
+        self._validate_times(event, context)
+        if request.attendee_emails:
+            event.attendees = self._get_attendees(
+                household_id, request.attendee_emails, context
+            )
+
+        touch_event(event)
+        self.db.add(event)
+        bump_calendar_version(self.db, household_id)
+        self.db.commit()
+        self.db.refresh(event)
+        self._after_commit(household_id, changed=[event])
+        conflicts = find_conflicts(self.db, event) if request.check_conflicts else []
+        return self._event_response(event, conflicts)
+
+    @blocking_rpc
+    def GetEvent(self, request, context):
+        """Get an event by ID.
+
+        Implements the GetEvent RPC method.
+        """
+        user = self._current_user(context)
+        event = self._get_event(request.id, user, context)
+        return calendar_pb2.EventResponse(event=self._event_to_proto(event))
+
+    @blocking_rpc
+    def ListEvents(self, request, context):
+        """List the events of a household without expanding recurrences.
+
+        Implements the ListEvents RPC method.
+        """
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+
+        query = self.db.query(Event).filter(Event.household_id == household_id)
+        if request.exclude_recurring:
+            query = query.filter(Event.recurrence_frequency.is_(None))
+        if request.HasField("start_date"):
+            query = query.filter(
+                Event.start_time >= from_proto_timestamp(request.start_date)
+            )
+        if request.HasField("end_date"):
+            query = query.filter(
+                Event.start_time < from_proto_timestamp(request.end_date)
+            )
+        if request.created_by:
+            query = query.filter(
+                Event.created_by_user_id.in_([int(i) for i in request.created_by])
+            )
+
+        page = max(request.page, 1)
+        page_size = min(request.page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        total = query.count()
+        events = (
+            query.order_by(Event.start_time, Event.id)
+            .offset((page - 1) * page_size)
+            .limit(page_size)
+            .all()
+        )
+        return calendar_pb2.EventListResponse(
+            events=[self._event_to_proto(event) for event in events], total=total
+        )
+
+    @blocking_rpc
+    def UpdateEvent(self, request, context):
+        """Update an event, a single occurrence or an occurrence and its successors.
+
+        Implements the UpdateEvent RPC method. Without an occurrence, or with
+        ``update_all_occurrences``, the whole series is updated.
+        """
+        user = self._current_user(context)
+        event = self._get_event(request.id, user, context)
+
+        previous = None
+        if request.HasField("occurrence_start_time") and not (
+            request.update_all_occurrences
+        ):
+            original_start = self._get_occurrence_start(
+                event, request.occurrence_start_time, context
+            )
+            if request.update_future_occurrences:
+                previous, event = event, self._split_series(event, original_start)
+            else:
+                exception = self._get_or_create_exception(event, original_start)
+                self._apply_exception_update(event, exception, request)
+                self._validate_exception(exception, context)
+                touch_event(event)
+                bump_calendar_version(self.db, event.household_id)
+                self.db.commit()
+                self.db.refresh(event)
+                self._after_commit(event.household_id, changed=[event])
+                occurrence = self._exception_occurrence(event, exception)
+                conflicts = []
+                if request.check_conflicts and not exception.is_cancelled:
+                    conflicts = find_conflicts(self.db, event, [occurrence])
+                return self._event_response(event, conflicts, occurrence)
+
+        self._apply_series_update(event, request, context)
+        self._validate_times(event, context)
+        touch_event(event)
+        bump_calendar_version(self.db, event.household_id)
+        self.db.commit()
+        self.db.refresh(event)
+        self._after_commit(
+            event.household_id,
+            changed=[changed for changed in (previous, event) if changed is not None],
+        )
+        conflicts = find_conflicts(self.db, event) if request.check_conflicts else []
+        return self._event_response(event, conflicts)
+
+    @blocking_rpc
+    def DeleteEvent(self, request, context):
+        """Delete an event, a single occurrence or an occurrence and its successors.
+
+        Implements the DeleteEvent RPC method.
+        """
+        user = self._current_user(context)
+        event = self._get_event(request.id, user, context)
+
+        if request.HasField("occurrence_start_time") and not (
+            request.delete_all_occurrences
+        ):
+            original_start = self._get_occurrence_start(
+                event, request.occurrence_start_time, context
+            )
+            # Deleting the first occurrence and its successors deletes the series
+            if not (
+                request.delete_future_occurrences and original_start == event.start_time
+            ):
+                if request.delete_future_occurrences:
+                    self._truncate_series(event, original_start)
+                else:
+                    exception = self._get_or_create_exception(event, original_start)
+                    exception.is_cancelled = True
+                touch_event(event)
+                bump_calendar_version(self.db, event.household_id)
+                self.db.commit()
+                self._after_commit(event.household_id, changed=[event])
+                return empty_pb2.Empty()
+
+        event_id, household_id = event.id, event.household_id
+        touch_event(event)
+        self.db.delete(event)
+        bump_calendar_version(self.db, household_id)
+        self.db.commit()
+        self._after_commit(household_id, deleted=[event_id])
+        return empty_pb2.Empty()
+
+    @blocking_rpc
+    def GetEventsInRange(self, request, context):
+        """Get the occurrences of a household's events in a time range.
+
+        Implements the GetEventsInRange RPC method. Recurring series are
+        expanded into one event message per occurrence.
+        """
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+        if not request.HasField("start_date") or not request.HasField("end_date"):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "start_date and end_date are required"
+            )
+
+        try:
+            pairs = get_occurrences_in_range(
+                self.db,
+                household_id,
+                from_proto_timestamp(request.start_date),
+                from_proto_timestamp(request.end_date),
+                include_recurring=not request.exclude_recurring,
+            )
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+
+        events = [
+            self._event_to_proto(event, occurrence) for event, occurrence in pairs
+        ]
+        return calendar_pb2.EventListResponse(events=events, total=len(events))
+
+    @blocking_rpc
+    def GetUpcomingEvents(self, request, context):
+        """Get the next occurrences of a household's events.
+
+        Implements the GetUpcomingEvents RPC method.
+        """
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+
+        now = datetime.utcnow()
+        days_ahead = request.days_ahead or DEFAULT_UPCOMING_DAYS
+        pairs = get_upcoming_occurrences(
+            self.db,
+            household_id,
+            now,
+            request.limit or DEFAULT_UPCOMING_LIMIT,
+            before=now + timedelta(days=days_ahead),
+        )
+        events = [
+            self._event_to_proto(event, occurrence) for event, occurrence in pairs
+        ]
+        return calendar_pb2.EventListResponse(events=events, total=len(events))
+
+    @blocking_rpc
+    def GetFreeBusy(self, request, context):
+        """Get the busy slots of household members and their common free slots.
+
+        Implements the GetFreeBusy RPC method. Busy slots are returned as one
+        bitset per member; common free slots are suggested when a duration is
+        given.
+        """
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+
+        weeks = request.weeks or 1
+        if not 1 <= weeks <= MAX_WEEKS:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"weeks must be between 1 and {MAX_WEEKS}",
+            )
+        day_start_hour = (
+            request.day_start_hour if request.HasField("day_start_hour") else 0
+        )
+        day_end_hour = request.day_end_hour if request.HasField("day_end_hour") else 24
+        if not 0 <= day_start_hour < day_end_hour <= 24:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "day_start_hour and day_end_hour must satisfy 0 <= start < end <= 24",
+            )
+        if request.duration_minutes < 0:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "duration_minutes must not be negative",
+            )
+
+        members = {
+            member_id
+            for (member_id,) in self.db.query(UserModel.id).filter(
+                UserModel.household_id == household_id
+            )
+        }
+        user_ids = sorted(members)
+        if request.user_ids:
+            requested = {int(i) for i in request.user_ids if i.isdigit()}
+            if len(requested) != len(set(request.user_ids)) or not requested <= members:
+                context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    "user_ids must be members of the household",
+                )
+            user_ids = sorted(requested)
+
+        start = week_start_of(
+            from_proto_timestamp(request.week_start)
+            if request.HasField("week_start")
+            else datetime.utcnow()
+        )
+        busy = free_busy_cache.busy(self.db, household_id, user_ids, start, weeks)
+
+        slot_count = weeks * SLOTS_PER_WEEK
+        response = calendar_pb2.FreeBusyResponse(
+            week_start=to_proto_timestamp(start),
+            slot_minutes=SLOT_MINUTES,
+            slot_count=slot_count,
+            members=[
+                calendar_pb2.MemberBusy(
+                    user_id=str(user_id),
+                    busy=busy[user_id].to_bytes((slot_count + 7) // 8, "little"),
+                )
+                for user_id in user_ids
+            ],
+        )
+        if request.duration_minutes:
+            slots = suggest_slots(
+                busy.values(),
+                start,
+                weeks,
+                timedelta(minutes=request.duration_minutes),
+                request.max_suggestions or DEFAULT_SUGGESTIONS,
+                day_start_hour=day_start_hour,
+                day_end_hour=day_end_hour,
+                not_before=datetime.utcnow(),
+            )
+            response.suggestions.extend(
+                calendar_pb2.TimeSlot(
+                    start_time=to_proto_timestamp(slot_start),
+                    end_time=to_proto_timestamp(slot_end),
+                )
+                for slot_start, slot_end in slots
+            )
+        return response
+
+    @blocking_rpc
+    def ShareEvent(self, request, context):
+        """Share an event with other users.
+
+        Implements the ShareEvent RPC method.
+        """
+        context.abort(grpc.StatusCode.UNIMPLEMENTED, "Event sharing is not supported")
+
+    def _get_event(self, event_id: str, user: UserModel, context) -> Event:
+        """Helper method to get an event of the user's household or raise an error."""
+        event = None
+        if event_id.isdigit():
+            event = (
+                self.db.query(Event)
+                .filter(
+                    Event.id == int(event_id),
+                    Event.household_id == user.household_id,
+                )
+                .first()
+            )
+        if not event:
+            context.abort(
+                grpc.StatusCode.NOT_FOUND, f"Event with ID {event_id} not found"
+            )
+        return event
+
+    def _get_attendees(
+        self, household_id: int, emails: Sequence[str], context
+    ) -> List[UserModel]:
+        """Return the household members with the given e-mail addresses."""
+        attendees = (
+            self.db.query(UserModel)
+            .filter(
+                UserModel.email.in_(set(emails)),
+                UserModel.household_id == household_id,
+            )
+            .all()
+        )
+        unknown = set(emails) - {attendee.email for attendee in attendees}
+        if unknown:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"Attendees are not household members: {', '.join(sorted(unknown))}",
+            )
+        return attendees
+
+    def _after_commit(
+        self,
+        household_id: int,
+        changed: Sequence[Event] = (),
+        deleted: Sequence[int] = (),
+    ) -> None:
+        """Propagate a committed calendar write to the in-process indexes."""
+        event_index.record_write(self.db, household_id, changed, deleted)
+        for event in changed:
+            reminder_scheduler.schedule(event)
+        for event_id in deleted:
+            reminder_scheduler.unschedule(event_id)
+
+    def _get_occurrence_start(self, event: Event, timestamp, context) -> datetime:
+        """Return the original start of an occurrence after validating it."""
+        original_start = from_proto_timestamp(timestamp)
+        rule = RecurrenceRule.from_event(event)
+        if rule is None or not rule.includes(original_start):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                f"Event {event.id} has no occurrence at {original_start.isoformat()}",
+            )
+        return original_start
+
+    def _get_or_create_exception(
+        self, event: Event, original_start: datetime
+    ) -> EventException:
+        """Return the exception of an occurrence, creating it if needed."""
+        for exception in event.exceptions:
+            if exception.original_start == original_start:
+                return exception
+        exception = EventException(original_start=original_start)
+        event.exceptions.append(exception)
+        return exception
+
+    def _set_rule(
+        self, event: Event, context, frequency, interval, count, end_date, by_weekday
+    ) -> None:
+        """Set the recurrence rule of an event from request fields."""
+        if frequency == calendar_pb2.NONE:
+            event.recurrence_frequency = None
+            return
+        if interval < 0 or count < 0:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "recurrence_interval and recurrence_count must not be negative",
+            )
+        try:
+            mask = weekday_mask(by_weekday)
+        except ValueError as e:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, str(e))
+        event.recurrence_frequency = EventFrequency[
+            calendar_pb2.RecurrenceFrequency.Name(frequency)
+        ]
+        event.recurrence_interval = interval or 1
+        event.recurrence_count = count or None
+        event.recurrence_end_date = end_date
+        event.recurrence_by_weekday = mask
+
+    def _apply_series_update(self, event: Event, request, context) -> None:
+        """Apply the fields set on an update request to a whole series."""
+        if request.HasField("title"):
+            event.title = request.title
+        if request.HasField("description"):
+            event.description = request.description
+        if request.HasField("location"):
+            event.location = request.location
+        if request.HasField("is_all_day"):
+            event.is_all_day = request.is_all_day
+        if request.HasField("start_time"):
+            event.start_time = from_proto_timestamp(request.start_time)
+        if request.HasField("end_time"):
+            event.end_time = from_proto_timestamp(request.end_time)
+        if request.attendee_emails:
+            event.attendees = self._get_attendees(
+                event.household_id, request.attendee_emails, context
+            )
+        if request.HasField("reminder_enabled"):
+            event.reminder_enabled = request.reminder_enabled
+        if request.HasField("reminder_minutes_before"):
+            event.reminder_time_before = request.reminder_minutes_before
+        self._validate_reminder(event, context)
+
+        rule_fields = (
+            "recurrence_frequency",
+            "recurrence_interval",
+            "recurrence_count",
+            "recurrence_end_date",
+        )
+        if request.HasField("is_recurring") and not request.is_recurring:
+            event.recurrence_frequency = None
+        elif request.recurrence_by_weekday or any(
+            request.HasField(name) for name in rule_fields
+        ):
+            current = self._event_to_proto(event)
+            self._set_rule(
+                event,
+                context,
+                frequency=(
+                    request.recurrence_frequency
+                    if request.HasField("recurrence_frequency")
+                    else current.recurrence_frequency
+                ),
+                interval=(
+                    request.recurrence_interval
+                    if request.HasField("recurrence_interval")
+                    else current.recurrence_interval
+                ),
+                count=(
+                    request.recurrence_count
+                    if request.HasField("recurrence_count")
+                    else current.recurrence_count
+                ),
+                end_date=(
+                    from_proto_timestamp(request.recurrence_end_date)
+                    if request.HasField("recurrence_end_date")
+                    else event.recurrence_end_date
+                ),
+                by_weekday=(
+                    request.recurrence_by_weekday or current.recurrence_by_weekday
+                ),
+            )
+
+        # Instances edited against a different rule or start no longer apply
+        rule = RecurrenceRule.from_event(event)
+        for exception in list(event.exceptions):
+            if rule is None or not rule.includes(exception.original_start):
+                event.exceptions.remove(exception)
+
+    def _apply_exception_update(
+        self, event: Event, exception: EventException, request
+    ) -> None:
+        """Apply the fields set on an update request to a single occurrence."""
+        exception.is_cancelled = False
+        if request.HasField("title"):
+            exception.title = request.title
+        if request.HasField("description"):
+            exception.description = request.description
+        if request.HasField("location"):
+            exception.location = request.location
+        if request.HasField("start_time"):
+            exception.start_time = from_proto_timestamp(request.start_time)
+        if request.HasField("end_time"):
+            exception.end_time = from_proto_timestamp(request.end_time)
+        # Moved instances always store their end so range queries can find them
+        if exception.start_time is not None and exception.end_time is None:
+            exception.end_time = exception.start_time + event_duration(event)
+
+    def _truncate_series(self, event: Event, original_start: datetime) -> None:
+        """End a series right before one of its occurrences."""
+        rule = RecurrenceRule.from_event(event)
+        ordinal = rule.ordinal(original_start)
+        if event.recurrence_count:
+            event.recurrence_count = ordinal
+        event.recurrence_end_date = original_start - timedelta(microseconds=1)
+        for exception in list(event.exceptions):
+            if exception.original_start >= original_start:
+                event.exceptions.remove(exception)
+
+    def _split_series(self, event: Event, original_start: datetime) -> Event:
+        """Split a series at an occurrence and return the new, later series.
+
+        The original series ends right before the occurrence; the new series
+        starts at the occurrence with the remaining count, if any, and takes
+        over the edited and cancelled instances from the occurrence on.
+        """
+        rule = RecurrenceRule.from_event(event)
+        ordinal = rule.ordinal(original_start)
+        if ordinal == 0:
+            return event
+
+        remaining = None
+        if event.recurrence_count:
+            remaining = event.recurrence_count - ordinal
+        duration = event_duration(event)
+        future = Event(
+            title=event.title,
+            description=event.description,
+            start_time=original_start,
+            end_time=original_start + duration if event.end_time else None,
+            is_all_day=event.is_all_day,
+            location=event.location,
+            household_id=event.household_id,
+            created_by_user_id=event.created_by_user_id,
+            reminder_enabled=event.reminder_enabled,
+            reminder_time_before=event.reminder_time_before,
+            attendees=list(event.attendees),
+            recurrence_frequency=event.recurrence_frequency,
+            recurrence_interval=event.recurrence_interval,
+            recurrence_count=remaining,
+            recurrence_end_date=event.recurrence_end_date,
+            recurrence_by_weekday=event.recurrence_by_weekday,
+        )
+        # Moving them keeps their original start, which the new series shares
+        for exception in list(event.exceptions):
+            if exception.original_start >= original_start:
+                future.exceptions.append(exception)
+        self._truncate_series(event, original_start)
+        touch_event(event)
+        touch_event(future)
+        self.db.add(future)
+        return future
+
+    def _validate_times(self, event: Event, context) -> None:
+        """Abort if an event has no start or ends before it starts."""
+        if event.start_time is None:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "start_time is required")
+        if event.end_time is not None and event.end_time < event.start_time:
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "end_time must not precede start_time"
+            )
+
+    def _validate_reminder(self, event: Event, context) -> None:
+        """Abort if a reminder fires after its event or too long before it."""
+        minutes = event.reminder_time_before
+        if minutes is not None and not (
+            0 <= minutes <= settings.REMINDER_MAX_LEAD_MINUTES
+        ):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT,
+                "reminder_minutes_before must be between 0 and "
+                f"{settings.REMINDER_MAX_LEAD_MINUTES}",
+            )
+
+    def _validate_exception(self, exception: EventException, context) -> None:
+        """Abort if an edited occurrence ends before it starts."""
+        if (
+            exception.start_time is not None
+            and exception.end_time is not None
+            and exception.end_time < exception.start_time
+        ):
+            context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "end_time must not precede start_time"
+            )
+
+    def _exception_occurrence(
+        self, event: Event, exception: EventException
+    ) -> Occurrence:
+        """Build the occurrence described by an exception."""
+        start = exception.start_time or exception.original_start
+        return Occurrence(
+            event_id=event.id,
+            original_start=exception.original_start,
+            start_time=start,
+            end_time=exception.end_time or start + event_duration(event),
+            title=exception.title if exception.title is not None else event.title,
+            description=(
+                exception.description
+                if exception.description is not None
+                else event.description
+            ),
+            location=(
+                exception.location if exception.location is not None else event.location
+            ),
+            is_all_day=bool(event.is_all_day),
+            is_recurring=True,
+            is_exception=True,
+        )
+
+    def _event_response(
+        self,
+        event: Event,
+        conflicts: Sequence[Conflict] = (),
+        occurrence: Optional[Occurrence] = None,
+    ) -> calendar_pb2.EventResponse:
+        """Build the response of a write, with the conflicts found, if any."""
+        return calendar_pb2.EventResponse(
+            event=self._event_to_proto(event, occurrence),
+            conflicts=[
+                calendar_pb2.EventConflict(
+                    event=self._event_to_proto(conflict.event, conflict.occurrence),
+                    occurrence_start_time=to_proto_timestamp(conflict.occurrence_start),
+                    user_ids=[str(user_id) for user_id in conflict.user_ids],
+                )
+                for conflict in conflicts
+            ],
+        )
+
+    def _event_to_proto(
+        self, event: Event, occurrence: Optional[Occurrence] = None
+    ) -> calendar_pb2.Event:
+        """Convert an Event model, or one of its occurrences, to a protobuf Event."""
+        message = calendar_pb2.Event(
+            id=str(event.id),
+            household_id=str(event.household_id or ""),
+            title=event.title or "",
+            description=event.description or "",
+            is_all_day=bool(event.is_all_day),
+            location=event.location or "",
+            is_recurring=event.is_recurring,
+            created_by=str(event.created_by_user_id or ""),
+            reminder_enabled=bool(event.reminder_enabled),
+            attendees=[str(attendee.id) for attendee in event.attendees],
+        )
+        if event.reminder_enabled:
+            message.reminder_minutes_before = int(
+                reminder_lead(event).total_seconds() // 60
+            )
+        if event.is_recurring:
+            message.recurrence_frequency = calendar_pb2.RecurrenceFrequency.Value(
+                EventFrequency(event.recurrence_frequency).name
+            )
+            message.recurrence_interval = event.recurrence_interval or 1
+            message.recurrence_count = event.recurrence_count or 0
+            message.recurrence_by_weekday.extend(
+                mask_weekdays(event.recurrence_by_weekday)
+            )
+            if event.recurrence_end_date is not None:
+                message.recurrence_end_date.CopyFrom(
+                    to_proto_timestamp(event.recurrence_end_date)
+                )
+
+        if occurrence is None:
+            start_time, end_time = event.start_time, event.end_time
+        else:
+            start_time, end_time = occurrence.start_time, occurrence.end_time
+            message.title = occurrence.title or ""
+            message.description = occurrence.description or ""
+            message.location = occurrence.location or ""
+            if occurrence.is_recurring:
+                message.original_start_time.CopyFrom(
+                    to_proto_timestamp(occurrence.original_start)
+                )
+        if start_time is not None:
+            message.start_time.CopyFrom(to_proto_timestamp(start_time))
+        if end_time is not None:
+            message.end_time.CopyFrom(to_proto_timestamp(end_time))
+        return message
@@ -0,0 +1,563 @@
+"""
+gRPC Finance Service
+
+This module implements the gRPC FinanceService defined in the protobuf files
+on top of the finance services shared with the REST API.
+
+The protobuf messages are richer than the models: transactions take the type
+of their category, categories are either income or expense, and budgets are
+monthly thresholds of one expense category.
+"""
+
+import asyncio
+import logging
+from datetime import date, datetime, time
+from typing import List, Optional, Tuple
+
+from google.protobuf import empty_pb2
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.orm import Session
+
+from api.base_service import NotFoundError, ValidationError
+from api.config import settings
+from api.generated.api.v1 import finance_pb2, finance_pb2_grpc
+from api.grpc_utils import ProtoConverter, from_proto_timestamp, to_proto_timestamp
+from api.models.finance import (
+    Budget,
+    Category,
+    Transaction,
+    TransactionStatus,
+    TransactionType,
+)
+from api.models.user import User as UserModel
+from api.schemas_main import BudgetCreate, CategoryCreate, TransactionCreate
+
+from ..batching import transaction_loader
+from ..finance import (
+    BudgetService,
+    CategoryService,
+    TransactionIngest,
+    TransactionService,
+    next_period_start,
+)
+from .base import (
+    BaseGRPCService,
+    blocking_rpc,
+    blocking_stream_rpc,
+    rpc_session,
+    run_blocking,
+)
+
+logger = logging.getLogger(__name__)
+
+# Page size of ListTransactions when the request sets none, and its maximum
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+def _to_proto_date(day: Optional[date]):
+    """Convert a date to a protobuf Timestamp at midnight."""
+    return to_proto_timestamp(datetime.combine(day, time())) if day else None
+
+
+def _from_proto_date(timestamp) -> date:
+    """Convert a protobuf Timestamp to its date."""
+    return from_proto_timestamp(timestamp).date()
+
+
+def _transaction_type(value: int) -> TransactionType:
+    """Convert a protobuf TransactionType to the model enum.
+
+    Raises:
+        ValidationError: For types the API does not support.
+    """
+    name = finance_pb2.TransactionType.Name(value)
+    if name.startswith("TRANSACTION_TYPE_"):
+        name = name[len("TRANSACTION_TYPE_") :]
+    if name not in TransactionType.__members__:
+        raise ValidationError(f"Unsupported transaction type: {name}")
+    return TransactionType[name]
+
+
+def _transaction_status(value: int) -> TransactionStatus:
+    """Convert a protobuf TransactionStatus to the model enum."""
+    name = finance_pb2.TransactionStatus.Name(value)
+    if name.startswith("TRANSACTION_STATUS_"):
+        name = name[len("TRANSACTION_STATUS_") :]
+    return TransactionStatus[name]
+
+
+def _category_type(is_income: bool, is_expense: bool) -> TransactionType:
+    """Return the type of a category from the flags of a request."""
+    if is_income == is_expense:
+        raise ValidationError("Exactly one of is_income and is_expense must be set")
+    return TransactionType.INCOME if is_income else TransactionType.EXPENSE
+
+
+def _budget_month(request) -> Tuple[int, int]:
+    """Return the month and year of a budget request, by default the current ones."""
+    if request.period not in ("", "monthly"):
+        raise ValidationError("Only monthly budgets are supported")
+    day = (
+        _from_proto_date(request.start_date)
+        if request.HasField("start_date")
+        else date.today()
+    )
+    return day.month, day.year
+
+
+class FinanceService(finance_pb2_grpc.FinanceServiceServicer, BaseGRPCService):
+    """gRPC servicer for Finance operations."""
+
+    def __init__(self, db: Optional[Session] = None):
+        """Initialize the FinanceService.
+
+        Args:
+            db: Optional SQLAlchemy session. If not provided, a new one will be created.
+        """
+        super().__init__(db)
+
+    def _scope(self, context, household_id: str = "") -> Tuple[UserModel, int]:
+        """Return the current user and the household a request may access."""
+        user = self._current_user(context)
+        return user, self._check_household(household_id, user)
+
+    # Transactions
+
+    def _transaction_create(self, request) -> TransactionCreate:
+        """Convert a TransactionCreate message to the schema."""
+        return TransactionCreate(
+            description=request.description,
+            amount=request.amount,
+            date=(
+                _from_proto_date(request.transaction_date)
+                if request.HasField("transaction_date")
+                else date.today()
+            ),
+            category_id=self._parse_id(request.category_id, "category_id"),
+        )
+
+    @blocking_rpc
+    def CreateTransaction(self, request, context):
+        """Create a transaction; its type is the type of its category."""
+        user, household_id = self._scope(context, request.household_id)
+        transaction = TransactionService(self.db, household_id).create_transaction(
+            self._transaction_create(request), user_id=user.id
+        )
+        return finance_pb2.TransactionResponse(
+            transaction=self._transaction_to_proto(transaction)
+        )
+
+    async def IngestTransactions(self, request_iterator, context):
+        """Create a stream of transactions in the current user's household.
+
+        Rows are buffered and committed in batches of ``GRPC_INGEST_BATCH_SIZE``,
+        or once ``GRPC_INGEST_FLUSH_SECONDS`` have passed since the last commit.
+        The stream is not read while a batch is written, so HTTP/2 flow control
+        holds the client back and no more than a batch of rows is buffered.
+        Invalid rows are skipped and reported; batches committed before an
+        error stay committed.
+        """
+        loop = asyncio.get_running_loop()
+        # One session serves the whole stream
+        async with rpc_session():
+            ingest = await run_blocking(
+                FinanceService._start_ingest, self, None, context
+            )
+            batch: List[Tuple[int, finance_pb2.TransactionCreate]] = []
+            flushed_at = loop.time()
+            index = 0
+            async for request in request_iterator:
+                batch.append((index, request))
+                index += 1
+                if (
+                    len(batch) >= settings.GRPC_INGEST_BATCH_SIZE
+                    or loop.time() - flushed_at >= settings.GRPC_INGEST_FLUSH_SECONDS
+                ):
+                    await run_blocking(
+                        FinanceService._ingest_batch, self, (ingest, batch), context
+                    )
+                    batch = []
+                    flushed_at = loop.time()
+            if batch:
+                await run_blocking(
+                    FinanceService._ingest_batch, self, (ingest, batch), context
+                )
+            await run_blocking(FinanceService._finish_ingest, self, ingest, context)
+        return finance_pb2.IngestTransactionsResponse(
+            received=ingest.received,
+            created=ingest.created,
+            rejected=ingest.rejected,
+            batches=ingest.batches,
+            errors=[
+                finance_pb2.IngestError(index=row, message=message)
+                for row, message in sorted(ingest.errors)
+            ],
+        )
+
+    def _start_ingest(self, request, context) -> TransactionIngest:
+        """Start ingesting transactions into the current user's household."""
+        user, household_id = self._scope(context)
+        return TransactionIngest(
+            self.db, household_id, user.id, settings.GRPC_INGEST_MAX_ERRORS
+        )
+
+    def _ingest_batch(self, request, context) -> None:
+        """Validate and create a batch of streamed TransactionCreate messages."""
+        ingest, messages = request
+        rows = []
+        for index, message in messages:
+            try:
+                if message.household_id and message.household_id != str(
+                    ingest.household_id
+                ):
+                    raise ValidationError(
+                        f"Transactions can only be ingested into household "
+                        f"{ingest.household_id}"
+                    )
+                rows.append((index, self._transaction_create(message)))
+            except ValidationError as e:
+                ingest.reject(index, e.details)
+            except PydanticValidationError as e:
+                ingest.reject(
+                    index,
+                    "; ".join(
+                        f"{'.'.join(map(str, error['loc']))}: {error['msg']}"
+                        for error in e.errors()
+                    ),
+                )
+            except (ValueError, OverflowError) as e:
+                # Timestamps out of the range of dates
+                ingest.reject(index, f"Invalid transaction_date: {e}")
+        ingest.add_batch(rows)
+
+    def _finish_ingest(self, request, context) -> None:
+        """Fold the ingested transactions into the recurring series."""
+        request.finish()
+
+    @blocking_rpc
+    def GetTransaction(self, request, context):
+        """Get a transaction of the current user's household."""
+        _, household_id = self._scope(context)
+        transaction_id = self._parse_id(request.id)
+        # Concurrent lookups are merged into one query, across households
+        transaction = transaction_loader.load(transaction_id)
+        if transaction is None or transaction.household_id != household_id:
+            raise NotFoundError(TransactionService.resource_name, transaction_id)
+        return finance_pb2.TransactionResponse(
+            transaction=self._transaction_to_proto(transaction)
+        )
+
+    @blocking_rpc
+    def BatchGetTransactions(self, request, context):
+        """Get transactions of the household by ID with one query."""
+        _, household_id = self._scope(context)
+        ids = self._parse_ids(request.ids)
+        found = TransactionService(self.db, household_id).get_many(ids)
+        return finance_pb2.BatchGetTransactionsResponse(
+            transactions=[
+                self._transaction_to_proto(found[id]) for id in ids if id in found
+            ],
+            missing_ids=[str(id) for id in ids if id not in found],
+        )
+
+    @blocking_rpc
+    def ListTransactions(self, request, context):
+        """List a page of the household's transactions matching a filter.
+
+        Pages are numbered from 1; transactions are listed newest first.
+        """
+        _, household_id = self._scope(context, request.household_id)
+        service = TransactionService(self.db, household_id)
+        query = service.filter(
+            category_id=(
+                self._parse_id(request.category_id, "category_id")
+                if request.HasField("category_id")
+                else None
+            ),
+            type=_transaction_type(request.type) if request.HasField("type") else None,
+            status=(
+                _transaction_status(request.status)
+                if request.HasField("status")
+                else None
+            ),
+            start_date=(
+                _from_proto_date(request.start_date)
+                if request.HasField("start_date")
+                else None
+            ),
+            end_date=(
+                _from_proto_date(request.end_date)
+                if request.HasField("end_date")
+                else None
+            ),
+        )
+        page_size = min(request.page_size or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+        page = max(request.page, 1)
+        total, transactions = service.page(query, (page - 1) * page_size, page_size)
+        return finance_pb2.TransactionListResponse(
+            transactions=[self._transaction_to_proto(t) for t in transactions],
+            total=total,
+        )
+
+    @blocking_rpc
+    def UpdateTransaction(self, request, context):
+        """Update a transaction; a new category also sets its type."""
+        _, household_id = self._scope(context)
+        transaction = TransactionService(self.db, household_id).update_transaction(
+            self._parse_id(request.id),
+            category_id=(
+                self._parse_id(request.category_id, "category_id")
+                if request.HasField("category_id")
+                else None
+            ),
+            description=(
+                request.description if request.HasField("description") else None
+            ),
+            amount=request.amount if request.HasField("amount") else None,
+            status=(
+                _transaction_status(request.status)
+                if request.HasField("status")
+                else None
+            ),
+            transaction_date=(
+                _from_proto_date(request.transaction_date)
+                if request.HasField("transaction_date")
+                else None
+            ),
+        )
+        return finance_pb2.TransactionResponse(
+            transaction=self._transaction_to_proto(transaction)
+        )
+
+    @blocking_rpc
+    def DeleteTransaction(self, request, context):
+        """Delete a transaction of the current user's household."""
+        _, household_id = self._scope(context)
+        TransactionService(self.db, household_id).delete_transaction(
+            self._parse_id(request.id)
+        )
+        return empty_pb2.Empty()
+
+    # Categories
+
+    @blocking_rpc
+    def CreateCategory(self, request, context):
+        """Create an income or expense category."""
+        _, household_id = self._scope(context, request.household_id)
+        category = CategoryService(self.db, household_id).create(
+            CategoryCreate(
+                name=request.name,
+                type=_category_type(request.is_income, request.is_expense),
+            )
+        )
+        return finance_pb2.CategoryResponse(category=self._category_to_proto(category))
+
+    @blocking_rpc
+    def GetCategory(self, request, context):
+        """Get a category of the current user's household."""
+        _, household_id = self._scope(context)
+        category = CategoryService(self.db, household_id).require(
+            self._parse_id(request.id)
+        )
+        return finance_pb2.CategoryResponse(category=self._category_to_proto(category))
+
+    @blocking_rpc
+    def ListCategories(self, request, context):
+        """List the categories of a household."""
+        _, household_id = self._scope(context, request.household_id)
+        categories = CategoryService(self.db, household_id).list()
+        return finance_pb2.CategoryListResponse(
+            categories=[self._category_to_proto(c) for c in categories],
+            total=len(categories),
+        )
+
+    @blocking_rpc
+    def UpdateCategory(self, request, context):
+        """Rename a category, or change its type if neither flag is left unset."""
+        _, household_id = self._scope(context, request.household_id)
+        type = None
+        if request.is_income or request.is_expense:
+            type = _category_type(request.is_income, request.is_expense)
+        category = CategoryService(self.db, household_id).update_category(
+            self._parse_id(request.id), name=request.name or None, type=type
+        )
+        return finance_pb2.CategoryResponse(category=self._category_to_proto(category))
+
+    @blocking_rpc
+    def DeleteCategory(self, request, context):
+        """Delete a category without transactions or budget."""
+        _, household_id = self._scope(context)
+        CategoryService(self.db, household_id).delete_category(
+            self._parse_id(request.id)
+        )
+        return empty_pb2.Empty()
+
+    # Budgets
+
+    @blocking_rpc
+    def CreateBudget(self, request, context):
+        """Set the monthly budget of an expense category.
+
+        The budget is for the month of ``start_date``, by default the current
+        one; setting it again replaces the amount.
+        """
+        _, household_id = self._scope(context, request.household_id)
+        month, year = _budget_month(request)
+        budget = BudgetService(self.db, household_id).set_budget(
+            BudgetCreate(
+                category_id=self._parse_id(request.category_id, "category_id"),
+                threshold=request.amount,
+                month=month,
+                year=year,
+            )
+        )
+        return finance_pb2.BudgetResponse(budget=self._budget_to_proto(budget))
+
+    @blocking_rpc
+    def GetBudget(self, request, context):
+        """Get a budget of the current user's household."""
+        _, household_id = self._scope(context)
+        budget = BudgetService(self.db, household_id).require(
+            self._parse_id(request.id)
+        )
+        return finance_pb2.BudgetResponse(budget=self._budget_to_proto(budget))
+
+    @blocking_rpc
+    def ListBudgets(self, request, context):
+        """List the budgets of a household."""
+        _, household_id = self._scope(context, request.household_id)
+        budgets = BudgetService(self.db, household_id).list()
+        return finance_pb2.BudgetListResponse(
+            budgets=[self._budget_to_proto(b) for b in budgets], total=len(budgets)
+        )
+
+    @blocking_rpc
+    def UpdateBudget(self, request, context):
+        """Update the amount of a budget, or move it to the month of start_date."""
+        _, household_id = self._scope(context, request.household_id)
+        month = year = None
+        if request.HasField("start_date"):
+            month, year = _budget_month(request)
+        budget = BudgetService(self.db, household_id).update_budget(
+            self._parse_id(request.id),
+            threshold=request.amount or None,
+            month=month,
+            year=year,
+        )
+        return finance_pb2.BudgetResponse(budget=self._budget_to_proto(budget))
+
+    @blocking_rpc
+    def DeleteBudget(self, request, context):
+        """Delete a budget of the current user's household."""
+        _, household_id = self._scope(context)
+        BudgetService(self.db, household_id).delete_budget(self._parse_id(request.id))
+        return empty_pb2.Empty()
+
+    # Reports
+
+    @blocking_stream_rpc
+    def GetSpendingByCategory(self, request, context):
+        """Stream the expenses of each category, largest first."""
+        _, household_id = self._scope(context, request.household_id)
+        spending = TransactionService(self.db, household_id).spending_by_category()
+        total = sum(amount for _, amount in spending)
+        for category, amount in spending:
+            yield finance_pb2.CategorySpending(
+                category_id=str(category.id),
+                category_name=category.name,
+                amount=amount,
+                percentage=amount / total * 100 if total else 0.0,
+            )
+
+    @blocking_stream_rpc
+    def GetSpendingOverTime(self, request, context):
+        """Stream the expenses of every period of a date range."""
+        _, household_id = self._scope(context, request.household_id)
+        if not request.HasField("start_date") or not request.HasField("end_date"):
+            raise ValidationError("start_date and end_date are required")
+        period = request.period or "monthly"
+        rows = TransactionService(self.db, household_id).spending_over_time(
+            period,
+            _from_proto_date(request.start_date),
+            _from_proto_date(request.end_date),
+            category_id=(
+                self._parse_id(request.category_id, "category_id")
+                if request.HasField("category_id")
+                else None
+            ),
+        )
+        for start, end, amount in rows:
+            yield finance_pb2.SpendingOverTimeResponse(
+                period=period,
+                start_date=_to_proto_date(start),
+                end_date=_to_proto_date(end),
+                amount=amount,
+            )
+
+    @blocking_rpc
+    def GetBudgetSummary(self, request, context):
+        """Summarize the household's budgets of the current month."""
+        _, household_id = self._scope(context, request.household_id)
+        today = date.today()
+        summaries = []
+        for budget, spent in BudgetService(self.db, household_id).summary(
+            today.month, today.year
+        ):
+            summaries.append(
+                finance_pb2.BudgetSummary(
+                    budget_id=str(budget.id),
+                    name=budget.category.name,
+                    category_id=str(budget.category_id),
+                    category_name=budget.category.name,
+                    budgeted_amount=budget.threshold,
+                    spent_amount=spent,
+                    remaining_amount=budget.threshold - spent,
+                    utilization_percentage=(
+                        spent / budget.threshold * 100 if budget.threshold else 0.0
+                    ),
+                )
+            )
+        total_budget = sum(summary.budgeted_amount for summary in summaries)
+        total_spent = sum(summary.spent_amount for summary in summaries)
+        return finance_pb2.BudgetSummaryResponse(
+            budgets=summaries,
+            total_budget=total_budget,
+            total_spent=total_spent,
+            remaining_budget=total_budget - total_spent,
+            utilization_percentage=(
+                total_spent / total_budget * 100 if total_budget else 0.0
+            ),
+        )
+
+    _transaction_to_proto = staticmethod(
+        ProtoConverter(
+            Transaction,
+            finance_pb2.Transaction,
+            transaction_date="date",
+            created_by="user_id",
+        )
+    )
+
+    _category_to_proto = staticmethod(
+        ProtoConverter(
+            Category,
+            finance_pb2.Category,
+            is_income=lambda category: category.type == TransactionType.INCOME,
+            is_expense=lambda category: category.type == TransactionType.EXPENSE,
+        )
+    )
+
+    def _budget_to_proto(self, budget: Budget) -> finance_pb2.Budget:
+        """Convert a Budget model to a protobuf Budget message for its month."""
+        start = date(budget.year, budget.month, 1)
+        return finance_pb2.Budget(
+            id=str(budget.id),
+            household_id=str(budget.household_id),
+            category_id=str(budget.category_id),
+            name=budget.category.name if budget.category else "",
+            amount=budget.threshold or 0.0,
+            period="monthly",
+            start_date=_to_proto_date(start),
+            end_date=_to_proto_date(next_period_start(start, "monthly")),
+        )
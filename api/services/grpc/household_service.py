@@ -0,0 +1,156 @@
+"""
+gRPC Household Service
+
+This module implements the gRPC HouseholdService defined in the protobuf files
+on top of the household service shared with the REST API.
+"""
+
+import logging
+from typing import Optional
+
+from google.protobuf import empty_pb2
+from sqlalchemy.orm import Session
+
+from api.generated.api.v1 import household_pb2, household_pb2_grpc
+from api.grpc_utils import ProtoConverter
+from api.models.household import Household
+from api.models.user import User as UserModel
+from api.models.user import UserRole
+from api.schemas_main import HouseholdCreate
+
+from .. import households
+from .base import BaseGRPCService, blocking_rpc
+from .user_service import user_to_proto
+
+logger = logging.getLogger(__name__)
+
+
+class HouseholdService(household_pb2_grpc.HouseholdServiceServicer, BaseGRPCService):
+    """gRPC servicer for Household operations."""
+
+    def __init__(self, db: Optional[Session] = None):
+        """Initialize the HouseholdService.
+
+        Args:
+            db: Optional SQLAlchemy session. If not provided, a new one will be created.
+        """
+        super().__init__(db)
+
+    @property
+    def households(self) -> households.HouseholdService:
+        """The household service of the servicer's session."""
+        return households.HouseholdService(self.db)
+
+    @blocking_rpc
+    def CreateHousehold(self, request, context):
+        """Create a household administered by the current user."""
+        user = self._current_user(context)
+        household = self.households.create_for_user(
+            HouseholdCreate(name=request.name), user
+        )
+        return household_pb2.HouseholdResponse(
+            household=self._household_to_proto(household)
+        )
+
+    @blocking_rpc
+    def GetHousehold(self, request, context):
+        """Get the household of the current user."""
+        user = self._current_user(context)
+        household_id = self._check_household(request.id, user)
+        return household_pb2.HouseholdResponse(
+            household=self._household_to_proto(self.households.require(household_id))
+        )
+
+    @blocking_rpc
+    def ListHouseholds(self, request, context):
+        """List the households of the current user, at most one."""
+        user = self._current_user(context)
+        found = []
+        if user.household_id is not None:
+            found.append(self.households.require(user.household_id))
+        return household_pb2.HouseholdListResponse(
+            households=[self._household_to_proto(household) for household in found],
+            total=len(found),
+        )
+
+    @blocking_rpc
+    def UpdateHousehold(self, request, context):
+        """Rename a household administered by the current user."""
+        user = self._current_user(context)
+        household_id = self._check_household(request.id, user)
+        if request.HasField("name"):
+            household = self.households.rename(household_id, request.name, user)
+        else:
+            household = self.households.require(household_id)
+        return household_pb2.HouseholdResponse(
+            household=self._household_to_proto(household)
+        )
+
+    @blocking_rpc
+    def DeleteHousehold(self, request, context):
+        """Delete an empty household administered by the current user."""
+        user = self._current_user(context)
+        household_id = self._check_household(request.id, user)
+        self.households.delete_household(household_id, user)
+        return empty_pb2.Empty()
+
+    @blocking_rpc
+    def AddHouseholdMember(self, request, context):
+        """Add a user to a household administered by the current user."""
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+        member = self.households.add_member(
+            household_id,
+            self._parse_id(request.user_id, "user_id"),
+            households.parse_role(request.role or "member"),
+            user,
+        )
+        return self._member_to_proto(member)
+
+    @blocking_rpc
+    def UpdateHouseholdMemberRole(self, request, context):
+        """Change the role of a member of a household."""
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+        member = self.households.set_member_role(
+            household_id,
+            self._parse_id(request.user_id, "user_id"),
+            households.parse_role(request.role),
+            user,
+        )
+        return self._member_to_proto(member)
+
+    @blocking_rpc
+    def RemoveHouseholdMember(self, request, context):
+        """Remove a member from a household, or leave it."""
+        user = self._current_user(context)
+        household_id = self._check_household(request.household_id, user)
+        self.households.remove_member(
+            household_id, self._parse_id(request.user_id, "user_id"), user
+        )
+        return empty_pb2.Empty()
+
+    @blocking_rpc
+    def ListHouseholdMembers(self, request, context):
+        """List the members of the current user's household."""
+        user = self._current_user(context)
+        household_id = self._check_household(request.id, user)
+        members = self.households.members(household_id)
+        return household_pb2.HouseholdMemberListResponse(
+            members=[self._member_to_proto(member) for member in members],
+            total=len(members),
+        )
+
+    _household_to_proto = staticmethod(
+        ProtoConverter(Household, household_pb2.Household)
+    )
+
+    _member_to_proto = staticmethod(
+        ProtoConverter(
+            UserModel,
+            household_pb2.HouseholdMember,
+            user_id="id",
+            role=lambda member: UserRole(member.role).value,
+            user=user_to_proto,
+        )
+    )
@@ -12,20 +12,32 @@ import grpc
 from google.protobuf import empty_pb2
 from sqlalchemy.orm import Session
 
-from api.core.security import create_access_token, get_password_hash, verify_password
-from api.db.session import get_db
+from api.base_service import BaseService
 
 # Import generated protobuf code
 from api.generated.api.v1 import user_pb2, user_pb2_grpc
+from api.grpc_utils import ProtoConverter
+from api.models.database import get_db
 from api.models.user import User as UserModel
+from api.models.user import UserRole
 from api.schemas.user import User as UserSchema
 from api.schemas.user import UserCreate, UserUpdate
+from api.security import create_access_token, get_password_hash, verify_password
 
-from .base import BaseGRPCService
+from ..batching import user_loader
+from .base import BaseGRPCService, RpcAborted, blocking_rpc
 
 logger = logging.getLogger(__name__)
 
 
+# Household admins are reported as superusers
+user_to_proto = ProtoConverter(
+    UserModel,
+    user_pb2.User,
+    is_superuser=lambda user: user.role == UserRole.ADMIN,
+)
+
+
 class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
     """gRPC servicer for User operations."""
 
@@ -37,6 +49,7 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
         """
         super().__init__(db)
 
+    @blocking_rpc
     def CreateUser(self, request, context):
         """Create a new user.
 
@@ -98,18 +111,37 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
             logger.exception("Error in CreateUser")
             context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    @blocking_rpc
     def GetUser(self, request, context):
         """Get a user by ID.
 
         Implements the GetUser RPC method.
         """
         try:
-            user = self._get_user_by_id(request.id, context)
+            # Concurrent lookups are merged into one query
+            user = user_loader.load(int(request.id)) if request.id.isdigit() else None
+            if not user:
+                context.abort(
+                    grpc.StatusCode.NOT_FOUND, f"User with ID {request.id} not found"
+                )
             return user_pb2.UserResponse(user=self._user_to_proto(user))
+        except RpcAborted:
+            raise
         except Exception as e:
             logger.exception("Error in GetUser")
             context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    @blocking_rpc
+    def BatchGetUsers(self, request, context):
+        """Get users by ID with one query, in the order requested."""
+        ids = self._parse_ids(request.ids)
+        found = BaseService(UserModel, self.db).get_many(ids)
+        return user_pb2.BatchGetUsersResponse(
+            users=[self._user_to_proto(found[id]) for id in ids if id in found],
+            missing_ids=[str(id) for id in ids if id not in found],
+        )
+
+    @blocking_rpc
     def GetUserByEmail(self, request, context):
         """Get a user by email.
 
@@ -134,6 +166,7 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
             logger.exception("Error in GetUserByEmail")
             context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    @blocking_rpc
     def ListUsers(self, request, context):
         """List all users.
 
@@ -160,6 +193,7 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
             logger.exception("Error in ListUsers")
             context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    @blocking_rpc
     def UpdateUser(self, request, context):
         """Update a user.
 
@@ -228,6 +262,7 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
             logger.exception("Error in UpdateUser")
             context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    @blocking_rpc
     def DeleteUser(self, request, context):
         """Delete a user.
 
@@ -270,6 +305,7 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
             logger.exception("Error in DeleteUser")
             context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    @blocking_rpc
     def Authenticate(self, request, context):
         """Authenticate a user and return an access token.
 
@@ -322,6 +358,7 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
             logger.exception("Error in Authenticate")
             context.abort(grpc.StatusCode.INTERNAL, str(e))
 
+    @blocking_rpc
     def VerifyToken(self, request, context):
         """Verify an access token and return the associated user.
 
@@ -365,23 +402,4 @@ class UserService(user_pb2_grpc.UserServiceServicer, BaseGRPCService):
 
     def _user_to_proto(self, user: UserModel) -> user_pb2.User:
         """Convert a User model to a protobuf User message."""
-        return user_pb2.User(
-            id=str(user.id),
-            email=user.email,
-            full_name=user.full_name,
-            is_active=user.is_active,
-            is_superuser=user.is_superuser,
-            created_at=self._datetime_to_timestamp(user.created_at),
-            updated_at=self._datetime_to_timestamp(user.updated_at),
-        )
-
-    @staticmethod
-    def _datetime_to_timestamp(dt):
-        """Convert a datetime to a protobuf Timestamp."""
-        if dt is None:
-            return None
-        from google.protobuf.timestamp_pb2 import Timestamp
-
-        timestamp = Timestamp()
-        timestamp.FromDatetime(dt)
-        return timestamp
+        return user_to_proto(user)
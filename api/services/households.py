@@ -0,0 +1,242 @@
+"""
+Households
+
+This module implements household management for the REST API and the gRPC
+HouseholdService. A user belongs to at most one household, recorded as
+``User.household_id``, and ``User.role`` says whether they administer it.
+"""
+
+import logging
+from typing import List, Optional
+
+from sqlalchemy.orm import Session
+
+from api.base_service import (
+    AlreadyExistsError,
+    BaseService,
+    FailedPreconditionError,
+    NotFoundError,
+    PermissionDeniedError,
+    ValidationError,
+)
+from api.models.calendar import Event
+from api.models.finance import Category, Transaction
+from api.models.household import Household
+from api.models.user import User, UserRole
+from api.schemas_main import HouseholdCreate, HouseholdResponse
+
+logger = logging.getLogger(__name__)
+
+
+def household_of(user: User, household_id: Optional[int] = None) -> int:
+    """Return the household of a user, checking a requested household.
+
+    Args:
+        user: The acting user.
+        household_id: The household a request names, if any.
+
+    Raises:
+        FailedPreconditionError: If the user does not belong to a household.
+        PermissionDeniedError: If the requested household is not the user's.
+    """
+    if user.household_id is None:
+        raise FailedPreconditionError("User does not belong to a household")
+    if household_id is not None and household_id != user.household_id:
+        raise PermissionDeniedError("Not authorized to access this household")
+    return user.household_id
+
+
+def require_admin(user: User, household_id: int) -> None:
+    """Check that a user administers a household.
+
+    Raises:
+        PermissionDeniedError: If the user is not an admin of the household.
+    """
+    household_of(user, household_id)
+    if user.role != UserRole.ADMIN:
+        raise PermissionDeniedError("Only household admins can do this")
+
+
+def parse_role(role: str) -> UserRole:
+    """Return the member role named by a request.
+
+    Raises:
+        ValidationError: If the role is unknown.
+    """
+    try:
+        return UserRole(role.lower())
+    except ValueError:
+        raise ValidationError(f"Unknown role: {role}")
+
+
+class HouseholdService(
+    BaseService[Household, HouseholdCreate, HouseholdCreate, HouseholdResponse]
+):
+    """Service for households and their members."""
+
+    def __init__(self, db_session: Session):
+        """Initialize with a database session."""
+        super().__init__(Household, db_session)
+
+    def require(self, household_id: int) -> Household:
+        """Get a household by ID.
+
+        Raises:
+            NotFoundError: If there is no such household.
+        """
+        household = self.get(household_id)
+        if household is None:
+            raise NotFoundError("Household", household_id)
+        return household
+
+    def get_by_name(self, name: str) -> Optional[Household]:
+        """Get a household by its unique name."""
+        return self.db.query(Household).filter(Household.name == name).first()
+
+    def create_for_user(self, household_in: HouseholdCreate, user: User) -> Household:
+        """Create a household administered by its creator.
+
+        Raises:
+            ValidationError: If the user already belongs to a household.
+            AlreadyExistsError: If the name is taken.
+        """
+        if user.household_id is not None:
+            raise ValidationError("User already belongs to a household")
+        self._check_name(household_in.name)
+        # The acting user may have been loaded by another session
+        user = self._user(user.id)
+
+        household = Household(name=household_in.name, created_by=user.id)
+        self.db.add(household)
+        self.db.flush()
+        user.household_id = household.id
+        user.role = UserRole.ADMIN
+        self.db.commit()
+        self.db.refresh(household)
+        return household
+
+    def rename(self, household_id: int, name: str, user: User) -> Household:
+        """Rename a household administered by the user."""
+        require_admin(user, household_id)
+        household = self.require(household_id)
+        if name != household.name:
+            self._check_name(name)
+            household.name = name
+            self.db.commit()
+            self.db.refresh(household)
+        return household
+
+    def delete_household(self, household_id: int, user: User) -> None:
+        """Delete an empty household administered by the user.
+
+        Raises:
+            FailedPreconditionError: If other members remain or the household
+                still has categories, transactions or events.
+        """
+        require_admin(user, household_id)
+        household = self.require(household_id)
+        if any(member.id != user.id for member in self.members(household_id)):
+            raise FailedPreconditionError(
+                "Remove the other members before deleting the household"
+            )
+        for model in (Category, Transaction, Event):
+            if (
+                self.db.query(model.id)
+                .filter(model.household_id == household_id)
+                .first()
+            ):
+                raise FailedPreconditionError("Household still has data")
+        user = self._user(user.id)
+        user.household_id = None
+        user.role = UserRole.MEMBER
+        self.db.delete(household)
+        self.db.commit()
+
+    def members(self, household_id: int) -> List[User]:
+        """Return the members of a household."""
+        return (
+            self.db.query(User)
+            .filter(User.household_id == household_id)
+            .order_by(User.id)
+            .all()
+        )
+
+    def add_member(
+        self, household_id: int, user_id: int, role: UserRole, by: User
+    ) -> User:
+        """Add a user without a household to a household the actor administers.
+
+        Raises:
+            FailedPreconditionError: If the user belongs to another household.
+        """
+        require_admin(by, household_id)
+        member = self._user(user_id)
+        if member.household_id == household_id:
+            raise AlreadyExistsError("Member", "user_id", user_id)
+        if member.household_id is not None:
+            raise FailedPreconditionError("User already belongs to a household")
+        member.household_id = household_id
+        member.role = role
+        self.db.commit()
+        self.db.refresh(member)
+        return member
+
+    def set_member_role(
+        self, household_id: int, user_id: int, role: UserRole, by: User
+    ) -> User:
+        """Change the role of a member of a household the actor administers."""
+        require_admin(by, household_id)
+        member = self._member(household_id, user_id)
+        if role != UserRole.ADMIN:
+            self._check_other_admin(household_id, member)
+        member.role = role
+        self.db.commit()
+        self.db.refresh(member)
+        return member
+
+    def remove_member(self, household_id: int, user_id: int, by: User) -> None:
+        """Remove a member from a household.
+
+        Admins can remove anyone and members themselves, as long as an admin
+        remains.
+        """
+        if by.id != user_id:
+            require_admin(by, household_id)
+        member = self._member(household_id, user_id)
+        self._check_other_admin(household_id, member)
+        member.household_id = None
+        member.role = UserRole.MEMBER
+        self.db.commit()
+
+    def _check_name(self, name: str) -> None:
+        """Check that no household has a name."""
+        if self.get_by_name(name) is not None:
+            raise AlreadyExistsError(
+                "Household", "name", name, details="Household name already exists"
+            )
+
+    def _user(self, user_id: int) -> User:
+        """Get a user by ID."""
+        user = self.db.get(User, user_id)
+        if user is None:
+            raise NotFoundError("User", user_id)
+        return user
+
+    def _member(self, household_id: int, user_id: int) -> User:
+        """Get a member of a household by user ID."""
+        member = self._user(user_id)
+        if member.household_id != household_id:
+            raise NotFoundError("Member", user_id)
+        return member
+
+    def _check_other_admin(self, household_id: int, member: User) -> None:
+        """Check that a household keeps an admin when a member stops being one."""
+        if member.role != UserRole.ADMIN:
+            return
+        admins = (
+            self.db.query(User.id)
+            .filter(User.household_id == household_id, User.role == UserRole.ADMIN)
+            .count()
+        )
+        if admins <= 1:
+            raise FailedPreconditionError("A household needs at least one admin")
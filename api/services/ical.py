@@ -0,0 +1,335 @@
+"""
+Calendar iCalendar Feed
+
+This module serializes a household calendar as an iCalendar (RFC 5545) feed
+for subscribing calendar apps. Series are written as a single VEVENT carrying
+an RRULE built from the stored rule, so the feed size depends on the number of
+events rather than on the number of occurrences. Cancelled instances become
+EXDATEs and edited instances separate VEVENTs with a RECURRENCE-ID.
+
+Events are read in chunks by ID and written as they are read, so the whole
+calendar is never held in memory. The feed's ETag is derived from the household's
+calendar version, which every event write bumps.
+"""
+
+import logging
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from api.models.calendar import Event, EventException, EventFrequency
+
+from .event_recurrence import RecurrenceRule, event_duration, mask_weekdays
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_ID = "-//Life Manager//Household Calendar//EN"
+MEDIA_TYPE = "text/calendar"  # Served as UTF-8
+
+# Events read per query, and written to the response as one chunk
+FEED_CHUNK_SIZE = 200
+
+# Content lines are folded after this many octets, excluding the CRLF
+_LINE_OCTETS = 75
+
+# RFC 5545 weekday codes, indexed like ``recurrence_by_weekday`` (0=Sunday)
+_WEEKDAYS = ("SU", "MO", "TU", "WE", "TH", "FR", "SA")
+
+
+def calendar_etag(household_id: int, version: int) -> str:
+    """Return the ETag of a household feed at a calendar version.
+
+    The ETag is weak because DTSTAMP changes between renderings of the same
+    version.
+    """
+    return f'W/"calendar-{household_id}-{version}"'
+
+
+def _opaque(etag: str) -> str:
+    """Strip the weakness indicator of an ETag."""
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag, comparing weakly."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque(etag)
+    return any(
+        _opaque(candidate.strip()) == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def escape_text(value: str) -> str:
+    """Escape a TEXT property value."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def fold(line: str) -> str:
+    """Fold a content line into CRLF-terminated lines of at most 75 octets.
+
+    Multi-octet UTF-8 characters are never split.
+    """
+    encoded = line.encode("utf-8")
+    if len(encoded) <= _LINE_OCTETS:
+        return line + "\r\n"
+    parts = []
+    start = 0
+    limit = _LINE_OCTETS
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Back off to the start of a character
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode("utf-8"))
+        start = end
+        limit = _LINE_OCTETS - 1  # Continuation lines start with a space
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def format_datetime(value: datetime) -> str:
+    """Format a naive UTC datetime as an RFC 5545 UTC DATE-TIME."""
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def format_date(value: date) -> str:
+    """Format a date as an RFC 5545 DATE."""
+    return value.strftime("%Y%m%d")
+
+
+def _time_property(name: str, value: datetime, all_day: bool) -> str:
+    """Format a DATE or DATE-TIME property such as DTSTART."""
+    if all_day:
+        return f"{name};VALUE=DATE:{format_date(value.date())}"
+    return f"{name}:{format_datetime(value)}"
+
+
+def _all_day_end(start: datetime, end: datetime) -> date:
+    """Return the exclusive end date of an all-day instance."""
+    last = (
+        end.date() if end.time() == datetime.min.time() else end.date() + timedelta(1)
+    )
+    return max(last, start.date() + timedelta(days=1))
+
+
+def event_uid(event: Event) -> str:
+    """Return the iCalendar UID of an event, keeping the UID it was imported with."""
+    return event.uid or f"event-{event.id}@life-manager"
+
+
+def recurrence_rule(event: Event) -> Optional[str]:
+    """Build the RRULE value of a series, or None for a single event.
+
+    Month-based rules that start past the 28th are clamped to the end of
+    shorter months here, which RFC 5545 expresses as the last of the candidate
+    month days (BYSETPOS=-1).
+    """
+    rule = RecurrenceRule.from_event(event)
+    if rule is None:
+        return None
+    parts = [f"FREQ={rule.frequency.name}"]
+    if rule.interval > 1:
+        parts.append(f"INTERVAL={rule.interval}")
+
+    if rule.frequency in (EventFrequency.DAILY, EventFrequency.WEEKLY):
+        if rule.by_weekday:
+            days = ",".join(_WEEKDAYS[day] for day in mask_weekdays(rule.by_weekday))
+            parts.append(f"BYDAY={days}")
+            if rule.frequency == EventFrequency.WEEKLY:
+                parts.append("WKST=SU")  # Weeks are anchored on Sunday
+    elif rule.start.day > 28:
+        if rule.frequency == EventFrequency.YEARLY:
+            parts.append(f"BYMONTH={rule.start.month}")
+        days = ",".join(str(day) for day in range(28, rule.start.day + 1))
+        parts.append(f"BYMONTHDAY={days};BYSETPOS=-1")
+
+    # RFC 5545 allows only one of COUNT and UNTIL; keep the one ending first
+    last_counted = rule.nth_start(rule.count - 1) if rule.count is not None else None
+    if rule.count is not None and (
+        rule.until is None or last_counted is None or last_counted <= rule.until
+    ):
+        parts.append(f"COUNT={rule.count}")
+    elif rule.until is not None:
+        if event.is_all_day:
+            parts.append(f"UNTIL={format_date(rule.until.date())}")
+        else:
+            parts.append(f"UNTIL={format_datetime(rule.until)}")
+    return ";".join(parts)
+
+
+def _component(
+    event: Event,
+    stamp: datetime,
+    start: datetime,
+    end: datetime,
+    title: Optional[str],
+    description: Optional[str],
+    location: Optional[str],
+) -> List[str]:
+    """Return the properties shared by series, single and edited VEVENTs."""
+    all_day = bool(event.is_all_day)
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:{event_uid(event)}",
+        f"DTSTAMP:{format_datetime(stamp)}",
+        f"SEQUENCE:{event.sequence or 0}",
+        _time_property("DTSTART", start, all_day),
+    ]
+    if all_day:
+        lines.append(f"DTEND;VALUE=DATE:{format_date(_all_day_end(start, end))}")
+    elif end > start:
+        lines.append(f"DTEND:{format_datetime(end)}")
+    lines.append(f"SUMMARY:{escape_text(title or '')}")
+    if description:
+        lines.append(f"DESCRIPTION:{escape_text(description)}")
+    if location:
+        lines.append(f"LOCATION:{escape_text(location)}")
+    return lines
+
+
+def _exception_component(
+    event: Event, rule: RecurrenceRule, exception: EventException, stamp: datetime
+) -> List[str]:
+    """Return the VEVENT overriding an edited instance of a series."""
+    start = exception.start_time or exception.original_start
+    lines = _component(
+        event,
+        stamp,
+        start,
+        exception.end_time or start + rule.duration,
+        exception.title if exception.title is not None else event.title,
+        (
+            exception.description
+            if exception.description is not None
+            else event.description
+        ),
+        exception.location if exception.location is not None else event.location,
+    )
+    lines.insert(
+        4,
+        _time_property(
+            "RECURRENCE-ID", exception.original_start, bool(event.is_all_day)
+        ),
+    )
+    lines.append("END:VEVENT")
+    return lines
+
+
+def event_lines(event: Event, stamp: datetime) -> List[str]:
+    """Return the unfolded content lines of an event's VEVENTs.
+
+    Args:
+        event: The event, with its exceptions loaded.
+        stamp: DTSTAMP of the feed.
+    """
+    if event.start_time is None:
+        return []
+    rule = RecurrenceRule.from_event(event)
+    if rule is None:
+        lines = _component(
+            event,
+            stamp,
+            event.start_time,
+            event.start_time + event_duration(event),
+            event.title,
+            event.description,
+            event.location,
+        )
+        lines.append("END:VEVENT")
+        return lines
+
+    # The stored start may not match the rule, e.g. a weekday outside BYDAY
+    first = rule.nth_start(0) or rule.start
+    lines = _component(
+        event,
+        stamp,
+        first,
+        first + rule.duration,
+        event.title,
+        event.description,
+        event.location,
+    )
+    lines.append(f"RRULE:{recurrence_rule(event)}")
+    # Exceptions left behind by a rule change no longer match an instance
+    exceptions = [
+        exception
+        for exception in sorted(
+            event.exceptions, key=lambda exception: exception.original_start
+        )
+        if rule.includes(exception.original_start)
+    ]
+    all_day = bool(event.is_all_day)
+    for exception in exceptions:
+        if exception.is_cancelled:
+            lines.append(_time_property("EXDATE", exception.original_start, all_day))
+    lines.append("END:VEVENT")
+    for exception in exceptions:
+        if not exception.is_cancelled:
+            lines.extend(_exception_component(event, rule, exception, stamp))
+    return lines
+
+
+def _render(lines: Iterable[str]) -> bytes:
+    """Fold and encode content lines."""
+    return "".join(fold(line) for line in lines).encode("utf-8")
+
+
+def iter_calendar(
+    db: Session,
+    household_id: int,
+    name: str,
+    stamp: Optional[datetime] = None,
+) -> Iterator[bytes]:
+    """Stream the iCalendar feed of a household.
+
+    Args:
+        db: Database session, used for the whole iteration.
+        household_id: ID of the household.
+        name: Display name of the calendar.
+        stamp: DTSTAMP of every VEVENT; defaults to now.
+
+    Yields:
+        Encoded chunks of the feed, each holding up to FEED_CHUNK_SIZE events.
+    """
+    stamp = (stamp or datetime.utcnow()).replace(microsecond=0)
+    yield _render(
+        [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODUCT_ID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{escape_text(name)}",
+        ]
+    )
+
+    # Keyset pagination keeps every query short instead of holding a cursor
+    # open while the client reads the response
+    count = 0
+    last_id = 0
+    while True:
+        events = (
+            db.query(Event)
+            .filter(Event.household_id == household_id, Event.id > last_id)
+            .order_by(Event.id)
+            .limit(FEED_CHUNK_SIZE)
+            .all()
+        )
+        if not events:
+            break
+        yield _render(line for event in events for line in event_lines(event, stamp))
+        count += len(events)
+        last_id = events[-1].id
+        db.expunge_all()
+
+    yield _render(["END:VCALENDAR"])
+    logger.debug(f"Streamed {count} events of household {household_id} as iCalendar")
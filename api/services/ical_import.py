@@ -0,0 +1,609 @@
+"""
+Calendar iCalendar Import
+
+This module imports iCalendar (RFC 5545) files exported by other calendar apps
+into a household calendar. The file is parsed line by line and events are
+inserted in batches as they are read, so a large export is never held in
+memory whole.
+
+Recurrence rules are mapped onto the compact rule storage of ``Event``. A rule
+is only accepted when its first occurrences, as expanded by dateutil, match
+the ones generated from the stored rule; anything else, such as "the second
+Tuesday of every month", is reported instead of being imported wrongly.
+Cancelled instances (EXDATE) and edited instances (VEVENTs with a
+RECURRENCE-ID) become ``EventException`` rows.
+
+Events are deduplicated by UID through the unique (household_id, uid) index,
+so importing the same file again only costs one UID lookup per batch.
+
+Times are converted to UTC on import. Series are stored in UTC, so a series
+defined in a time zone with daylight saving time keeps its UTC time of day.
+"""
+
+import hashlib
+import logging
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, time, timedelta
+from itertools import islice
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dateutil import tz
+from dateutil.rrule import rrulestr
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.models.calendar import Event, EventException, EventFrequency
+
+from .event_recurrence import RecurrenceRule, touch_event, weekday_mask
+from .ical import format_datetime
+from .versions import bump_calendar_version
+
+logger = logging.getLogger(__name__)
+
+# Events inserted per transaction
+IMPORT_BATCH_SIZE = 500
+
+# Upper bound on the failures listed in a result; all of them are counted
+MAX_REPORTED_FAILURES = 1000
+
+# Occurrences compared when checking that a recurrence rule is supported
+RULE_CHECK_OCCURRENCES = 100
+
+_FREQUENCIES = {frequency.name: frequency for frequency in EventFrequency}
+_WEEKDAYS = {"SU": 0, "MO": 1, "TU": 2, "WE": 3, "TH": 4, "FR": 5, "SA": 6}
+_RULE_PARTS = {
+    "FREQ",
+    "INTERVAL",
+    "COUNT",
+    "UNTIL",
+    "BYDAY",
+    "BYMONTHDAY",
+    "BYMONTH",
+    "BYSETPOS",
+    "WKST",
+}
+_DURATION = re.compile(
+    r"^(?P<sign>[+-])?P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+
+class InvalidEvent(ValueError):
+    """A VEVENT that cannot be imported."""
+
+
+@dataclass
+class ContentLine:
+    """A property of a component, e.g. ``DTSTART;TZID=Europe/Paris:...``."""
+
+    name: str
+    params: Dict[str, str]
+    value: str
+
+
+@dataclass
+class Component:
+    """A VEVENT as read from the file; nested components are dropped."""
+
+    index: int  # Position among the file's VEVENTs, from 1
+    properties: Dict[str, List[ContentLine]] = field(
+        default_factory=lambda: defaultdict(list)
+    )
+    error: Optional[str] = None
+
+    def first(self, name: str) -> Optional[ContentLine]:
+        """Return the first property with a name, if any."""
+        values = self.properties.get(name)
+        return values[0] if values else None
+
+    def text(self, name: str) -> Optional[str]:
+        """Return the unescaped value of a TEXT property, if any."""
+        line = self.first(name)
+        return unescape_text(line.value) if line is not None else None
+
+    @property
+    def uid(self) -> str:
+        """Return the UID of the event, derived from its content if missing."""
+        line = self.first("UID")
+        if line is not None and line.value:
+            return line.value
+        digest = hashlib.sha1()
+        for name in ("DTSTART", "DTEND", "DURATION", "SUMMARY", "RRULE"):
+            digest.update(
+                (self.first(name) or ContentLine(name, {}, "")).value.encode()
+            )
+        return f"{digest.hexdigest()}@import"
+
+
+@dataclass
+class ImportFailure:
+    """An event that was not imported."""
+
+    index: int
+    uid: Optional[str]
+    message: str
+
+
+@dataclass
+class ImportResult:
+    """Outcome of an import."""
+
+    created: int = 0
+    skipped: int = 0  # Already imported or cancelled
+    failed: int = 0
+    failures: List[ImportFailure] = field(default_factory=list)
+
+    def fail(self, index: int, uid: Optional[str], message: str) -> None:
+        """Record an event that was not imported."""
+        self.failed += 1
+        if len(self.failures) < MAX_REPORTED_FAILURES:
+            self.failures.append(ImportFailure(index, uid, message))
+
+
+def decode_lines(stream: BinaryIO) -> Iterator[str]:
+    """Lazily decode the lines of an uploaded file as UTF-8."""
+    for number, raw in enumerate(stream):
+        line = raw.decode("utf-8", errors="replace")
+        yield line.lstrip("\ufeff") if number == 0 else line
+
+
+def unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join folded content lines and drop line breaks and blank lines."""
+    current = None
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        if line[:1] in (" ", "\t"):
+            if current is not None:
+                current += line[1:]
+            continue
+        if current:
+            yield current
+        current = line
+    if current:
+        yield current
+
+
+def _split(text: str, separator: str) -> List[str]:
+    """Split on a separator outside of double quotes."""
+    parts = []
+    quoted = False
+    start = 0
+    for i, char in enumerate(text):
+        if char == '"':
+            quoted = not quoted
+        elif char == separator and not quoted:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def parse_line(line: str) -> ContentLine:
+    """Parse an unfolded content line.
+
+    Raises:
+        ValueError: If the line has no value.
+    """
+    head, *rest = _split(line, ":")
+    if not rest:
+        raise ValueError(f"Malformed content line: {line[:40]!r}")
+    name, *params = _split(head, ";")
+    parsed = {}
+    for param in params:
+        key, _, value = param.partition("=")
+        parsed[key.upper()] = value.strip('"')
+    return ContentLine(name.upper(), parsed, ":".join(rest))
+
+
+def iter_components(lines: Iterable[str]) -> Iterator[Component]:
+    """Lazily yield the VEVENTs of an iCalendar stream.
+
+    Components nested in a VEVENT, such as VALARMs, are skipped; a VEVENT
+    with a malformed line is yielded with its ``error`` set.
+    """
+    index = 0
+    component: Optional[Component] = None
+    nested = 0
+    for line in unfold(lines):
+        upper = line.upper()
+        if component is None:
+            if upper == "BEGIN:VEVENT":
+                index += 1
+                component = Component(index)
+            continue
+        if upper.startswith("BEGIN:"):
+            nested += 1
+        elif upper.startswith("END:"):
+            if nested:
+                nested -= 1
+            else:
+                yield component
+                component = None
+        elif not nested:
+            try:
+                parsed = parse_line(line)
+            except ValueError as exc:
+                component.error = component.error or str(exc)
+            else:
+                component.properties[parsed.name].append(parsed)
+    if component is not None:
+        component.error = "Unterminated VEVENT"
+        yield component
+
+
+def unescape_text(value: str) -> str:
+    """Unescape a TEXT property value."""
+    return re.sub(
+        r"\\([\\;,nN])",
+        lambda match: "\n" if match.group(1) in "nN" else match.group(1),
+        value,
+    )
+
+
+def _parse_moment(value: str, params: Dict[str, str]) -> Tuple[datetime, bool]:
+    """Parse a DATE or DATE-TIME value as naive UTC; return it and if it is a date."""
+    try:
+        if params.get("VALUE") == "DATE" or len(value) == 8:
+            return datetime.strptime(value, "%Y%m%d"), True
+        moment = datetime.strptime(value.rstrip("Z"), "%Y%m%dT%H%M%S")
+    except ValueError:
+        raise InvalidEvent(f"Invalid date or time: {value!r}")
+    if value.endswith("Z"):
+        return moment, False
+    tzid = params.get("TZID")
+    if tzid:
+        zone = tz.gettz(tzid)
+        if zone is None:
+            raise InvalidEvent(f"Unknown time zone: {tzid}")
+        return (
+            moment.replace(tzinfo=zone).astimezone(tz.UTC).replace(tzinfo=None),
+            False,
+        )
+    return moment, False  # Floating times are taken as UTC
+
+
+def parse_time(line: ContentLine) -> Tuple[datetime, bool]:
+    """Parse a DATE or DATE-TIME property such as DTSTART as naive UTC.
+
+    Returns:
+        The time and whether the value is a date.
+    """
+    return _parse_moment(line.value, line.params)
+
+
+def parse_duration(value: str) -> timedelta:
+    """Parse a DURATION value such as ``PT1H30M``."""
+    match = _DURATION.match(value)
+    if match is None:
+        raise InvalidEvent(f"Invalid duration: {value!r}")
+    parts = {
+        key: int(amount or 0)
+        for key, amount in match.groupdict().items()
+        if key != "sign"
+    }
+    duration = timedelta(**parts)
+    return -duration if match.group("sign") == "-" else duration
+
+
+def _end_time(
+    component: Component, start: datetime, all_day: bool
+) -> Optional[datetime]:
+    """Return the end of an event from its DTEND or DURATION."""
+    end_line = component.first("DTEND")
+    if end_line is not None:
+        end, _ = parse_time(end_line)
+    elif component.first("DURATION") is not None:
+        end = start + parse_duration(component.first("DURATION").value)
+    else:
+        # Timed events without an end are instantaneous, dates last one day
+        return None
+    if end < start:
+        raise InvalidEvent("Event ends before it starts")
+    if all_day and end <= start:
+        return None
+    return end
+
+
+def _parse_rule(value: str) -> Dict[str, str]:
+    """Split an RRULE value into its parts."""
+    parts = {}
+    for part in value.split(";"):
+        key, _, part_value = part.partition("=")
+        parts[key.upper()] = part_value.upper()
+    unsupported = sorted(set(parts) - _RULE_PARTS)
+    if unsupported:
+        raise InvalidEvent(f"Unsupported recurrence rule part: {unsupported[0]}")
+    return parts
+
+
+def apply_rule(event: Event, value: str) -> None:
+    """Store an RRULE on a series whose start is set.
+
+    Raises:
+        InvalidEvent: If the rule cannot be stored exactly.
+    """
+    parts = _parse_rule(value)
+    frequency = _FREQUENCIES.get(parts.get("FREQ", ""))
+    if frequency is None:
+        raise InvalidEvent(f"Unsupported recurrence frequency: {parts.get('FREQ')}")
+    event.recurrence_frequency = frequency
+    try:
+        event.recurrence_interval = int(parts.get("INTERVAL", "1"))
+        event.recurrence_count = int(parts["COUNT"]) if "COUNT" in parts else None
+    except ValueError:
+        raise InvalidEvent(f"Invalid recurrence rule: {value}")
+
+    until = None
+    if "UNTIL" in parts:
+        until, is_date = _parse_moment(parts["UNTIL"], {})
+        if is_date and not event.is_all_day:
+            # The whole last day is included
+            until = datetime.combine(until.date(), time.max.replace(microsecond=0))
+    event.recurrence_end_date = until
+
+    weekdays = []
+    for day in filter(None, parts.get("BYDAY", "").split(",")):
+        if day not in _WEEKDAYS:
+            raise InvalidEvent(f"Unsupported weekday in recurrence rule: {day}")
+        weekdays.append(_WEEKDAYS[day])
+    event.recurrence_by_weekday = weekday_mask(weekdays)
+
+    # Compare with dateutil, with UNTIL normalized to the stored UTC value
+    if until is not None:
+        parts["UNTIL"] = format_datetime(until)
+    normalized = ";".join(f"{key}={part}" for key, part in parts.items())
+    try:
+        expected = rrulestr(normalized, dtstart=event.start_time.replace(tzinfo=tz.UTC))
+    except (ValueError, TypeError):
+        raise InvalidEvent(f"Invalid recurrence rule: {value}")
+    stored = RecurrenceRule.from_event(event)
+    if list(islice(stored.starts_from(stored.start), RULE_CHECK_OCCURRENCES)) != [
+        start.replace(tzinfo=None) for start in islice(expected, RULE_CHECK_OCCURRENCES)
+    ]:
+        raise InvalidEvent(f"Unsupported recurrence rule: {value}")
+
+
+def build_event(component: Component, household_id: int, user_id: int) -> Event:
+    """Build an event, with its cancelled instances, from a VEVENT.
+
+    Raises:
+        InvalidEvent: If the VEVENT cannot be imported.
+    """
+    if component.error:
+        raise InvalidEvent(component.error)
+    start_line = component.first("DTSTART")
+    if start_line is None:
+        raise InvalidEvent("Missing DTSTART")
+    if component.first("RDATE") is not None:
+        raise InvalidEvent("RDATE is not supported")
+    start, all_day = parse_time(start_line)
+    event = Event(
+        uid=component.uid,
+        title=component.text("SUMMARY") or "",
+        description=component.text("DESCRIPTION"),
+        location=component.text("LOCATION"),
+        start_time=start,
+        end_time=_end_time(component, start, all_day),
+        is_all_day=all_day,
+        household_id=household_id,
+        created_by_user_id=user_id,
+        reminder_enabled=False,
+    )
+
+    rules = component.properties.get("RRULE", [])
+    if len(rules) > 1:
+        raise InvalidEvent("Multiple RRULEs are not supported")
+    if rules:
+        apply_rule(event, rules[0].value)
+        rule = RecurrenceRule.from_event(event)
+        cancelled = set()
+        for line in component.properties.get("EXDATE", []):
+            for value in filter(None, line.value.split(",")):
+                original_start, _ = _parse_moment(value, line.params)
+                if all_day:
+                    original_start = datetime.combine(
+                        original_start.date(), start.time()
+                    )
+                # Dates the rule never generates exclude nothing
+                if rule.includes(original_start):
+                    cancelled.add(original_start)
+        event.exceptions = [
+            EventException(original_start=original_start, is_cancelled=True)
+            for original_start in sorted(cancelled)
+        ]
+    return event
+
+
+def build_override(component: Component) -> EventException:
+    """Build the exception of an edited instance from a VEVENT with a RECURRENCE-ID.
+
+    Raises:
+        InvalidEvent: If the VEVENT cannot be imported.
+    """
+    if component.error:
+        raise InvalidEvent(component.error)
+    recurrence_id = component.first("RECURRENCE-ID")
+    if recurrence_id.params.get("RANGE", "").upper() == "THISANDFUTURE":
+        raise InvalidEvent("RANGE=THISANDFUTURE is not supported")
+    original_start, all_day = parse_time(recurrence_id)
+    exception = EventException(original_start=original_start)
+    if (component.text("STATUS") or "").upper() == "CANCELLED":
+        exception.is_cancelled = True
+        return exception
+    start_line = component.first("DTSTART")
+    if start_line is not None:
+        start, _ = parse_time(start_line)
+        exception.start_time = start if start != original_start else None
+        exception.end_time = _end_time(component, start, all_day)
+    exception.title = component.text("SUMMARY")
+    exception.description = component.text("DESCRIPTION")
+    exception.location = component.text("LOCATION")
+    return exception
+
+
+class _Import:
+    """State of one import: the current batch and edited instances to attach."""
+
+    def __init__(self, db: Session, household_id: int, user_id: int):
+        self.db = db
+        self.household_id = household_id
+        self.user_id = user_id
+        self.result = ImportResult()
+        self.batch: List[Component] = []
+        self.seen = set()  # UIDs of the series and single events of the file
+        self.created: Dict[str, int] = {}  # UID to ID of events created here
+        # UID to (index, exception) of edited instances not attached yet
+        self.overrides: Dict[str, List[Tuple[int, EventException]]] = defaultdict(list)
+
+    def add(self, component: Component) -> None:
+        """Add a VEVENT to the current batch, flushing it when full.
+
+        Events are only built once the batch is flushed and known UIDs are
+        left out, so re-imports skip the recurrence rule checks.
+        """
+        uid = component.uid
+        try:
+            if component.first("RECURRENCE-ID") is not None:
+                self.overrides[uid].append((component.index, build_override(component)))
+                return
+            if uid in self.seen:
+                raise InvalidEvent("Duplicate UID")
+            self.seen.add(uid)
+            if (component.text("STATUS") or "").upper() == "CANCELLED":
+                self.result.skipped += 1
+                return
+            self.batch.append(component)
+        except InvalidEvent as exc:
+            self.result.fail(component.index, uid, str(exc))
+        if len(self.batch) >= IMPORT_BATCH_SIZE:
+            self.flush()
+
+    def _attach(self, event: Event) -> None:
+        """Attach the pending edited instances of a series before it is saved."""
+        pending = self.overrides.pop(event.uid, [])
+        if not pending:
+            return
+        rule = RecurrenceRule.from_event(event)
+        exceptions = {
+            exception.original_start: exception for exception in event.exceptions
+        }
+        for index, exception in pending:
+            if rule is None or not rule.includes(exception.original_start):
+                self.result.fail(
+                    index, event.uid, "RECURRENCE-ID matches no occurrence"
+                )
+                continue
+            exceptions[exception.original_start] = exception
+        event.exceptions = list(exceptions.values())
+
+    def flush(self) -> None:
+        """Insert the current batch, skipping events imported before."""
+        batch, self.batch = self.batch, []
+        if not batch:
+            return
+        uids = [component.uid for component in batch]
+        existing = {
+            uid
+            for (uid,) in self.db.query(Event.uid).filter(
+                Event.household_id == self.household_id, Event.uid.in_(uids)
+            )
+        }
+        self.result.skipped += len(existing)
+        new = []
+        for component in batch:
+            if component.uid in existing:
+                self.overrides.pop(component.uid, None)
+                continue
+            try:
+                new.append(build_event(component, self.household_id, self.user_id))
+            except InvalidEvent as exc:
+                self.overrides.pop(component.uid, None)
+                self.result.fail(component.index, component.uid, str(exc))
+        for event in new:
+            self._attach(event)
+            touch_event(event)
+        try:
+            self.db.add_all(new)
+            self.db.flush()
+        except IntegrityError:
+            # Another import inserted some of these UIDs since the lookup
+            self.db.rollback()
+            new = self._insert_each(new)
+        # Read the IDs before the commit expires the events
+        for event in new:
+            self.created[event.uid] = event.id
+        self.result.created += len(new)
+        bump_calendar_version(self.db, self.household_id)
+        self.db.commit()
+        self.db.expunge_all()
+
+    def _insert_each(self, events: List[Event]) -> List[Event]:
+        """Insert events one by one, skipping the UIDs that already exist."""
+        inserted = []
+        for event in events:
+            try:
+                with self.db.begin_nested():
+                    self.db.add(event)
+            except IntegrityError:
+                self.result.skipped += 1
+            else:
+                inserted.append(event)
+        return inserted
+
+    def finish(self) -> ImportResult:
+        """Flush the last batch and attach edited instances read after their series."""
+        self.flush()
+        late = [
+            (uid, pending)
+            for uid, pending in self.overrides.items()
+            if uid in self.created
+        ]
+        for uid, pending in self.overrides.items():
+            if uid in self.created:
+                continue
+            exists = (
+                self.db.query(Event.id)
+                .filter(Event.household_id == self.household_id, Event.uid == uid)
+                .first()
+            )
+            if exists is None:
+                for index, _ in pending:
+                    self.result.fail(index, uid, "No event with this UID")
+        self.overrides.clear()
+
+        if late:
+            for uid, pending in late:
+                event = self.db.get(Event, self.created[uid])
+                self.overrides[uid] = pending
+                self._attach(event)
+                touch_event(event)
+            bump_calendar_version(self.db, self.household_id)
+            self.db.commit()
+        return self.result
+
+
+def import_calendar(
+    db: Session, household_id: int, user_id: int, lines: Iterable[str]
+) -> ImportResult:
+    """Import the events of an iCalendar stream into a household calendar.
+
+    Each batch of IMPORT_BATCH_SIZE events is committed on its own, so events
+    of earlier batches stay imported if a later batch fails.
+
+    Args:
+        db: Database session.
+        household_id: ID of the household.
+        user_id: ID of the member importing the file, who becomes the creator.
+        lines: Lines of the file, e.g. from ``decode_lines``.
+    """
+    state = _Import(db, household_id, user_id)
+    for component in iter_components(lines):
+        state.add(component)
+    result = state.finish()
+    logger.info(
+        f"Imported {result.created} events into household {household_id}, "
+        f"skipped {result.skipped}, failed {result.failed}"
+    )
+    return result
@@ -0,0 +1,486 @@
+"""
+Recurring Transaction Detection
+
+This module detects recurring series in a household's transaction history.
+Transactions are grouped by a hash of their normalized description and amount
+band, neighbouring bands are merged, and each group is checked for a periodic
+gap between its dates.
+"""
+
+import hashlib
+import logging
+import math
+import re
+import statistics
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from api.models.finance import (
+    RecurrenceFrequency,
+    RecurringSeries,
+    Transaction,
+    TransactionStatus,
+)
+
+from .versions import bump_finance_version
+
+logger = logging.getLogger(__name__)
+
+# Relative width of an amount band. Bands are fixed logarithmic buckets
+# [1.1**k, 1.1**(k + 1)), so amounts 1% apart can still straddle a boundary
+# (97.00 and 97.99 do); detection merges neighbouring bands for that reason.
+AMOUNT_BAND_WIDTH = 0.10
+
+# Minimum number of transactions before a group is considered recurring
+MIN_OCCURRENCES = 3
+
+# Fraction of date gaps that must fall within the frequency tolerance
+MIN_MATCHING_GAP_RATIO = 0.75
+
+# Nominal period and allowed deviation, in days, for each frequency
+FREQUENCY_PERIODS: Dict[RecurrenceFrequency, Tuple[float, float]] = {
+    RecurrenceFrequency.DAILY: (1.0, 0.0),
+    RecurrenceFrequency.WEEKLY: (7.0, 1.0),
+    RecurrenceFrequency.BIWEEKLY: (14.0, 2.0),
+    RecurrenceFrequency.MONTHLY: (30.44, 3.0),
+    RecurrenceFrequency.QUARTERLY: (91.31, 7.0),
+    RecurrenceFrequency.YEARLY: (365.25, 10.0),
+}
+
+# Calendar step used to project the next due date of a series
+FREQUENCY_STEPS: Dict[RecurrenceFrequency, relativedelta] = {
+    RecurrenceFrequency.DAILY: relativedelta(days=1),
+    RecurrenceFrequency.WEEKLY: relativedelta(weeks=1),
+    RecurrenceFrequency.BIWEEKLY: relativedelta(weeks=2),
+    RecurrenceFrequency.MONTHLY: relativedelta(months=1),
+    RecurrenceFrequency.QUARTERLY: relativedelta(months=3),
+    RecurrenceFrequency.YEARLY: relativedelta(years=1),
+}
+
+# Statuses that never take part in a recurring series
+_EXCLUDED_STATUSES = (TransactionStatus.CANCELLED, TransactionStatus.FAILED)
+
+_NON_ALPHA = re.compile(r"[^a-z]+")
+
+
+def normalize_description(description: Optional[str]) -> str:
+    """Normalize a description so repeated charges compare equal.
+
+    Digits and punctuation are dropped because merchants usually embed
+    reference numbers or dates that change between charges.
+    """
+    if not description:
+        return ""
+    return " ".join(_NON_ALPHA.sub(" ", description.lower()).split())
+
+
+def amount_band(amount: Optional[float]) -> int:
+    """Return the logarithmic band index of an amount."""
+    magnitude = abs(amount or 0.0)
+    if magnitude < 1.0:
+        return 0
+    return int(math.floor(math.log(magnitude) / math.log1p(AMOUNT_BAND_WIDTH)))
+
+
+def _hash_key(type, normalized_description: str, band: int) -> str:
+    """Hash a grouping key into a fixed-size fingerprint."""
+    type_value = getattr(type, "value", type) or ""
+    key = f"{type_value}|{normalized_description}|{band}"
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def compute_fingerprint(
+    description: Optional[str], amount: Optional[float], type
+) -> str:
+    """Hash the grouping key of a transaction into a fixed-size fingerprint."""
+    return _hash_key(type, normalize_description(description), amount_band(amount))
+
+
+def band_fingerprints(
+    description: Optional[str], amount: Optional[float], type
+) -> List[str]:
+    """Return the fingerprint of a transaction, then those of its neighbouring bands."""
+    normalized = normalize_description(description)
+    band = amount_band(amount)
+    return [_hash_key(type, normalized, b) for b in (band, band - 1, band + 1)]
+
+
+def _band_runs(bands: Iterable[int]) -> List[List[int]]:
+    """Split band indexes into runs of consecutive bands."""
+    runs: List[List[int]] = []
+    for band in sorted(bands):
+        if runs and band == runs[-1][-1] + 1:
+            runs[-1].append(band)
+        else:
+            runs.append([band])
+    return runs
+
+
+def gap_matches(gap_days: float, frequency: RecurrenceFrequency) -> bool:
+    """Check whether a gap between two dates fits the given frequency."""
+    period, tolerance = FREQUENCY_PERIODS[frequency]
+    return abs(gap_days - period) <= tolerance
+
+
+def classify_period(dates: Sequence[date]) -> Optional[RecurrenceFrequency]:
+    """Find the frequency of a sorted sequence of dates, if there is one.
+
+    Args:
+        dates: Dates of the transactions in a group, in ascending order.
+
+    Returns:
+        The matching frequency, or None if the dates are not periodic.
+    """
+    unique_dates = sorted(set(dates))
+    if len(unique_dates) < MIN_OCCURRENCES:
+        return None
+
+    gaps = [
+        (later - earlier).days for earlier, later in zip(unique_dates, unique_dates[1:])
+    ]
+    median_gap = statistics.median(gaps)
+
+    for frequency in FREQUENCY_PERIODS:
+        if not gap_matches(median_gap, frequency):
+            continue
+        matching = sum(1 for gap in gaps if gap_matches(gap, frequency))
+        if matching / len(gaps) >= MIN_MATCHING_GAP_RATIO:
+            return frequency
+    return None
+
+
+def next_due_date(last_date: date, frequency: RecurrenceFrequency) -> date:
+    """Project the date the next transaction of a series is due."""
+    return last_date + FREQUENCY_STEPS[frequency]
+
+
+def _advance_due_date(series: RecurringSeries, last_date: date) -> date:
+    """Project the next due date without moving it behind the scheduler.
+
+    Occurrences up to the persisted due date may already have been
+    materialized, so the due date of a series only ever moves forward.
+    """
+    projected = next_due_date(last_date, series.frequency)
+    if series.next_due_date is not None and series.next_due_date > projected:
+        return series.next_due_date
+    return projected
+
+
+def _active_transactions(db: Session, household_id: int):
+    """Query the organic transactions of a household that can form a series.
+
+    Rows materialized from a series are projections and must not reinforce it.
+    """
+    return db.query(Transaction).filter(
+        Transaction.household_id == household_id,
+        Transaction.recurring_series_id.is_(None),
+        or_(
+            Transaction.status.is_(None),
+            Transaction.status.notin_(_EXCLUDED_STATUSES),
+        ),
+    )
+
+
+def claim_materialized(
+    db: Session, series: RecurringSeries, transactions: Iterable[Transaction]
+) -> int:
+    """Delete the materialized occurrences that real transactions arrived for.
+
+    The scheduler inserts a pending row when an occurrence falls due, and the
+    real transaction usually arrives around the same date. Each transaction
+    claims the nearest unclaimed pending row of its series within the
+    frequency tolerance, so the payment is not counted twice. Rows that were
+    confirmed or edited to another status are left alone. The caller is
+    responsible for committing.
+
+    Args:
+        db: Database session.
+        series: The series the transactions belong to.
+        transactions: Organic transactions of the series.
+
+    Returns:
+        The number of materialized rows deleted.
+    """
+    if series.id is None:
+        return 0  # A series that was just detected has nothing materialized
+    pending = (
+        db.query(Transaction)
+        .filter(
+            Transaction.recurring_series_id == series.id,
+            Transaction.status == TransactionStatus.PENDING,
+        )
+        .order_by(Transaction.date)
+        .all()
+    )
+    if not pending:
+        return 0
+    _, tolerance = FREQUENCY_PERIODS[series.frequency]
+    claimed = 0
+    for transaction in transactions:
+        if transaction.date is None:
+            continue
+        nearest = min(pending, key=lambda row: abs((row.date - transaction.date).days))
+        if abs((nearest.date - transaction.date).days) > tolerance:
+            continue
+        pending.remove(nearest)
+        db.delete(nearest)
+        claimed += 1
+        if not pending:
+            break
+    return claimed
+
+
+def _apply_group(
+    series: RecurringSeries,
+    transactions: Sequence[Transaction],
+    frequency: RecurrenceFrequency,
+) -> None:
+    """Overwrite a series with the statistics of its date-ordered transactions."""
+    latest = transactions[-1]
+    series.user_id = latest.user_id
+    series.category_id = latest.category_id
+    series.description = latest.description
+    series.type = latest.type
+    series.frequency = frequency
+    series.average_amount = sum(t.amount or 0.0 for t in transactions) / len(
+        transactions
+    )
+    series.occurrence_count = len(transactions)
+    series.first_date = transactions[0].date
+    series.last_date = latest.date
+    series.next_due_date = _advance_due_date(series, latest.date)
+    series.last_transaction_id = max(t.id for t in transactions)
+    series.is_active = True
+
+
+def _upsert_group(
+    db: Session,
+    household_id: int,
+    fingerprint: str,
+    transactions: Sequence[Transaction],
+    series: Optional[RecurringSeries],
+) -> Optional[RecurringSeries]:
+    """Create, refresh or deactivate the series for one fingerprint group."""
+    frequency = classify_period([t.date for t in transactions])
+    if frequency is None:
+        if series is not None:
+            series.is_active = False
+        return None
+
+    if series is None:
+        series = RecurringSeries(household_id=household_id, fingerprint=fingerprint)
+        db.add(series)
+    _apply_group(series, transactions, frequency)
+    return series
+
+
+def detect_recurring_series(db: Session, household_id: int) -> List[RecurringSeries]:
+    """Run a full detection pass over the history of a household.
+
+    Transactions are sorted by date once and bucketed by description and amount
+    band in a single pass, so the whole run is O(n log n) in the number of
+    transactions. Runs of neighbouring bands are merged, so a series whose
+    amounts straddle a band boundary is not split in two. Every transaction is
+    stored with the fingerprint of its group, that of the group's series if
+    it has one, so later incremental updates can use the index.
+
+    Args:
+        db: Database session.
+        household_id: ID of the household to scan.
+
+    Returns:
+        The active recurring series of the household.
+    """
+    bands: Dict[Tuple, Dict[int, List[Transaction]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    transactions = (
+        _active_transactions(db, household_id)
+        .order_by(Transaction.date, Transaction.id)
+        .all()
+    )
+    for transaction in transactions:
+        if transaction.date is None:
+            continue
+        key = (transaction.type, normalize_description(transaction.description))
+        bands[key][amount_band(transaction.amount)].append(transaction)
+
+    existing = {
+        series.fingerprint: series
+        for series in db.query(RecurringSeries).filter(
+            RecurringSeries.household_id == household_id
+        )
+    }
+
+    groups: Dict[str, List[Transaction]] = {}
+    for (type, description), by_band in bands.items():
+        for run in _band_runs(by_band):
+            group = sorted(
+                (t for band in run for t in by_band[band]),
+                key=lambda t: (t.date, t.id),
+            )
+            # Keep the series of a merged band, else file it under the latest
+            fingerprint = next(
+                (
+                    candidate
+                    for candidate in (_hash_key(type, description, b) for b in run)
+                    if candidate in existing
+                ),
+                _hash_key(type, description, amount_band(group[-1].amount)),
+            )
+            for transaction in group:
+                transaction.recurrence_fingerprint = fingerprint
+            groups[fingerprint] = group
+
+    detected = []
+    for fingerprint, group in groups.items():
+        series = _upsert_group(
+            db, household_id, fingerprint, group, existing.pop(fingerprint, None)
+        )
+        if series is not None:
+            detected.append(series)
+
+    # Series whose transactions have all disappeared are no longer recurring
+    for series in existing.values():
+        series.is_active = False
+
+    bump_finance_version(db, household_id)
+    db.commit()
+    logger.info(
+        f"Detected {len(detected)} recurring series for household {household_id}"
+    )
+    return detected
+
+
+def observe_fingerprints(
+    db: Session, household_id: int, fingerprints: Iterable[str]
+) -> List[RecurringSeries]:
+    """Refresh the series of the fingerprints of newly stored transactions.
+
+    Used after bulk inserts, where folding rows in one at a time would reload
+    a fingerprint's transactions once per row: the transactions sharing any
+    of the fingerprints are loaded with one query, and each group is
+    reclassified once. The rest of the history is not read. The caller is
+    responsible for committing.
+
+    Args:
+        db: Database session.
+        household_id: ID of the household.
+        fingerprints: Fingerprints of the new transactions, which must have
+            been stored with them.
+
+    Returns:
+        The active series of the fingerprints.
+    """
+    fingerprints = set(fingerprints)
+    if not fingerprints:
+        return []
+    groups: Dict[str, List[Transaction]] = defaultdict(list)
+    for transaction in (
+        _active_transactions(db, household_id)
+        .filter(Transaction.recurrence_fingerprint.in_(fingerprints))
+        .order_by(Transaction.date, Transaction.id)
+    ):
+        if transaction.date is not None:
+            groups[transaction.recurrence_fingerprint].append(transaction)
+    existing = {
+        series.fingerprint: series
+        for series in db.query(RecurringSeries).filter(
+            RecurringSeries.household_id == household_id,
+            RecurringSeries.fingerprint.in_(fingerprints),
+        )
+    }
+    observed = []
+    for fingerprint, group in groups.items():
+        series = _upsert_group(
+            db, household_id, fingerprint, group, existing.get(fingerprint)
+        )
+        if series is not None:
+            claim_materialized(db, series, group)
+            observed.append(series)
+    return observed
+
+
+def observe_transaction(
+    db: Session, transaction: Transaction
+) -> Optional[RecurringSeries]:
+    """Incrementally fold a newly stored transaction into the recurring series.
+
+    The common case, a transaction that continues a known series on schedule,
+    only touches that series row and the occurrence the scheduler materialized
+    for it, if any. Otherwise only the transactions sharing its fingerprint
+    are reloaded and reclassified, never the full history. The caller is
+    responsible for committing.
+
+    Args:
+        db: Database session.
+        transaction: A transaction that has already been flushed.
+
+    Returns:
+        The series the transaction belongs to, or None.
+    """
+    if transaction.date is None or transaction.status in _EXCLUDED_STATUSES:
+        return None
+
+    candidates = band_fingerprints(
+        transaction.description, transaction.amount, transaction.type
+    )
+    found = {
+        series.fingerprint: series
+        for series in db.query(RecurringSeries).filter(
+            RecurringSeries.household_id == transaction.household_id,
+            RecurringSeries.fingerprint.in_(candidates),
+        )
+    }
+    # A series near a band boundary may be filed under the neighbouring band
+    fingerprint = next(
+        (c for c in candidates if c in found and found[c].is_active), candidates[0]
+    )
+    transaction.recurrence_fingerprint = fingerprint
+    series = found.get(fingerprint)
+
+    # Already folded in by an earlier call or a full detection pass
+    if (
+        series is not None
+        and series.last_transaction_id is not None
+        and transaction.id <= series.last_transaction_id
+    ):
+        return series if series.is_active else None
+
+    if (
+        series is not None
+        and series.is_active
+        and transaction.date > series.last_date
+        and gap_matches((transaction.date - series.last_date).days, series.frequency)
+    ):
+        count = series.occurrence_count or 0
+        series.average_amount = (
+            (series.average_amount or 0.0) * count + (transaction.amount or 0.0)
+        ) / (count + 1)
+        series.occurrence_count = count + 1
+        series.last_date = transaction.date
+        series.next_due_date = _advance_due_date(series, transaction.date)
+        series.user_id = transaction.user_id
+        series.category_id = transaction.category_id
+        series.description = transaction.description
+        series.last_transaction_id = transaction.id
+        claim_materialized(db, series, [transaction])
+        return series
+
+    # Sessions do not autoflush, so persist the fingerprint before querying
+    db.flush()
+    group = (
+        _active_transactions(db, transaction.household_id)
+        .filter(Transaction.recurrence_fingerprint == fingerprint)
+        .order_by(Transaction.date, Transaction.id)
+        .all()
+    )
+    series = _upsert_group(db, transaction.household_id, fingerprint, group, series)
+    if series is not None:
+        claim_materialized(db, series, [transaction])
+    return series
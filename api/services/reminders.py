@@ -0,0 +1,520 @@
+"""
+Event Reminders
+
+This module e-mails the members of a household before the occurrences of
+events that have ``reminder_enabled`` set. A min-heap holds only the reminders
+firing within the loaded horizon. It is refilled incrementally as time
+advances, from the events starting within the horizon plus the maximum lead
+time, and whenever an event is created or edited, so the events table is never
+scanned as a whole.
+
+Delivery is at least once. Every (occurrence, recipient) pair has a dedupe key
+that is claimed in ``reminder_deliveries`` before the message is sent and
+marked as sent once the SMTP server accepted it; a claim that was never marked
+is retried after its lease expires. The key doubles as the Message-ID so that
+mail clients can drop the rare duplicate.
+
+Messages are sent in batches over a single connection with an async SMTP
+client. For local development, point ``SMTP_HOST`` and ``SMTP_PORT`` at a
+stand-in server such as ``python -m aiosmtpd -n -l localhost:8025`` and set
+``SMTP_TLS=False``.
+"""
+
+import asyncio
+import heapq
+import logging
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from email.message import EmailMessage
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import aiosmtplib
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.calendar import Event, ReminderDelivery
+from api.models.database import SessionLocal
+from api.models.user import User
+
+from .event_recurrence import Occurrence, expand_event
+
+logger = logging.getLogger(__name__)
+
+# Lead time of reminders without an explicit one, as asked for by the spec
+DEFAULT_REMINDER_MINUTES = 24 * 60
+
+# Heap entry: (fire time, event ID, occurrence start)
+_Entry = Tuple[datetime, int, datetime]
+
+
+@dataclass(frozen=True)
+class ReminderMessage:
+    """A claimed reminder e-mail, ready to be sent."""
+
+    dedupe_key: str
+    event_id: int
+    recipient: str
+    subject: str
+    body: str
+
+
+def reminder_lead(event: Event) -> timedelta:
+    """Return how long before each occurrence an event's reminder fires."""
+    minutes = event.reminder_time_before
+    if minutes is None:
+        minutes = DEFAULT_REMINDER_MINUTES
+    return timedelta(minutes=min(max(minutes, 0), settings.REMINDER_MAX_LEAD_MINUTES))
+
+
+def reminder_occurrences(
+    event: Event, start: datetime, end: datetime
+) -> List[Tuple[datetime, Occurrence]]:
+    """List the (fire time, occurrence) pairs of reminders firing in [start, end)."""
+    if not event.reminder_enabled or event.start_time is None:
+        return []
+    lead = reminder_lead(event)
+    occurrences, _ = expand_event(event, start + lead, end + lead)
+    return [
+        (occurrence.start_time - lead, occurrence)
+        for occurrence in occurrences
+        if start + lead <= occurrence.start_time < end + lead
+    ]
+
+
+def find_occurrence(event: Event, start: datetime) -> Optional[Occurrence]:
+    """Return the occurrence of an event starting at a time, if it still exists."""
+    occurrences, _ = expand_event(event, start, start + timedelta(microseconds=1))
+    for occurrence in occurrences:
+        if occurrence.start_time == start:
+            return occurrence
+    return None
+
+
+def dedupe_key(event_id: int, start: datetime, user_id: int) -> str:
+    """Return the delivery key of an occurrence's reminder to one user."""
+    return f"reminder-{event_id}-{start:%Y%m%dT%H%M%S}-{user_id}"
+
+
+class ReminderScheduler:
+    """Min-heap of the reminders firing within a sliding horizon."""
+
+    def __init__(
+        self,
+        horizon_minutes: int = settings.REMINDER_HORIZON_MINUTES,
+        batch_size: int = settings.REMINDER_BATCH_SIZE,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            horizon_minutes: How far ahead reminders are loaded into the heap.
+            batch_size: Maximum number of occurrences popped per batch.
+        """
+        self.horizon = timedelta(minutes=horizon_minutes)
+        self.batch_size = batch_size
+        self._heap: List[_Entry] = []
+        # Canonical fire time per (event, occurrence); heap entries that
+        # disagree are stale
+        self._scheduled: Dict[Tuple[int, datetime], datetime] = {}
+        self._by_event: Dict[int, Set[datetime]] = defaultdict(set)
+        self._loaded_until: Optional[datetime] = None
+        # Events scheduled while a refill is running, reloaded once it ends
+        self._touched: Optional[Set[int]] = None
+        self._lock = threading.Lock()
+
+    def needs_refill(self, now: datetime) -> bool:
+        """Check whether less than half of the horizon is left loaded."""
+        with self._lock:
+            return self._loaded_until is None or (
+                self._loaded_until <= now + self.horizon / 2
+            )
+
+    def _push(self, event_id: int, fire_at: datetime, start: datetime) -> None:
+        """Schedule one reminder; the caller holds the lock."""
+        key = (event_id, start)
+        if self._scheduled.get(key) == fire_at:
+            return
+        self._scheduled[key] = fire_at
+        self._by_event[event_id].add(start)
+        heapq.heappush(self._heap, (fire_at, event_id, start))
+
+    def _drop(self, event_id: int) -> None:
+        """Unschedule every reminder of an event; the caller holds the lock."""
+        for start in self._by_event.pop(event_id, ()):
+            self._scheduled.pop((event_id, start), None)
+
+    def refill(self, db: Session, now: datetime) -> int:
+        """Load the reminders firing between the loaded horizon and now + horizon.
+
+        Reminders missed by less than ``REMINDER_GRACE_MINUTES``, e.g. during a
+        restart, are loaded as well; the delivery log skips those already sent.
+
+        Returns:
+            The number of reminders added to the heap.
+        """
+        until = now + self.horizon
+        earliest = now - timedelta(minutes=settings.REMINDER_GRACE_MINUTES)
+        with self._lock:
+            start = max(self._loaded_until or earliest, earliest)
+            if start >= until:
+                return 0
+            self._touched = set()
+
+        max_lead = timedelta(minutes=settings.REMINDER_MAX_LEAD_MINUTES)
+        singles = (
+            db.query(Event)
+            .filter(
+                Event.reminder_enabled.is_(True),
+                Event.recurrence_frequency.is_(None),
+                Event.start_time >= start,
+                Event.start_time < until + max_lead,
+            )
+            .all()
+        )
+        series = (
+            db.query(Event)
+            .filter(
+                Event.reminder_enabled.is_(True),
+                Event.recurrence_frequency.isnot(None),
+                Event.span_start < until + max_lead,
+                (Event.span_end.is_(None)) | (Event.span_end >= start),
+            )
+            .all()
+        )
+
+        pairs = [
+            (event.id, fire_at, occurrence.start_time)
+            for event in singles + series
+            for fire_at, occurrence in reminder_occurrences(event, start, until)
+        ]
+        added = 0
+        with self._lock:
+            touched, self._touched = self._touched, None
+            for event_id, fire_at, occurrence_start in pairs:
+                if event_id not in touched:
+                    self._push(event_id, fire_at, occurrence_start)
+                    added += 1
+            self._loaded_until = until
+
+        # Events written during the refill are reloaded with their new state
+        if touched:
+            for event in db.query(Event).filter(Event.id.in_(list(touched))):
+                self.schedule(event, now)
+        logger.debug(
+            f"Loaded {added} reminders firing between {start.isoformat()} "
+            f"and {until.isoformat()}"
+        )
+        return added
+
+    def schedule(self, event: Event, now: Optional[datetime] = None) -> None:
+        """Reschedule the reminders of a new or edited event.
+
+        Reminders whose time has passed while their occurrence has not started
+        yet fire right away.
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            if self._loaded_until is None:
+                return
+            if self._touched is not None:
+                self._touched.add(event.id)
+            self._drop(event.id)
+            until = self._loaded_until
+
+        pairs = reminder_occurrences(event, now - reminder_lead(event), until)
+        with self._lock:
+            for fire_at, occurrence in pairs:
+                self._push(event.id, max(fire_at, now), occurrence.start_time)
+
+    def unschedule(self, event_id: int) -> None:
+        """Drop the reminders of a deleted event."""
+        with self._lock:
+            if self._touched is not None:
+                self._touched.add(event_id)
+            self._drop(event_id)
+
+    def pop_due(self, now: datetime) -> List[Tuple[int, datetime]]:
+        """Pop up to one batch of (event ID, occurrence start) pairs that are due."""
+        due: List[Tuple[int, datetime]] = []
+        with self._lock:
+            while self._heap and len(due) < self.batch_size:
+                fire_at, event_id, start = self._heap[0]
+                if fire_at > now:
+                    break
+                heapq.heappop(self._heap)
+                if self._scheduled.get((event_id, start)) != fire_at:
+                    continue  # Superseded by a later schedule() call
+                del self._scheduled[(event_id, start)]
+                self._by_event[event_id].discard(start)
+                due.append((event_id, start))
+        return due
+
+    def next_fire_at(self) -> Optional[datetime]:
+        """Return the time of the earliest scheduled reminder."""
+        with self._lock:
+            while self._heap:
+                fire_at, event_id, start = self._heap[0]
+                if self._scheduled.get((event_id, start)) == fire_at:
+                    return fire_at
+                heapq.heappop(self._heap)
+        return None
+
+
+def _recipients(db: Session, household_ids: Iterable[int]) -> Dict[int, List[User]]:
+    """Return the active members of several households."""
+    members: Dict[int, List[User]] = defaultdict(list)
+    for user in db.query(User).filter(
+        User.household_id.in_(list(household_ids)), User.is_active.is_(True)
+    ):
+        members[user.household_id].append(user)
+    return members
+
+
+def _message(
+    event: Event, occurrence: Occurrence, key: str, user: User
+) -> ReminderMessage:
+    """Build the reminder e-mail of one occurrence for one user."""
+    when = occurrence.start_time.strftime("%A %d %B %Y, %H:%M")
+    if occurrence.is_all_day:
+        when = occurrence.start_time.strftime("%A %d %B %Y")
+    lines = [f"{occurrence.title or 'Untitled event'} starts {when}."]
+    if occurrence.location:
+        lines.append(f"Location: {occurrence.location}")
+    if occurrence.description:
+        lines.extend(["", occurrence.description])
+    return ReminderMessage(
+        dedupe_key=key,
+        event_id=event.id,
+        recipient=user.email,
+        subject=f"Reminder: {occurrence.title or 'Untitled event'}",
+        body="\n".join(lines),
+    )
+
+
+def claim_reminders(
+    db: Session, due: List[Tuple[int, datetime]], now: datetime
+) -> List[ReminderMessage]:
+    """Claim the deliveries of due reminders and build their messages.
+
+    Deliveries already sent, or claimed by another worker whose lease has not
+    expired, are skipped. Expired claims of earlier batches are taken over.
+
+    Args:
+        db: Database session.
+        due: (event ID, occurrence start) pairs popped from the scheduler.
+        now: Current time.
+
+    Returns:
+        The messages to send; the claims are committed.
+    """
+    lease_expired = now - timedelta(seconds=settings.REMINDER_LEASE_SECONDS)
+    retries = (
+        db.query(ReminderDelivery)
+        .filter(
+            ReminderDelivery.sent_at.is_(None),
+            ReminderDelivery.claimed_at < lease_expired,
+            ReminderDelivery.attempts < settings.REMINDER_MAX_ATTEMPTS,
+        )
+        .limit(settings.REMINDER_BATCH_SIZE)
+        .all()
+    )
+    wanted = set(due) | {(row.event_id, row.occurrence_start) for row in retries}
+    if not wanted:
+        return []
+
+    events = {
+        event.id: event
+        for event in db.query(Event).filter(
+            Event.id.in_({event_id for event_id, _ in wanted})
+        )
+    }
+    members = _recipients(db, {event.household_id for event in events.values()})
+    candidates: Dict[str, ReminderMessage] = {}
+    deliveries: Dict[str, Tuple[int, str, datetime]] = {}
+    for event_id, start in sorted(wanted, key=lambda pair: (pair[1], pair[0])):
+        event = events.get(event_id)
+        if event is None or not event.reminder_enabled:
+            continue
+        occurrence = find_occurrence(event, start)
+        if occurrence is None:
+            continue  # Cancelled or moved since it was scheduled
+        for user in members.get(event.household_id, []):
+            key = dedupe_key(event_id, start, user.id)
+            candidates[key] = _message(event, occurrence, key, user)
+            deliveries[key] = (user.id, user.email, start)
+    if not candidates:
+        return []
+
+    existing = {
+        row.dedupe_key: row
+        for row in db.query(ReminderDelivery).filter(
+            ReminderDelivery.dedupe_key.in_(list(candidates))
+        )
+    }
+    claimed = []
+    for key, message in candidates.items():
+        row = existing.get(key)
+        if row is None:
+            user_id, recipient, start = deliveries[key]
+            db.add(
+                ReminderDelivery(
+                    dedupe_key=key,
+                    event_id=message.event_id,
+                    user_id=user_id,
+                    recipient=recipient,
+                    occurrence_start=start,
+                    attempts=1,
+                    claimed_at=now,
+                )
+            )
+            claimed.append(message)
+            continue
+        if row.sent_at is not None or row.claimed_at >= lease_expired:
+            continue
+        if row.attempts >= settings.REMINDER_MAX_ATTEMPTS:
+            continue
+        # Take over an expired claim unless another worker just did
+        taken = (
+            db.query(ReminderDelivery)
+            .filter(
+                ReminderDelivery.id == row.id,
+                ReminderDelivery.claimed_at == row.claimed_at,
+            )
+            .update(
+                {
+                    ReminderDelivery.claimed_at: now,
+                    ReminderDelivery.attempts: ReminderDelivery.attempts + 1,
+                },
+                synchronize_session=False,
+            )
+        )
+        if taken:
+            claimed.append(message)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker claimed part of the batch first; it sends the batch
+        db.rollback()
+        logger.info("Reminder batch already claimed by another worker")
+        return []
+    return claimed
+
+
+def complete_reminders(
+    db: Session, sent: List[str], failed: Dict[str, str], now: datetime
+) -> None:
+    """Mark claimed deliveries as sent, or record why sending failed."""
+    if sent:
+        db.query(ReminderDelivery).filter(ReminderDelivery.dedupe_key.in_(sent)).update(
+            {ReminderDelivery.sent_at: now}, synchronize_session=False
+        )
+    for key, error in failed.items():
+        db.query(ReminderDelivery).filter(ReminderDelivery.dedupe_key == key).update(
+            {ReminderDelivery.last_error: error[:1000]}, synchronize_session=False
+        )
+    db.commit()
+
+
+def _email(message: ReminderMessage) -> EmailMessage:
+    """Convert a reminder into an e-mail message."""
+    sender = settings.EMAILS_FROM_EMAIL or f"no-reply@{settings.SMTP_HOST}"
+    email = EmailMessage()
+    email["From"] = (
+        f"{settings.EMAILS_FROM_NAME} <{sender}>"
+        if settings.EMAILS_FROM_NAME
+        else sender
+    )
+    email["To"] = message.recipient
+    email["Subject"] = message.subject
+    email["Message-ID"] = f"<{message.dedupe_key}@{sender.rsplit('@', 1)[-1]}>"
+    email.set_content(message.body)
+    return email
+
+
+async def send_reminders(
+    messages: List[ReminderMessage],
+) -> Tuple[List[str], Dict[str, str]]:
+    """Send a batch of reminders over a single SMTP connection.
+
+    Returns:
+        The dedupe keys of the accepted messages, and the error of each
+        rejected one.
+    """
+    sent: List[str] = []
+    failed: Dict[str, str] = {}
+    client = aiosmtplib.SMTP(
+        hostname=settings.SMTP_HOST,
+        port=settings.SMTP_PORT,
+        username=settings.SMTP_USER,
+        password=settings.SMTP_PASSWORD,
+        start_tls=settings.SMTP_TLS,
+    )
+    try:
+        async with client:
+            for message in messages:
+                try:
+                    await client.send_message(_email(message))
+                    sent.append(message.dedupe_key)
+                except aiosmtplib.SMTPResponseException as e:
+                    failed[message.dedupe_key] = f"{e.code} {e.message}"
+                except aiosmtplib.SMTPRecipientsRefused as e:
+                    # The client reset the envelope; the connection is usable
+                    failed[message.dedupe_key] = "; ".join(
+                        f"{refused.code} {refused.message}" for refused in e.recipients
+                    )
+    except (aiosmtplib.SMTPException, OSError) as e:
+        # The connection failed; unsent messages are retried after their lease
+        for message in messages:
+            if message.dedupe_key not in sent:
+                failed.setdefault(message.dedupe_key, str(e))
+    return sent, failed
+
+
+# Shared reminder scheduler used by the API process
+reminder_scheduler = ReminderScheduler()
+
+
+def _collect_due(now: datetime) -> List[ReminderMessage]:
+    """Refill the scheduler if needed and claim one batch of due reminders."""
+    db = SessionLocal()
+    try:
+        if reminder_scheduler.needs_refill(now):
+            reminder_scheduler.refill(db, now)
+        return claim_reminders(db, reminder_scheduler.pop_due(now), now)
+    finally:
+        db.close()
+
+
+def _complete(sent: List[str], failed: Dict[str, str], now: datetime) -> None:
+    """Record the outcome of a batch in a dedicated session."""
+    db = SessionLocal()
+    try:
+        complete_reminders(db, sent, failed, now)
+    finally:
+        db.close()
+
+
+async def dispatch_due_reminders(now: Optional[datetime] = None) -> int:
+    """Send every due reminder, one batch per SMTP connection.
+
+    Database work runs in the default executor so the event loop only waits
+    on the SMTP server.
+
+    Returns:
+        The number of reminders sent.
+    """
+    loop = asyncio.get_running_loop()
+    total = 0
+    while True:
+        batch_time = now or datetime.utcnow()
+        messages = await loop.run_in_executor(None, _collect_due, batch_time)
+        if not messages:
+            return total
+        sent, failed = await send_reminders(messages)
+        await loop.run_in_executor(None, _complete, sent, failed, batch_time)
+        total += len(sent)
+        logger.info(f"Sent {len(sent)} reminders, {len(failed)} failed")
+        if failed:
+            return total  # Let the leases expire before retrying
@@ -0,0 +1,309 @@
+"""
+Recurring Transaction Scheduler
+
+This module materializes transactions of recurring series lazily. Instead of
+pre-inserting future rows, the scheduler keeps a min-heap of the next due date
+of every active series and inserts a transaction only once it is due, or when a
+range query reaches a due date that has not been materialized yet.
+
+The persisted ``RecurringSeries.next_due_date`` is the only scheduler state, so
+the heap can be rebuilt after a restart and a crashed tick is simply retried.
+"""
+
+import heapq
+import logging
+import threading
+from collections import defaultdict
+from datetime import date
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.database import SessionLocal
+from api.models.finance import (
+    RecurringSeries,
+    Transaction,
+    TransactionStatus,
+)
+
+from .recurring import next_due_date
+from .versions import bump_finance_version
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on catch-up occurrences per series in one tick, so a series that
+# was missed for years cannot monopolize a tick
+MAX_OCCURRENCES_PER_SERIES = 366
+
+
+def iter_occurrences(series: RecurringSeries, start: date, end: date) -> Iterator[date]:
+    """Yield the due dates of a series between two dates, inclusive.
+
+    Iteration starts at the persisted next due date, so only occurrences that
+    have not been materialized yet are produced.
+    """
+    due = series.next_due_date
+    while due is not None and due <= end:
+        if due >= start:
+            yield due
+        due = next_due_date(due, series.frequency)
+
+
+class RecurringScheduler:
+    """Min-heap scheduler that materializes recurring transactions when due."""
+
+    def __init__(self, batch_size: int = settings.RECURRING_SCHEDULER_BATCH_SIZE):
+        """Initialize the scheduler.
+
+        Args:
+            batch_size: Maximum number of series materialized per tick.
+        """
+        self.batch_size = batch_size
+        self._heap: List[Tuple[date, int]] = []
+        # Canonical due date per series; heap entries that disagree are stale
+        self._scheduled: Dict[int, date] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def load(self, db: Session) -> None:
+        """Rebuild the heap from the persisted next due dates."""
+        rows = (
+            db.query(RecurringSeries.id, RecurringSeries.next_due_date)
+            .filter(
+                RecurringSeries.is_active.is_(True),
+                RecurringSeries.next_due_date.isnot(None),
+            )
+            .all()
+        )
+        with self._lock:
+            self._scheduled = {series_id: due for series_id, due in rows}
+            self._heap = [(due, series_id) for series_id, due in rows]
+            heapq.heapify(self._heap)
+            self._loaded = True
+        logger.info(f"Loaded {len(rows)} recurring series into the scheduler")
+
+    def schedule(self, series: RecurringSeries) -> None:
+        """Register a new or changed series with the scheduler."""
+        with self._lock:
+            if not series.is_active or series.next_due_date is None:
+                self._scheduled.pop(series.id, None)
+                return
+            if self._scheduled.get(series.id) == series.next_due_date:
+                return
+            self._scheduled[series.id] = series.next_due_date
+            heapq.heappush(self._heap, (series.next_due_date, series.id))
+
+    def _pop_due(self, today: date) -> List[Tuple[date, int]]:
+        """Pop up to one batch of the series due on or before today.
+
+        Returns:
+            The due date and ID of every series popped.
+        """
+        popped: List[Tuple[date, int]] = []
+        with self._lock:
+            while self._heap and len(popped) < self.batch_size:
+                due, series_id = self._heap[0]
+                if due > today:
+                    break
+                heapq.heappop(self._heap)
+                if self._scheduled.get(series_id) != due:
+                    continue  # Superseded by a later schedule() call
+                del self._scheduled[series_id]
+                popped.append((due, series_id))
+        return popped
+
+    def _requeue(self, popped: List[Tuple[date, int]]) -> None:
+        """Put back series popped by a tick that failed, unless rescheduled since."""
+        with self._lock:
+            for due, series_id in popped:
+                if series_id in self._scheduled:
+                    continue
+                self._scheduled[series_id] = due
+                heapq.heappush(self._heap, (due, series_id))
+
+    def tick(self, db: Session, today: Optional[date] = None) -> int:
+        """Materialize one batch of due transactions.
+
+        Args:
+            db: Database session.
+            today: The date to materialize up to. Defaults to the current date.
+
+        Returns:
+            The number of transactions inserted.
+        """
+        today = today or date.today()
+        if not self._loaded:
+            self.load(db)
+
+        popped = self._pop_due(today)
+        if not popped:
+            return 0
+
+        try:
+            series_list = (
+                db.query(RecurringSeries)
+                .filter(RecurringSeries.id.in_([series_id for _, series_id in popped]))
+                .all()
+            )
+            inserted = materialize_series(db, series_list, today)
+        except Exception:
+            # Nothing was committed, so the next tick retries the same series
+            db.rollback()
+            self._requeue(popped)
+            raise
+        for series in series_list:
+            self.schedule(series)
+        return inserted
+
+    def run_pending(self, db: Session, today: Optional[date] = None) -> int:
+        """Tick until nothing is due, committing once per batch."""
+        today = today or date.today()
+        total = 0
+        while True:
+            total += self.tick(db, today)
+            with self._lock:
+                more_due = bool(self._heap) and self._heap[0][0] <= today
+            if not more_due:
+                return total
+
+
+def materialize_series(
+    db: Session, series_list: List[RecurringSeries], until: date
+) -> int:
+    """Insert the due transactions of several series in one batch.
+
+    Existing rows for the same (series, date) pair are skipped, so running the
+    same batch twice inserts nothing. The batch is committed as a whole and the
+    due dates of the series are advanced in the same transaction.
+
+    Args:
+        db: Database session.
+        series_list: Series to materialize.
+        until: Last date (inclusive) to materialize.
+
+    Returns:
+        The number of transactions inserted.
+    """
+    pending: Dict[int, List[date]] = {}
+    for series in series_list:
+        if not series.is_active or series.next_due_date is None:
+            continue
+        dates = []
+        for due in iter_occurrences(series, series.next_due_date, until):
+            dates.append(due)
+            if len(dates) >= MAX_OCCURRENCES_PER_SERIES:
+                break
+        if dates:
+            pending[series.id] = dates
+    if not pending:
+        return 0
+
+    existing: Dict[int, Set[date]] = defaultdict(set)
+    for series_id, existing_date in db.query(
+        Transaction.recurring_series_id, Transaction.date
+    ).filter(
+        Transaction.recurring_series_id.in_(list(pending)),
+        Transaction.date >= min(d[0] for d in pending.values()),
+    ):
+        existing[series_id].add(existing_date)
+
+    new_rows = []
+    for series in series_list:
+        dates = pending.get(series.id)
+        if not dates:
+            continue
+        for due in dates:
+            if due in existing[series.id]:
+                continue
+            new_rows.append(
+                Transaction(
+                    description=series.description,
+                    amount=series.average_amount,
+                    date=due,
+                    type=series.type,
+                    status=TransactionStatus.PENDING,
+                    category_id=series.category_id,
+                    user_id=series.user_id,
+                    household_id=series.household_id,
+                    recurrence_fingerprint=series.fingerprint,
+                    recurring_series_id=series.id,
+                )
+            )
+        series.next_due_date = next_due_date(dates[-1], series.frequency)
+
+    db.add_all(new_rows)
+    for household_id in {row.household_id for row in new_rows}:
+        bump_finance_version(db, household_id)
+    try:
+        db.commit()
+    except IntegrityError:
+        # Another worker materialized the same batch first; its due dates win
+        db.rollback()
+        for series in series_list:
+            db.refresh(series)
+        logger.info("Recurring batch already materialized by another worker")
+        return 0
+    logger.info(
+        f"Materialized {len(new_rows)} recurring transactions "
+        f"for {len(pending)} series"
+    )
+    return len(new_rows)
+
+
+def materialize_household_until(db: Session, household_id: int, until: date) -> int:
+    """Materialize the due transactions of a household before a range query.
+
+    Only occurrences up to today are inserted; future occurrences remain
+    projections.
+    """
+    until = min(until, date.today())
+    series_list = (
+        db.query(RecurringSeries)
+        .filter(
+            RecurringSeries.household_id == household_id,
+            RecurringSeries.is_active.is_(True),
+            RecurringSeries.next_due_date <= until,
+        )
+        .all()
+    )
+    inserted = materialize_series(db, series_list, until)
+    for series in series_list:
+        scheduler.schedule(series)
+    return inserted
+
+
+def project_household_occurrences(
+    db: Session, household_id: int, start: date, end: date
+) -> List[Tuple[RecurringSeries, date]]:
+    """List the not-yet-materialized occurrences of a household in a window."""
+    series_list = (
+        db.query(RecurringSeries)
+        .filter(
+            RecurringSeries.household_id == household_id,
+            RecurringSeries.is_active.is_(True),
+            RecurringSeries.next_due_date <= end,
+        )
+        .all()
+    )
+    occurrences = [
+        (series, due)
+        for series in series_list
+        for due in iter_occurrences(series, start, end)
+    ]
+    occurrences.sort(key=lambda item: (item[1], item[0].id))
+    return occurrences
+
+
+# Shared scheduler instance used by the API process
+scheduler = RecurringScheduler()
+
+
+def run_scheduler_once() -> int:
+    """Run all pending scheduler ticks in a dedicated session."""
+    db = SessionLocal()
+    try:
+        return scheduler.run_pending(db)
+    finally:
+        db.close()
@@ -0,0 +1,240 @@
+"""
+Savings Goal Simulation
+
+This module estimates the probability that a household reaches a savings goal
+by a target date. Monthly net cash flows are resampled from the household's own
+history (an empirical bootstrap) and thousands of balance paths are simulated at
+once with NumPy.
+
+Paths are simulated in fixed-size chunks so that a request stops early, with a
+smaller sample, once it has used its CPU time budget.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from dateutil.relativedelta import relativedelta
+from sqlalchemy import case, extract, func, or_
+from sqlalchemy.orm import Session
+
+from api.config import settings
+from api.models.finance import Transaction, TransactionStatus, TransactionType
+
+logger = logging.getLogger(__name__)
+
+# Percentiles reported for every simulated month
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Number of paths simulated between two CPU budget checks
+CHUNK_SIZE = 1000
+
+# Minimum number of complete months of history to sample from
+MIN_HISTORY_MONTHS = 2
+
+_EXCLUDED_STATUSES = (TransactionStatus.CANCELLED, TransactionStatus.FAILED)
+
+
+@dataclass
+class SimulationResult:
+    """Outcome of a savings goal simulation."""
+
+    months: List[date]
+    percentiles: np.ndarray  # Shape (len(PERCENTILES), len(months))
+    probability: float
+    paths: int
+    truncated: bool
+    history_months: int
+
+
+def monthly_net_cash_flows(
+    db: Session, household_id: int, before: Optional[date] = None
+) -> np.ndarray:
+    """Return the net cash flow of every complete month in a household's history.
+
+    History starts with the household's first month with a transaction; later
+    months without any count as a net flow of zero, so that quiet months are
+    sampled as often as they happened.
+
+    Args:
+        db: Database session.
+        household_id: ID of the household.
+        before: Exclusive upper bound; defaults to the first day of this month
+            so that the current, partial month is ignored.
+    """
+    before = before or date.today().replace(day=1)
+    signed_amount = case(
+        (Transaction.type == TransactionType.INCOME, func.abs(Transaction.amount)),
+        else_=-func.abs(Transaction.amount),
+    )
+    year = extract("year", Transaction.date)
+    month = extract("month", Transaction.date)
+    rows = (
+        db.query(year, month, func.sum(signed_amount))
+        .filter(
+            Transaction.household_id == household_id,
+            Transaction.date < before,
+            or_(
+                Transaction.status.is_(None),
+                Transaction.status.notin_(_EXCLUDED_STATUSES),
+            ),
+        )
+        .group_by(year, month)
+        .all()
+    )
+    if not rows:
+        return np.zeros(0)
+    # Months are indexed from year 0 so that consecutive months differ by one
+    totals = {int(y) * 12 + int(m) - 1: total or 0.0 for y, m, total in rows}
+    first = min(totals)
+    flows = np.zeros(before.year * 12 + before.month - 1 - first)
+    for index, total in totals.items():
+        flows[index - first] = total
+    return flows
+
+
+def months_until(start: date, target: date) -> List[date]:
+    """List the monthly checkpoints between two dates.
+
+    The rest of the start month ends at its last day, each following full
+    month contributes its last day, and the target date closes the final,
+    possibly partial, month.
+    """
+    checkpoints = []
+    month_end = start.replace(day=1) + relativedelta(months=1, days=-1)
+    while month_end < target:
+        checkpoints.append(month_end)
+        month_end = month_end.replace(day=1) + relativedelta(months=2, days=-1)
+    checkpoints.append(target)
+    return checkpoints
+
+
+def month_fractions(start: date, checkpoints: Sequence[date]) -> np.ndarray:
+    """Return the fraction of its month covered by every simulated step.
+
+    Every step runs from the previous checkpoint, or the start, to its
+    checkpoint, within one month: the first and last steps are usually
+    partial, the others are whole months.
+    """
+    fractions = np.empty(len(checkpoints))
+    previous = start
+    for index, checkpoint in enumerate(checkpoints):
+        days_in_month = (
+            checkpoint.replace(day=1) + relativedelta(months=1, days=-1)
+        ).day
+        fractions[index] = (checkpoint - previous).days / days_in_month
+        previous = checkpoint
+    return fractions
+
+
+def simulate_goal(
+    monthly_flows: Sequence[float],
+    starting_balance: float,
+    target_amount: float,
+    months: int,
+    paths: int,
+    seed: Optional[int] = None,
+    max_cpu_seconds: Optional[float] = None,
+    fractions: Optional[Sequence[float]] = None,
+) -> Tuple[np.ndarray, float, bool]:
+    """Simulate savings paths by resampling monthly net cash flows.
+
+    Args:
+        monthly_flows: Empirical monthly net cash flows to sample from.
+        starting_balance: Balance at the start of the simulation.
+        target_amount: Savings goal to reach.
+        months: Number of months to simulate.
+        paths: Number of paths requested.
+        seed: Optional seed for reproducible results.
+        max_cpu_seconds: CPU time budget; remaining chunks are skipped once
+            it is exhausted.
+        fractions: Fraction of a month covered by every step, by which its
+            sampled flows are scaled; whole months by default.
+
+    Returns:
+        A tuple of (balances, probability, truncated) where balances has shape
+        (simulated_paths, months).
+    """
+    flows = np.asarray(monthly_flows, dtype=float)
+    scale = None if fractions is None else np.asarray(fractions, dtype=float)
+    rng = np.random.default_rng(seed)
+    budget = max_cpu_seconds
+    if budget is None:
+        budget = settings.SIMULATION_MAX_CPU_SECONDS
+    # CPU time of this thread only, so concurrent requests don't use it up
+    started = time.thread_time()
+
+    chunks = []
+    hits = 0
+    simulated = 0
+    truncated = False
+    while simulated < paths:
+        size = min(CHUNK_SIZE, paths - simulated)
+        samples = flows[rng.integers(0, len(flows), size=(size, months))]
+        if scale is not None:
+            samples *= scale
+        balances = starting_balance + np.cumsum(samples, axis=1)
+        hits += int(np.count_nonzero(balances.max(axis=1) >= target_amount))
+        chunks.append(balances)
+        simulated += size
+        if simulated < paths and time.thread_time() - started > budget:
+            truncated = True
+            break
+
+    return np.concatenate(chunks), hits / simulated, truncated
+
+
+def simulate_household_goal(
+    db: Session,
+    household_id: int,
+    starting_balance: float,
+    target_amount: float,
+    target_date: date,
+    paths: int,
+    seed: Optional[int] = None,
+    today: Optional[date] = None,
+) -> SimulationResult:
+    """Estimate whether a household reaches a savings goal by a date.
+
+    Raises:
+        ValueError: If the target date is in the past or the household does
+            not have enough history to sample from.
+    """
+    today = today or date.today()
+    if target_date <= today:
+        raise ValueError("target_date must be in the future")
+
+    flows = monthly_net_cash_flows(db, household_id, before=today.replace(day=1))
+    if len(flows) < MIN_HISTORY_MONTHS:
+        raise ValueError(
+            f"At least {MIN_HISTORY_MONTHS} complete months of transactions are "
+            "required to simulate a goal"
+        )
+
+    checkpoints = months_until(today, target_date)
+    balances, probability, truncated = simulate_goal(
+        flows,
+        starting_balance,
+        target_amount,
+        len(checkpoints),
+        min(paths, settings.SIMULATION_MAX_PATHS),
+        seed=seed,
+        fractions=month_fractions(today, checkpoints),
+    )
+    if truncated:
+        logger.info(
+            f"Goal simulation for household {household_id} stopped after "
+            f"{len(balances)} paths on CPU budget"
+        )
+
+    return SimulationResult(
+        months=checkpoints,
+        percentiles=np.percentile(balances, PERCENTILES, axis=0),
+        probability=probability,
+        paths=len(balances),
+        truncated=truncated,
+        history_months=len(flows),
+    )
@@ -0,0 +1,53 @@
+"""
+Household Versions
+
+This module maintains the per-household version counters that key cached
+projections. Bumping happens inside the caller's transaction, so readers in
+other processes see the new version exactly when they see the new data.
+"""
+
+from sqlalchemy.orm import Session
+
+from api.models.household import Household
+
+
+def bump_finance_version(db: Session, household_id: int) -> None:
+    """Increment the finance version of a household.
+
+    The caller is responsible for committing.
+    """
+    db.query(Household).filter(Household.id == household_id).update(
+        {Household.finance_version: Household.finance_version + 1},
+        synchronize_session=False,
+    )
+
+
+def get_finance_version(db: Session, household_id: int) -> int:
+    """Return the current finance version of a household."""
+    version = (
+        db.query(Household.finance_version)
+        .filter(Household.id == household_id)
+        .scalar()
+    )
+    return version or 0
+
+
+def bump_calendar_version(db: Session, household_id: int) -> None:
+    """Increment the calendar version of a household.
+
+    The caller is responsible for committing.
+    """
+    db.query(Household).filter(Household.id == household_id).update(
+        {Household.calendar_version: Household.calendar_version + 1},
+        synchronize_session=False,
+    )
+
+
+def get_calendar_version(db: Session, household_id: int) -> int:
+    """Return the current calendar version of a household."""
+    version = (
+        db.query(Household.calendar_version)
+        .filter(Household.id == household_id)
+        .scalar()
+    )
+    return version or 0
@@ -0,0 +1,86 @@
+"""Add event recurrence
+
+Revision ID: 3f6a9d2c4b17
+Revises: d7a3c5f81e29
+Create Date: 2026-10-19 15:02:51.447126
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3f6a9d2c4b17"
+down_revision: Union[str, None] = "d7a3c5f81e29"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "recurrence_frequency",
+                sa.Enum("DAILY", "WEEKLY", "MONTHLY", "YEARLY", name="eventfrequency"),
+                nullable=True,
+            )
+        )
+        batch_op.add_column(
+            sa.Column("recurrence_interval", sa.Integer(), nullable=True)
+        )
+        batch_op.add_column(sa.Column("recurrence_count", sa.Integer(), nullable=True))
+        batch_op.add_column(
+            sa.Column("recurrence_end_date", sa.DateTime(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("recurrence_by_weekday", sa.Integer(), nullable=True)
+        )
+        batch_op.add_column(
+            sa.Column("sequence", sa.Integer(), server_default="0", nullable=False)
+        )
+
+    op.create_table(
+        "event_exceptions",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("original_start", sa.DateTime(), nullable=False),
+        sa.Column("is_cancelled", sa.Boolean(), nullable=True),
+        sa.Column("start_time", sa.DateTime(), nullable=True),
+        sa.Column("end_time", sa.DateTime(), nullable=True),
+        sa.Column("title", sa.String(), nullable=True),
+        sa.Column("description", sa.Text(), nullable=True),
+        sa.Column("location", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "event_id", "original_start", name="uq_event_exceptions_original_start"
+        ),
+    )
+    with op.batch_alter_table("event_exceptions", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_event_exceptions_id"), ["id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_event_exceptions_event_id"), ["event_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("event_exceptions", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_event_exceptions_event_id"))
+        batch_op.drop_index(batch_op.f("ix_event_exceptions_id"))
+    op.drop_table("event_exceptions")
+
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.drop_column("sequence")
+        batch_op.drop_column("recurrence_by_weekday")
+        batch_op.drop_column("recurrence_end_date")
+        batch_op.drop_column("recurrence_count")
+        batch_op.drop_column("recurrence_interval")
+        batch_op.drop_column("recurrence_frequency")
+    sa.Enum(name="eventfrequency").drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,109 @@
+"""Add recurring series
+
+Revision ID: 5b2e8d41a7c3
+Revises: c216979b7c9d
+Create Date: 2026-10-19 09:12:04.318270
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "5b2e8d41a7c3"
+down_revision: Union[str, None] = "c216979b7c9d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("transactions", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("recurrence_fingerprint", sa.String(length=32), nullable=True)
+        )
+        batch_op.create_index(
+            batch_op.f("ix_transactions_recurrence_fingerprint"),
+            ["recurrence_fingerprint"],
+            unique=False,
+        )
+
+    op.create_table(
+        "recurring_series",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("household_id", sa.Integer(), nullable=True),
+        sa.Column("category_id", sa.Integer(), nullable=True),
+        sa.Column("fingerprint", sa.String(length=32), nullable=False),
+        sa.Column("description", sa.String(), nullable=True),
+        sa.Column(
+            "type",
+            # The transactiontype enum already exists from the initial schema
+            postgresql.ENUM(
+                "EXPENSE", "INCOME", name="transactiontype", create_type=False
+            ),
+            nullable=True,
+        ),
+        sa.Column(
+            "frequency",
+            sa.Enum(
+                "DAILY",
+                "WEEKLY",
+                "BIWEEKLY",
+                "MONTHLY",
+                "QUARTERLY",
+                "YEARLY",
+                name="recurrencefrequency",
+            ),
+            nullable=True,
+        ),
+        sa.Column("average_amount", sa.Float(), nullable=True),
+        sa.Column("occurrence_count", sa.Integer(), nullable=True),
+        sa.Column("first_date", sa.Date(), nullable=True),
+        sa.Column("last_date", sa.Date(), nullable=True),
+        sa.Column("next_due_date", sa.Date(), nullable=True),
+        sa.Column("last_transaction_id", sa.Integer(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["category_id"],
+            ["categories.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["household_id"],
+            ["households.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "household_id", "fingerprint", name="uq_recurring_series_fingerprint"
+        ),
+    )
+    with op.batch_alter_table("recurring_series", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_recurring_series_id"), ["id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_recurring_series_household_id"),
+            ["household_id"],
+            unique=False,
+        )
+        batch_op.create_index(
+            batch_op.f("ix_recurring_series_next_due_date"),
+            ["next_due_date"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("recurring_series", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_recurring_series_next_due_date"))
+        batch_op.drop_index(batch_op.f("ix_recurring_series_household_id"))
+        batch_op.drop_index(batch_op.f("ix_recurring_series_id"))
+    op.drop_table("recurring_series")
+    sa.Enum(name="recurrencefrequency").drop(op.get_bind(), checkfirst=True)
+
+    with op.batch_alter_table("transactions", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_transactions_recurrence_fingerprint"))
+        batch_op.drop_column("recurrence_fingerprint")
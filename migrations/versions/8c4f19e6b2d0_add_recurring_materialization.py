@@ -0,0 +1,53 @@
+"""Add recurring transaction materialization
+
+Revision ID: 8c4f19e6b2d0
+Revises: 5b2e8d41a7c3
+Create Date: 2026-10-19 11:40:27.905113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8c4f19e6b2d0"
+down_revision: Union[str, None] = "5b2e8d41a7c3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("recurring_series", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("user_id", sa.Integer(), nullable=True))
+        batch_op.create_foreign_key(
+            "fk_recurring_series_user", "users", ["user_id"], ["id"]
+        )
+
+    with op.batch_alter_table("transactions", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column("recurring_series_id", sa.Integer(), nullable=True)
+        )
+        batch_op.create_foreign_key(
+            "fk_transactions_recurring_series",
+            "recurring_series",
+            ["recurring_series_id"],
+            ["id"],
+        )
+        batch_op.create_unique_constraint(
+            "uq_transactions_series_date", ["recurring_series_id", "date"]
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("transactions", schema=None) as batch_op:
+        batch_op.drop_constraint("uq_transactions_series_date", type_="unique")
+        batch_op.drop_constraint("fk_transactions_recurring_series", type_="foreignkey")
+        batch_op.drop_column("recurring_series_id")
+
+    with op.batch_alter_table("recurring_series", schema=None) as batch_op:
+        batch_op.drop_constraint("fk_recurring_series_user", type_="foreignkey")
+        batch_op.drop_column("user_id")
@@ -0,0 +1,96 @@
+"""Add event interval index
+
+Revision ID: a41e7b9c2d58
+Revises: 3f6a9d2c4b17
+Create Date: 2026-10-19 16:48:13.602915
+
+"""
+
+from datetime import timedelta
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a41e7b9c2d58"
+down_revision: Union[str, None] = "3f6a9d2c4b17"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("households", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "calendar_version", sa.Integer(), server_default="0", nullable=False
+            )
+        )
+
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("span_start", sa.DateTime(), nullable=True))
+        batch_op.add_column(sa.Column("span_end", sa.DateTime(), nullable=True))
+        batch_op.create_index(
+            "ix_events_household_start", ["household_id", "start_time"], unique=False
+        )
+
+    # Backfill the spans; series are left endless until their next write
+    bind = op.get_bind()
+    events = sa.table(
+        "events",
+        sa.column("id", sa.Integer),
+        sa.column("start_time", sa.DateTime),
+        sa.column("end_time", sa.DateTime),
+        sa.column("is_all_day", sa.Boolean),
+        sa.column("recurrence_frequency", sa.String),
+        sa.column("span_start", sa.DateTime),
+        sa.column("span_end", sa.DateTime),
+    )
+    rows = bind.execute(
+        sa.select(
+            events.c.id,
+            events.c.start_time,
+            events.c.end_time,
+            events.c.is_all_day,
+            events.c.recurrence_frequency,
+        ).where(events.c.start_time.isnot(None))
+    ).fetchall()
+    spans = []
+    for event_id, start_time, end_time, is_all_day, frequency in rows:
+        if frequency is not None:
+            span_end = None
+        elif end_time is not None:
+            span_end = max(end_time, start_time)
+        else:
+            span_end = start_time + timedelta(days=1 if is_all_day else 0)
+        spans.append({"event_id": event_id, "start": start_time, "end": span_end})
+    if spans:
+        bind.execute(
+            events.update()
+            .where(events.c.id == sa.bindparam("event_id"))
+            .values(span_start=sa.bindparam("start"), span_end=sa.bindparam("end")),
+            spans,
+        )
+
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            "ALTER TABLE events ADD COLUMN during tsrange "
+            "GENERATED ALWAYS AS (tsrange(span_start, span_end, '[]')) STORED"
+        )
+        op.execute("CREATE INDEX ix_events_during ON events USING gist (during)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_events_during")
+        op.execute("ALTER TABLE events DROP COLUMN IF EXISTS during")
+
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.drop_index("ix_events_household_start")
+        batch_op.drop_column("span_end")
+        batch_op.drop_column("span_start")
+
+    with op.batch_alter_table("households", schema=None) as batch_op:
+        batch_op.drop_column("calendar_version")
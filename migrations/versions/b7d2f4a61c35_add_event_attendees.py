@@ -0,0 +1,42 @@
+"""Add event attendees
+
+Revision ID: b7d2f4a61c35
+Revises: e58b3c1f7a94
+Create Date: 2026-10-19 19:42:11.583120
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d2f4a61c35"
+down_revision: Union[str, None] = "e58b3c1f7a94"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "event_attendees",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "user_id"),
+    )
+    with op.batch_alter_table("event_attendees", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_event_attendees_user_id"), ["user_id"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("event_attendees", schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f("ix_event_attendees_user_id"))
+
+    op.drop_table("event_attendees")
@@ -0,0 +1,34 @@
+"""Add event UID
+
+Revision ID: c94e2a7d5b13
+Revises: b7d2f4a61c35
+Create Date: 2026-10-19 21:16:48.302957
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c94e2a7d5b13"
+down_revision: Union[str, None] = "b7d2f4a61c35"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.add_column(sa.Column("uid", sa.String(), nullable=True))
+        batch_op.create_index(
+            "ix_events_household_uid", ["household_id", "uid"], unique=True
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.drop_index("ix_events_household_uid")
+        batch_op.drop_column("uid")
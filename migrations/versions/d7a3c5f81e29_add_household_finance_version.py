@@ -0,0 +1,34 @@
+"""Add household finance version
+
+Revision ID: d7a3c5f81e29
+Revises: 8c4f19e6b2d0
+Create Date: 2026-10-19 14:05:51.662094
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d7a3c5f81e29"
+down_revision: Union[str, None] = "8c4f19e6b2d0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("households", schema=None) as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "finance_version", sa.Integer(), nullable=False, server_default="0"
+            )
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("households", schema=None) as batch_op:
+        batch_op.drop_column("finance_version")
@@ -0,0 +1,69 @@
+"""Add reminder deliveries
+
+Revision ID: e58b3c1f7a94
+Revises: a41e7b9c2d58
+Create Date: 2026-10-19 18:05:37.214806
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e58b3c1f7a94"
+down_revision: Union[str, None] = "a41e7b9c2d58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_events_reminder_start",
+            ["reminder_enabled", "start_time"],
+            unique=False,
+        )
+
+    op.create_table(
+        "reminder_deliveries",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("dedupe_key", sa.String(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("recipient", sa.String(), nullable=False),
+        sa.Column("occurrence_start", sa.DateTime(), nullable=False),
+        sa.Column("attempts", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("claimed_at", sa.DateTime(), nullable=False),
+        sa.Column("sent_at", sa.DateTime(), nullable=True),
+        sa.Column("last_error", sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("dedupe_key"),
+    )
+    with op.batch_alter_table("reminder_deliveries", schema=None) as batch_op:
+        batch_op.create_index(
+            batch_op.f("ix_reminder_deliveries_event_id"), ["event_id"], unique=False
+        )
+        batch_op.create_index(
+            batch_op.f("ix_reminder_deliveries_id"), ["id"], unique=False
+        )
+        batch_op.create_index(
+            "ix_reminder_deliveries_pending", ["sent_at", "claimed_at"], unique=False
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("reminder_deliveries", schema=None) as batch_op:
+        batch_op.drop_index("ix_reminder_deliveries_pending")
+        batch_op.drop_index(batch_op.f("ix_reminder_deliveries_id"))
+        batch_op.drop_index(batch_op.f("ix_reminder_deliveries_event_id"))
+
+    op.drop_table("reminder_deliveries")
+
+    with op.batch_alter_table("events", schema=None) as batch_op:
+        batch_op.drop_index("ix_events_reminder_start")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the generated client's throughput as its channel pool grows.
+
+Serves the gRPC API from a child process, as ``transports`` does, and lists
+one page of transactions from many concurrent tasks sharing one
+``AsyncClient`` with 1, 2, 4... channels. A channel is one HTTP/2 connection,
+whose streams are limited by the server's ``grpc.max_concurrent_streams`` and
+share one connection's flow control, so a client hammering the API with a
+single channel queues calls that a pool would send at once.
+
+The client must have been generated first, and the database is shared by
+all processes, so it must be a file or a server, and it must be empty.
+
+Usage:
+    python scripts/generate_client.py
+    SECRET_KEY=bench DATABASE_URL=sqlite:////tmp/client-bench.db \\
+        PYTHONPATH=client python -m scripts.benchmarks.client_pool
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import time
+from typing import List, Tuple
+
+from lifemanager_client import AsyncClient
+from lifemanager_client.exceptions import GRPCClientError
+from lifemanager_client.proto.api.v1 import finance_pb2
+
+from api.models.database import engine
+from api.security import create_access_token
+
+from .grpc_server import free_port
+from .transports import EMAIL, load, serve
+
+
+async def drive(
+    port: int, pool_size: int, page_size: int, concurrency: int, duration: float
+) -> Tuple[int, List[float], int]:
+    """List transactions from concurrent tasks; return calls, latencies, errors."""
+    token = create_access_token(data={"sub": EMAIL})
+    async with AsyncClient(
+        host="127.0.0.1", port=port, token=token, pool_size=pool_size
+    ) as client:
+        request = finance_pb2.TransactionFilter(page_size=page_size)
+        # Warm up every channel of the pool
+        for _ in range(pool_size):
+            await client.finance.ListTransactions(request)
+        latencies: List[float] = []
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    await client.finance.ListTransactions(request)
+                except GRPCClientError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1e3)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return len(latencies), latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=1_000)
+    parser.add_argument("--pool-size", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=256)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    load(args.transactions)
+    print(f"Loaded {args.transactions} transactions into {engine.dialect.name}")
+    context = multiprocessing.get_context("spawn")
+    port = free_port()
+    ready = context.Event()
+    process = context.Process(target=serve, args=("grpc", port, ready))
+    process.start()
+    try:
+        ready.wait(30)
+        baseline = None
+        for pool_size in args.pool_size:
+            calls, latencies, errors = asyncio.run(
+                drive(port, pool_size, args.page_size, args.concurrency, args.duration)
+            )
+            throughput = (calls - errors) / args.duration
+            baseline = baseline or throughput
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(
+                f"  {pool_size:>3} channels {throughput:8.0f} rps  "
+                f"x{throughput / baseline:5.2f}  "
+                f"p50 {statistics.median(latencies):8.2f} ms  "
+                f"p99 {p99:8.2f} ms  errors {errors}"
+            )
+    finally:
+        process.terminate()
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
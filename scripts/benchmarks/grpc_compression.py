@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Benchmark the CPU cost of compressing gRPC responses against the bytes saved.
+
+Builds ``ListUsers`` and ``ListTransactions`` responses of increasing sizes
+and compresses each with gzip and deflate as gRPC does (zlib at its default
+level), reporting the bytes on the wire, the CPU time spent compressing on
+the server and decompressing on the client, and the break-even bandwidth:
+on links slower than it, compression saves more transfer time than it costs.
+Responses of a method whose typical size is below the smallest size that
+breaks even on the links its clients use are not worth compressing, which is
+where ``GRPC_COMPRESSION_MIN_BYTES`` and the per-method thresholds of
+``GRPC_COMPRESSION_POLICY`` should sit.
+
+Usage:
+    DATABASE_URL=sqlite:// python -m scripts.benchmarks.grpc_compression
+"""
+
+import argparse
+import statistics
+import time
+import zlib
+from typing import Callable, List, Tuple
+
+from api.generated.api.v1 import finance_pb2, user_pb2
+from api.services.grpc.finance_service import FinanceService
+from api.services.grpc.user_service import user_to_proto
+
+from .proto_converters import generate
+
+# zlib window bits of gRPC's algorithms; gzip adds a header and trailer
+WINDOW_BITS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def compress(data: bytes, wbits: int) -> bytes:
+    """Compress data the way gRPC's message compression does."""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, wbits)
+    return compressor.compress(data) + compressor.flush()
+
+
+def measure(function: Callable[[], object], repeat: int) -> float:
+    """Return the median time in microseconds of calls to a function."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1e6)
+    return statistics.median(timings)
+
+
+def responses(sizes: List[int]) -> List[Tuple[str, int, bytes]]:
+    """Serialize list responses with each number of items."""
+    users, transactions = generate(max(sizes))
+    transaction_to_proto = FinanceService._transaction_to_proto
+    serialized = []
+    for size in sizes:
+        serialized.append(
+            (
+                "ListUsers",
+                size,
+                user_pb2.UserListResponse(
+                    users=[user_to_proto(user) for user in users[:size]]
+                ).SerializeToString(),
+            )
+        )
+        serialized.append(
+            (
+                "ListTransactions",
+                size,
+                finance_pb2.TransactionListResponse(
+                    transactions=[
+                        transaction_to_proto(transaction)
+                        for transaction in transactions[:size]
+                    ],
+                    total=size,
+                ).SerializeToString(),
+            )
+        )
+    return serialized
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 50, 200, 500])
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    print(
+        f"{'response':<17}{'items':>6}{'bytes':>9}  {'algorithm':<8}{'wire':>8}"
+        f"{'ratio':>7}{'compress':>11}{'decompress':>12}{'break-even':>13}"
+    )
+    for name, size, data in responses(args.sizes):
+        for algorithm, wbits in WINDOW_BITS.items():
+            compressed = compress(data, wbits)
+            compress_us = measure(lambda: compress(data, wbits), args.repeat)
+            decompress_us = measure(
+                lambda: zlib.decompress(compressed, wbits), args.repeat
+            )
+            saved_bits = (len(data) - len(compressed)) * 8
+            # Link speed at which sending the saved bytes takes as long as
+            # compressing and decompressing them
+            cpu_seconds = (compress_us + decompress_us) / 1e6
+            break_even = (
+                f"{saved_bits / cpu_seconds / 1e6:8.0f} Mbps"
+                if saved_bits > 0
+                else "never"
+            )
+            print(
+                f"{name:<17}{size:>6}{len(data):>9}  {algorithm:<8}"
+                f"{len(compressed):>8}{len(compressed) / len(data):>7.2f}"
+                f"{compress_us:>9.0f}us{decompress_us:>10.0f}us{break_even:>13}"
+            )
+
+
+if __name__ == "__main__":
+    main()
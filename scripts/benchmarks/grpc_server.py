@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+Benchmark the gRPC server before and after the move to grpc.aio.
+
+Serves ``CalendarService`` from a child process, either the way ``api.run``
+used to (a synchronous ``grpc.server`` with ``settings.WORKERS`` threads) or
+the way it does now (the ``grpc.aio`` server of ``create_servers``, with its
+interceptors), and drives it from an asyncio client at increasing numbers of
+concurrent RPCs. The synchronous server runs the same blocking method bodies
+without interceptors, so it is not charged for authentication.
+
+``--db-latency-ms`` delays every query to emulate a database server; the
+synchronous server then runs at most ``WORKERS`` queries at a time.
+
+The database is shared by both processes, so it must be a file or a server,
+and it must be empty.
+
+Usage:
+    DATABASE_URL=sqlite:////tmp/grpc-bench.db \\
+        python -m scripts.benchmarks.grpc_server
+    DATABASE_URL=sqlite:////tmp/grpc-bench.db \\
+        python -m scripts.benchmarks.grpc_server --db-latency-ms 20
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import socket
+import statistics
+import time
+from concurrent import futures
+from datetime import datetime, timedelta
+from typing import Callable, List, Tuple
+
+import grpc
+import grpc.aio
+from grpc_health.v1 import health, health_pb2, health_pb2_grpc
+from sqlalchemy import event, insert
+
+from api.config import settings
+from api.generated.api.v1 import calendar_pb2, calendar_pb2_grpc
+from api.grpc_utils import to_proto_timestamp
+from api.models import Base, Event, Household, User
+from api.models.database import SessionLocal, engine
+from api.security import create_access_token
+from api.services.grpc import CalendarService
+
+EMAIL = "member@example.com"
+EPOCH = datetime(2030, 1, 6)  # A Sunday
+
+
+class ThreadedServicer:
+    """Serve the blocking bodies of a servicer's RPC methods, as before grpc.aio.
+
+    The user is set on the context as the removed synchronous auth
+    interceptor did.
+    """
+
+    def __init__(self, servicer, user: dict):
+        self._servicer = servicer
+        self._user = user
+
+    def __getattr__(self, name: str) -> Callable:
+        blocking = getattr(type(self._servicer), name).__wrapped__
+
+        def method(request, context):
+            context.user = self._user
+            return blocking(self._servicer, request, context)
+
+        return method
+
+
+def load(events: int) -> None:
+    """Insert a household with one member and a week of events."""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    db.execute(insert(Household), [{"id": 1, "name": "household-1"}])
+    db.execute(
+        insert(User),
+        [{"id": 1, "email": EMAIL, "hashed_password": "x", "household_id": 1}],
+    )
+    rows = []
+    for event_id in range(1, events + 1):
+        start = EPOCH + timedelta(minutes=30 * (event_id % (7 * 48)))
+        rows.append(
+            {
+                "id": event_id,
+                "title": f"event-{event_id}",
+                "household_id": 1,
+                "created_by_user_id": 1,
+                "start_time": start,
+                "end_time": start + timedelta(minutes=30),
+                "is_all_day": False,
+                "span_start": start,
+                "span_end": start + timedelta(minutes=30),
+            }
+        )
+    db.execute(insert(Event), rows)
+    db.commit()
+    db.close()
+    engine.dispose()  # Connections must not be shared with the server process
+
+
+def serve(mode: str, port: int, ready, db_latency: float) -> None:
+    """Run a server of the given mode until the process is terminated."""
+    if db_latency:
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def round_trip(*args):
+            time.sleep(db_latency)
+
+    if mode == "sync":
+        server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=settings.WORKERS),
+            options=[
+                ("grpc.max_concurrent_streams", settings.GRPC_MAX_CONCURRENT_RPCS)
+            ],
+        )
+        calendar_pb2_grpc.add_CalendarServiceServicer_to_server(
+            ThreadedServicer(CalendarService(), {"email": EMAIL}), server
+        )
+        health_pb2_grpc.add_HealthServicer_to_server(health.HealthServicer(), server)
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        server.start()
+        ready.set()
+        server.wait_for_termination()
+        return
+
+    async def serve_aio():
+        from api.run import create_servers
+
+        [server] = create_servers()
+        health_pb2_grpc.add_HealthServicer_to_server(
+            health.aio.HealthServicer(), server
+        )
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        await server.start()
+        ready.set()
+        await server.wait_for_termination()
+
+    asyncio.run(serve_aio())
+
+
+async def drive(
+    port: int, workload: str, concurrency: int, duration: float
+) -> Tuple[int, List[float], int]:
+    """Call a workload's RPC from concurrent tasks; return calls, latencies, errors."""
+    metadata = (
+        ("authorization", f"Bearer {create_access_token(data={'sub': EMAIL})}"),
+    )
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        calendar = calendar_pb2_grpc.CalendarServiceStub(channel)
+        health_stub = health_pb2_grpc.HealthStub(channel)
+        calls = {
+            "Health/Check": lambda: health_stub.Check(health_pb2.HealthCheckRequest()),
+            "GetEvent": lambda: calendar.GetEvent(
+                calendar_pb2.IdRequest(id="1"), metadata=metadata
+            ),
+            "GetEventsInRange (1 day)": lambda: calendar.GetEventsInRange(
+                calendar_pb2.EventsInRangeRequest(
+                    household_id="1",
+                    start_date=to_proto_timestamp(EPOCH),
+                    end_date=to_proto_timestamp(EPOCH + timedelta(days=1)),
+                ),
+                metadata=metadata,
+            ),
+        }
+        call = calls[workload]
+        await call()  # Warm up the channel and the server's caches
+        latencies: List[float] = []
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    await call()
+                except grpc.aio.AioRpcError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1e3)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return len(latencies), latencies, errors
+
+
+def free_port() -> int:
+    """Return a free local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=2_000)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64, 256])
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument(
+        "--db-latency-ms",
+        type=float,
+        default=0.0,
+        help="Delay added to every query, e.g. the round trip to a database server",
+    )
+    args = parser.parse_args()
+
+    load(args.events)
+    print(
+        f"Loaded {args.events} events into {engine.dialect.name} "
+        f"(+{args.db_latency_ms:g} ms per query); "
+        f"sync server has {settings.WORKERS} threads, aio server admits "
+        f"{settings.GRPC_MAX_CONCURRENT_RPCS} RPCs"
+    )
+    context = multiprocessing.get_context("spawn")
+    for mode in ("sync", "aio"):
+        port = free_port()
+        ready = context.Event()
+        process = context.Process(
+            target=serve, args=(mode, port, ready, args.db_latency_ms / 1e3)
+        )
+        process.start()
+        try:
+            ready.wait(30)
+            print(f"{mode}:")
+            for workload in ("Health/Check", "GetEvent", "GetEventsInRange (1 day)"):
+                for concurrency in args.concurrency:
+                    calls, latencies, errors = asyncio.run(
+                        drive(port, workload, concurrency, args.duration)
+                    )
+                    latencies.sort()
+                    p50 = statistics.median(latencies)
+                    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                    print(
+                        f"  {workload:<26} x{concurrency:<4} "
+                        f"{calls / args.duration:8.0f} rps  p50 {p50:8.2f} ms  "
+                        f"p99 {p99:8.2f} ms  errors {errors}"
+                    )
+        finally:
+            process.terminate()
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark REST and gRPC throughput as the prefork servers get more processes.
+
+Runs the HTTP and gRPC servers with 1, 2, 4... worker processes each under
+the prefork supervisor, as ``python -m api`` does with ``HTTP_PROCESSES``
+and ``GRPC_PROCESSES`` set, and lists one page of transactions over each
+transport from several client processes, so the clients do not become the
+bottleneck. A single server process is bound to one core by the GIL, so
+throughput should grow with the workers up to the number of cores left to
+the servers once the clients have theirs.
+
+The database is shared by all processes, so it must be a file or a server,
+and it must be empty. Both transports must accept the same tokens, so set
+``SECRET_KEY``.
+
+Usage:
+    SECRET_KEY=bench DATABASE_URL=sqlite:////tmp/prefork-bench.db \\
+        python -m scripts.benchmarks.prefork
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+import grpc
+import httpx
+from grpc_health.v1 import health_pb2, health_pb2_grpc
+
+from api.models.database import engine
+
+from .grpc_server import free_port
+from .transports import drive, load
+
+# Seconds the workers are given to come up
+STARTUP_TIMEOUT = 60.0
+
+
+def start_servers(processes: int, http_port: int, grpc_port: int) -> subprocess.Popen:
+    """Start the prefork servers with the given number of workers each."""
+    env = dict(
+        os.environ,
+        PORT=str(http_port),
+        GRPC_PORT=str(grpc_port),
+        HOST="127.0.0.1",
+        # Background jobs are not measured
+        RECURRING_SCHEDULER_ENABLED="false",
+        REMINDER_WORKER_ENABLED="false",
+    )
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-c",
+            f"from api.run import run_prefork; run_prefork({processes}, {processes})",
+        ],
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def wait_ready(processes: int, http_port: int, grpc_port: int) -> None:
+    """Wait until every gRPC worker reports SERVING and HTTP answers."""
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    with grpc.insecure_channel(f"127.0.0.1:{grpc_port}") as channel:
+        health = health_pb2_grpc.HealthStub(channel)
+        while time.monotonic() < deadline:
+            try:
+                statuses = [
+                    health.Check(
+                        health_pb2.HealthCheckRequest(service=f"worker-{slot}"),
+                        timeout=1,
+                    ).status
+                    for slot in range(processes)
+                ]
+                httpx.get(f"http://127.0.0.1:{http_port}/health").raise_for_status()
+                if all(
+                    status == health_pb2.HealthCheckResponse.SERVING
+                    for status in statuses
+                ):
+                    # HTTP workers have no health of their own; give the
+                    # slowest one time to finish its startup
+                    time.sleep(2)
+                    return
+            except (grpc.RpcError, httpx.HTTPError):
+                pass
+            time.sleep(0.5)
+    raise RuntimeError(f"Workers did not come up in {STARTUP_TIMEOUT:g}s")
+
+
+def client(
+    transport: str, port: int, page_size: int, concurrency: int, duration: float
+) -> Tuple[int, List[float], int]:
+    """Run one client process's share of the load."""
+    return asyncio.run(drive(transport, port, page_size, concurrency, duration))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=1_000)
+    parser.add_argument("--processes", type=int, nargs="+")
+    parser.add_argument("--clients", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+    cores = os.cpu_count() or 1
+    processes = args.processes or [
+        2**power for power in range(cores.bit_length()) if 2**power <= cores
+    ]
+
+    load(args.transactions)
+    print(
+        f"Loaded {args.transactions} transactions into {engine.dialect.name}; "
+        f"{cores} cores, {args.clients} client processes x{args.concurrency}"
+    )
+    context = multiprocessing.get_context("spawn")
+    baselines = {}
+    with context.Pool(args.clients) as pool:
+        for count in processes:
+            http_port, grpc_port = free_port(), free_port()
+            servers = start_servers(count, http_port, grpc_port)
+            try:
+                wait_ready(count, http_port, grpc_port)
+                print(f"{count} processes:")
+                for transport, port in (("rest", http_port), ("grpc", grpc_port)):
+                    results = pool.starmap(
+                        client,
+                        [
+                            (
+                                transport,
+                                port,
+                                args.page_size,
+                                args.concurrency,
+                                args.duration,
+                            )
+                        ]
+                        * args.clients,
+                    )
+                    calls = sum(result[0] for result in results)
+                    latencies = [latency for result in results for latency in result[1]]
+                    errors = sum(result[2] for result in results)
+                    throughput = (calls - errors) / args.duration
+                    baseline = baselines.setdefault(transport, throughput)
+                    print(
+                        f"  {transport:<5}{throughput:8.0f} rps  "
+                        f"x{throughput / baseline:5.2f}  "
+                        f"p50 {statistics.median(latencies):8.2f} ms  "
+                        f"errors {errors}"
+                    )
+            finally:
+                servers.send_signal(signal.SIGTERM)
+                servers.wait()
+
+
+if __name__ == "__main__":
+    main()
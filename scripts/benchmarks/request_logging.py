@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cost of logging a request on the request path.
+
+Logs request lines with ``RequestLog`` from concurrent tasks, as the servers
+do once a request ends, and times each call with:
+
+* a ``StreamHandler`` writing on the calling thread, as the servers used to;
+* the queue pipeline of ``configure_logging``, writing on a listener thread;
+
+both to a stream whose writes take ``--write-latency`` milliseconds, as a
+pipe to a busy log collector or a slow disk would. Only the time spent in
+the logging call is measured: with the stream handler every request waits
+for the write, with the queue it only waits to put the record on the queue.
+
+Usage:
+    DATABASE_URL=sqlite:// python -m scripts.benchmarks.request_logging
+"""
+
+import argparse
+import asyncio
+import io
+import logging
+import statistics
+import time
+from typing import List
+
+from api import request_logging
+from api.config import settings
+from api.request_logging import JsonFormatter, RequestLog
+
+
+class SlowStream(io.StringIO):
+    """In-memory stream whose writes take a fixed time."""
+
+    def __init__(self, latency: float):
+        super().__init__()
+        self.latency = latency
+
+    def write(self, text: str) -> int:
+        time.sleep(self.latency)
+        return super().write(text)
+
+
+async def drive(log: RequestLog, requests: int, concurrency: int) -> List[float]:
+    """Log requests from concurrent tasks; return the latency of every call."""
+    latencies: List[float] = []
+
+    async def worker(count: int):
+        for index in range(count):
+            await asyncio.sleep(0)
+            started = time.perf_counter()
+            log.log(
+                "grpc",
+                "api.v1.FinanceService/ListTransactions",
+                "OK",
+                False,
+                1.5,
+                peer=f"ipv4:127.0.0.1:{40000 + index}",
+            )
+            latencies.append((time.perf_counter() - started) * 1e3)
+
+    await asyncio.gather(*(worker(requests // concurrency) for _ in range(concurrency)))
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5_000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--write-latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    # Both write the request lines as JSON
+    settings.LOG_FORMAT = "json"
+    root = logging.getLogger()
+    root.setLevel(logging.INFO)
+    log = RequestLog([], 1.0, float("inf"))
+    for name in ("stream", "queue"):
+        stream = SlowStream(args.write_latency / 1e3)
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        if name == "stream":
+            handler = logging.StreamHandler(stream)
+            handler.setFormatter(JsonFormatter())
+            root.addHandler(handler)
+        else:
+            request_logging.configure_logging(stream=stream)
+        started = time.perf_counter()
+        latencies = sorted(asyncio.run(drive(log, args.requests, args.concurrency)))
+        elapsed = time.perf_counter() - started
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        dropped = request_logging._queue_handler.dropped if name == "queue" else 0
+        print(
+            f"  {name:<7}{len(latencies) / elapsed:9.0f} requests/s  "
+            f"p50 {statistics.median(latencies) * 1e3:8.1f} us  "
+            f"p99 {p99 * 1e3:8.1f} us  dropped {dropped}"
+        )
+
+
+if __name__ == "__main__":
+    main()
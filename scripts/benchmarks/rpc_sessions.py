@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Stress the gRPC server's database sessions at increasing worker counts.
+
+Serves ``FinanceService`` from a child process whose blocking RPC methods run
+on a given number of worker threads, and lists transactions from twice as
+many concurrent RPCs. Every query is delayed by ``--db-latency-ms`` to
+emulate a database server, so throughput is bound by how many RPCs query the
+database at once. Two modes are compared:
+
+* ``per-rpc``: every RPC checks a session out of the pool, as the servicers
+  do now, so throughput grows linearly with the workers, up to the size of
+  the connection pool;
+* ``shared``: the servicer is given one session, as it used to keep, which
+  every worker uses at once. A session is not safe for concurrent use, so
+  once several RPCs overlap they fail or hang until their ``RPC_TIMEOUT``.
+
+The database is shared by all processes, so it must be a file or a server,
+and it must be empty.
+
+Usage:
+    SECRET_KEY=bench DATABASE_URL=sqlite:////tmp/sessions-bench.db \\
+        python -m scripts.benchmarks.rpc_sessions
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import time
+from concurrent import futures
+from typing import List, Tuple
+
+import grpc.aio
+from sqlalchemy import event
+
+from api.generated.api.v1 import finance_pb2, finance_pb2_grpc
+from api.models.database import SessionLocal, engine
+from api.security import create_access_token
+
+from .grpc_server import free_port
+from .transports import EMAIL, load
+
+# Seconds after which an RPC counts as failed; a shared session can hang
+RPC_TIMEOUT = 5.0
+
+
+def serve(mode: str, workers: int, port: int, ready, db_latency: float) -> None:
+    """Run a FinanceService of the given mode until the process is terminated."""
+    from api.grpc_interceptors import create_grpc_interceptors
+    from api.services.grpc import FinanceService, base
+
+    base._blocking_executor = futures.ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="grpc-rpc"
+    )
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def round_trip(*args):
+        time.sleep(db_latency)
+
+    async def serve_aio():
+        server = grpc.aio.server(interceptors=create_grpc_interceptors())
+        servicer = FinanceService(
+            SessionLocal.session_factory() if mode == "shared" else None
+        )
+        finance_pb2_grpc.add_FinanceServiceServicer_to_server(servicer, server)
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        await server.start()
+        ready.set()
+        await server.wait_for_termination()
+
+    asyncio.run(serve_aio())
+
+
+async def drive(
+    port: int, page_size: int, concurrency: int, duration: float
+) -> Tuple[int, List[float], int]:
+    """List transactions from concurrent tasks; return calls, latencies, errors."""
+    metadata = (
+        ("authorization", f"Bearer {create_access_token(data={'sub': EMAIL})}"),
+    )
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        finance = finance_pb2_grpc.FinanceServiceStub(channel)
+
+        async def call() -> None:
+            await finance.ListTransactions(
+                finance_pb2.TransactionFilter(page_size=page_size),
+                metadata=metadata,
+                timeout=RPC_TIMEOUT,
+            )
+
+        await call()  # Warm up the connection
+        latencies: List[float] = []
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    await call()
+                except grpc.aio.AioRpcError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1e3)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return len(latencies), latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=1_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--db-latency-ms", type=float, default=10.0)
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    load(args.transactions)
+    print(
+        f"Loaded {args.transactions} transactions into {engine.dialect.name} "
+        f"(+{args.db_latency_ms:g} ms per query)"
+    )
+    context = multiprocessing.get_context("spawn")
+    for mode in ("per-rpc", "shared"):
+        print(f"{mode}:")
+        baseline = None
+        for workers in args.workers:
+            port = free_port()
+            ready = context.Event()
+            process = context.Process(
+                target=serve,
+                args=(mode, workers, port, ready, args.db_latency_ms / 1e3),
+            )
+            process.start()
+            try:
+                ready.wait(30)
+                calls, latencies, errors = asyncio.run(
+                    drive(port, args.page_size, 2 * workers, args.duration)
+                )
+            finally:
+                process.terminate()
+                process.join()
+            throughput = (calls - errors) / args.duration
+            baseline = baseline or throughput
+            print(
+                f"  {workers:>3} workers {throughput:8.0f} rps  "
+                f"x{throughput / baseline:5.2f}  "
+                f"p50 {statistics.median(latencies):8.2f} ms  errors {errors}"
+            )
+
+
+if __name__ == "__main__":
+    main()
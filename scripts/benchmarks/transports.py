@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark listing transactions over REST and over gRPC side by side.
+
+Both transports call the same ``TransactionService``, so the difference is
+the cost of the transport: HTTP/1.1 and JSON through uvicorn and FastAPI
+against HTTP/2 and protobuf through the ``grpc.aio`` server. Each server runs
+in a child process and is driven by an asyncio client at increasing numbers
+of concurrent requests, each listing one page of transactions.
+
+The gRPC page also counts the matching transactions, which the REST list
+does not.
+
+The database is shared by all processes, so it must be a file or a server,
+and it must be empty. Both transports must accept the same tokens, so set
+``SECRET_KEY``.
+
+Usage:
+    SECRET_KEY=bench DATABASE_URL=sqlite:////tmp/transports-bench.db \\
+        python -m scripts.benchmarks.transports
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Awaitable, Callable, List, Tuple
+
+import grpc.aio
+import httpx
+from sqlalchemy import insert
+
+from api.config import settings
+from api.generated.api.v1 import finance_pb2, finance_pb2_grpc
+from api.models import Base, Category, Household, Transaction, User
+from api.models.database import SessionLocal, engine
+from api.models.finance import TransactionType
+from api.security import create_access_token
+
+from .grpc_server import free_port
+
+EMAIL = "member@example.com"
+
+
+def load(transactions: int) -> None:
+    """Insert a household with one member, one category and its transactions."""
+    Base.metadata.create_all(engine)
+    db = SessionLocal()
+    db.execute(insert(Household), [{"id": 1, "name": "household-1"}])
+    db.execute(
+        insert(User),
+        [{"id": 1, "email": EMAIL, "hashed_password": "x", "household_id": 1}],
+    )
+    db.execute(
+        insert(Category),
+        [
+            {
+                "id": 1,
+                "name": "groceries",
+                "household_id": 1,
+                "type": TransactionType.EXPENSE,
+            }
+        ],
+    )
+    first = date(2030, 1, 1)
+    db.execute(
+        insert(Transaction),
+        [
+            {
+                "id": transaction_id,
+                "description": f"transaction-{transaction_id}",
+                "amount": float(transaction_id % 100),
+                "date": first + timedelta(days=transaction_id % 365),
+                "type": TransactionType.EXPENSE,
+                "category_id": 1,
+                "user_id": 1,
+                "household_id": 1,
+            }
+            for transaction_id in range(1, transactions + 1)
+        ],
+    )
+    db.commit()
+    db.close()
+    engine.dispose()  # Connections must not be shared with the server processes
+
+
+def serve(transport: str, port: int, ready) -> None:
+    """Run a server of the given transport until the process is terminated."""
+    if transport == "rest":
+        import uvicorn
+
+        from api.main import app
+
+        # Lifespan startup runs the background schedulers; they are not measured
+        config = uvicorn.Config(
+            app, host="127.0.0.1", port=port, lifespan="off", log_level="warning"
+        )
+        ready.set()
+        uvicorn.Server(config).run()
+        return
+
+    async def serve_grpc():
+        from api.run import create_servers
+
+        [server] = create_servers()
+        server.add_insecure_port(f"127.0.0.1:{port}")
+        await server.start()
+        ready.set()
+        await server.wait_for_termination()
+
+    asyncio.run(serve_grpc())
+
+
+async def drive(
+    transport: str, port: int, page_size: int, concurrency: int, duration: float
+) -> Tuple[int, List[float], int]:
+    """List transactions from concurrent tasks; return calls, latencies, errors."""
+    token = create_access_token(data={"sub": EMAIL})
+    async with httpx.AsyncClient(
+        base_url=f"http://127.0.0.1:{port}",
+        headers={"Authorization": f"Bearer {token}"},
+        limits=httpx.Limits(max_connections=concurrency),
+    ) as client, grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        finance = finance_pb2_grpc.FinanceServiceStub(channel)
+
+        async def rest() -> None:
+            response = await client.get(
+                f"{settings.API_V1_STR}/finance/transactions/",
+                params={"limit": page_size},
+            )
+            response.raise_for_status()
+
+        async def rpc() -> None:
+            await finance.ListTransactions(
+                finance_pb2.TransactionFilter(page_size=page_size),
+                metadata=(("authorization", f"Bearer {token}"),),
+            )
+
+        call: Callable[[], Awaitable[None]] = rest if transport == "rest" else rpc
+        await call()  # Warm up the connection and the server's caches
+        latencies: List[float] = []
+        errors = 0
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            nonlocal errors
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    await call()
+                except (httpx.HTTPError, grpc.aio.AioRpcError):
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1e3)
+
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return len(latencies), latencies, errors
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transactions", type=int, default=5_000)
+    parser.add_argument("--page-size", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 16, 64])
+    parser.add_argument("--duration", type=float, default=3.0)
+    args = parser.parse_args()
+
+    load(args.transactions)
+    print(f"Loaded {args.transactions} transactions into {engine.dialect.name}")
+    context = multiprocessing.get_context("spawn")
+    for transport in ("rest", "grpc"):
+        port = free_port()
+        ready = context.Event()
+        process = context.Process(target=serve, args=(transport, port, ready))
+        process.start()
+        try:
+            ready.wait(30)
+            time.sleep(1)  # uvicorn binds after signalling
+            print(f"{transport}:")
+            for page_size in args.page_size:
+                for concurrency in args.concurrency:
+                    calls, latencies, errors = asyncio.run(
+                        drive(transport, port, page_size, concurrency, args.duration)
+                    )
+                    latencies.sort()
+                    p50 = statistics.median(latencies)
+                    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+                    print(
+                        f"  page {page_size:<4} x{concurrency:<4} "
+                        f"{calls / args.duration:8.0f} rps  p50 {p50:8.2f} ms  "
+                        f"p99 {p99:8.2f} ms  errors {errors}"
+                    )
+        finally:
+            process.terminate()
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
@@ -28,6 +28,7 @@ TEMPLATE_FILES = [
     "setup.py.tmpl",
     "__init__.py.tmpl",
     "client.py.tmpl",
+    "cache.py.tmpl",
     "models.py.tmpl",
     "exceptions.py.tmpl",
 ]
@@ -67,8 +68,11 @@ def copy_generated_files():
                 # Create destination directory if it doesn't exist
                 dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Copy the file
-                shutil.copy2(src_path, dest_path)
+                # Copy the file, importing its siblings from the client package
+                source = src_path.read_text()
+                dest_path.write_text(
+                    source.replace("from api.generated.api.v1 import", "from . import")
+                )
 
     # Create __init__.py files in all subdirectories
     for root, dirs, _ in os.walk(CLIENT_DIR):
@@ -0,0 +1,49 @@
+"""Shared fixtures of the test suite."""
+
+import os
+import tempfile
+
+# The application reads its settings on import: point it at a SQLite file,
+# shared by the threads of a test, before anything imports it
+os.environ.setdefault(
+    "DATABASE_URL", f"sqlite:///{tempfile.mkdtemp(prefix='life-manager-')}/test.db"
+)
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+import pytest  # noqa: E402
+
+from api.models.base import Base  # noqa: E402
+from api.models.database import SessionLocal, engine  # noqa: E402
+from api.models.household import Household  # noqa: E402
+from api.models.user import User  # noqa: E402
+
+
+@pytest.fixture
+def tables():
+    """Create every table for a test and drop them afterwards."""
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db(tables):
+    """A session of its own, closed after the test."""
+    session = SessionLocal.session_factory()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def household(db):
+    """A household with one member."""
+    user = User(email="owner@example.com", full_name="Owner")
+    user.set_password("password")
+    db.add(user)
+    db.flush()
+    household = Household(name="Home", created_by=user.id)
+    db.add(household)
+    db.flush()
+    user.household_id = household.id
+    db.commit()
+    return household
@@ -0,0 +1,52 @@
+"""Tests of splitting recurring calendar series."""
+
+from datetime import datetime, timedelta
+
+from api.models.calendar import Event, EventException, EventFrequency
+from api.services.event_recurrence import expand_event, touch_event
+from api.services.grpc import CalendarService
+
+WEEK = timedelta(weeks=1)
+T0 = datetime(2024, 1, 1, 18, 0)
+
+
+def test_split_series_moves_later_exceptions_to_the_new_series(db, household):
+    event = Event(
+        title="Choir",
+        start_time=T0,
+        end_time=T0 + timedelta(hours=2),
+        household_id=household.id,
+        created_by_user_id=household.created_by,
+        recurrence_frequency=EventFrequency.WEEKLY,
+        recurrence_count=10,
+    )
+    event.exceptions = [
+        EventException(original_start=T0 + WEEK, is_cancelled=True),
+        EventException(original_start=T0 + 5 * WEEK, title="Concert"),
+        EventException(original_start=T0 + 7 * WEEK, is_cancelled=True),
+    ]
+    touch_event(event)
+    db.add(event)
+    db.commit()
+
+    future = CalendarService(db)._split_series(event, T0 + 4 * WEEK)
+    touch_event(event)
+    db.commit()
+    db.expire_all()
+
+    assert [e.original_start for e in event.exceptions] == [T0 + WEEK]
+    assert sorted(
+        (e.original_start, e.title, e.is_cancelled) for e in future.exceptions
+    ) == [(T0 + 5 * WEEK, "Concert", False), (T0 + 7 * WEEK, None, True)]
+    assert db.query(EventException).count() == 3
+
+    earlier, _ = expand_event(event, T0, T0 + 20 * WEEK)
+    later, _ = expand_event(future, T0, T0 + 20 * WEEK)
+    assert [o.start_time for o in earlier] == [T0, T0 + 2 * WEEK, T0 + 3 * WEEK]
+    assert [(o.start_time, o.title) for o in later] == [
+        (T0 + 4 * WEEK, "Choir"),
+        (T0 + 5 * WEEK, "Concert"),
+        (T0 + 6 * WEEK, "Choir"),
+        (T0 + 8 * WEEK, "Choir"),
+        (T0 + 9 * WEEK, "Choir"),
+    ]
@@ -0,0 +1,224 @@
+"""Tests of the calendar event interval index.
+
+Queries run against the in-memory interval tree on SQLite, and against the
+GiST-indexed ``during`` column on the Postgres database named by
+``TEST_POSTGRES_URL`` when it is set.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from api.models.base import Base
+from api.models.calendar import Event, EventFrequency
+from api.models.household import Household
+from api.models.user import User
+from api.services.event_index import EventIntervalIndex, IntervalTree
+from api.services.event_recurrence import touch_event
+from api.services.versions import bump_calendar_version
+
+DAY = timedelta(days=1)
+T0 = datetime(2024, 3, 1)
+
+
+@pytest.fixture(params=["sqlite", "postgresql"])
+def backend_db(request):
+    """A session on each backend, with the tables created."""
+    if request.param == "sqlite":
+        yield request.getfixturevalue("db")
+        return
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL is not set")
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    try:
+        yield session
+    finally:
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+
+@pytest.fixture
+def calendar(backend_db):
+    """A household to add events to, and an index of its own."""
+    user = User(email="owner@example.com")
+    user.set_password("password")
+    backend_db.add(user)
+    backend_db.flush()
+    household = Household(name="Home", created_by=user.id)
+    backend_db.add(household)
+    backend_db.commit()
+    index = EventIntervalIndex()
+    assert index.uses_database(backend_db) == (
+        backend_db.get_bind().dialect.name == "postgresql"
+    )
+    return backend_db, household, index
+
+
+def add_event(db, household, title, start, end, **recurrence):
+    event = Event(
+        title=title,
+        start_time=start,
+        end_time=end,
+        household_id=household.id,
+        created_by_user_id=household.created_by,
+        **recurrence,
+    )
+    touch_event(event)
+    db.add(event)
+    bump_calendar_version(db, household.id)
+    db.commit()
+    return event
+
+
+def titles(events):
+    return sorted(event.title for event in events)
+
+
+def test_overlapping_finds_events_started_before_the_window(calendar):
+    db, household, index = calendar
+    add_event(db, household, "before", T0 - 3 * DAY, T0 - 2 * DAY)
+    add_event(db, household, "trip", T0 - 5 * DAY, T0 + 2 * DAY)
+    add_event(db, household, "inside", T0 + DAY, T0 + DAY + timedelta(hours=1))
+    add_event(db, household, "at-end", T0 + 7 * DAY, T0 + 8 * DAY)
+    add_event(
+        db,
+        household,
+        "weekly",
+        T0 - 60 * DAY,
+        T0 - 60 * DAY + timedelta(hours=1),
+        recurrence_frequency=EventFrequency.WEEKLY,
+    )
+    add_event(
+        db,
+        household,
+        "ended-series",
+        T0 - 60 * DAY,
+        T0 - 60 * DAY + timedelta(hours=1),
+        recurrence_frequency=EventFrequency.DAILY,
+        recurrence_count=3,
+    )
+
+    window = (T0, T0 + 7 * DAY)
+    assert titles(index.overlapping(db, household.id, *window)) == [
+        "inside",
+        "trip",
+        "weekly",
+    ]
+    assert titles(index.overlapping(db, household.id, *window, recurring=False)) == [
+        "inside",
+        "trip",
+    ]
+    assert titles(index.overlapping(db, household.id, *window, recurring=True)) == [
+        "weekly"
+    ]
+    assert index.overlapping_ids(db, household.id, [window]) == {
+        event.id for event in index.overlapping(db, household.id, *window)
+    }
+
+
+def test_containing_and_within(calendar):
+    db, household, index = calendar
+    add_event(db, household, "month", T0, T0 + 30 * DAY)
+    add_event(db, household, "day", T0 + 2 * DAY, T0 + 3 * DAY)
+    add_event(db, household, "straddling", T0 + 6 * DAY, T0 + 9 * DAY)
+
+    assert titles(index.containing(db, household.id, T0 + 2 * DAY, T0 + 3 * DAY)) == [
+        "day",
+        "month",
+    ]
+    assert titles(index.within(db, household.id, T0 + DAY, T0 + 7 * DAY)) == ["day"]
+
+
+def test_upcoming_lists_next_single_events_by_start(calendar):
+    db, household, index = calendar
+    for day in (5, 1, 3, 2, 4):
+        add_event(db, household, f"day-{day}", T0 + day * DAY, T0 + day * DAY)
+    add_event(db, household, "past", T0 - DAY, T0 - DAY)
+    add_event(
+        db,
+        household,
+        "daily",
+        T0,
+        T0 + timedelta(hours=1),
+        recurrence_frequency=EventFrequency.DAILY,
+    )
+
+    upcoming = index.upcoming(db, household.id, T0, limit=3)
+    assert [event.title for event in upcoming] == ["day-1", "day-2", "day-3"]
+    upcoming = index.upcoming(db, household.id, T0, limit=10, before=T0 + 3 * DAY)
+    assert [event.title for event in upcoming] == ["day-1", "day-2"]
+
+
+def test_queries_see_writes(calendar):
+    db, household, index = calendar
+    moved = add_event(db, household, "moved", T0 + DAY, T0 + 2 * DAY)
+    gone = add_event(db, household, "gone", T0 + DAY, T0 + 2 * DAY)
+    window = (T0, T0 + 7 * DAY)
+    assert titles(index.overlapping(db, household.id, *window)) == ["gone", "moved"]
+
+    # One write since the tree was built is applied to it as an overlay
+    moved.start_time, moved.end_time = T0 + 10 * DAY, T0 + 11 * DAY
+    touch_event(moved)
+    bump_calendar_version(db, household.id)
+    db.commit()
+    index.record_write(db, household.id, changed=[moved])
+    assert titles(index.overlapping(db, household.id, *window)) == ["gone"]
+
+    # After two writes the tree is rebuilt instead
+    gone_id = gone.id
+    db.delete(gone)
+    bump_calendar_version(db, household.id)
+    db.commit()
+    add_event(db, household, "new", T0 + 3 * DAY, T0 + 4 * DAY)
+    index.record_write(db, household.id, deleted=[gone_id])
+    assert titles(index.overlapping(db, household.id, *window)) == ["new"]
+    assert titles(
+        index.overlapping(db, household.id, T0 + 10 * DAY, T0 + 12 * DAY)
+    ) == ["moved"]
+
+
+def test_interval_tree_matches_a_scan():
+    rng = random.Random(31)
+    intervals = []
+    for event_id in range(2000):
+        start = T0 + timedelta(hours=rng.randrange(24 * 365))
+        end = (
+            None
+            if rng.random() < 0.02
+            else start + timedelta(hours=rng.choice([0, 1, 5, 48, 24 * 40]))
+        )
+        intervals.append((start, end, event_id))
+    tree = IntervalTree(intervals)
+
+    def scan(predicate):
+        return sorted(
+            event_id
+            for start, end, event_id in intervals
+            if predicate(start, end or datetime.max)
+        )
+
+    for _ in range(200):
+        low = T0 + timedelta(hours=rng.randrange(24 * 365))
+        high = low + timedelta(hours=rng.choice([1, 24, 24 * 7, 24 * 90]))
+        assert sorted(tree.overlapping(low, high)) == scan(
+            lambda start, end: start < high and end >= low
+        )
+        assert sorted(tree.containing(low, high)) == scan(
+            lambda start, end: start <= low and end >= high
+        )
+        assert sorted(tree.within(low, high)) == scan(
+            lambda start, end: start >= low and end <= high
+        )
+        assert [event_id for _, event_id in tree.starting_from(low)] == [
+            event_id
+            for start, _, event_id in sorted(intervals, key=lambda item: item[::2])
+            if start >= low
+        ]
@@ -0,0 +1,51 @@
+"""Tests of the cash flow forecast cache."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from api.models.finance import Category, TransactionType
+from api.schemas_main import BudgetCreate
+from api.services.finance import BudgetService
+from api.services.forecast import forecaster
+
+AS_OF = date(2024, 1, 10)
+
+
+@pytest.fixture
+def category_id(db, household):
+    category = Category(
+        name="Groceries", type=TransactionType.EXPENSE, household_id=household.id
+    )
+    db.add(category)
+    db.commit()
+    forecaster.invalidate(household.id)
+    return category.id
+
+
+def first_day(db, household):
+    _, path = forecaster.forecast(db, household.id, 1, as_of=AS_OF)
+    return path[0]
+
+
+def test_budget_writes_reach_the_cached_forecast(db, household, category_id):
+    budgets = BudgetService(db, household.id)
+    # Cache the forecast before any budget exists
+    assert first_day(db, household) == 0.0
+
+    budget = budgets.set_budget(
+        BudgetCreate(category_id=category_id, threshold=310.0, month=1, year=2024)
+    )
+    np.testing.assert_allclose(first_day(db, household), -10.0)
+
+    budgets.set_budget(
+        BudgetCreate(category_id=category_id, threshold=155.0, month=1, year=2024)
+    )
+    np.testing.assert_allclose(first_day(db, household), -5.0)
+
+    budgets.update_budget(budget.id, threshold=620.0)
+    np.testing.assert_allclose(first_day(db, household), -20.0)
+
+    budgets.delete_budget(budget.id)
+    assert first_day(db, household) == 0.0
@@ -0,0 +1,92 @@
+"""Tests of the gRPC interceptors on response-streaming handlers."""
+
+import logging
+
+import grpc
+import grpc.aio
+import pytest
+
+from api.grpc_interceptors import ErrorHandlingInterceptor, LoggingInterceptor
+from api.request_logging import RequestLog
+
+
+async def written(request, context):
+    await context.write(b"first")
+    await context.write(b"second")
+
+
+async def failing(request, context):
+    await context.write(b"first")
+    raise ValueError("bad request")
+
+
+def synchronous(request, context):
+    yield b"first"
+
+
+@pytest.fixture
+async def call():
+    """Call the methods of a test service served through the interceptors."""
+    server = grpc.aio.server(
+        interceptors=[
+            LoggingInterceptor(RequestLog([], 1.0, float("inf"))),
+            ErrorHandlingInterceptor(),
+        ]
+    )
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "test.Streams",
+                {
+                    name: grpc.unary_stream_rpc_method_handler(behavior)
+                    for name, behavior in (
+                        ("Written", written),
+                        ("Failing", failing),
+                        ("Synchronous", synchronous),
+                    )
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+
+        async def call(method):
+            stream = channel.unary_stream(f"/test.Streams/{method}")(b"")
+            return [response async for response in stream]
+
+        yield call
+    await server.stop(None)
+
+
+def logged(caplog):
+    return [
+        (record.fields["route"], record.fields["status"])
+        for record in caplog.records
+        if record.name == "api.requests"
+    ]
+
+
+async def test_streams_written_with_context_write_are_wrapped(call, caplog):
+    with caplog.at_level(logging.INFO, logger="api.requests"):
+        assert await call("Written") == [b"first", b"second"]
+
+    assert logged(caplog) == [("test.Streams/Written", "OK")]
+
+
+async def test_errors_of_written_streams_are_mapped(call, caplog):
+    with caplog.at_level(logging.INFO, logger="api.requests"):
+        with pytest.raises(grpc.aio.AioRpcError) as error:
+            await call("Failing")
+
+    assert error.value.code() is grpc.StatusCode.INVALID_ARGUMENT
+    assert error.value.details() == "bad request"
+    assert logged(caplog) == [("test.Streams/Failing", "INVALID_ARGUMENT")]
+
+
+async def test_synchronous_streams_are_rejected(call):
+    with pytest.raises(grpc.aio.AioRpcError) as error:
+        await call("Synchronous")
+
+    assert error.value.code() is grpc.StatusCode.UNKNOWN
@@ -0,0 +1,136 @@
+"""Tests of recurring series detection and materialization."""
+
+from datetime import date
+
+import pytest
+
+from api.models.finance import (
+    Category,
+    RecurringSeries,
+    Transaction,
+    TransactionType,
+)
+from api.schemas_main import TransactionCreate
+from api.services import recurring
+from api.services.finance import TransactionIngest, TransactionService
+from api.services.scheduler import materialize_series
+
+HISTORY = [date(2024, 1, 5), date(2024, 2, 5), date(2024, 3, 5)]
+
+
+@pytest.fixture
+def category_id(db, household):
+    category = Category(
+        name="Streaming", type=TransactionType.EXPENSE, household_id=household.id
+    )
+    db.add(category)
+    db.commit()
+    return category.id
+
+
+def payment(category_id, day, amount=15.99):
+    return TransactionCreate(
+        description="STREAMCO 4411", amount=amount, date=day, category_id=category_id
+    )
+
+
+@pytest.fixture
+def series(db, household, category_id):
+    transactions = TransactionService(db, household.id)
+    for day in HISTORY:
+        transactions.create_transaction(payment(category_id, day), household.created_by)
+    series = db.query(RecurringSeries).one()
+    # The April payment falls due before it arrives
+    assert materialize_series(db, [series], date(2024, 4, 5)) == 1
+    return series
+
+
+def april_rows(db, household):
+    return (
+        db.query(Transaction)
+        .filter(
+            Transaction.household_id == household.id,
+            Transaction.date >= date(2024, 4, 1),
+        )
+        .all()
+    )
+
+
+def test_arriving_payment_claims_the_materialized_occurrence(
+    db, household, category_id, series
+):
+    TransactionService(db, household.id).create_transaction(
+        payment(category_id, date(2024, 4, 6)), household.created_by
+    )
+
+    rows = april_rows(db, household)
+    assert [(row.date, row.recurring_series_id) for row in rows] == [
+        (date(2024, 4, 6), None)
+    ]
+    # The next occurrence is projected from the payment that arrived
+    assert series.next_due_date == date(2024, 5, 6)
+
+
+def test_ingested_payment_claims_the_materialized_occurrence(
+    db, household, category_id, series
+):
+    ingest = TransactionIngest(db, household.id, household.created_by)
+    ingest.add_batch([(0, payment(category_id, date(2024, 4, 4), amount=16.49))])
+    ingest.finish()
+
+    rows = april_rows(db, household)
+    assert [(row.date, row.recurring_series_id) for row in rows] == [
+        (date(2024, 4, 4), None)
+    ]
+
+
+def test_payment_outside_the_tolerance_leaves_the_occurrence(
+    db, household, category_id, series
+):
+    TransactionService(db, household.id).create_transaction(
+        payment(category_id, date(2024, 4, 20)), household.created_by
+    )
+
+    rows = april_rows(db, household)
+    assert sorted((row.date, row.recurring_series_id) for row in rows) == [
+        (date(2024, 4, 5), series.id),
+        (date(2024, 4, 20), None),
+    ]
+
+
+def test_detection_merges_amounts_straddling_a_band_boundary(
+    db, household, category_id
+):
+    # 97.02 is a band boundary, so the March charge is in the band below
+    for day, amount in zip(HISTORY, [97.99, 97.50, 96.50]):
+        db.add(
+            Transaction(
+                description="GYM CLUB",
+                amount=amount,
+                date=day,
+                type=TransactionType.EXPENSE,
+                category_id=category_id,
+                household_id=household.id,
+            )
+        )
+    db.commit()
+
+    [series] = recurring.detect_recurring_series(db, household.id)
+
+    assert series.occurrence_count == 3
+    assert {t.recurrence_fingerprint for t in db.query(Transaction)} == {
+        series.fingerprint
+    }
+
+    # A charge back in the upper band still continues the series
+    TransactionService(db, household.id).create_transaction(
+        TransactionCreate(
+            description="GYM CLUB",
+            amount=97.50,
+            date=date(2024, 4, 5),
+            category_id=category_id,
+        ),
+        household.created_by,
+    )
+    assert series.occurrence_count == 4
+    assert db.query(RecurringSeries).count() == 1
@@ -0,0 +1,167 @@
+"""Tests of reminder delivery against a local SMTP server."""
+
+import socket
+from datetime import datetime, timedelta
+from email import message_from_bytes
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from api.config import settings
+from api.models.calendar import Event, ReminderDelivery
+from api.models.user import User
+from api.services import reminders
+from api.services.event_recurrence import occurrence_cache, touch_event
+
+NOW = datetime(2024, 5, 1, 9, 0)
+LEASE = timedelta(seconds=settings.REMINDER_LEASE_SECONDS)
+
+
+class RecordingHandler:
+    """Accept messages and record them, refusing some recipients with a 451."""
+
+    def __init__(self):
+        self.messages = []
+        self.refuse = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refuse:
+            return "451 4.3.0 Try again later"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages.append(message_from_bytes(envelope.content))
+        return "250 Message accepted for delivery"
+
+    def recipients(self):
+        return sorted(message["To"] for message in self.messages)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def smtp(monkeypatch):
+    """A local SMTP server the reminders are sent to."""
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    monkeypatch.setattr(settings, "SMTP_HOST", "127.0.0.1")
+    monkeypatch.setattr(settings, "SMTP_PORT", controller.port)
+    monkeypatch.setattr(settings, "SMTP_TLS", False)
+    monkeypatch.setattr(settings, "SMTP_USER", None)
+    monkeypatch.setattr(settings, "SMTP_PASSWORD", None)
+    monkeypatch.setattr(settings, "EMAILS_FROM_EMAIL", "calendar@example.com")
+    yield handler
+    controller.stop()
+
+
+@pytest.fixture(autouse=True)
+def scheduler(monkeypatch):
+    """A scheduler of its own, as a freshly started worker has."""
+    occurrence_cache.clear()
+    scheduler = reminders.ReminderScheduler()
+    monkeypatch.setattr(reminders, "reminder_scheduler", scheduler)
+    return scheduler
+
+
+@pytest.fixture
+def event(db, household):
+    """An event whose reminder fired five minutes ago, in a household of three."""
+    for email, active in (("second@example.com", True), ("gone@example.com", False)):
+        user = User(email=email, household_id=household.id, is_active=active)
+        user.set_password("password")
+        db.add(user)
+    event = Event(
+        title="Dentist",
+        location="High Street",
+        start_time=NOW + timedelta(minutes=10),
+        end_time=NOW + timedelta(minutes=40),
+        household_id=household.id,
+        created_by_user_id=household.created_by,
+        reminder_enabled=True,
+        reminder_time_before=15,
+    )
+    touch_event(event)
+    db.add(event)
+    db.commit()
+    return event
+
+
+def deliveries(db):
+    db.expire_all()
+    return {row.recipient: row for row in db.query(ReminderDelivery)}
+
+
+async def test_reminders_are_sent_to_active_members_once(db, smtp, event, monkeypatch):
+    assert await reminders.dispatch_due_reminders(NOW) == 2
+
+    assert smtp.recipients() == ["owner@example.com", "second@example.com"]
+    message = smtp.messages[0]
+    assert message["Subject"] == "Reminder: Dentist"
+    assert message["Message-ID"].startswith(f"<reminder-{event.id}-20240501T091000-")
+    assert "Location: High Street" in message.get_payload()
+    rows = deliveries(db)
+    assert all(row.sent_at == NOW and row.attempts == 1 for row in rows.values())
+
+    # Neither the same worker nor a restarted one sends them again
+    assert await reminders.dispatch_due_reminders(NOW + timedelta(minutes=1)) == 0
+    monkeypatch.setattr(reminders, "reminder_scheduler", reminders.ReminderScheduler())
+    assert await reminders.dispatch_due_reminders(NOW + LEASE * 2) == 0
+    assert len(smtp.messages) == 2
+
+
+async def test_refused_recipient_is_retried_after_the_lease(db, smtp, event):
+    smtp.refuse.add("owner@example.com")
+
+    assert await reminders.dispatch_due_reminders(NOW) == 1
+    assert smtp.recipients() == ["second@example.com"]
+    refused = deliveries(db)["owner@example.com"]
+    assert refused.sent_at is None
+    assert refused.last_error.startswith("451")
+
+    # The claim is held until its lease expires
+    smtp.refuse.clear()
+    assert await reminders.dispatch_due_reminders(NOW + LEASE / 2) == 0
+
+    later = NOW + LEASE + timedelta(seconds=1)
+    assert await reminders.dispatch_due_reminders(later) == 1
+    assert smtp.recipients() == ["owner@example.com", "second@example.com"]
+    retried = deliveries(db)["owner@example.com"]
+    assert retried.sent_at == later
+    assert retried.attempts == 2
+
+
+async def test_unreachable_server_leaves_reminders_to_retry(
+    db, smtp, event, monkeypatch
+):
+    port = settings.SMTP_PORT
+    monkeypatch.setattr(settings, "SMTP_PORT", free_port())
+
+    assert await reminders.dispatch_due_reminders(NOW) == 0
+    rows = deliveries(db)
+    assert len(rows) == 2
+    assert all(row.sent_at is None and row.last_error for row in rows.values())
+
+    monkeypatch.setattr(settings, "SMTP_PORT", port)
+    monkeypatch.setattr(reminders, "reminder_scheduler", reminders.ReminderScheduler())
+    assert await reminders.dispatch_due_reminders(NOW + LEASE * 2) == 2
+    assert smtp.recipients() == ["owner@example.com", "second@example.com"]
+
+
+async def test_stops_after_max_attempts(db, smtp, event, monkeypatch):
+    monkeypatch.setattr(settings, "REMINDER_MAX_ATTEMPTS", 2)
+    smtp.refuse.add("owner@example.com")
+
+    now = NOW
+    for _ in range(3):
+        await reminders.dispatch_due_reminders(now)
+        now += LEASE + timedelta(seconds=1)
+
+    refused = deliveries(db)["owner@example.com"]
+    assert refused.sent_at is None
+    assert refused.attempts == 2
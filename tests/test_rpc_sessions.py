@@ -0,0 +1,177 @@
+"""Stress tests of the database sessions of concurrent gRPC calls."""
+
+import asyncio
+import threading
+import time
+from datetime import date
+
+import grpc
+import grpc.aio
+import pytest
+from sqlalchemy import event
+
+from api.generated.api.v1 import finance_pb2, finance_pb2_grpc
+from api.grpc_interceptors import create_grpc_interceptors
+from api.models.database import engine
+from api.models.finance import Category, Transaction, TransactionType
+from api.security import create_access_token
+from api.services.grpc import FinanceService
+
+TRANSACTIONS = 50
+
+# Time every statement takes, so that concurrent RPCs overlap in the database
+STATEMENT_LATENCY = 0.005
+
+
+class PoolWatch:
+    """Count the connections checked out of the pool, and their peak."""
+
+    def __init__(self):
+        self.checked_out = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def checkout(self, *args):
+        with self._lock:
+            self.checked_out += 1
+            self.peak = max(self.peak, self.checked_out)
+
+    def checkin(self, *args):
+        with self._lock:
+            self.checked_out -= 1
+
+
+@pytest.fixture
+def pool():
+    """Watch the pool while statements take STATEMENT_LATENCY each."""
+
+    def round_trip(*args):
+        time.sleep(STATEMENT_LATENCY)
+
+    watch = PoolWatch()
+    event.listen(engine, "before_cursor_execute", round_trip)
+    event.listen(engine.pool, "checkout", watch.checkout)
+    event.listen(engine.pool, "checkin", watch.checkin)
+    yield watch
+    event.remove(engine, "before_cursor_execute", round_trip)
+    event.remove(engine.pool, "checkout", watch.checkout)
+    event.remove(engine.pool, "checkin", watch.checkin)
+
+
+@pytest.fixture
+def category_id(db, household):
+    """ID of an expense category of the household, with some transactions.
+
+    The test's session holds no connection once it is committed.
+    """
+    category = Category(
+        name="groceries", household_id=household.id, type=TransactionType.EXPENSE
+    )
+    db.add(category)
+    db.flush()
+    for index in range(TRANSACTIONS):
+        db.add(
+            Transaction(
+                description=f"transaction-{index}",
+                amount=float(index),
+                date=date(2024, 1, 1 + index % 28),
+                type=TransactionType.EXPENSE,
+                category_id=category.id,
+                household_id=household.id,
+            )
+        )
+    category_id = category.id
+    db.commit()
+    return category_id
+
+
+@pytest.fixture
+async def finance(tables):
+    """A FinanceService stub of a server whose RPCs get sessions of their own."""
+    server = grpc.aio.server(interceptors=create_grpc_interceptors())
+    finance_pb2_grpc.add_FinanceServiceServicer_to_server(FinanceService(), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+        yield finance_pb2_grpc.FinanceServiceStub(channel)
+    await server.stop(None)
+
+
+def credentials():
+    token = create_access_token(data={"sub": "owner@example.com"})
+    return (("authorization", f"Bearer {token}"),)
+
+
+async def gather_limited(calls, concurrency):
+    """Await coroutines, at most ``concurrency`` at a time."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(call):
+        async with semaphore:
+            try:
+                return await call
+            except grpc.aio.AioRpcError as e:
+                return e
+
+    return await asyncio.gather(*(limited(call) for call in calls))
+
+
+async def test_concurrent_reads_use_sessions_of_their_own(finance, category_id, pool):
+    metadata = credentials()
+    responses = await gather_limited(
+        [
+            finance.ListTransactions(
+                finance_pb2.TransactionFilter(page=1 + index % 5, page_size=10),
+                metadata=metadata,
+            )
+            for index in range(200)
+        ],
+        concurrency=32,
+    )
+
+    for index, response in enumerate(responses):
+        assert isinstance(response, finance_pb2.TransactionListResponse), response
+        assert response.total == TRANSACTIONS
+        assert len(response.transactions) == 10
+        assert {t.description for t in response.transactions} <= {
+            f"transaction-{i}" for i in range(TRANSACTIONS)
+        }
+    # RPCs queried the database side by side, and returned every connection
+    assert pool.peak > 1
+    assert pool.checked_out == 0
+
+
+async def test_failed_writes_do_not_affect_concurrent_ones(
+    db, finance, category_id, pool
+):
+    metadata = credentials()
+
+    def create(index):
+        valid = index % 2 == 0
+        return finance.CreateTransaction(
+            finance_pb2.TransactionCreate(
+                category_id=str(category_id if valid else category_id + 1000),
+                description=f"new-{index}",
+                amount=10.0,
+            ),
+            metadata=metadata,
+        )
+
+    responses = await gather_limited([create(index) for index in range(60)], 16)
+
+    created = {
+        response.transaction.description
+        for response in responses
+        if isinstance(response, finance_pb2.TransactionResponse)
+    }
+    assert created == {f"new-{index}" for index in range(0, 60, 2)}
+    failed = [response for response in responses if isinstance(response, grpc.RpcError)]
+    assert len(failed) == 30
+    assert {response.code() for response in failed} == {grpc.StatusCode.NOT_FOUND}
+    assert pool.checked_out == 0
+
+    db.expire_all()
+    stored = db.query(Transaction.description).filter(
+        Transaction.description.like("new-%")
+    )
+    assert {description for (description,) in stored} == created
@@ -0,0 +1,180 @@
+"""Tests of the savings goal simulation."""
+
+from datetime import date
+
+import numpy as np
+import pytest
+
+from api.models.finance import Transaction, TransactionStatus, TransactionType
+from api.services.simulation import (
+    month_fractions,
+    monthly_net_cash_flows,
+    months_until,
+    simulate_goal,
+    simulate_household_goal,
+)
+
+FLOWS = [1200.0, -300.0, 450.0, 0.0, 800.0, -50.0]
+
+
+def add_transaction(db, household, day, amount, type_=TransactionType.INCOME, **kw):
+    db.add(
+        Transaction(
+            description="t",
+            amount=amount,
+            date=day,
+            type=type_,
+            household_id=household.id,
+            **kw,
+        )
+    )
+
+
+def test_simulate_goal_is_deterministic_with_a_seed():
+    first = simulate_goal(FLOWS, 100.0, 3000.0, 12, 5000, seed=7)
+    second = simulate_goal(FLOWS, 100.0, 3000.0, 12, 5000, seed=7)
+
+    np.testing.assert_array_equal(first[0], second[0])
+    assert first[1] == second[1]
+    assert first[2] is second[2] is False
+
+
+def test_simulate_goal_differs_across_seeds():
+    first, _, _ = simulate_goal(FLOWS, 100.0, 3000.0, 12, 2000, seed=1)
+    second, _, _ = simulate_goal(FLOWS, 100.0, 3000.0, 12, 2000, seed=2)
+
+    assert not np.array_equal(first, second)
+
+
+def test_simulate_goal_paths_sum_sampled_flows():
+    balances, probability, truncated = simulate_goal(FLOWS, 100.0, 1e9, 6, 2500, seed=3)
+
+    assert balances.shape == (2500, 6)
+    steps = np.diff(balances, axis=1, prepend=100.0)
+    assert np.isin(steps, FLOWS).all()
+    assert probability == 0.0
+    assert not truncated
+
+
+def test_simulate_goal_scales_partial_months():
+    full, _, _ = simulate_goal(FLOWS, 0.0, 1e9, 3, 1000, seed=5)
+    partial, _, _ = simulate_goal(
+        FLOWS, 0.0, 1e9, 3, 1000, seed=5, fractions=[0.5, 1.0, 0.25]
+    )
+
+    np.testing.assert_allclose(
+        np.diff(partial, axis=1, prepend=0.0),
+        np.diff(full, axis=1, prepend=0.0) * [0.5, 1.0, 0.25],
+    )
+
+
+def test_simulate_goal_stops_on_cpu_budget():
+    balances, _, truncated = simulate_goal(
+        FLOWS, 0.0, 1e9, 12, 50_000, seed=1, max_cpu_seconds=0.0
+    )
+
+    assert truncated
+    assert len(balances) < 50_000
+
+
+def test_months_until_starts_with_the_rest_of_the_month():
+    start = date(2024, 10, 19)
+
+    assert months_until(start, date(2024, 11, 30)) == [
+        date(2024, 10, 31),
+        date(2024, 11, 30),
+    ]
+    assert months_until(start, date(2025, 1, 10)) == [
+        date(2024, 10, 31),
+        date(2024, 11, 30),
+        date(2024, 12, 31),
+        date(2025, 1, 10),
+    ]
+    assert months_until(start, date(2024, 10, 25)) == [date(2024, 10, 25)]
+
+
+def test_month_fractions():
+    start = date(2024, 10, 19)
+
+    fractions = month_fractions(start, months_until(start, date(2025, 1, 10)))
+    np.testing.assert_allclose(fractions, [12 / 31, 1.0, 1.0, 10 / 31])
+    # A target in the start month is a single partial step
+    np.testing.assert_allclose(
+        month_fractions(start, months_until(start, date(2024, 10, 25))), [6 / 31]
+    )
+
+
+def test_monthly_net_cash_flows_fills_empty_months(db, household):
+    add_transaction(db, household, date(2024, 1, 5), 1000.0)
+    add_transaction(db, household, date(2024, 1, 20), 400.0, TransactionType.EXPENSE)
+    add_transaction(db, household, date(2024, 4, 2), 250.0)
+    add_transaction(
+        db, household, date(2024, 4, 3), 900.0, status=TransactionStatus.CANCELLED
+    )
+    # The current, partial month is left out
+    add_transaction(db, household, date(2024, 6, 1), 5000.0)
+    db.commit()
+
+    flows = monthly_net_cash_flows(db, household.id, before=date(2024, 6, 1))
+
+    np.testing.assert_array_equal(flows, [600.0, 0.0, 0.0, 250.0, 0.0])
+
+
+def test_monthly_net_cash_flows_without_history(db, household):
+    assert len(monthly_net_cash_flows(db, household.id)) == 0
+
+
+def test_simulate_household_goal_is_deterministic_with_a_seed(db, household):
+    for month, amount in enumerate([500.0, -200.0, 800.0, 150.0], start=1):
+        add_transaction(
+            db,
+            household,
+            date(2024, month, 10),
+            abs(amount),
+            TransactionType.INCOME if amount > 0 else TransactionType.EXPENSE,
+        )
+    db.commit()
+
+    def run():
+        return simulate_household_goal(
+            db,
+            household.id,
+            starting_balance=1000.0,
+            target_amount=2500.0,
+            target_date=date(2025, 1, 15),
+            paths=3000,
+            seed=42,
+            today=date(2024, 6, 20),
+        )
+
+    first, second = run(), run()
+
+    assert first.probability == second.probability
+    np.testing.assert_array_equal(first.percentiles, second.percentiles)
+    assert first.months == second.months
+    assert first.months[0] == date(2024, 6, 30)
+    assert first.months[-1] == date(2025, 1, 15)
+    assert len(first.months) == 8
+    # January to May, with May empty
+    assert first.history_months == 5
+    assert first.paths == 3000
+
+
+def test_simulate_household_goal_requires_history(db, household):
+    add_transaction(db, household, date(2024, 5, 10), 100.0)
+    db.commit()
+
+    with pytest.raises(ValueError):
+        simulate_household_goal(
+            db,
+            household.id,
+            0.0,
+            100.0,
+            date(2025, 1, 1),
+            100,
+            today=date(2024, 6, 1),
+        )
+    with pytest.raises(ValueError):
+        simulate_household_goal(
+            db, household.id, 0.0, 100.0, date(2024, 5, 1), 100, today=date(2024, 6, 1)
+        )